@@ -1047,6 +1047,7 @@ class EntityEditorWindow(QMainWindow):
     
     def populate_table(self, items):
         """Заполнить таблицу"""
+        self.table_items = list(items)  # Элемент каждой строки (для фильтров)
         self.table.setRowCount(len(items))
         for row_idx, item in enumerate(items):
             self.table.setItem(row_idx, 0, QTableWidgetItem(item.functional_id))
@@ -1060,7 +1061,11 @@ class EntityEditorWindow(QMainWindow):
     
     def apply_filters(self):
         """Применить все фильтры"""
-        search_text = self.search_input.text().lower()
+        from src.db.search_index import search_functional_items
+
+        # Текстовый поиск — по FTS-индексу, строки проверяются по id
+        found_ids = search_functional_items(self.session, self.search_input.text())
+        found_ids = set(found_ids) if found_ids is not None else None
         module_filter = self.module_filter.currentText()
         epic_filter = self.epic_filter.currentText()
         
@@ -1068,12 +1073,8 @@ class EntityEditorWindow(QMainWindow):
             show = True
             
             # Текстовый поиск
-            if search_text:
-                match = any(
-                    self.table.item(row, col) and search_text in self.table.item(row, col).text().lower()
-                    for col in [0, 1]
-                )
-                show = show and match
+            if found_ids is not None:
+                show = self.table_items[row].id in found_ids
             
             # Фильтр по модулю
             if module_filter and show:
@@ -1148,7 +1149,7 @@ class MainWindow(QMainWindow):
                 sys.exit(0)
         
         # Подключаемся к БД проекта
-        if not self.db_manager.connect_to_database(current_project.database_path):
+        if not self.db_manager.connect_to_database(current_project.database_path, current_project.performance):
             QMessageBox.critical(self, 'Ошибка', f'Не удалось подключиться к БД проекта:\n{current_project.database_path}')
             sys.exit(1)
         
@@ -1456,17 +1457,35 @@ class MainWindow(QMainWindow):
         # Горизонтальный layout: таблица + мини-граф
         content_layout = QHBoxLayout()
         
-        # Таблица
-        self.table = QTableWidget()
-        self.table.setColumnCount(13)
-        self.table.setHorizontalHeaderLabels([
-            'FuncID', 'Alias', 'Title', 'Type', 'Module', 'Epic', 'Feature', 'QA', 'Dev', 'Segment', 'Crit', 'Focus', 'Actions'
-        ])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        # Таблица (model/view: строки — кортежи, чекбоксы и кнопки рисуют делегаты)
+        from src.ui.views.functional_items_model import (
+            FunctionalItemTableModel, FunctionalItemFilterProxyModel, COL_CRIT, COL_FOCUS, COL_ACTIONS
+        )
+        from src.ui.delegates.table_delegates import CheckBoxDelegate, ActionButtonsDelegate
+
+        self.table_model = FunctionalItemTableModel(self, on_commit=self.on_cell_commit)
+        self.table_proxy = FunctionalItemFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+
+        self.table = QTableView()
+        self.table.setModel(self.table_proxy)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setDefaultSectionSize(29)
+        # Ширину колонок считаем по выборке строк, а не по всей таблице
+        self.table.horizontalHeader().setResizeContentsPrecision(200)
         # Inline-редактирование по double-click для определённых колонок
-        self.table.setEditTriggers(QTableWidget.EditTrigger.DoubleClicked | QTableWidget.EditTrigger.EditKeyPressed)
-        self.table.itemChanged.connect(self.on_item_changed)
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.setEditTriggers(QTableView.EditTrigger.DoubleClicked | QTableView.EditTrigger.EditKeyPressed)
+        self.table.selectionModel().currentRowChanged.connect(self.on_selection_changed)
+
+        # Crit и Focus - чекбоксы, Actions - кнопки редактирования и удаления
+        check_delegate = CheckBoxDelegate(self.table)
+        self.table.setItemDelegateForColumn(COL_CRIT, check_delegate)
+        self.table.setItemDelegateForColumn(COL_FOCUS, check_delegate)
+
+        actions_delegate = ActionButtonsDelegate(self.table)
+        actions_delegate.edit_clicked.connect(lambda index: self.edit_item_by_row(index.row()))
+        actions_delegate.delete_clicked.connect(lambda index: self.delete_item_by_row(index.row()))
+        self.table.setItemDelegateForColumn(COL_ACTIONS, actions_delegate)
 
         # Контекстное меню для таблицы
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -1508,6 +1527,11 @@ class MainWindow(QMainWindow):
         self.infra_tab = InfraMaturityTabWidget(self)
         self.tabs.addTab(self.infra_tab, '🏗️ INFRA')
         
+        # Таб 6: RACI матрица
+        from src.ui.widgets.raci_matrix_tab import RaciMatrixTabWidget
+        self.raci_tab = RaciMatrixTabWidget(self)
+        self.tabs.addTab(self.raci_tab, '👥 RACI')
+        
         # Добавляем табы в главный layout
         layout.addWidget(self.tabs)
         
@@ -1518,6 +1542,7 @@ class MainWindow(QMainWindow):
         QShortcut(QKeySequence('Ctrl+3'), self).activated.connect(lambda: self.tabs.setCurrentIndex(2))
         QShortcut(QKeySequence('Ctrl+4'), self).activated.connect(lambda: self.tabs.setCurrentIndex(3))
         QShortcut(QKeySequence('Ctrl+5'), self).activated.connect(lambda: self.tabs.setCurrentIndex(4))
+        QShortcut(QKeySequence('Ctrl+6'), self).activated.connect(lambda: self.tabs.setCurrentIndex(5))
         
         # Обработка смены таба
         self.tabs.currentChanged.connect(self.on_tab_changed)
@@ -1529,171 +1554,70 @@ class MainWindow(QMainWindow):
         print(f"[VoluptAS] {banner} | root={project_root}")
     
     def load_data(self):
-        self.current_items = self.session.query(FunctionalItem).order_by(FunctionalItem.functional_id).all()
-        
+        from src.ui.views.functional_items_model import load_item_rows
+
+        self.current_items = load_item_rows(self.session)
+
         # Обновляем все фильтры
-        types = sorted(set(item.type for item in self.current_items if item.type))
-        modules = sorted(set(item.module for item in self.current_items if item.module))
-        epics = sorted(set(item.epic for item in self.current_items if item.epic))
-        segments = sorted(set(item.segment for item in self.current_items if item.segment))
-        qa_users = sorted(set(item.responsible_qa.name for item in self.current_items if item.responsible_qa))
-        dev_users = sorted(set(item.responsible_dev.name for item in self.current_items if item.responsible_dev))
-        
+        types = sorted(set(row.type for row in self.current_items if row.type))
+        modules = sorted(set(row.module for row in self.current_items if row.module))
+        epics = sorted(set(row.epic for row in self.current_items if row.epic))
+        segments = sorted(set(row.segment for row in self.current_items if row.segment))
+        qa_users = sorted(set(row.qa_name for row in self.current_items if row.qa_name))
+        dev_users = sorted(set(row.dev_name for row in self.current_items if row.dev_name))
+
+        # Блокируем сигналы, чтобы не перефильтровывать таблицу на каждый clear/addItems
+        filters = [self.type_filter, self.module_filter, self.epic_filter,
+                   self.segment_filter, self.qa_filter, self.dev_filter]
+        for combo in filters:
+            combo.blockSignals(True)
+
         self.type_filter.clear()
         self.type_filter.addItems([''] + types)
-        
+
         self.module_filter.clear()
         self.module_filter.addItems([''] + modules)
-        
+
         self.epic_filter.clear()
         self.epic_filter.addItems([''] + epics)
-        
+
         self.segment_filter.clear()
         self.segment_filter.addItems([''] + segments)
-        
+
         self.qa_filter.clear()
         self.qa_filter.addItems([''] + qa_users)
-        
+
         self.dev_filter.clear()
         self.dev_filter.addItems([''] + dev_users)
-        
+
+        for combo in filters:
+            combo.blockSignals(False)
+
         self.populate_table(self.current_items)
         self.apply_quick_filter()
         self.statusBar().showMessage(f'✅ Загружено: {len(self.current_items)} записей')
-    
+
     def populate_table(self, items):
-        # Отключаем itemChanged на время заполнения
-        self.table.itemChanged.disconnect(self.on_item_changed)
-        
-        self.table.setRowCount(len(items))
-        for row_idx, item in enumerate(items):
-            # Если alias_tag пустой, используем последнюю часть functional_id
-            alias_display = item.alias_tag if item.alias_tag else item.functional_id.split('.')[-1]
-            
-            # Нередактируемые колонки
-            funcid_item = QTableWidgetItem(item.functional_id)
-            funcid_item.setFlags(funcid_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row_idx, 0, funcid_item)
-            
-            self.table.setItem(row_idx, 1, QTableWidgetItem(alias_display))  # Редактируемый
-            self.table.setItem(row_idx, 2, QTableWidgetItem(item.title or ''))  # Редактируемый
-            
-            type_item = QTableWidgetItem(item.type or '')
-            type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row_idx, 3, type_item)
-            
-            # Module - показываем ──┐ если item.type == 'Module'
-            module_display = '──┐' if item.type == 'Module' else (item.module or '')
-            module_item = QTableWidgetItem(module_display)
-            module_item.setFlags(module_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row_idx, 4, module_item)
-            
-            # Epic - показываем ──┐ если item.type == 'Epic'
-            epic_display = '──┐' if item.type == 'Epic' else (item.epic or '')
-            epic_item = QTableWidgetItem(epic_display)
-            epic_item.setFlags(epic_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row_idx, 5, epic_item)
-            
-            # Feature - показываем ──┐ если item.type == 'Feature'
-            feature_display = '──┐' if item.type == 'Feature' else (item.feature or '')
-            feature_item = QTableWidgetItem(feature_display)
-            feature_item.setFlags(feature_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row_idx, 6, feature_item)
-            
-            qa_item = QTableWidgetItem(item.responsible_qa.name if item.responsible_qa else '')
-            qa_item.setFlags(qa_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row_idx, 7, qa_item)
-            
-            dev_item = QTableWidgetItem(item.responsible_dev.name if item.responsible_dev else '')
-            dev_item.setFlags(dev_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row_idx, 8, dev_item)
-            
-            self.table.setItem(row_idx, 9, QTableWidgetItem(item.segment or ''))  # Редактируемый
-            
-            # Crit и Focus - чекбоксы
-            crit_widget = QWidget()
-            crit_layout = QHBoxLayout(crit_widget)
-            crit_layout.setContentsMargins(0, 0, 0, 0)
-            crit_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            crit_check = QCheckBox()
-            crit_check.setChecked(bool(item.is_crit))
-            crit_check.stateChanged.connect(lambda state, r=row_idx, c=10: self.on_checkbox_changed(r, c, state))
-            crit_layout.addWidget(crit_check)
-            self.table.setCellWidget(row_idx, 10, crit_widget)
-            
-            focus_widget = QWidget()
-            focus_layout = QHBoxLayout(focus_widget)
-            focus_layout.setContentsMargins(0, 0, 0, 0)
-            focus_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            focus_check = QCheckBox()
-            focus_check.setChecked(bool(item.is_focus))
-            focus_check.stateChanged.connect(lambda state, r=row_idx, c=11: self.on_checkbox_changed(r, c, state))
-            focus_layout.addWidget(focus_check)
-            self.table.setCellWidget(row_idx, 11, focus_widget)
-            
-            # Actions - кнопки редактирования и удаления
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 2, 4, 2)
-            actions_layout.setSpacing(4)
-            
-            edit_btn = QPushButton('✏️')
-            edit_btn.setFixedSize(30, 25)
-            edit_btn.setToolTip('Редактировать')
-            edit_btn.setStyleSheet('QPushButton { font-size: 14px; }')
-            edit_btn.clicked.connect(lambda checked, r=row_idx: self.edit_item_by_row(r))
-            actions_layout.addWidget(edit_btn)
-            
-            delete_btn = QPushButton('🗑️')
-            delete_btn.setFixedSize(30, 25)
-            delete_btn.setToolTip('Удалить')
-            delete_btn.setStyleSheet('QPushButton { font-size: 14px; }')
-            delete_btn.clicked.connect(lambda checked, r=row_idx: self.delete_item_by_row(r))
-            actions_layout.addWidget(delete_btn)
-            
-            self.table.setCellWidget(row_idx, 12, actions_widget)
-        
+        """Заполнение модели таблицы (отрисовываются только видимые строки)"""
+        self.table_model.set_rows(items)
         self.table.resizeColumnsToContents()
-        
-        # Включаем itemChanged обратно
-        self.table.itemChanged.connect(self.on_item_changed)
-    
+
+    def row_item(self, view_row):
+        """Строка модели (ItemRow) по номеру строки в таблице (с учётом фильтров)"""
+        if view_row < 0 or view_row >= self.table_proxy.rowCount():
+            return None
+        source_index = self.table_proxy.mapToSource(self.table_proxy.index(view_row, 0))
+        return self.table_model.row_at(source_index.row())
+
     def quick_filter(self, filter_type):
         """Быстрая фильтрация (все/критичное/фокусное)"""
         self.current_filter = filter_type
         self.apply_quick_filter()
-    
+
     def apply_quick_filter(self):
         """Применить быстрый фильтр"""
-        # Сначала показываем все строки
-        for row in range(self.table.rowCount()):
-            self.table.setRowHidden(row, False)
-        
-        # Потом применяем фильтр
-        if self.current_filter != 'all':
-            for row in range(self.table.rowCount()):
-                show = True
-                if self.current_filter == 'crit':
-                    # Crit теперь в колонке 10 (было 9)
-                    crit_widget = self.table.cellWidget(row, 10)
-                    if crit_widget:
-                        crit_check = crit_widget.findChild(QCheckBox)
-                        show = crit_check and crit_check.isChecked()
-                    else:
-                        show = False
-                elif self.current_filter == 'focus':
-                    # Focus теперь в колонке 11 (было 10)
-                    focus_widget = self.table.cellWidget(row, 11)
-                    if focus_widget:
-                        focus_check = focus_widget.findChild(QCheckBox)
-                        show = focus_check and focus_check.isChecked()
-                    else:
-                        show = False
-                
-                self.table.setRowHidden(row, not show)
-        
-        self.filter_table()  # Применяем остальные фильтры
-    
+        self.filter_table()  # Быстрый фильтр применяется вместе с остальными
+
     def clear_filters(self):
         """Сбросить все фильтры"""
         self.search_input.clear()
@@ -1705,146 +1629,78 @@ class MainWindow(QMainWindow):
         self.dev_filter.setCurrentIndex(0)
         self.current_filter = 'all'
         self.apply_quick_filter()
-    
-    def on_checkbox_changed(self, row, col, state):
-        """Обработка изменения чекбокса"""
-        functional_id = self.table.item(row, 0).text()
-        db_item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
-        
-        if not db_item:
-            return
-        
-        try:
-            if col == 9:  # Crit
-                db_item.is_crit = 1 if state == Qt.CheckState.Checked.value else 0
-            elif col == 10:  # Focus
-                db_item.is_focus = 1 if state == Qt.CheckState.Checked.value else 0
-            
-            self.session.commit()
-            self.statusBar().showMessage(f'✅ Сохранено: {functional_id}')
-        except Exception as e:
-            self.session.rollback()
-            QMessageBox.critical(self, 'Ошибка', f'Не удалось сохранить:\n{e}')
-    
-    def on_item_changed(self, item):
-        """Обработка изменения ячейки в таблице"""
-        row = item.row()
-        col = item.column()
 
-        # Редактируемые колонки: Alias(1), Title(2), Segment(8), isCrit(10), isFocus(11)
-        if col not in [1, 2, 8, 10, 11]:
-            return
+    def on_cell_commit(self, row, col, value):
+        """
+        Сохранение изменения ячейки в БД (callback модели таблицы)
 
-        functional_id = self.table.item(row, 0).text()
-        db_item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
+        Returns:
+            True если изменение сохранено и строку модели можно обновить
+        """
+        from src.ui.views.functional_items_model import COL_ALIAS, COL_TITLE, COL_SEGMENT, COL_CRIT, COL_FOCUS
 
+        db_item = self.session.get(FunctionalItem, row.id)
         if not db_item:
-            return
+            return False
 
-        # Обработка checkbox (isCrit, isFocus)
-        if col in [10, 11]:
-            # Для checkbox используем текст "✓" или пустую строку
-            new_value = 1 if item.text() == '✓' else 0
-            
-            try:
-                if col == 10:  # isCrit
-                    db_item.is_crit = new_value
-                elif col == 11:  # isFocus
-                    db_item.is_focus = new_value
-                
-                self.session.commit()
-                self.statusBar().showMessage(f'✅ Сохранено: {functional_id}')
-            except Exception as e:
-                self.session.rollback()
-                QMessageBox.critical(self, 'Ошибка', f'Не удалось сохранить:\n{e}')
-            return
-        
-        # Обработка текстовых полей
-        new_value = item.text().strip()
+        if col == COL_TITLE and not value:
+            QMessageBox.warning(self, 'Ошибка', 'Title не может быть пустым')
+            return False
 
         try:
-            if col == 1:  # Alias
-                db_item.alias_tag = new_value if new_value else None
-            elif col == 2:  # Title
-                if not new_value:
-                    QMessageBox.warning(self, 'Ошибка', 'Title не может быть пустым')
-                    item.setText(db_item.title)
-                    return
-                db_item.title = new_value
-            elif col == 8:  # Segment
-                db_item.segment = new_value if new_value else None
+            if col == COL_ALIAS:
+                db_item.alias_tag = value if value else None
+            elif col == COL_TITLE:
+                db_item.title = value
+            elif col == COL_SEGMENT:
+                db_item.segment = value if value else None
+            elif col == COL_CRIT:
+                db_item.is_crit = value
+            elif col == COL_FOCUS:
+                db_item.is_focus = value
+            else:
+                return False
 
             self.session.commit()
-            self.statusBar().showMessage(f'✅ Сохранено: {functional_id}')
+            self.statusBar().showMessage(f'✅ Сохранено: {row.functional_id}')
+            return True
         except Exception as e:
             self.session.rollback()
             QMessageBox.critical(self, 'Ошибка', f'Не удалось сохранить:\n{e}')
-    
-    def on_selection_changed(self):
+            return False
+
+    def on_selection_changed(self, current=None, previous=None):
         """Обработка выбора строки в таблице"""
-        selected = self.table.currentRow()
-        if selected >= 0:
-            functional_id = self.table.item(selected, 0).text()
-            item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
-            if item:
-                self.mini_graph.update_graph(item.id)
+        row = self.row_item(self.table.currentIndex().row())
+        if row:
+            self.mini_graph.update_graph(row.id)
         else:
             self.mini_graph.clear_graph()
-    
+
     def filter_table(self):
         """Фильтрация таблицы — ВСЕГДА из всех элементов"""
-        search_text = self.search_input.text().lower()
-        type_filter = self.type_filter.currentText()
-        module_filter = self.module_filter.currentText()
-        epic_filter = self.epic_filter.currentText()
-        segment_filter = self.segment_filter.currentText()
-        qa_filter = self.qa_filter.currentText()
-        dev_filter = self.dev_filter.currentText()
-
-        # Фильтруем ВСЕ строки, а не только видимые
-        for row in range(self.table.rowCount()):
-            show = True
-
-            # Текстовый поиск
-            if search_text:
-                match = any(
-                    self.table.item(row, col) and search_text in self.table.item(row, col).text().lower()
-                    for col in range(self.table.columnCount())
-                )
-                show = show and match
-
-            # Фильтр по Type
-            if type_filter and show:
-                type_cell = self.table.item(row, 3)
-                show = show and (type_cell and type_cell.text() == type_filter)
-
-            # Фильтр по Module
-            if module_filter and show:
-                module_cell = self.table.item(row, 4)
-                show = show and (module_cell and module_cell.text() == module_filter)
-
-            # Фильтр по Epic
-            if epic_filter and show:
-                epic_cell = self.table.item(row, 5)
-                show = show and (epic_cell and epic_cell.text() == epic_filter)
-
-            # Фильтр по Segment
-            if segment_filter and show:
-                segment_cell = self.table.item(row, 9)  # Изменено: 8 → 9
-                show = show and (segment_cell and segment_cell.text() == segment_filter)
-
-            # Фильтр по QA
-            if qa_filter and show:
-                qa_cell = self.table.item(row, 7)  # Изменено: 6 → 7
-                show = show and (qa_cell and qa_cell.text() == qa_filter)
+        from src.ui.views.functional_items_model import (
+            COL_TYPE, COL_MODULE, COL_EPIC, COL_SEGMENT, COL_QA, COL_DEV
+        )
 
-            # Фильтр по Dev
-            if dev_filter and show:
-                dev_cell = self.table.item(row, 8)  # Изменено: 7 → 8
-                show = show and (dev_cell and dev_cell.text() == dev_filter)
+        from src.db.search_index import search_functional_items
+
+        # Текстовый поиск — по FTS-индексу БД, таблица фильтруется по набору id
+        found_ids = search_functional_items(self.session, self.search_input.text())
+
+        self.table_proxy.set_filters(
+            column_filters={
+                COL_TYPE: self.type_filter.currentText(),
+                COL_MODULE: self.module_filter.currentText(),
+                COL_EPIC: self.epic_filter.currentText(),
+                COL_SEGMENT: self.segment_filter.currentText(),
+                COL_QA: self.qa_filter.currentText(),
+                COL_DEV: self.dev_filter.currentText(),
+            },
+            quick_filter=self.current_filter,
+            allowed_ids=set(found_ids) if found_ids is not None else None,
+        )
 
-            self.table.setRowHidden(row, not show)
-    
     def add_item(self):
         """Добавление нового элемента"""
         new_item = FunctionalItem()
@@ -1861,13 +1717,12 @@ class MainWindow(QMainWindow):
 
     def edit_item(self):
         """Редактирование выбранного элемента"""
-        selected = self.table.currentRow()
-        if selected < 0:
+        row = self.row_item(self.table.currentIndex().row())
+        if not row:
             QMessageBox.warning(self, 'Внимание', 'Выберите элемент')
             return
 
-        functional_id = self.table.item(selected, 0).text()
-        item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
+        item = self.session.get(FunctionalItem, row.id)
 
         if item:
             dialog = DynamicEditDialog(item, self.session, self)
@@ -1881,14 +1736,13 @@ class MainWindow(QMainWindow):
                     QMessageBox.critical(self, 'Ошибка', f'Не удалось обновить:\n{e}')
     
     def delete_item(self):
-        selected = self.table.currentRow()
-        if selected < 0:
+        row = self.row_item(self.table.currentIndex().row())
+        if not row:
             QMessageBox.warning(self, 'Внимание', 'Выберите элемент')
             return
-        
-        functional_id = self.table.item(selected, 0).text()
-        item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
-        
+
+        item = self.session.get(FunctionalItem, row.id)
+
         if item:
             reply = QMessageBox.question(
                 self, 'Подтверждение',
@@ -1897,22 +1751,26 @@ class MainWindow(QMainWindow):
             )
             if reply == QMessageBox.StandardButton.Yes:
                 try:
-                    self.session.delete(item)
+                    from src.models.hierarchy import delete_subtree
+
+                    # Элемент удаляется вместе с поддеревом одним запросом
+                    functional_id = item.functional_id
+                    delete_subtree(self.session, item.id)
                     self.session.commit()
                     self.load_data()
-                    self.statusBar().showMessage(f'✅ Удалено: {item.functional_id}')
+                    self.statusBar().showMessage(f'✅ Удалено: {functional_id}')
                 except Exception as e:
                     self.session.rollback()
                     QMessageBox.critical(self, 'Ошибка', f'Не удалось удалить:\n{e}')
     
     def edit_item_by_row(self, row_idx):
         """Редактирование элемента по номеру строки"""
-        if row_idx < 0 or row_idx >= self.table.rowCount():
+        row = self.row_item(row_idx)
+        if not row:
             return
-        
-        functional_id = self.table.item(row_idx, 0).text()
-        item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
-        
+
+        item = self.session.get(FunctionalItem, row.id)
+
         if item:
             dialog = DynamicEditDialog(item, self.session, self)
             if dialog.exec():
@@ -1926,12 +1784,12 @@ class MainWindow(QMainWindow):
     
     def delete_item_by_row(self, row_idx):
         """Удаление элемента по номеру строки"""
-        if row_idx < 0 or row_idx >= self.table.rowCount():
+        row = self.row_item(row_idx)
+        if not row:
             return
-        
-        functional_id = self.table.item(row_idx, 0).text()
-        item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
-        
+
+        item = self.session.get(FunctionalItem, row.id)
+
         if item:
             reply = QMessageBox.question(
                 self, 'Подтверждение',
@@ -1940,10 +1798,14 @@ class MainWindow(QMainWindow):
             )
             if reply == QMessageBox.StandardButton.Yes:
                 try:
-                    self.session.delete(item)
+                    from src.models.hierarchy import delete_subtree
+
+                    # Элемент удаляется вместе с поддеревом одним запросом
+                    functional_id = item.functional_id
+                    delete_subtree(self.session, item.id)
                     self.session.commit()
                     self.load_data()
-                    self.statusBar().showMessage(f'✅ Удалено: {item.functional_id}')
+                    self.statusBar().showMessage(f'✅ Удалено: {functional_id}')
                 except Exception as e:
                     self.session.rollback()
                     QMessageBox.critical(self, 'Ошибка', f'Не удалось удалить:\n{e}')
@@ -1960,9 +1822,9 @@ class MainWindow(QMainWindow):
         create_child_menu = menu.addMenu('➕ Создать дочерний')
         
         # Определяем тип текущего элемента и предлагаем подходящие дочерние
-        type_cell = self.table.item(row, 3)  # Type column
-        current_type = type_cell.text() if type_cell else ''
-        
+        row_data = self.row_item(row)
+        current_type = row_data.type if row_data and row_data.type else ''
+
         child_types = {
             'Module': ['Epic'],
             'Epic': ['Feature'],
@@ -2003,9 +1865,11 @@ class MainWindow(QMainWindow):
     
     def create_child_item(self, parent_row, child_type):
         """Создание дочернего элемента с авто-FuncID и связями"""
-        parent_funcid = self.table.item(parent_row, 0).text()
-        parent_item = self.session.query(FunctionalItem).filter_by(functional_id=parent_funcid).first()
-        
+        parent_row_data = self.row_item(parent_row)
+        if not parent_row_data:
+            return
+        parent_item = self.session.get(FunctionalItem, parent_row_data.id)
+
         if not parent_item:
             return
         
@@ -2074,12 +1938,12 @@ class MainWindow(QMainWindow):
     
     def duplicate_item_by_row(self, row_idx):
         """Дублирование элемента по номеру строки"""
-        if row_idx < 0 or row_idx >= self.table.rowCount():
+        row = self.row_item(row_idx)
+        if not row:
             return
-        
-        functional_id = self.table.item(row_idx, 0).text()
-        original_item = self.session.query(FunctionalItem).filter_by(functional_id=functional_id).first()
-        
+
+        original_item = self.session.get(FunctionalItem, row.id)
+
         if original_item:
             # Создаем копию
             new_item = FunctionalItem(
@@ -2210,9 +2074,12 @@ class MainWindow(QMainWindow):
     
     def on_tab_changed(self, index: int):
         """Обработка смены таба"""
-        tab_names = ['Таблица', 'Граф', 'BDD', 'Трассировки', 'INFRA']
+        tab_names = ['Таблица', 'Граф', 'BDD', 'Трассировки', 'INFRA', 'RACI']
         if 0 <= index < len(tab_names):
             self.statusBar().showMessage(f'Активная вкладка: {tab_names[index]}')
+        # Покрытие и RACI матрица считаются при открытии таба
+        if self.tabs.widget(index) in (self.coverage_tab, self.raci_tab):
+            self.tabs.widget(index).refresh()
     
     def save_data(self):
         """Сохранить данные"""
@@ -2276,19 +2143,19 @@ class MainWindow(QMainWindow):
                     'FuncID', 'Alias', 'Title', 'Type', 'Module', 'Epic', 'QA', 'Dev', 'Segment', 'Crit', 'Focus'
                 ])
                 
-                for item in self.current_items:
+                for row in self.current_items:
                     writer.writerow([
-                        item.functional_id,
-                        item.alias_tag or '',
-                        item.title or '',
-                        item.type or '',
-                        item.module or '',
-                        item.epic or '',
-                        item.responsible_qa.name if item.responsible_qa else '',
-                        item.responsible_dev.name if item.responsible_dev else '',
-                        item.segment or '',
-                        '1' if item.is_crit else '0',
-                        '1' if item.is_focus else '0'
+                        row.functional_id,
+                        row.alias_tag or '',
+                        row.title or '',
+                        row.type or '',
+                        row.module or '',
+                        row.epic or '',
+                        row.qa_name or '',
+                        row.dev_name or '',
+                        row.segment or '',
+                        '1' if row.is_crit else '0',
+                        '1' if row.is_focus else '0'
                     ])
             
             QMessageBox.information(self, 'Успех', f'✅ Экспортировано: {len(self.current_items)} элементов')
@@ -2410,7 +2277,7 @@ class MainWindow(QMainWindow):
             new_project = self.project_manager.get_current_project()
             
             # Переподключаемся к новой БД
-            if self.db_manager.connect_to_database(new_project.database_path):
+            if self.db_manager.connect_to_database(new_project.database_path, new_project.performance):
                 self.session = self.db_manager.get_session()
                 
                 # Обновляем UI
@@ -2445,7 +2312,7 @@ class MainWindow(QMainWindow):
                 self.project_manager.switch_project(dialog.created_project_id)
                 new_project = self.project_manager.get_current_project()
 
-                if self.db_manager.connect_to_database(new_project.database_path):
+                if self.db_manager.connect_to_database(new_project.database_path, new_project.performance):
                     self.ensure_database_initialized()
                     self.session = self.db_manager.get_session()
                     self.load_data()
@@ -2494,7 +2361,7 @@ class MainWindow(QMainWindow):
             self.session.close()
         
         # Переподключаемся к новой БД
-        if self.db_manager.connect_to_database(new_project.database_path):
+        if self.db_manager.connect_to_database(new_project.database_path, new_project.performance):
             self.ensure_database_initialized()
             self.session = self.db_manager.get_session()
             
@@ -2573,7 +2440,7 @@ class MainWindow(QMainWindow):
         new_project = self.project_manager.get_current_project()
         
         # Переподключаемся к новой БД
-        if self.db_manager.connect_to_database(new_project.database_path):
+        if self.db_manager.connect_to_database(new_project.database_path, new_project.performance):
             self.ensure_database_initialized()
             self.session = self.db_manager.get_session()
             
@@ -2607,6 +2474,8 @@ class MainWindow(QMainWindow):
             self.session.close()
         if self.db_manager:
             self.db_manager.close()
+        from src.db.engine_registry import get_engine_registry
+        get_engine_registry().dispose_all()
         event.accept()
 
 
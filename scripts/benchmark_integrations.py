@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Замер пропускной способности интеграций на локальном стенде
+
+Запускает scripts/integration_standin.py в фоне и прогоняет настоящий код
+VoluptAS (без сети и боевых порталов):
+- zoho-full:   ZohoSyncService — полная синхронизация всех milestone
+- zoho-incr:   ZohoSyncService — повторная (инкрементальная) синхронизация
+- qase-cases:  QaseClient.get_cases
+- qase-cached: QaseClient.get_cases повторно (из дискового кэша)
+- sheets:      GoogleSheetsExporter.export_all_tables — полный экспорт и
+               diff-экспорт после правки ~1% элементов
+
+Для каждого сценария: запросов к стенду, время, строк, строк/с, повторов.
+
+Использование:
+    python scripts/benchmark_integrations.py [--latency-ms 50] [--tasks 5000]
+        [--cases 2000] [--items 1000] [--error-rate 0.05] [--only zoho,qase]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Добавляем корень проекта в PYTHONPATH
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import gspread
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from scripts.integration_standin import IntegrationStandIn, StandInConfig
+from src.db.base import Base
+from src.integrations.google.google_sheets_client import ExecutorHTTPClient
+from src.integrations.http_cache import HttpCache
+from src.integrations.http_client import get_http_executor, reset_http_executor
+from src.integrations.qase.qase_api import QaseClient
+from src.integrations.zoho.TokenManager import EXPIRES_AT_KEY, reset_token_managers
+from src.integrations.zoho.Zoho_api_client import ZohoAPI
+from src.models import FunctionalItem, Relation, User
+from src.services.GoogleSheetsExporter import GoogleSheetsExporter
+from src.services.ZohoSyncService import ZohoSyncService
+
+SHEETS_API_URL = "https://sheets.googleapis.com"
+SCENARIOS = ["zoho", "qase", "sheets"]
+
+
+def make_session():
+    """Чистая БД в памяти"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def measure(name, standin, run):
+    """Выполнить сценарий run() → число строк и собрать метрики"""
+    standin.reset_counts()
+    executor = get_http_executor()
+    executor.reset_metrics()
+
+    started = time.perf_counter()
+    rows = run()
+    elapsed = time.perf_counter() - started
+
+    retries = sum(m["retries"] for m in executor.get_metrics().values())
+    return {
+        "name": name,
+        "requests": standin.counts["total"],
+        "seconds": elapsed,
+        "rows": rows,
+        "rows_per_sec": rows / elapsed if elapsed else 0.0,
+        "retries": retries,
+    }
+
+
+# === Zoho ===
+
+
+def make_zoho_client(standin, env_dir, page_size, prefetch):
+    """ZohoAPI со своим zoho.env, направленный на стенд"""
+    env_path = os.path.join(env_dir, "zoho.env")
+    config = standin.config
+    with open(env_path, "w", encoding="utf-8") as file:
+        file.write(
+            "ZOHO_CLIENT_ID=standin\n"
+            "ZOHO_CLIENT_SECRET=standin\n"
+            "ZOHO_REFRESH_TOKEN=standin\n"
+            "ZOHO_ACCESS_TOKEN=standin\n"
+            f"{EXPIRES_AT_KEY}={int(time.time()) + 86400}\n"
+            f"ZOHO_PORTAL_NAME={config.portal}\n"
+            f"ZOHO_PROJECT_ID={config.project_id}\n"
+            f"ZOHO_API_URL={standin.url}\n"
+            f"ZOHO_PAGE_SIZE={page_size}\n"
+            f"ZOHO_PAGE_PREFETCH={prefetch}\n"
+        )
+    return ZohoAPI(env_path)
+
+
+def bench_zoho(standin, args):
+    session = make_session()
+    service = ZohoSyncService(session)
+    with tempfile.TemporaryDirectory() as env_dir:
+        service.zoho_client = make_zoho_client(
+            standin, env_dir, args.page_size, args.prefetch
+        )
+        # Свой кэш: повторная синхронизация берёт milestones из него
+        service.zoho_client.http_cache = HttpCache(os.path.join(env_dir, "http_cache.db"))
+        milestones = [m["name"] for m in standin.data.milestones]
+
+        def sync(full_resync):
+            rows = 0
+            for name in milestones:
+                stats = service.sync_tasks_by_milestone(name, full_resync=full_resync)
+                rows += sum(stats.get(key, 0) for key in ("new", "updated", "unchanged"))
+            return rows
+
+        results = [
+            measure("zoho-full", standin, lambda: sync(True)),
+            measure("zoho-incr", standin, lambda: sync(False)),
+        ]
+        service.zoho_client.http_cache.close()
+    session.close()
+    return results
+
+
+# === Qase ===
+
+
+def bench_qase(standin, args):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = HttpCache(os.path.join(cache_dir, "http_cache.db"))
+
+        def load_cases():
+            # Новый клиент, как при повторном открытии диалога импорта
+            client = QaseClient("standin-token", standin.config.qase_project)
+            client.base_url = f"{standin.url}/v1"
+            client.http_cache = cache
+            return len(client.get_cases())
+
+        results = [
+            measure("qase-cases", standin, load_cases),
+            measure("qase-cached", standin, load_cases),
+        ]
+        cache.close()
+    return results
+
+
+# === Google Sheets ===
+
+
+def standin_sheets_client(base_url):
+    """gspread-клиент, направленный на стенд (без учётной записи Google)"""
+
+    class StandInHTTPClient(ExecutorHTTPClient):
+        def request(self, method, endpoint, *args, **kwargs):
+            endpoint = endpoint.replace(SHEETS_API_URL, base_url, 1)
+            return super().request(method, endpoint, *args, **kwargs)
+
+    return gspread.Client(None, session=requests.Session(), http_client=StandInHTTPClient)
+
+
+def fill_database(session, items):
+    users = [User(name=f"User {i}", email=f"user{i}@standin.test") for i in range(20)]
+    session.add_all(users)
+    session.flush()
+
+    records = [
+        FunctionalItem(
+            functional_id=f"module{i % 10}.epic{i % 50}.feature{i}",
+            title=f"Feature {i}",
+            type="Feature",
+            module=f"Module {i % 10}",
+            is_crit=i % 7 == 0,
+            responsible_qa_id=users[i % len(users)].id,
+        )
+        for i in range(items)
+    ]
+    session.add_all(records)
+    session.flush()
+    session.add_all(
+        Relation(source_id=records[i].id, target_id=records[i + 1].id, type="functional")
+        for i in range(0, len(records) - 1, 2)
+    )
+    session.commit()
+
+
+def bench_sheets(standin, args):
+    session = make_session()
+    fill_database(session, args.items)
+
+    manifest_dir = tempfile.TemporaryDirectory()
+    try:
+        exporter = GoogleSheetsExporter("standin.json", session, manifest_dir=manifest_dir.name)
+        exporter.client = standin_sheets_client(standin.url)
+
+        def export(diff=False):
+            stats = exporter.export_all_tables("standin-spreadsheet", diff=diff)
+            return stats["functional_items"] + stats["users"] + stats["relations"]
+
+        results = [measure("sheets-export", standin, export)]
+
+        # Правка ~1% элементов и удаление одного (со связью)
+        items = session.query(FunctionalItem).order_by(FunctionalItem.id).all()
+        for item in items[::100]:
+            item.title = f"{item.title} (upd)"
+        session.query(Relation).filter(Relation.target_id == items[-1].id).delete()
+        session.delete(items[-1])
+        session.commit()
+        results.append(measure("sheets-diff", standin, lambda: export(diff=True)))
+    finally:
+        session.close()
+        manifest_dir.cleanup()
+    return results
+
+
+BENCHMARKS = {"zoho": bench_zoho, "qase": bench_qase, "sheets": bench_sheets}
+
+
+def run_benchmarks(config, args):
+    """Прогнать выбранные сценарии; у каждого свой стенд (свой лимит на хост)"""
+    results = []
+    for scenario in args.only:
+        reset_http_executor()
+        reset_token_managers()
+        if args.rate:
+            get_http_executor().rate = args.rate
+            get_http_executor().burst = args.rate
+        with IntegrationStandIn(config) as standin:
+            results.extend(BENCHMARKS[scenario](standin, args))
+    return results
+
+
+def print_report(results):
+    header = f"{'Сценарий':<16}{'Запросов':>10}{'Время, с':>11}{'Строк':>9}{'Строк/с':>11}{'Повторов':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['name']:<16}{r['requests']:>10}{r['seconds']:>11.2f}"
+            f"{r['rows']:>9}{r['rows_per_sec']:>11.1f}{r['retries']:>10}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Замер интеграций на локальном стенде")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Задержка ответа стенда")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов 429/503")
+    parser.add_argument("--server-page-size", type=int, default=200, help="Максимум записей на страницу Zoho")
+    parser.add_argument("--page-size", type=int, default=100, help="ZOHO_PAGE_SIZE клиента")
+    parser.add_argument("--prefetch", type=int, default=2, help="ZOHO_PAGE_PREFETCH клиента")
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--milestones", type=int, default=5)
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--items", type=int, default=500, help="Функциональных элементов для экспорта")
+    parser.add_argument("--rate", type=float, default=None, help="Запросов/с на хост (по умолчанию как в приложении)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", default=",".join(SCENARIOS), help="zoho,qase,sheets")
+    args = parser.parse_args(argv)
+    args.only = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = set(args.only) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Неизвестные сценарии: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # До первого запроса: иначе ZohoAPI.send_request настроит запись в logs/voluptas.log
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+    config = StandInConfig(
+        latency=args.latency_ms / 1000,
+        page_size=args.server_page_size,
+        error_rate=args.error_rate,
+        tasks=args.tasks,
+        milestones=args.milestones,
+        tasklists=args.milestones * 2,
+        cases=args.cases,
+        seed=args.seed,
+    )
+    print(
+        f"🧪 Стенд: задержка {args.latency_ms:g} мс, ошибки {args.error_rate:.0%}, "
+        f"задач {args.tasks}, кейсов {args.cases}, элементов {args.items}\n"
+    )
+    print_report(run_benchmarks(config, args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
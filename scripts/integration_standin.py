@@ -0,0 +1,653 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Локальный стенд вместо Zoho Projects, Qase.io и Google Sheets
+
+Отвечает на те запросы, которые делает VoluptAS, с настраиваемыми
+задержкой, размером страниц, долей ошибок (429/503) и объёмом данных.
+Нужен для замеров (scripts/benchmark_integrations.py) и ручной проверки
+синхронизации без обращения к боевым порталам.
+
+Использование:
+    python scripts/integration_standin.py [--port 8765] [--latency-ms 50]
+        [--tasks 5000] [--cases 2000] [--page-size 200] [--error-rate 0.05]
+
+Подключение приложения:
+    Zoho:   ZOHO_API_URL=http://127.0.0.1:8765 в credentials/zoho.env
+    Qase:   QASE_BASE_URL=http://127.0.0.1:8765/v1 в credentials/qase.env
+    Sheets: только из скрипта замеров (gspread ходит на sheets.googleapis.com)
+
+Маршруты:
+    Zoho:   /restapi/portal/<portal>/projects/[<id>/<entity>/] — projects,
+            tasks, tasklists, milestones, bugs (defects), users, tags,
+            bugs/defaultfields; /oauth/v2/token
+    Qase:   /v1/project, /v1/case, /v1/suite, /v1/run, /v1/result
+    Sheets: /v4/spreadsheets/<id> — метаданные, :batchUpdate, values
+            (get/update/append/clear, batchGet/batchUpdate/batchClear)
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+ZOHO_PREFIX = "/restapi/portal/"
+QASE_PREFIX = "/v1/"
+SHEETS_PREFIX = "/v4/spreadsheets"
+
+TASK_STATUSES = ["Open", "In Progress", "Closed", "On Hold"]
+BUG_STATUSES = ["Open", "Fixed", "Closed", "Reopen"]
+PRIORITIES = ["None", "Low", "Medium", "High"]
+QASE_MAX_LIMIT = 100
+
+
+@dataclass
+class StandInConfig:
+    """Параметры стенда"""
+
+    latency: float = 0.0  # задержка ответа, секунды
+    page_size: int = 200  # максимум записей на страницу Zoho (range)
+    error_rate: float = 0.0  # доля ответов 429/503
+    tasks: int = 1000
+    milestones: int = 5
+    tasklists: int = 10
+    bugs: int = 200
+    users: int = 20
+    cases: int = 500
+    suites: int = 10
+    seed: int = 42
+    portal: str = "standin"
+    project_id: str = "1"
+    qase_project: str = "DEMO"
+
+
+class StandInData:
+    """Детерминированный набор данных по seed"""
+
+    def __init__(self, config: StandInConfig):
+        rng = random.Random(config.seed)
+        base_time = int(datetime(2025, 1, 1).timestamp() * 1000)
+
+        self.users = [
+            {
+                "id": str(1000 + i),
+                "name": f"User {i}",
+                "email": f"user{i}@standin.test",
+                "role": "Employee",
+            }
+            for i in range(config.users)
+        ]
+        self.milestones = [
+            {"id": str(2000 + i), "name": f"Release {i + 1}", "status": "notcompleted"}
+            for i in range(config.milestones)
+        ]
+        self.tasklists = [
+            {
+                "id": str(3000 + i),
+                "name": f"Tasklist {i + 1}",
+                "milestone": self.milestones[i % len(self.milestones)]
+                if self.milestones
+                else {},
+            }
+            for i in range(config.tasklists)
+        ]
+
+        self.tasks = []
+        for i in range(config.tasks):
+            tasklist = self.tasklists[i % len(self.tasklists)] if self.tasklists else {}
+            owner = rng.choice(self.users) if self.users else {}
+            start = datetime(2025, 1, 1) + timedelta(days=rng.randrange(180))
+            self.tasks.append(
+                {
+                    "id": 10_000 + i,
+                    "id_string": str(10_000 + i),
+                    "project_id": config.project_id,
+                    "name": f"Task {i}: {rng.choice(['login', 'cart', 'search', 'profile'])}",
+                    "description": f"Описание задачи {i}",
+                    "status": {"name": rng.choice(TASK_STATUSES)},
+                    "priority": rng.choice(PRIORITIES),
+                    "created_time": start.strftime("%m-%d-%Y"),
+                    "start_date": start.strftime("%m-%d-%Y"),
+                    "end_date": (start + timedelta(days=14)).strftime("%m-%d-%Y"),
+                    "last_updated_time_long": base_time + i * 1000,
+                    "details": {
+                        "owners": [{"id": owner.get("id"), "name": owner.get("name")}]
+                    },
+                    "milestone_id": tasklist.get("milestone", {}).get("id", ""),
+                    "tasklist": {"id": tasklist.get("id"), "name": tasklist.get("name")},
+                    "tags": [{"name": rng.choice(["front", "back", "api"])}],
+                }
+            )
+
+        self.bugs = [
+            {
+                "id": 50_000 + i,
+                "title": f"Bug {i}",
+                "status": {"type": rng.choice(BUG_STATUSES)},
+                "severity": {"type": rng.choice(["Minor", "Major", "Critical"])},
+                "last_updated_time_long": base_time + i * 1000,
+            }
+            for i in range(config.bugs)
+        ]
+        self.tags = [
+            {"id": str(4000 + i), "name": name}
+            for i, name in enumerate(["front", "back", "api"])
+        ]
+
+        self.suites = [
+            {"id": i + 1, "title": f"Suite {i + 1}", "parent_id": None}
+            for i in range(config.suites)
+        ]
+        self.cases = [
+            {
+                "id": i + 1,
+                "title": f"Case {i + 1}",
+                "description": f"Проверка {i + 1}",
+                "suite_id": self.suites[i % len(self.suites)]["id"]
+                if self.suites
+                else None,
+                "severity": rng.randint(1, 5),
+                "priority": rng.randint(1, 3),
+                "automation": rng.choice([0, 2]),
+                "steps": [{"action": "step", "expected_result": "ok"}],
+            }
+            for i in range(config.cases)
+        ]
+        self.runs = []
+        self.results = []
+
+        # Таблицы Google: id → {"sheets": [properties], "values": {sheetId: rows}}
+        self.spreadsheets = {}
+
+
+class StandInResponse(Exception):
+    """Готовый ответ обработчика (статус и тело)"""
+
+    def __init__(self, status, payload=None, headers=None):
+        super().__init__(status)
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {}
+
+
+class IntegrationStandIn:
+    """HTTP-сервер стенда в фоновом потоке"""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or StandInConfig()
+        self.data = StandInData(self.config)
+        self.counts = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_counts(self):
+        with self._lock:
+            self.counts.clear()
+
+    # === Общая обработка ===
+
+    def handle(self, method, path, query, body):
+        """Ответ на запрос: (status, payload, headers)"""
+        service = _service(path)
+        with self._lock:
+            self.counts[service] += 1
+            self.counts["total"] += 1
+            roll = self._rng.random()
+
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        if roll < self.config.error_rate:
+            if roll < self.config.error_rate / 2:
+                return 429, {"error": "rate limit"}, {"Retry-After": "0"}
+            return 503, {"error": "unavailable"}, {}
+
+        try:
+            if service == "zoho":
+                payload = self._zoho(method, path[len(ZOHO_PREFIX):], query)
+            elif service == "zoho-oauth":
+                payload = {"access_token": "standin-token", "expires_in": 3600}
+            elif service == "qase":
+                payload = self._qase(method, path[len(QASE_PREFIX):], query, body)
+            elif service == "sheets":
+                payload = self._sheets(method, path[len(SHEETS_PREFIX):], query, body)
+            else:
+                raise StandInResponse(404, {"error": f"Неизвестный путь {path}"})
+        except StandInResponse as response:
+            return response.status, response.payload, response.headers
+        return 200, payload, {}
+
+    # === Zoho Projects ===
+
+    def _zoho(self, method, path, query):
+        parts = [part for part in path.split("/") if part]
+        # <portal>/projects/[<project_id>/<entity>[/<sub>]]
+        if len(parts) < 2 or parts[1] != "projects":
+            raise StandInResponse(404, {"error": "portal"})
+        if len(parts) == 2:
+            return {"projects": [{"id": self.config.project_id, "name": "Stand-in"}]}
+
+        entity = parts[3] if len(parts) > 3 else ""
+        if entity == "bugs" and parts[4:5] == ["defaultfields"]:
+            return {
+                "defaultfields": {
+                    "status_details": [
+                        {"id": str(i), "name": name}
+                        for i, name in enumerate(BUG_STATUSES)
+                    ]
+                }
+            }
+        if entity == "tags":
+            return {"tags": self.data.tags}
+
+        records = {
+            "tasks": self.data.tasks,
+            "tasklists": self.data.tasklists,
+            "milestones": self.data.milestones,
+            "bugs": self.data.bugs,
+            "defects": self.data.bugs,
+            "users": self.data.users,
+        }.get(entity)
+        if records is None:
+            raise StandInResponse(404, {"error": f"entity {entity}"})
+
+        records = _filter_zoho(records, query)
+        index = int(query.get("index", 1))
+        size = min(int(query.get("range", self.config.page_size)), self.config.page_size)
+        page = records[index - 1:index - 1 + size]
+        if not page:
+            # Zoho отвечает 204 за концом списка
+            raise StandInResponse(204)
+        return {entity: page}
+
+    # === Qase ===
+
+    def _qase(self, method, path, query, body):
+        parts = [part for part in path.split("/") if part]
+        kind = parts[0] if parts else ""
+        rest = parts[2:]
+
+        if kind == "project":
+            project = {"code": self.config.qase_project, "title": "Stand-in"}
+            if len(parts) > 1:
+                return _qase_result(project)
+            return _qase_page([project], query)
+
+        if kind == "case":
+            if rest:
+                return _qase_result(_find(self.data.cases, int(rest[0])))
+            if method == "POST":
+                case = dict(body or {}, id=len(self.data.cases) + 1)
+                self.data.cases.append(case)
+                return _qase_result({"id": case["id"]})
+            cases = self.data.cases
+            if query.get("suite_id"):
+                suite_id = int(query["suite_id"])
+                cases = [case for case in cases if case.get("suite_id") == suite_id]
+            return _qase_page(cases, query)
+
+        if kind == "suite":
+            return _qase_page(self.data.suites, query)
+
+        if kind == "run":
+            if method == "POST" and not rest:
+                run = dict(body or {}, id=len(self.data.runs) + 1, status=0)
+                self.data.runs.append(run)
+                return _qase_result({"id": run["id"]})
+            if rest:
+                run = _find(self.data.runs, int(rest[0]))
+                if rest[1:] == ["complete"]:
+                    run["status"] = 1
+                return _qase_result(run)
+            return _qase_page(self.data.runs, query)
+
+        if kind == "result":
+            if method == "POST" and rest:
+                run_id = int(rest[0])
+                items = (body or {}).get("results", []) if rest[1:] == ["bulk"] else [body or {}]
+                for item in items:
+                    self.data.results.append(dict(item, run_id=run_id))
+                return _qase_result({"run_id": run_id, "hash": f"h{len(self.data.results)}"})
+            return _qase_page(self.data.results, query)
+
+        raise StandInResponse(404, {"status": False, "errorMessage": f"{kind} not found"})
+
+    # === Google Sheets ===
+
+    def _sheets(self, method, path, query, body):
+        match = re.match(r"/([^/:]+)(.*)$", path)
+        if not match:
+            raise StandInResponse(404, {"error": {"code": 404, "message": "spreadsheet"}})
+        spreadsheet_id, rest = match.groups()
+        with self._lock:
+            book = self.data.spreadsheets.setdefault(spreadsheet_id, _new_book())
+            return self._sheets_call(spreadsheet_id, book, method, rest, query, body or {})
+
+    def _sheets_call(self, spreadsheet_id, book, method, rest, query, body):
+        if rest == "":
+            return {
+                "spreadsheetId": spreadsheet_id,
+                "properties": {
+                    "title": f"Stand-in {spreadsheet_id}",
+                    "locale": "ru_RU",
+                    "timeZone": "Europe/Moscow",
+                },
+                "sheets": [{"properties": props} for props in book["sheets"]],
+            }
+        if rest == ":batchUpdate":
+            replies = [self._sheets_request(book, request) for request in body.get("requests", [])]
+            return {"spreadsheetId": spreadsheet_id, "replies": replies}
+        if rest == "/values:batchGet":
+            ranges = query.get("ranges", [])
+            ranges = ranges if isinstance(ranges, list) else [ranges]
+            return {
+                "spreadsheetId": spreadsheet_id,
+                "valueRanges": [_get_values(book, name) for name in ranges],
+            }
+        if rest == "/values:batchUpdate":
+            for item in body.get("data", []):
+                _put_values(book, item["range"], item.get("values", []))
+            return {"spreadsheetId": spreadsheet_id, "totalUpdatedCells": 0}
+        if rest == "/values:batchClear":
+            for name in body.get("ranges", []):
+                _clear_values(book, name)
+            return {"spreadsheetId": spreadsheet_id, "clearedRanges": body.get("ranges", [])}
+
+        match = re.match(r"/values/(.+?)(:append|:clear)?$", rest)
+        if not match:
+            raise StandInResponse(404, {"error": {"code": 404, "message": rest}})
+        range_name, action = unquote(match.group(1)), match.group(2)
+        if action == ":append":
+            return {"spreadsheetId": spreadsheet_id, "updates": _append_values(book, range_name, body.get("values", []))}
+        if action == ":clear":
+            _clear_values(book, range_name)
+            return {"spreadsheetId": spreadsheet_id, "clearedRange": range_name}
+        if method == "PUT":
+            return dict(_put_values(book, range_name, body.get("values", [])), spreadsheetId=spreadsheet_id)
+        return _get_values(book, range_name)
+
+    def _sheets_request(self, book, request):
+        if "addSheet" in request:
+            props = dict(request["addSheet"].get("properties", {}))
+            props.setdefault("sheetId", max(p["sheetId"] for p in book["sheets"]) + 1 if book["sheets"] else 0)
+            props.setdefault("index", len(book["sheets"]))
+            props.setdefault("sheetType", "GRID")
+            grid = props.setdefault("gridProperties", {})
+            grid.setdefault("rowCount", 1000)
+            grid.setdefault("columnCount", 26)
+            book["sheets"].append(props)
+            book["values"][props["sheetId"]] = []
+            return {"addSheet": {"properties": props}}
+        if "deleteSheet" in request:
+            sheet_id = request["deleteSheet"]["sheetId"]
+            book["sheets"] = [p for p in book["sheets"] if p["sheetId"] != sheet_id]
+            book["values"].pop(sheet_id, None)
+        elif "insertDimension" in request:
+            dimension = request["insertDimension"]["range"]
+            if dimension.get("dimension", "ROWS") == "ROWS":
+                rows = book["values"].setdefault(dimension["sheetId"], [])
+                start, end = dimension["startIndex"], dimension["endIndex"]
+                rows[start:start] = [[] for _ in range(end - start)]
+                _sheet_props(book, sheet_id=dimension["sheetId"])["gridProperties"]["rowCount"] += end - start
+        elif "deleteDimension" in request:
+            dimension = request["deleteDimension"]["range"]
+            if dimension.get("dimension", "ROWS") == "ROWS":
+                rows = book["values"].setdefault(dimension["sheetId"], [])
+                start, end = dimension["startIndex"], dimension["endIndex"]
+                del rows[start:end]
+                _sheet_props(book, sheet_id=dimension["sheetId"])["gridProperties"]["rowCount"] -= end - start
+        elif "updateSheetProperties" in request:
+            update = request["updateSheetProperties"]["properties"]
+            props = _sheet_props(book, sheet_id=update["sheetId"])
+            props["gridProperties"].update(update.get("gridProperties", {}))
+        return {}
+
+
+# === Вспомогательные функции ===
+
+
+def _service(path):
+    if path.startswith(ZOHO_PREFIX):
+        return "zoho"
+    if path.startswith("/oauth/v2/token"):
+        return "zoho-oauth"
+    if path.startswith(QASE_PREFIX):
+        return "qase"
+    if path.startswith(SHEETS_PREFIX):
+        return "sheets"
+    return "unknown"
+
+
+def _filter_zoho(records, query):
+    if query.get("milestone_id"):
+        records = [r for r in records if str(r.get("milestone_id")) == str(query["milestone_id"])]
+    if query.get("tasklist_id"):
+        records = [r for r in records if str(r.get("tasklist", {}).get("id")) == str(query["tasklist_id"])]
+    if query.get("last_modified_time"):
+        since = int(query["last_modified_time"])
+        records = [r for r in records if r.get("last_updated_time_long", 0) > since]
+    return records
+
+
+def _find(records, record_id):
+    for record in records:
+        if record.get("id") == record_id:
+            return record
+    raise StandInResponse(404, {"status": False, "errorMessage": "Not found"})
+
+
+def _qase_result(result):
+    return {"status": True, "result": result}
+
+
+def _qase_page(records, query):
+    limit = min(int(query.get("limit", 10)), QASE_MAX_LIMIT)
+    offset = int(query.get("offset", 0))
+    entities = records[offset:offset + limit]
+    return _qase_result(
+        {"total": len(records), "filtered": len(records), "count": len(entities), "entities": entities}
+    )
+
+
+def _new_book():
+    props = {
+        "sheetId": 0,
+        "title": "Sheet1",
+        "index": 0,
+        "sheetType": "GRID",
+        "gridProperties": {"rowCount": 1000, "columnCount": 26},
+    }
+    return {"sheets": [props], "values": {0: []}}
+
+
+def _sheet_props(book, title=None, sheet_id=None):
+    for props in book["sheets"]:
+        if (title is None and sheet_id is None) or props["title"] == title or props["sheetId"] == sheet_id:
+            return props
+    raise StandInResponse(400, {"error": {"code": 400, "message": f"Unable to parse range: {title}"}})
+
+
+def _column_index(letters):
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _parse_range(book, range_name):
+    """'Лист'!A1:B2 → (props, row0, col0, row_end, col_end); концы — None (до конца)"""
+    title, _, cells = range_name.rpartition("!")
+    titles = {props["title"] for props in book["sheets"]}
+    if not title and (
+        cells.strip("'") in titles
+        or not re.fullmatch(r"[A-Za-z]*\d*(:[A-Za-z]*\d*)?", cells)
+    ):
+        # Имя листа без диапазона
+        title, cells = cells, ""
+    title = title.strip("'").replace("''", "'") if title else None
+    props = _sheet_props(book, title=title)
+
+    bounds = []
+    for cell in (cells.split(":") + [""])[:2] if cells else ["", ""]:
+        letters, digits = re.fullmatch(r"([A-Za-z]*)(\d*)", cell).groups()
+        bounds.append(
+            (int(digits) - 1 if digits else None, _column_index(letters) if letters else None)
+        )
+    (row0, col0), (row1, col1) = bounds
+    if ":" not in cells and cells:
+        # Одна ячейка
+        row1, col1 = row0, col0
+    return props, row0 or 0, col0 or 0, row1, col1
+
+
+def _get_values(book, range_name):
+    props, row0, col0, row1, col1 = _parse_range(book, range_name)
+    rows = book["values"].get(props["sheetId"], [])
+    rows = rows[row0:None if row1 is None else row1 + 1]
+    values = [row[col0:None if col1 is None else col1 + 1] for row in rows]
+    while values and not any(cell not in ("", None) for cell in values[-1]):
+        values.pop()
+    return {"range": range_name, "majorDimension": "ROWS", "values": values}
+
+
+def _put_values(book, range_name, values):
+    props, row0, col0, _, _ = _parse_range(book, range_name)
+    rows = book["values"].setdefault(props["sheetId"], [])
+    for offset, new_row in enumerate(values):
+        while len(rows) <= row0 + offset:
+            rows.append([])
+        row = rows[row0 + offset]
+        if len(row) < col0 + len(new_row):
+            row.extend([""] * (col0 + len(new_row) - len(row)))
+        row[col0:col0 + len(new_row)] = new_row
+    grid = props["gridProperties"]
+    grid["rowCount"] = max(grid["rowCount"], len(rows))
+    return {
+        "updatedRange": range_name,
+        "updatedRows": len(values),
+        "updatedColumns": max((len(row) for row in values), default=0),
+        "updatedCells": sum(len(row) for row in values),
+    }
+
+
+def _append_values(book, range_name, values):
+    props, _, col0, _, _ = _parse_range(book, range_name)
+    rows = book["values"].setdefault(props["sheetId"], [])
+    last = len(rows)
+    while last and not any(cell not in ("", None) for cell in rows[last - 1]):
+        last -= 1
+    column = chr(ord("A") + col0) if col0 < 26 else "A"
+    target = f"'{props['title']}'!{column}{last + 1}"
+    return _put_values(book, target, values)
+
+
+def _clear_values(book, range_name):
+    props, row0, col0, row1, col1 = _parse_range(book, range_name)
+    rows = book["values"].get(props["sheetId"], [])
+    for row in rows[row0:None if row1 is None else row1 + 1]:
+        end = len(row) if col1 is None else min(len(row), col1 + 1)
+        row[col0:end] = [""] * max(0, end - col0)
+
+
+def _make_handler(standin):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self):
+            parts = urlsplit(self.path)
+            query = {
+                key: values if len(values) > 1 else values[0]
+                for key, values in parse_qs(parts.query).items()
+            }
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            body = None
+            if raw:
+                content_type = self.headers.get("Content-Type", "")
+                if "json" in content_type:
+                    body = json.loads(raw)
+                else:
+                    body = {k: v[0] for k, v in parse_qs(raw.decode()).items()}
+
+            status, payload, headers = standin.handle(self.command, parts.path, query, body)
+            data = b"" if status == 204 or payload is None else json.dumps(payload).encode()
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            if data:
+                self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальный стенд Zoho / Qase / Google Sheets")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency=args.latency_ms / 1000,
+        page_size=args.page_size,
+        error_rate=args.error_rate,
+        tasks=args.tasks,
+        cases=args.cases,
+        seed=args.seed,
+    )
+    standin = IntegrationStandIn(config, port=args.port)
+    print(f"🧪 Стенд запущен: {standin.url} (Ctrl+C — остановить)")
+    print(f"   Zoho: ZOHO_API_URL={standin.url}, ZOHO_PORTAL_NAME={config.portal}, ZOHO_PROJECT_ID={config.project_id}")
+    print(f"   Qase: QASE_BASE_URL={standin.url}/v1, QASE_PROJECT_CODE={config.qase_project}")
+    try:
+        standin._server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nЗапросов обработано: {dict(standin.counts)}")
+        standin._server.server_close()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
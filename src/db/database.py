@@ -1,40 +1,58 @@
 ﻿import os
 from pathlib import Path
-from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine import Engine
 from src.models.project_config import ProjectManager
 from src.db.base import Base
+from src.db.engine_registry import get_engine_registry
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-CONFIG_DIR = PROJECT_ROOT / "data" / "config"
+# VOLUPTAS_CONFIG_DIR — другой каталог конфигурации (тесты, отдельные стенды)
+CONFIG_DIR = Path(os.getenv("VOLUPTAS_CONFIG_DIR", PROJECT_ROOT / "data" / "config"))
 project_manager = ProjectManager(CONFIG_DIR)
 
 
 # Получаем путь к БД текущего проекта
-def get_database_url():
+def get_database_path() -> Path:
+    # Если DatabaseManager уже подключён (MainWindow) — используем его БД
+    from src.db.database_manager import get_database_manager
+
+    db_manager = get_database_manager()
+    if db_manager.is_connected():
+        return db_manager.current_db_path
+
     current_project = project_manager.get_current_project()
     if not current_project:
         raise RuntimeError("Не выбран активный проект!")
-    db_path = current_project.database_path
-    return f"sqlite:///{db_path}"
+    return current_project.database_path
 
 
-def get_engine():
-    return create_engine(
-        get_database_url(), echo=False, connect_args={"check_same_thread": False}
-    )
+def get_database_profile():
+    """Профиль производительности SQLite текущей БД"""
+    from src.db.database_manager import get_database_manager
 
+    db_manager = get_database_manager()
+    if db_manager.is_connected():
+        return db_manager.current_profile
+
+    current_project = project_manager.get_current_project()
+    return current_project.performance if current_project else None
 
-def get_session_local():
-    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
+def get_database_url():
+    return f"sqlite:///{get_database_path()}"
 
-@event.listens_for(Engine, "connect")
-def set_sqlite_pragma(dbapi_conn, connection_record):
-    cursor = dbapi_conn.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+
+def get_engine() -> Engine:
+    """Engine текущей БД (берётся из реестра, не создаётся заново)"""
+    return get_engine_registry().get_engine(get_database_path(), get_database_profile())
+
+
+def get_session_local() -> sessionmaker:
+    """sessionmaker текущей БД (берётся из реестра)"""
+    return get_engine_registry().get_sessionmaker(
+        get_database_path(), get_database_profile()
+    )
 
 
 def get_db():
@@ -54,11 +72,17 @@ def init_db():
         relation,
         dictionary,
         zoho_task,
+        zoho_sync_state,
         report_template,
+        hierarchy,
     )
 
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
+
+    from src.db.search_index import ensure_search_index
+
+    ensure_search_index(engine)
     print(f"✅ База данных инициализирована: {get_database_url()}")
     print(
         f"   Таблицы: functional_items, users, functional_item_relations, dictionaries, zoho_tasks, report_templates"
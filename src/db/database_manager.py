@@ -6,10 +6,11 @@ DatabaseManager - Управление подключением к БД прое
 
 import logging
 from pathlib import Path
-from typing import Optional
-from sqlalchemy import create_engine, event
+from typing import Dict, Optional
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
+from src.db.engine_registry import get_engine_registry, read_effective_pragmas
+from src.models.project_config import DatabasePerformanceProfile
 
 logger = logging.getLogger(__name__)
 
@@ -21,42 +22,43 @@ class DatabaseManager:
         self.engine: Optional[Engine] = None
         self.SessionLocal: Optional[sessionmaker] = None
         self.current_db_path: Optional[Path] = None
+        self.current_profile: Optional[DatabasePerformanceProfile] = None
 
-    def connect_to_database(self, db_path: Path) -> bool:
+    def connect_to_database(
+        self, db_path: Path, profile: Optional[DatabasePerformanceProfile] = None
+    ) -> bool:
         """
         Подключение к БД проекта
 
         Args:
             db_path: Путь к БД проекта
+            profile: Профиль производительности SQLite (ProjectConfig.performance)
 
         Returns:
             True если успешно, False при ошибке
         """
         try:
-            # Закрываем предыдущее подключение если есть
-            if self.engine:
-                self.engine.dispose()
-                logger.info(f"Закрыто предыдущее подключение: {self.current_db_path}")
-
-            # Создаём новое подключение
-            DATABASE_URL = f"sqlite:///{db_path}"
-            self.engine = create_engine(
-                DATABASE_URL, echo=False, connect_args={"check_same_thread": False}
-            )
+            # Engine предыдущего проекта остаётся в реестре (LRU) —
+            # повторное переключение на него не создаёт новый пул
+            registry = get_engine_registry()
+            self.engine = registry.get_engine(db_path, profile)
+            self.SessionLocal = registry.get_sessionmaker(db_path)
 
-            # Включаем foreign keys для SQLite
-            @event.listens_for(self.engine, "connect")
-            def set_sqlite_pragma(dbapi_conn, connection_record):
-                cursor = dbapi_conn.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.close()
+            self.current_db_path = db_path
+            self.current_profile = registry.get_profile(db_path)
 
-            # Создаём sessionmaker
-            self.SessionLocal = sessionmaker(
-                autocommit=False, autoflush=False, bind=self.engine
-            )
+            # Старые БД: создаём closure table иерархии до первых изменений
+            from src.models.hierarchy import ensure_closure_table
 
-            self.current_db_path = db_path
+            try:
+                ensure_closure_table(self.engine)
+            except Exception as e:
+                logger.warning(f"Closure table иерархии не создана: {e}")
+
+            # Старые БД: полнотекстовый индекс создаётся здесь, не при поиске
+            from src.db.search_index import ensure_search_index
+
+            ensure_search_index(self.engine)
 
             logger.info(f"✅ Подключено к БД: {db_path}")
             return True
@@ -100,25 +102,45 @@ class DatabaseManager:
             relation,
             dictionary,
             zoho_task,
+            zoho_sync_state,
             report_template,
+            hierarchy,
         )
 
         Base.metadata.create_all(bind=self.engine)
 
+        from src.db.search_index import ensure_search_index
+
+        ensure_search_index(self.engine)
+
         logger.info(f"✅ БД инициализирована: {self.current_db_path}")
         logger.info(
             "   Таблицы: functional_items, users, functional_item_relations, "
-            "dictionaries, zoho_tasks, report_templates"
+            "dictionaries, zoho_tasks, zoho_sync_state, report_templates"
         )
 
+    def get_effective_pragmas(self) -> Dict[str, object]:
+        """
+        Фактические PRAGMA текущей БД (для окна настроек)
+
+        Raises:
+            RuntimeError: Если БД не подключена
+        """
+        if not self.engine:
+            raise RuntimeError(
+                "Engine не создан. Вызовите connect_to_database() сначала."
+            )
+        return read_effective_pragmas(self.engine)
+
     def close(self):
         """Закрыть текущее подключение"""
         if self.engine:
-            self.engine.dispose()
+            get_engine_registry().dispose(self.current_db_path)
             logger.info(f"Закрыто подключение к {self.current_db_path}")
             self.engine = None
             self.SessionLocal = None
             self.current_db_path = None
+            self.current_profile = None
 
     def is_connected(self) -> bool:
         """Проверка наличия активного подключения"""
@@ -0,0 +1,242 @@
+"""
+EngineRegistry - Реестр engine/sessionmaker по пути к БД
+
+Engine создаётся один раз на файл БД и переиспользуется всеми сессиями
+(database.SessionLocal, DatabaseManager). При переключении проектов
+редко используемые engine вытесняются (LRU) и закрываются.
+
+На каждое соединение применяется профиль производительности SQLite
+(WAL, mmap, cache_size, ...); при закрытии engine выполняется checkpoint WAL.
+"""
+
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from functools import partial
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.project_config import DatabasePerformanceProfile
+
+logger = logging.getLogger(__name__)
+
+# Сколько БД проектов держим открытыми одновременно
+DEFAULT_MAX_ENGINES = 4
+
+
+# Числовые значения PRAGMA -> имена (как в профиле)
+_SYNCHRONOUS_NAMES = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+_TEMP_STORE_NAMES = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+
+_Entry = namedtuple("_Entry", ["engine", "session_factory", "profile"])
+
+
+def set_sqlite_pragma(
+    dbapi_conn,
+    connection_record,
+    profile: Optional[DatabasePerformanceProfile] = None,
+):
+    """Включаем foreign keys и профиль производительности (на каждое соединение)"""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    if profile is not None:
+        for name, value in profile.pragmas():
+            cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def read_effective_pragmas(engine: Engine) -> Dict[str, object]:
+    """
+    Фактические значения PRAGMA на соединении engine
+
+    Returns:
+        {pragma: значение} — journal_mode/synchronous/temp_store в виде имён
+    """
+    names = [
+        "journal_mode",
+        "synchronous",
+        "mmap_size",
+        "cache_size",
+        "temp_store",
+        "busy_timeout",
+        "foreign_keys",
+    ]
+    with engine.connect() as conn:
+        values = {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names
+        }
+    values["journal_mode"] = str(values["journal_mode"]).upper()
+    values["synchronous"] = _SYNCHRONOUS_NAMES.get(
+        values["synchronous"], values["synchronous"]
+    )
+    values["temp_store"] = _TEMP_STORE_NAMES.get(
+        values["temp_store"], values["temp_store"]
+    )
+    return values
+
+
+def checkpoint_wal(engine: Engine, mode: str) -> bool:
+    """
+    Сбросить WAL в основной файл БД (PRAGMA wal_checkpoint)
+
+    Returns:
+        True если checkpoint выполнен
+    """
+    if mode == "NONE":
+        return False
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql(f"PRAGMA wal_checkpoint({mode})")
+        return True
+    except Exception as e:
+        logger.warning(f"Не удалось выполнить wal_checkpoint({mode}): {e}")
+        return False
+
+
+class EngineRegistry:
+    """Реестр engine/sessionmaker с LRU-вытеснением"""
+
+    def __init__(self, max_engines: int = DEFAULT_MAX_ENGINES):
+        self.max_engines = max_engines
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(db_path: Union[str, Path]) -> str:
+        return str(Path(db_path).resolve())
+
+    def _get_entry(
+        self,
+        db_path: Union[str, Path],
+        profile: Optional[DatabasePerformanceProfile] = None,
+    ) -> _Entry:
+        key = self._key(db_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if profile is None or profile == entry.profile:
+                    self._entries.move_to_end(key)
+                    return entry
+                # Профиль изменился — пересоздаём engine с новыми PRAGMA
+                del self._entries[key]
+                self._close_entry(entry)
+
+            profile = profile or DatabasePerformanceProfile()
+            engine = create_engine(
+                f"sqlite:///{key}",
+                echo=False,
+                connect_args={"check_same_thread": False},
+            )
+            # Копия профиля: изменения в настройках не влияют на открытый engine
+            profile = DatabasePerformanceProfile.from_dict(profile.to_dict())
+            event.listen(engine, "connect", partial(set_sqlite_pragma, profile=profile))
+            session_factory = sessionmaker(
+                autocommit=False, autoflush=False, bind=engine
+            )
+
+            entry = _Entry(engine, session_factory, profile)
+            self._entries[key] = entry
+            logger.info(f"Создан engine для БД: {key}")
+
+            self._evict()
+            return entry
+
+    @staticmethod
+    def _close_entry(entry: _Entry):
+        """Checkpoint WAL (по политике профиля) и закрытие пула"""
+        if entry.profile.journal_mode == "WAL":
+            checkpoint_wal(entry.engine, entry.profile.checkpoint_on_close)
+        entry.engine.dispose()
+
+    def _evict(self):
+        """Закрыть самые давно использованные engine сверх лимита"""
+        while len(self._entries) > self.max_engines:
+            key, entry = self._entries.popitem(last=False)
+            self._close_entry(entry)
+            logger.info(f"Engine вытеснен из реестра: {key}")
+
+    def get_engine(
+        self,
+        db_path: Union[str, Path],
+        profile: Optional[DatabasePerformanceProfile] = None,
+    ) -> Engine:
+        """
+        Получить (или создать) engine для БД
+
+        Args:
+            db_path: Путь к БД
+            profile: Профиль SQLite (None — профиль уже открытого engine
+                или профиль по умолчанию)
+        """
+        return self._get_entry(db_path, profile).engine
+
+    def get_sessionmaker(
+        self,
+        db_path: Union[str, Path],
+        profile: Optional[DatabasePerformanceProfile] = None,
+    ) -> sessionmaker:
+        """Получить (или создать) sessionmaker для БД"""
+        return self._get_entry(db_path, profile).session_factory
+
+    def get_profile(
+        self, db_path: Union[str, Path]
+    ) -> Optional[DatabasePerformanceProfile]:
+        """Профиль, с которым открыт engine (None если engine нет)"""
+        entry = self._entries.get(self._key(db_path))
+        return entry.profile if entry else None
+
+    def dispose(self, db_path: Union[str, Path]) -> bool:
+        """
+        Закрыть engine конкретной БД и убрать его из реестра
+
+        Returns:
+            True если engine был в реестре
+        """
+        key = self._key(db_path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._close_entry(entry)
+        logger.info(f"Engine закрыт: {key}")
+        return True
+
+    def dispose_all(self):
+        """Закрыть все engine (при выходе из приложения)"""
+        with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+        for key, entry in entries:
+            self._close_entry(entry)
+        if entries:
+            logger.info(f"Закрыто engine: {len(entries)}")
+
+    def __contains__(self, db_path: Union[str, Path]) -> bool:
+        return self._key(db_path) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Singleton instance для глобального использования
+_registry_instance: Optional[EngineRegistry] = None
+
+
+def get_engine_registry() -> EngineRegistry:
+    """Получить singleton instance EngineRegistry"""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = EngineRegistry()
+    return _registry_instance
+
+
+def reset_engine_registry():
+    """Сброс singleton (для тестирования)"""
+    global _registry_instance
+    if _registry_instance:
+        _registry_instance.dispose_all()
+    _registry_instance = None
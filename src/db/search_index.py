@@ -0,0 +1,206 @@
+"""
+Search Index - Полнотекстовый поиск по functional_items (SQLite FTS5)
+
+Виртуальная таблица functional_items_fts (external content) зеркалирует
+текстовые поля functional_items и синхронизируется триггерами.
+Создаётся при инициализации engine (init_db, DatabaseManager), поиск
+только проверяет её наличие и без индекса ищет через LIKE.
+"""
+
+import logging
+import re
+import weakref
+from typing import List, Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "functional_items_fts"
+
+# Индексируемые колонки и их веса для bm25 (совпадение в ID важнее описания)
+FTS_COLUMNS = {
+    "functional_id": 10.0,
+    "alias_tag": 8.0,
+    "title": 5.0,
+    "description": 1.0,
+    "tags": 2.0,
+    "aliases": 2.0,
+    "module": 1.0,
+    "epic": 1.0,
+    "feature": 1.0,
+}
+
+# Engine, для которых индекс уже проверен в этом процессе
+_ready_engines = weakref.WeakSet()
+# Engine, SQLite которых собран без FTS5 (DDL не повторяем)
+_unavailable_engines = weakref.WeakSet()
+
+
+def _ddl_statements() -> List[str]:
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{name}" for name in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{name}" for name in FTS_COLUMNS)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{columns}, content='functional_items', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON functional_items "
+        f"BEGIN INSERT INTO {FTS_TABLE}(rowid, {columns}) "
+        f"VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON functional_items "
+        f"BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON functional_items "
+        f"BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {FTS_TABLE}(rowid, {columns}) "
+        f"VALUES (new.id, {new_values}); END",
+    ]
+
+
+def ensure_search_index(bind: Engine) -> bool:
+    """
+    Создать FTS-таблицу и триггеры (если их нет) и заполнить индекс
+
+    Выполняется в отдельной транзакции engine, а не в сессии вызывающего.
+    Отсутствие FTS5 запоминается для engine; блокировка БД или ещё не
+    созданная functional_items — нет, следующий вызов повторит попытку.
+
+    Returns:
+        True если индекс доступен, False если SQLite собран без FTS5
+        или индекс пока не создан
+    """
+    if bind in _ready_engines:
+        return True
+    if bind in _unavailable_engines:
+        return False
+
+    try:
+        with bind.begin() as conn:
+            tables = set(
+                conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='table' AND name IN ('functional_items', ?)",
+                    (FTS_TABLE,),
+                ).scalars()
+            )
+            if "functional_items" not in tables:
+                return False
+            exists = FTS_TABLE in tables
+            for statement in _ddl_statements():
+                conn.exec_driver_sql(statement)
+            if not exists:
+                # Новый индекс — заполняем из существующих строк
+                conn.exec_driver_sql(
+                    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+                )
+                logger.info(f"✅ Создан полнотекстовый индекс: {bind.url}")
+    except Exception as e:
+        if "no such module" in str(e):
+            _unavailable_engines.add(bind)
+            logger.warning(f"FTS5 недоступен ({bind.url}), поиск через LIKE: {e}")
+        else:
+            logger.warning(f"FTS5 индекс не создан ({bind.url}): {e}")
+        return False
+
+    _ready_engines.add(bind)
+    return True
+
+
+def _index_ready(session: Session) -> bool:
+    """Индекс уже создан (в этом процессе или раньше) — без DDL и записи"""
+    bind = session.get_bind()
+    if bind in _ready_engines:
+        return True
+    if bind in _unavailable_engines:
+        return False
+    exists = (
+        session.connection()
+        .exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)
+        )
+        .scalar()
+    )
+    if exists:
+        _ready_engines.add(bind)
+    return bool(exists)
+
+
+def rebuild_search_index(bind: Engine):
+    """Полная перестройка индекса (после массовых правок в обход триггеров)"""
+    if ensure_search_index(bind):
+        with bind.begin() as conn:
+            conn.exec_driver_sql(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+            )
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    Пользовательский ввод -> выражение MATCH
+
+    Каждое слово ищется как префикс, слова объединяются по AND:
+    "splash cook" -> "splash"* AND "cook"*
+
+    Returns:
+        None если во вводе нет слов
+    """
+    tokens = re.findall(r"\w+", text, re.UNICODE)
+    if not tokens:
+        return None
+    return " AND ".join(f'"{token}"*' for token in tokens)
+
+
+def search_functional_items(
+    session: Session, text: str, limit: Optional[int] = None
+) -> Optional[List[int]]:
+    """
+    Поиск functional_items по тексту
+
+    Args:
+        session: Сессия БД
+        text: Строка поиска
+        limit: Максимум результатов (None — все)
+
+    Returns:
+        id элементов, отсортированные по релевантности (bm25);
+        None если строка поиска пустая (фильтр не нужен)
+    """
+    query = build_match_query(text)
+    if query is None:
+        return None
+
+    if _index_ready(session):
+        weights = ", ".join(str(weight) for weight in FTS_COLUMNS.values())
+        sql = (
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ? "
+            f"ORDER BY bm25({FTS_TABLE}, {weights})"
+        )
+        params = (query,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (query, limit)
+        connection: Connection = session.connection()
+        return [row[0] for row in connection.exec_driver_sql(sql, params)]
+
+    return _search_like(session, text, limit)
+
+
+def _search_like(session: Session, text: str, limit: Optional[int]) -> List[int]:
+    """Запасной поиск через LIKE (SQLite без FTS5), без ранжирования"""
+    from src.models import FunctionalItem
+
+    conditions = []
+    for token in re.findall(r"\w+", text, re.UNICODE):
+        pattern = f"%{token}%"
+        conditions.append(
+            or_(*(getattr(FunctionalItem, name).ilike(pattern) for name in FTS_COLUMNS))
+        )
+
+    stmt = select(FunctionalItem.id).where(*conditions).order_by(FunctionalItem.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return list(session.execute(stmt).scalars())
@@ -7,8 +7,8 @@ Google Sheets Integration - MATURE CODE
 ⚠️ MATURE CODE - проверенный код из продакшена
 """
 
-from .google_sheets_client import GoogleSheetsClient
+from .google_sheets_client import GoogleSheetsClient, SpreadsheetSession
 
-__all__ = ["GoogleSheetsClient"]
+__all__ = ["GoogleSheetsClient", "SpreadsheetSession"]
 
 # from .cli_runner import run_lighthouse
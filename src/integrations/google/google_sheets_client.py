@@ -11,10 +11,391 @@
 """
 
 import gspread
+import logging
 import numpy as np
-from typing import Dict, List, Optional, Any, Literal
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from gspread.exceptions import APIError, WorksheetNotFound
+from gspread.http_client import HTTPClient
+from gspread.utils import absolute_range_name
 from google.oauth2.service_account import Credentials
+from src.integrations.http_client import get_http_executor
+from src.integrations.google.sheet_diff import (
+    HEADER_ROWS,
+    RowDiff,
+    SheetManifest,
+    diff_rows,
+    index_sheet,
+    keyed_rows,
+    row_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorHTTPClient(HTTPClient):
+    """HTTP-клиент gspread через общий HttpExecutor (лимит частоты, повторы 429/5xx)"""
+
+    def request(
+        self,
+        method,
+        endpoint,
+        params=None,
+        data=None,
+        json=None,
+        files=None,
+        headers=None,
+    ):
+        response = get_http_executor().request(
+            self.session,
+            method,
+            endpoint,
+            json=json,
+            params=params,
+            data=data,
+            files=files,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        if response.ok:
+            return response
+        raise APIError(response)
+
+
+def authorize(credentials_path: str) -> gspread.Client:
+    """gspread-клиент сервисного аккаунта (запросы через общий HttpExecutor)"""
+    scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+    credentials = Credentials.from_service_account_file(credentials_path, scopes=scopes)
+    return gspread.authorize(credentials, http_client=ExecutorHTTPClient)
+
+
+def normalize_value(value: Any) -> Any:
+    """numpy-скаляры → int/float (остальное как есть)"""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    return value
+
+
+class SheetTable(NamedTuple):
+    """Лист в очереди записи SpreadsheetSession"""
+
+    headers: List[str]
+    rows: List[List[Any]]
+    # Ключевые колонки (пусто — лист без манифеста)
+    key: List[str]
+    diff: bool
+    unchanged: List[str]
+
+
+class SpreadsheetSession:
+    """
+    Пакетная запись нескольких листов одной таблицы:
+    - Один авторизованный клиент и один open_by_key
+    - Структура (новые листы, удаление строк, размер сетки) — один batch_update
+    - Полная перезапись: все листы очищаются одним values_batch_clear
+    - Все значения пишутся одним values_batch_update
+    - Diff-режим: только изменённые, новые и удалённые строки по манифесту
+      (без манифеста лист читается одним values_batch_get)
+    """
+
+    def __init__(
+        self,
+        client: gspread.Client,
+        spreadsheet_id: str,
+        manifest: Optional[SheetManifest] = None,
+    ):
+        self.client = client
+        self.spreadsheet = client.open_by_key(spreadsheet_id)
+        self.manifest = manifest or SheetManifest()
+        # Лист -> (id, строк, колонок)
+        self._grids = {
+            ws.title: (ws.id, ws.row_count, ws.col_count)
+            for ws in self.spreadsheet.worksheets()
+        }
+        self._tables: Dict[str, SheetTable] = {}
+
+    def manifest_entry(
+        self, sheet_name: str, headers: Sequence[str], key: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Запись манифеста листа (только если лист есть в таблице)"""
+        if sheet_name not in self._grids:
+            return None
+        return self.manifest.get(sheet_name, headers, key)
+
+    def add_table(
+        self,
+        sheet_name: str,
+        records: List[Dict[str, Any]],
+        headers: Optional[List[str]] = None,
+        key: Sequence[str] = (),
+        diff: bool = False,
+        unchanged: Iterable[str] = (),
+    ):
+        """
+        Поставить лист в очередь записи
+
+        Args:
+            sheet_name: Лист
+            records: Строки; пустой список при полной записи только очищает лист
+            headers: Заголовки (по умолчанию — ключи записей в порядке появления)
+            key: Ключевые колонки строки (для манифеста и diff)
+            diff: Писать только отличия от манифеста (нужен key)
+            unchanged: Ключи строк, не переданных в records, но оставшихся
+                на листе без изменений
+        """
+        if headers is None:
+            headers = list(
+                dict.fromkeys(column for record in records for column in record)
+            )
+        rows = [
+            [normalize_value(record.get(header, "")) for header in headers]
+            for record in records
+        ]
+        self.add_rows(sheet_name, headers, rows, key, diff, unchanged)
+
+    def add_rows(
+        self,
+        sheet_name: str,
+        headers: List[str],
+        rows: List[List[Any]],
+        key: Sequence[str] = (),
+        diff: bool = False,
+        unchanged: Iterable[str] = (),
+    ):
+        """
+        Поставить лист в очередь записи готовыми строками
+
+        Значения строк уже приведены (normalize_value) и идут в порядке headers;
+        остальные аргументы — как у add_table
+        """
+        if diff and not key:
+            raise ValueError("Diff-запись листа требует ключевые колонки")
+        self._tables[sheet_name] = SheetTable(
+            list(headers), rows, list(key), diff, list(unchanged)
+        )
+
+    def flush(self, exported_at: Optional[datetime] = None):
+        """
+        Записать очередь листов и сохранить манифест
+
+        Args:
+            exported_at: Момент снимка данных (для префильтра следующего diff)
+        """
+        if not self._tables:
+            return
+
+        diffs = self._diffs()
+        full = [name for name in self._tables if name not in diffs]
+
+        # До записи манифест листов уже неверен (строки удаляются первым
+        # запросом): при сбое следующий diff перечитает лист
+        self._invalidate_manifest()
+        self._apply_structure(diffs)
+
+        if full:
+            self.spreadsheet.values_batch_clear(
+                body={"ranges": [absolute_range_name(name) for name in full]}
+            )
+
+        data = []
+        for name in full:
+            table = self._tables[name]
+            if table.rows or table.headers:
+                data.append(
+                    {
+                        "range": absolute_range_name(name, "A1"),
+                        "values": [table.headers] + table.rows,
+                    }
+                )
+        for name, changes in diffs.items():
+            data.extend(
+                {"range": absolute_range_name(name, f"A{number}"), "values": [row]}
+                for number, row in changes.updates
+            )
+            if changes.appends:
+                data.append(
+                    {
+                        "range": absolute_range_name(name, f"A{changes.append_at}"),
+                        "values": changes.appends,
+                    }
+                )
+        if data:
+            self.spreadsheet.values_batch_update(
+                {"valueInputOption": "USER_ENTERED", "data": data}
+            )
+
+        self._update_manifest(diffs, exported_at)
+        self._tables.clear()
+
+    def _diffs(self) -> Dict[str, RowDiff]:
+        """Отличия diff-листов; листы без известного состояния пишутся целиком"""
+        states = {}
+        to_read = []
+        for name, table in self._tables.items():
+            if not table.diff or name not in self._grids:
+                continue
+            entry = self.manifest.get(name, table.headers, table.key)
+            if entry is not None:
+                states[name] = (entry["rows"], [], entry.get("row_count"))
+            else:
+                to_read.append(name)
+
+        if to_read:
+            logger.info(f"Манифест не найден, читаем листы: {to_read}")
+            response = self.spreadsheet.values_batch_get(
+                [absolute_range_name(name) for name in to_read],
+                params={"valueRenderOption": "UNFORMATTED_VALUE"},
+            )
+            for name, value_range in zip(to_read, response.get("valueRanges", [])):
+                table = self._tables[name]
+                state = index_sheet(
+                    value_range.get("values", []), table.headers, table.key
+                )
+                if state is not None:
+                    states[name] = state + (None,)
+
+        return {
+            name: diff_rows(
+                previous,
+                stray,
+                self._tables[name].headers,
+                self._tables[name].key,
+                self._tables[name].rows,
+                self._tables[name].unchanged,
+                row_count,
+            )
+            for name, (previous, stray, row_count) in states.items()
+        }
+
+    def _apply_structure(self, diffs: Dict[str, RowDiff]):
+        """Новые листы, удаление строк и расширение сетки — одним batch_update"""
+        requests = []
+        added = []
+        for name, table in self._tables.items():
+            changes = diffs.get(name)
+            rows = changes.row_count if changes else len(table.rows) + 1
+            rows = max(rows, 100)
+            cols = max(len(table.headers), 26)
+
+            grid = self._grids.get(name)
+            if grid is None:
+                added.append(name)
+                requests.append(
+                    {
+                        "addSheet": {
+                            "properties": {
+                                "title": name,
+                                "gridProperties": {
+                                    "rowCount": rows,
+                                    "columnCount": cols,
+                                },
+                            }
+                        }
+                    }
+                )
+                continue
+
+            sheet_id, row_count, col_count = grid
+            if changes:
+                requests.extend(
+                    {
+                        "deleteDimension": {
+                            "range": {
+                                "sheetId": sheet_id,
+                                "dimension": "ROWS",
+                                "startIndex": start - 1,
+                                "endIndex": end,
+                            }
+                        }
+                    }
+                    for start, end in _row_spans(changes.deletes)
+                )
+                row_count -= len(changes.deletes)
+            if rows > row_count or cols > col_count:
+                row_count, col_count = max(rows, row_count), max(cols, col_count)
+                requests.append(
+                    {
+                        "updateSheetProperties": {
+                            "properties": {
+                                "sheetId": sheet_id,
+                                "gridProperties": {
+                                    "rowCount": row_count,
+                                    "columnCount": col_count,
+                                },
+                            },
+                            "fields": "gridProperties(rowCount,columnCount)",
+                        }
+                    }
+                )
+            self._grids[name] = (sheet_id, row_count, col_count)
+
+        if not requests:
+            return
+        response = self.spreadsheet.batch_update({"requests": requests})
+        for reply in response.get("replies", []):
+            props = reply.get("addSheet", {}).get("properties")
+            if props:
+                grid = props["gridProperties"]
+                self._grids[props["title"]] = (
+                    props["sheetId"],
+                    grid["rowCount"],
+                    grid["columnCount"],
+                )
+
+    def _invalidate_manifest(self):
+        stale = [name for name in self._tables if name in self.manifest.sheets]
+        for name in stale:
+            self.manifest.discard(name)
+        if stale:
+            self.manifest.save()
+
+    def _update_manifest(
+        self, diffs: Dict[str, RowDiff], exported_at: Optional[datetime]
+    ):
+        for name, table in self._tables.items():
+            if not table.key:
+                self.manifest.discard(name)
+                continue
+            if name in diffs:
+                rows = diffs[name].rows
+                row_count = diffs[name].row_count
+            else:
+                # Каждая записанная строка, повторы ключа — с номером вхождения
+                rows = {
+                    row_key: [number, row_hash(row)]
+                    for number, (row_key, row) in enumerate(
+                        keyed_rows(table.headers, table.key, table.rows),
+                        start=HEADER_ROWS + 1,
+                    )
+                }
+                row_count = len(table.rows) + HEADER_ROWS
+            self.manifest.set(
+                name, table.headers, table.key, rows, exported_at, row_count
+            )
+        self.manifest.save()
+
+
+def _row_spans(deletes: List[int]) -> List[Tuple[int, int]]:
+    """Номера строк по убыванию -> диапазоны (первая, последняя) по убыванию"""
+    spans: List[List[int]] = []
+    for number in deletes:
+        if spans and spans[-1][0] == number + 1:
+            spans[-1][0] = number
+        else:
+            spans.append([number, number])
+    return [(start, end) for start, end in spans]
 
 
 class GoogleSheetsClient:
@@ -45,11 +426,7 @@ class GoogleSheetsClient:
         self._current_headers: List[str] = []  # Кэш заголовков
 
     def _authorize(self):
-        scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-        credentials = Credentials.from_service_account_file(
-            self.credentials_path, scopes=scopes
-        )
-        return gspread.authorize(credentials)
+        return authorize(self.credentials_path)
 
     def _open_or_create_sheet(self, sheet_name: str, clear_on_open: bool = True):
         try:
@@ -181,15 +558,7 @@ class GoogleSheetsClient:
         """
         Преобразует типы данных в поддерживаемые Google Sheets.
         """
-        normalized = {}
-        for k, v in data.items():
-            if isinstance(v, (np.integer, np.int32, np.int64)):
-                normalized[k] = int(v)
-            elif isinstance(v, (np.floating, np.float32, np.float64)):
-                normalized[k] = float(v)
-            else:
-                normalized[k] = v
-        return normalized
+        return {k: normalize_value(v) for k, v in data.items()}
 
     @staticmethod
     def prepare_link(anchor: str, url: str) -> str:
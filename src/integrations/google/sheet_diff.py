@@ -0,0 +1,280 @@
+"""
+Sheet Diff - дифференциальная запись листов Google Sheets
+
+Строки листа сравниваются по хешу, ключ строки — значения ключевых
+колонок (FuncID, ID и т.п.); повторы ключа различаются номером вхождения.
+Манифест последнего экспорта (заголовки,
+ключ -> номер строки и хеш) хранится локально, по файлу на spreadsheet,
+поэтому следующий diff не читает лист.
+
+Манифест описывает лист таким, каким его записал экспорт: если строки
+правили или пересортировали вручную — нужен полный экспорт.
+"""
+
+from bisect import bisect_left
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_DIR_NAME = "sheet_manifests"
+# Строка заголовков
+HEADER_ROWS = 1
+# Повтор ключа на листе: вторая строка с ключом K — "K\x1e2"
+REPEAT_SEPARATOR = "\x1e"
+
+
+def cell_text(value: Any) -> str:
+    """Текст ячейки для сравнения (1.0 и "1" совпадают: USER_ENTERED парсит числа)"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def row_hash(row: Sequence[Any]) -> str:
+    payload = json.dumps([cell_text(value) for value in row], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def key_getter(headers: Sequence[str], key: Sequence[str]):
+    """Функция строка -> ключ (несколько колонок склеиваются)"""
+    indexes = [list(headers).index(column) for column in key]
+    return lambda row: "\x1f".join(cell_text(row[index]) for index in indexes)
+
+
+def keyed_rows(
+    headers: Sequence[str], key: Sequence[str], rows: Iterable[List[Any]]
+) -> Iterator[Tuple[str, List[Any]]]:
+    """(ключ, строка) по порядку; повторный ключ получает номер вхождения"""
+    key_of = key_getter(headers, key)
+    seen: Dict[str, int] = {}
+    for row in rows:
+        row_key = key_of(row)
+        count = seen[row_key] = seen.get(row_key, 0) + 1
+        if count > 1:
+            row_key = f"{row_key}{REPEAT_SEPARATOR}{count}"
+        yield row_key, row
+
+
+def base_key(row_key: str) -> str:
+    """Ключ без номера вхождения"""
+    return row_key.split(REPEAT_SEPARATOR, 1)[0]
+
+
+class SheetManifest:
+    """Манифест экспортов одного spreadsheet: лист -> заголовки и строки"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: JSON-файл манифеста (None — только в памяти)
+        """
+        self.path = Path(path) if path else None
+        self.sheets: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Манифест {self.path} не прочитан: {e}")
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("sheets", {})
+
+    def get(
+        self, sheet_name: str, headers: Sequence[str], key: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Запись листа, если она снята с теми же заголовками и ключом"""
+        entry = self.sheets.get(sheet_name)
+        if entry and entry["headers"] == list(headers) and entry["key"] == list(key):
+            return entry
+        return None
+
+    def set(
+        self,
+        sheet_name: str,
+        headers: Sequence[str],
+        key: Sequence[str],
+        rows: Dict[str, List],
+        exported_at: Optional[datetime] = None,
+        row_count: Optional[int] = None,
+    ):
+        """row_count — строк на листе вместе с заголовком"""
+        self.sheets[sheet_name] = {
+            "headers": list(headers),
+            "key": list(key),
+            "rows": rows,
+            "row_count": row_count,
+            "exported_at": exported_at.isoformat() if exported_at else None,
+        }
+
+    def discard(self, sheet_name: str):
+        self.sheets.pop(sheet_name, None)
+
+    def save(self):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {"version": MANIFEST_VERSION, "sheets": self.sheets},
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+
+def manifest_path(directory: Path, spreadsheet_id: str) -> Path:
+    safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in spreadsheet_id)
+    return Path(directory) / f"{safe_id}.json"
+
+
+def index_sheet(
+    values: List[List[Any]], headers: Sequence[str], key: Sequence[str]
+) -> Optional[Tuple[Dict[str, List], List[int]]]:
+    """
+    Индекс прочитанного листа
+
+    Returns:
+        (ключ -> [номер строки, хеш], строки без ключа);
+        None — заголовки листа не совпадают с headers
+    """
+    width = len(headers)
+    if not values or [cell_text(v) for v in values[0][:width]] != list(headers):
+        return None
+
+    key_of = key_getter(headers, key)
+    numbers: List[int] = []
+    rows: List[List[Any]] = []
+    stray: List[int] = []
+    for number, row in enumerate(values[HEADER_ROWS:], start=HEADER_ROWS + 1):
+        row = list(row[:width]) + [""] * (width - len(row))
+        if key_of(row).strip("\x1f"):
+            numbers.append(number)
+            rows.append(row)
+        else:
+            stray.append(number)
+
+    previous = {
+        row_key: [number, row_hash(row)]
+        for number, (row_key, row) in zip(numbers, keyed_rows(headers, key, rows))
+    }
+    return previous, stray
+
+
+class RowDiff(NamedTuple):
+    """Изменения листа: номера строк — 1-based, как в A1-нотации"""
+
+    # Номера строк до удаления, по убыванию
+    deletes: List[int]
+    # (номер строки после удалений, значения)
+    updates: List[Tuple[int, List[Any]]]
+    appends: List[List[Any]]
+    # Первая строка для appends (после удалений)
+    append_at: int
+    # Новый манифест: ключ -> [номер строки, хеш]
+    rows: Dict[str, List]
+
+    @property
+    def row_count(self) -> int:
+        """Строк на листе после применения"""
+        return self.append_at - 1 + len(self.appends)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.deletes or self.updates or self.appends)
+
+
+def diff_rows(
+    previous: Dict[str, List],
+    stray: Iterable[int],
+    headers: Sequence[str],
+    key: Sequence[str],
+    rows: List[List[Any]],
+    unchanged: Iterable[str] = (),
+    row_count: Optional[int] = None,
+) -> RowDiff:
+    """
+    Сравнить строки с состоянием листа
+
+    Args:
+        previous: Ключ -> [номер строки, хеш] (из манифеста или index_sheet)
+        stray: Строки листа, которые нужно удалить в любом случае
+        headers: Заголовки (порядок колонок rows)
+        key: Ключевые колонки
+        rows: Новые строки (для unchanged-ключей можно не передавать)
+        unchanged: Ключи, заведомо не изменившиеся (префильтр по updated_at)
+        row_count: Строк на листе с заголовком (None — по previous и stray)
+
+    Returns:
+        RowDiff: Удаления, обновления на месте и добавления в конец
+    """
+    unchanged = set(unchanged)
+
+    current: Dict[str, Tuple[List[Any], str]] = {
+        row_key: (row, row_hash(row)) for row_key, row in keyed_rows(headers, key, rows)
+    }
+
+    deletes = sorted(
+        set(stray)
+        | {
+            number
+            for row_key, (number, _) in previous.items()
+            if row_key not in current and base_key(row_key) not in unchanged
+        },
+        reverse=True,
+    )
+    deleted = sorted(deletes)
+    deleted_set = set(deletes)
+
+    def shifted(number: int) -> int:
+        # Минус удалённые строки выше
+        return number - bisect_left(deleted, number)
+
+    new_rows: Dict[str, List] = {}
+    updates: List[Tuple[int, List[Any]]] = []
+    appends: List[List[Any]] = []
+    for row_key, (number, old_hash) in previous.items():
+        if number in deleted_set:
+            continue
+        entry = current.get(row_key)
+        if entry is not None and entry[1] != old_hash:
+            updates.append((shifted(number), entry[0]))
+            old_hash = entry[1]
+        new_rows[row_key] = [shifted(number), old_hash]
+
+    if row_count is None:
+        row_count = max(
+            [HEADER_ROWS] + [number for number, _ in previous.values()] + list(stray)
+        )
+    append_at = row_count - len(deletes) + 1
+    for row_key, (row, new_hash) in current.items():
+        if row_key not in previous:
+            new_rows[row_key] = [append_at + len(appends), new_hash]
+            appends.append(row)
+
+    updates.sort()
+    return RowDiff(deletes, updates, appends, append_at, new_rows)
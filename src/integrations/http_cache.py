@@ -0,0 +1,303 @@
+"""
+HTTP Cache - дисковый кэш ответов интеграций (SQLite)
+
+Справочные GET-запросы Zoho и Qase (tasklists, milestones, пользователи,
+теги, статусы багов, проекты/сюиты/кейсы Qase) кэшируются в файле
+http_cache.db рядом с БД текущего проекта и переживают перезапуск:
+- TTL задаёт вызывающий код (по endpoint)
+- Устаревшая запись с ETag/Last-Modified перепроверяется условным
+  запросом; 304 продлевает запись без передачи тела
+- Размер ограничен: при превышении вытесняются давно не читанные записи
+- invalidate(prefix) удаляет записи по префиксу URL (после изменений)
+
+Размер кэша переопределяется переменной окружения HTTP_CACHE_MAX_MB.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = "http_cache.db"
+DEFAULT_MAX_MB = 64
+# После вытеснения оставляем запас, чтобы не чистить на каждой записи
+EVICT_RATIO = 0.9
+# Кэшируются только успешные ответы (204 — пустой список/конец страниц Zoho)
+CACHEABLE_STATUSES = {200, 204}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_http_cache_accessed ON http_cache (accessed_at);
+CREATE INDEX IF NOT EXISTS ix_http_cache_url ON http_cache (url);
+"""
+
+
+def make_key(url: str, params: Optional[Dict] = None) -> str:
+    """Ключ записи: URL и отсортированные параметры (без заголовков/токенов)"""
+    if not params:
+        return url
+    items = sorted((str(k), str(v)) for k, v in params.items() if v is not None)
+    return f"{url}?{json.dumps(items, ensure_ascii=False)}"
+
+
+class HttpCache:
+    """Кэш HTTP-ответов в SQLite с TTL, перепроверкой и LRU-вытеснением"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path: Файл кэша (":memory:" — в памяти)
+            max_bytes: Предельный размер тел ответов (по умолчанию HTTP_CACHE_MAX_MB)
+            clock: Источник времени (для тестов)
+        """
+        if max_bytes is None:
+            max_bytes = int(
+                float(os.getenv("HTTP_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024
+            )
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.clock = clock
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Клиенты ходят из потоков предвыборки страниц — одно соединение под lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        url: str,
+        params: Optional[Dict],
+        ttl: float,
+        fetch: Callable[[Dict[str, str]], requests.Response],
+    ) -> requests.Response:
+        """
+        Ответ из кэша или от сервера
+
+        Args:
+            url: URL запроса
+            params: Параметры запроса (часть ключа)
+            ttl: Сколько секунд ответ считается свежим
+            fetch: fetch(conditional_headers) → ответ сервера; заголовки
+                If-None-Match/If-Modified-Since нужно добавить к запросу
+
+        Returns:
+            requests.Response: Свежая запись из кэша, подтверждённая 304 запись
+            или ответ сервера (успешный сохраняется в кэш)
+        """
+        key = make_key(url, params)
+        entry = self._get(key)
+        now = self.clock()
+        if entry and entry["expires_at"] > now:
+            logger.debug(f"Cache hit: {key}")
+            return self._response(url, entry)
+
+        conditional = {}
+        if entry and entry["etag"]:
+            conditional["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            conditional["If-Modified-Since"] = entry["last_modified"]
+
+        response = fetch(conditional)
+        if response.status_code == 304 and entry:
+            logger.debug(f"Cache revalidated: {key}")
+            self._touch(key, now + ttl)
+            return self._response(url, entry)
+        if response.status_code in CACHEABLE_STATUSES:
+            self.put(key, url, response, ttl)
+        return response
+
+    def put(self, key: str, url: str, response: requests.Response, ttl: float):
+        """Сохранить ответ на ttl секунд"""
+        body = response.content or b""
+        now = self.clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (key, url, status, body, "
+                "content_type, etag, last_modified, stored_at, expires_at, "
+                "accessed_at, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    response.status_code,
+                    body,
+                    response.headers.get("Content-Type"),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now + ttl,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def invalidate(self, prefix: str = "") -> int:
+        """
+        Удалить записи, URL которых начинается с prefix ("" — все)
+
+        Returns:
+            int: Число удалённых записей
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM http_cache WHERE substr(url, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+            self._conn.commit()
+        if cursor.rowcount:
+            logger.debug(f"Cache invalidated: {prefix or '*'} ({cursor.rowcount})")
+        return cursor.rowcount
+
+    def clear(self):
+        """Очистить кэш"""
+        self.invalidate()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Число записей и суммарный размер тел"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache"
+            ).fetchone()
+        return {"entries": entries, "bytes": size}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, body, content_type, etag, last_modified, "
+                "expires_at FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE http_cache SET accessed_at = ? WHERE key = ?",
+                (self.clock(), key),
+            )
+            self._conn.commit()
+        status, body, content_type, etag, last_modified, expires_at = row
+        return {
+            "status": status,
+            "body": body,
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires_at": expires_at,
+        }
+
+    def _touch(self, key: str, expires_at: float):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                (expires_at, self.clock(), key),
+            )
+            self._conn.commit()
+
+    def _evict(self):
+        """Вытеснить давно не читанные записи сверх max_bytes (под lock)"""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM http_cache"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        target = total - int(self.max_bytes * EVICT_RATIO)
+        freed = 0
+        keys = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM http_cache ORDER BY accessed_at"
+        ):
+            keys.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self._conn.executemany("DELETE FROM http_cache WHERE key = ?", keys)
+        logger.debug(f"Cache evicted {len(keys)} записей ({freed} байт)")
+
+    @staticmethod
+    def _response(url: str, entry: Dict) -> requests.Response:
+        """requests.Response из записи кэша"""
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response._content = entry["body"]
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({"X-Cache": "HIT"})
+        if entry["content_type"]:
+            response.headers["Content-Type"] = entry["content_type"]
+        return response
+
+
+def default_cache_path() -> Path:
+    """Файл кэша рядом с БД текущего проекта"""
+    from src.db.database import get_database_path
+
+    return Path(get_database_path()).parent / CACHE_FILE_NAME
+
+
+# Кэши по пути к файлу (по одному на проект)
+_http_caches: Dict[str, HttpCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(path: Union[str, Path, None] = None) -> Optional[HttpCache]:
+    """
+    Получить кэш проекта
+
+    Args:
+        path: Файл кэша (по умолчанию — рядом с БД текущего проекта)
+
+    Returns:
+        HttpCache | None: None, если проект не выбран (запросы идут без кэша)
+    """
+    if path is None:
+        try:
+            path = default_cache_path()
+        except Exception as e:
+            logger.debug(f"HTTP-кэш недоступен: {e}")
+            return None
+    key = str(Path(path).resolve()) if str(path) != ":memory:" else str(path)
+    with _caches_lock:
+        cache = _http_caches.get(key)
+        if cache is None:
+            cache = _http_caches[key] = HttpCache(path)
+        return cache
+
+
+def reset_http_caches():
+    """Закрыть кэши (для тестирования и при смене проекта)"""
+    with _caches_lock:
+        for cache in _http_caches.values():
+            cache.close()
+        _http_caches.clear()
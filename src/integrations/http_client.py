@@ -0,0 +1,292 @@
+"""
+HTTP Executor - общий слой исходящих HTTP-запросов интеграций
+
+Через него ходят Zoho, Qase и gspread:
+- Token bucket на хост: не больше rate запросов в секунду (burst — запас)
+- Повтор 429/5xx и сетевых ошибок с экспоненциальной задержкой и jitter
+- Retry-After из ответа сервера имеет приоритет над расчётной задержкой
+- Метрики по хостам: число вызовов, повторов, ошибок, время ответа и ожидания
+
+Настройки по умолчанию переопределяются переменными окружения
+HTTP_RATE_LIMIT, HTTP_RATE_BURST, HTTP_MAX_RETRIES.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Запросов в секунду на хост и размер всплеска
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_RETRIES = 4
+# Экспоненциальная задержка: base * 2**attempt, не больше BACKOFF_MAX
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+# Retry-After больше этого значения не ждём — возвращаем ответ как есть
+MAX_RETRY_AFTER = 120.0
+DEFAULT_TIMEOUT = 30
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Для неидемпотентных методов повторяем только ответы "запрос не обработан"
+UNPROCESSED_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class TokenBucket:
+    """Token bucket: rate токенов в секунду, не больше capacity в запасе"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Занять токен
+
+        Returns:
+            float: Сколько секунд подождать до запроса (0 — можно сразу).
+            Токен резервируется сразу, поэтому параллельные потоки
+            выстраиваются в очередь, а не будят друг друга.
+        """
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Retry-After в секундах (число секунд или HTTP-дата)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment is None:
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, moment.timestamp() - now)
+
+
+class HttpExecutor:
+    """Выполнение запросов с ограничением частоты и повторами"""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ):
+        """
+        Args:
+            rate: Запросов в секунду на хост (по умолчанию HTTP_RATE_LIMIT)
+            burst: Размер всплеска (по умолчанию HTTP_RATE_BURST)
+            max_retries: Повторов на запрос (по умолчанию HTTP_MAX_RETRIES)
+            backoff_base, backoff_max: Параметры экспоненциальной задержки
+            clock, sleep, jitter: Время, ожидание и случайность (для тестов)
+        """
+        self.rate = rate or float(os.getenv("HTTP_RATE_LIMIT", DEFAULT_RATE))
+        self.burst = burst or float(os.getenv("HTTP_RATE_BURST", DEFAULT_BURST))
+        if max_retries is None:
+            max_retries = int(os.getenv("HTTP_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.sleep = sleep
+        self.jitter = jitter
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._limits: Dict[str, tuple] = {}
+        self._metrics: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def configure_host(self, host: str, rate: float, burst: Optional[float] = None):
+        """Отдельный лимит для хоста (например, по квоте API)"""
+        with self._lock:
+            self._limits[host] = (rate, burst or rate)
+            self._buckets.pop(host, None)
+
+    def request(self, session, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Выполнить запрос через session.request с троттлингом и повторами
+
+        Args:
+            session: requests.Session (или модуль requests)
+            method: HTTP-метод
+            url: URL запроса
+            **kwargs: Аргументы session.request (timeout по умолчанию 30 с)
+
+        Returns:
+            requests.Response: Последний ответ (после исчерпания повторов —
+            ответ с ошибкой, статус проверяет вызывающий код)
+
+        Raises:
+            requests.RequestException: Сетевая ошибка после всех повторов
+        """
+        method = method.upper()
+        host = urlsplit(url).netloc
+        bucket = self._bucket(host)
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        # Файловые потоки при повторе уже прочитаны
+        retries = 0 if kwargs.get("files") else self.max_retries
+        idempotent = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            wait = bucket.reserve()
+            if wait:
+                self._record(host, wait=wait)
+                self.sleep(wait)
+
+            started = self.clock()
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(host, elapsed=self.clock() - started, error=True)
+                if attempt >= retries or not idempotent:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"⚠️ {method} {host}: {e.__class__.__name__}, "
+                    f"повтор через {delay:.1f} с"
+                )
+            else:
+                elapsed = self.clock() - started
+                status = response.status_code
+                delay = self._retry_delay(response, attempt, retries, idempotent)
+                self._record(
+                    host, elapsed=elapsed, error=status >= 400 and delay is None
+                )
+                logger.debug(f"{method} {url} → {status} за {elapsed:.3f} с")
+                if delay is None:
+                    return response
+                logger.warning(
+                    f"⚠️ {method} {host}: {status}, повтор через {delay:.1f} с"
+                )
+
+            attempt += 1
+            self._record(host, retry=True, wait=delay)
+            self.sleep(delay)
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Метрики по хостам: calls, retries, errors, total_time, max_time, wait_time"""
+        with self._lock:
+            return {host: dict(values) for host, values in self._metrics.items()}
+
+    def reset_metrics(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._limits.get(host, (self.rate, self.burst))
+                bucket = self._buckets[host] = TokenBucket(rate, burst, self.clock)
+            return bucket
+
+    def _retry_delay(
+        self, response, attempt: int, retries: int, idempotent: bool
+    ) -> Optional[float]:
+        """Задержка перед повтором или None, если ответ окончательный"""
+        status = response.status_code
+        if status not in RETRY_STATUSES or attempt >= retries:
+            return None
+        if not idempotent and status not in UNPROCESSED_STATUSES:
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self._backoff(attempt)
+        if retry_after > MAX_RETRY_AFTER:
+            return None
+        return retry_after
+
+    def _backoff(self, attempt: int) -> float:
+        """Экспоненциальная задержка с full jitter"""
+        return min(self.backoff_max, self.backoff_base * 2**attempt) * self.jitter()
+
+    def _record(
+        self,
+        host: str,
+        elapsed: Optional[float] = None,
+        wait: float = 0.0,
+        retry: bool = False,
+        error: bool = False,
+    ):
+        with self._lock:
+            metrics = self._metrics.setdefault(
+                host,
+                {
+                    "calls": 0,
+                    "retries": 0,
+                    "errors": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                    "wait_time": 0.0,
+                },
+            )
+            if elapsed is not None:
+                metrics["calls"] += 1
+                metrics["total_time"] += elapsed
+                metrics["max_time"] = max(metrics["max_time"], elapsed)
+            metrics["retries"] += int(retry)
+            metrics["errors"] += int(error)
+            metrics["wait_time"] += wait
+
+
+# Общий исполнитель процесса (лимиты на хост действуют для всех клиентов)
+_http_executor: Optional[HttpExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_http_executor() -> HttpExecutor:
+    """Получить общий HttpExecutor"""
+    global _http_executor
+    with _executor_lock:
+        if _http_executor is None:
+            _http_executor = HttpExecutor()
+        return _http_executor
+
+
+def reset_http_executor():
+    """Сброс исполнителя (для тестирования)"""
+    global _http_executor
+    with _executor_lock:
+        _http_executor = None
@@ -0,0 +1,81 @@
+"""
+Постраничная выборка списков Qase.io
+
+Списки Qase отдаются страницами limit/offset (limit не больше 100), ответ
+содержит total/filtered. По первой странице вычисляется число страниц,
+остальные запрашиваются параллельно (не больше concurrency одновременно)
+и отдаются по порядку — по мере поступления.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, NamedTuple
+
+# Максимальный limit в API Qase
+MAX_LIMIT = 100
+DEFAULT_CONCURRENCY = 4
+
+
+class QasePage(NamedTuple):
+    """Страница списка Qase"""
+
+    entities: List[Dict]
+    offset: int
+    total: int
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], Dict],
+    limit: int = MAX_LIMIT,
+    offset: int = 0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Iterator[QasePage]:
+    """
+    Постранично выбрать список Qase
+
+    Args:
+        fetch_page: fetch_page(limit, offset) → поле result ответа Qase
+            ({"total", "filtered", "count", "entities"})
+        limit: Размер страницы (не больше MAX_LIMIT)
+        offset: Смещение первой страницы
+        concurrency: Сколько страниц запрашивать одновременно
+
+    Yields:
+        QasePage: Страницы по порядку offset; total — число записей
+        с учётом фильтров
+
+    Ранний выход из генератора отменяет ещё не начатые запросы.
+    """
+    limit = max(1, min(limit, MAX_LIMIT))
+    first = fetch_page(limit, offset)
+    total = first.get("filtered", first.get("total", 0)) or 0
+    entities = first.get("entities", [])
+    yield QasePage(entities, offset, total)
+    if len(entities) < limit:
+        return
+
+    offsets = iter(range(offset + limit, total, limit))
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    pending = deque()
+    try:
+        for page_offset in offsets:
+            pending.append(
+                (page_offset, executor.submit(fetch_page, limit, page_offset))
+            )
+            if len(pending) >= concurrency:
+                break
+
+        while pending:
+            page_offset, future = pending.popleft()
+            entities = future.result().get("entities", [])
+            # Держим в работе до concurrency запросов
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(
+                    (next_offset, executor.submit(fetch_page, limit, next_offset))
+                )
+            yield QasePage(entities, page_offset, total)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
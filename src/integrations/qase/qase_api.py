@@ -7,11 +7,17 @@ API Docs: https://developers.qase.io/
 
 import logging
 import requests
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import Iterator, List, Dict, Optional
+
+from src.integrations.http_cache import HttpCache, get_http_cache
+from src.integrations.http_client import get_http_executor
+from src.integrations.qase.paginator import DEFAULT_CONCURRENCY, QasePage, iter_pages
 
 logger = logging.getLogger(__name__)
 
+# TTL дискового кэша списков по первому сегменту пути, секунды
+CACHE_TTLS = {"project": 24 * 3600, "suite": 3600, "case": 3600}
+
 
 class QaseClient:
     """Клиент для работы с Qase.io API"""
@@ -34,29 +40,81 @@ class QaseClient:
         self.project_code = project_code
         self.base_url = "https://api.qase.io/v1"
         self.headers = {"Token": self.api_token, "Content-Type": "application/json"}
+        self.session = requests.Session()
+        # Сколько страниц списка запрашивать одновременно
+        self.page_concurrency = DEFAULT_CONCURRENCY
 
-        # Кэш для ответов (TTL: 1 час)
-        self._cache = {}
-        self._cache_ttl = 3600  # секунды
+        # Дисковый кэш списков (None — кэш текущего проекта)
+        self.http_cache: Optional[HttpCache] = None
 
         logger.info(f"QaseClient инициализирован для проекта: {project_code}")
 
-    def _get_cached(self, key: str) -> Optional[any]:
-        """Получить значение из кэша если оно ещё актуально"""
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            if datetime.now().timestamp() - timestamp < self._cache_ttl:
-                logger.debug(f"Cache hit: {key}")
-                return value
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Запрос через общий HttpExecutor (лимит частоты, повторы 429/5xx)"""
+        return get_http_executor().request(self.session, method, url, **kwargs)
+
+    def get_cache(self) -> Optional[HttpCache]:
+        """Дисковый кэш ответов (свой или кэш текущего проекта)"""
+        return self.http_cache or get_http_cache()
+
+    def invalidate_cache(self, path: str = "") -> int:
+        """
+        Сбросить кэшированные списки
+
+        Args:
+            path: Префикс пути относительно base_url (например: "case/SAN");
+                "" — все ответы Qase
+
+        Returns:
+            int: Число удалённых записей
+        """
+        cache = self.get_cache()
+        if cache is None:
+            return 0
+        return cache.invalidate(f"{self.base_url}/{path}")
+
+    def iter_pages(
+        self, path: str, params: Optional[Dict] = None
+    ) -> Iterator[QasePage]:
+        """
+        Постранично получить список (страницы после первой — параллельно)
+
+        Страницы кэшируются на диске на CACHE_TTLS[первый сегмент пути].
+
+        Args:
+            path: Путь списка относительно base_url (например: "case/SAN")
+            params: Фильтры запроса
+
+        Returns:
+            Iterator[QasePage]: Страницы по порядку
+
+        Raises:
+            requests.HTTPError: При ошибке API
+        """
+        url = f"{self.base_url}/{path}"
+        cache = self.get_cache()
+        ttl = CACHE_TTLS.get(path.split("/")[0])
+
+        def fetch_page(limit: int, offset: int) -> Dict:
+            page_params = dict(params or {}, limit=limit, offset=offset)
+
+            def fetch(conditional: Dict[str, str]) -> requests.Response:
+                return self._request(
+                    "GET",
+                    url,
+                    headers={**self.headers, **conditional},
+                    params=page_params,
+                    timeout=10,
+                )
+
+            if cache is None or not ttl:
+                response = fetch({})
             else:
-                del self._cache[key]
-                logger.debug(f"Cache expired: {key}")
-        return None
+                response = cache.send(url, page_params, ttl, fetch)
+            response.raise_for_status()
+            return response.json().get("result", {})
 
-    def _set_cache(self, key: str, value: any):
-        """Установить значение в кэш"""
-        self._cache[key] = (value, datetime.now().timestamp())
-        logger.debug(f"Cache set: {key}")
+        return iter_pages(fetch_page, concurrency=self.page_concurrency)
 
     def get_projects(self) -> List[Dict]:
         """
@@ -69,19 +127,11 @@ class QaseClient:
             requests.HTTPError: При ошибке API
         """
         try:
-            cache_key = "projects"
-            cached = self._get_cached(cache_key)
-            if cached:
-                return cached
-
-            response = requests.get(
-                f"{self.base_url}/project", headers=self.headers, timeout=10
-            )
-            response.raise_for_status()
-
-            projects = response.json().get("result", [])
-            self._set_cache(cache_key, projects)
-
+            projects = [
+                project
+                for page in self.iter_pages("project")
+                for project in page.entities
+            ]
             logger.info(f"Получено {len(projects)} проектов из Qase")
             return projects
 
@@ -105,21 +155,11 @@ class QaseClient:
         project_code = project_code or self.project_code
 
         try:
-            cache_key = f"suites_{project_code}"
-            cached = self._get_cached(cache_key)
-            if cached:
-                return cached
-
-            response = requests.get(
-                f"{self.base_url}/suite/{project_code}",
-                headers=self.headers,
-                timeout=10,
-            )
-            response.raise_for_status()
-
-            suites = response.json().get("result", [])
-            self._set_cache(cache_key, suites)
-
+            suites = [
+                suite
+                for page in self.iter_pages(f"suite/{project_code}")
+                for suite in page.entities
+            ]
             logger.info(f"Получено {len(suites)} сюит из проекта {project_code}")
             return suites
 
@@ -127,6 +167,26 @@ class QaseClient:
             logger.error(f"Ошибка при получении сюит: {e}")
             raise
 
+    def iter_cases(
+        self, project_code: Optional[str] = None, suite_id: Optional[int] = None
+    ) -> Iterator[QasePage]:
+        """
+        Постранично получить тест-кейсы (по мере поступления страниц)
+
+        Args:
+            project_code: Код проекта (если None, используется self.project_code)
+            suite_id: Фильтр по ID сюиты (опционально)
+
+        Returns:
+            Iterator[QasePage]: Страницы кейсов; total — всего кейсов
+
+        Raises:
+            requests.HTTPError: При ошибке API
+        """
+        project_code = project_code or self.project_code
+        params = {"suite_id": suite_id} if suite_id else {}
+        return self.iter_pages(f"case/{project_code}", params)
+
     def get_cases(
         self, project_code: Optional[str] = None, suite_id: Optional[int] = None
     ) -> List[Dict]:
@@ -146,26 +206,11 @@ class QaseClient:
         project_code = project_code or self.project_code
 
         try:
-            params = {}
-            if suite_id:
-                params["suite_id"] = suite_id
-
-            cache_key = f"cases_{project_code}_{suite_id}"
-            cached = self._get_cached(cache_key)
-            if cached:
-                return cached
-
-            response = requests.get(
-                f"{self.base_url}/case/{project_code}",
-                headers=self.headers,
-                params=params,
-                timeout=10,
-            )
-            response.raise_for_status()
-
-            cases = response.json().get("result", [])
-            self._set_cache(cache_key, cases)
-
+            cases = [
+                case
+                for page in self.iter_cases(project_code, suite_id)
+                for case in page.entities
+            ]
             suite_filter = f" (suite: {suite_id})" if suite_id else ""
             logger.info(f"Получено {len(cases)} кейсов из {project_code}{suite_filter}")
             return cases
@@ -204,7 +249,8 @@ class QaseClient:
                 data["suite_id"] = suite_id
             data.update(kwargs)
 
-            response = requests.post(
+            response = self._request(
+                "POST",
                 f"{self.base_url}/case/{project_code}",
                 headers=self.headers,
                 json=data,
@@ -212,6 +258,7 @@ class QaseClient:
             )
             response.raise_for_status()
 
+            self.invalidate_cache(f"case/{project_code}")
             result = response.json().get("result", {})
             logger.info(f"Создан кейс: {title} (ID: {result.get('id')})")
             return result
@@ -240,7 +287,8 @@ class QaseClient:
         project_code = project_code or self.project_code
 
         try:
-            response = requests.patch(
+            response = self._request(
+                "PATCH",
                 f"{self.base_url}/case/{project_code}/{case_id}",
                 headers=self.headers,
                 json=kwargs,
@@ -248,6 +296,7 @@ class QaseClient:
             )
             response.raise_for_status()
 
+            self.invalidate_cache(f"case/{project_code}")
             result = response.json().get("result", {})
             logger.info(f"Обновлен кейс ID: {case_id}")
             return result
@@ -273,12 +322,14 @@ class QaseClient:
         project_code = project_code or self.project_code
 
         try:
-            response = requests.delete(
+            response = self._request(
+                "DELETE",
                 f"{self.base_url}/case/{project_code}/{case_id}",
                 headers=self.headers,
                 timeout=10,
             )
             response.raise_for_status()
+            self.invalidate_cache(f"case/{project_code}")
 
             logger.info(f"Удален кейс ID: {case_id}")
             return True
@@ -295,8 +346,8 @@ class QaseClient:
             bool: True если подключение успешно
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/project", headers=self.headers, timeout=5
+            response = self._request(
+                "GET", f"{self.base_url}/project", headers=self.headers, timeout=5
             )
             if response.status_code == 200:
                 logger.info("✅ Qase API подключение успешно")
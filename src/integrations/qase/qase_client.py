@@ -12,7 +12,14 @@ import requests
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+
+from src.integrations.http_client import get_http_executor
+from src.integrations.qase.paginator import (
+    DEFAULT_CONCURRENCY,
+    QasePage,
+    iter_pages,
+)
 
 
 class QaseClient:
@@ -34,6 +41,9 @@ class QaseClient:
         self.api_token = os.getenv("QASE_API_TOKEN")
         self.project_code = os.getenv("QASE_PROJECT_CODE")
         self.base_url = os.getenv("QASE_BASE_URL", "https://api.qase.io/v1")
+        self.page_concurrency = int(
+            os.getenv("QASE_PAGE_CONCURRENCY", DEFAULT_CONCURRENCY)
+        )
 
         if not self.api_token or not self.project_code:
             raise ValueError(
@@ -46,6 +56,10 @@ class QaseClient:
             {"Token": self.api_token, "Content-Type": "application/json"}
         )
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Запрос через общий HttpExecutor (лимит частоты, повторы 429/5xx)"""
+        return get_http_executor().request(self.session, method, url, **kwargs)
+
     def test_connection(self) -> Dict:
         """
         Проверка подключения к Qase.io
@@ -54,7 +68,7 @@ class QaseClient:
             Информация о проекте
         """
         url = f"{self.base_url}/project/{self.project_code}"
-        response = self.session.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -69,21 +83,36 @@ class QaseClient:
         Returns:
             Список тест-кейсов
         """
-        url = f"{self.base_url}/case/{self.project_code}"
-        params = {"limit": limit, "offset": offset}
+        cases = []
+        for page in self.iter_case_pages(limit=limit, offset=offset):
+            cases.extend(page.entities)
+        return cases
 
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
+    def iter_case_pages(
+        self, filters: Optional[Dict] = None, limit: int = 100, offset: int = 0
+    ) -> Iterator[QasePage]:
+        """
+        Постранично получить тест-кейсы (страницы после первой — параллельно)
+
+        Args:
+            filters: Фильтры (suite_id, severity, priority, type, etc.)
+            limit: Количество кейсов на страницу (макс 100)
+            offset: Смещение первой страницы
 
-        result = response.json().get("result", {})
-        cases = result.get("entities", [])
+        Returns:
+            Генератор страниц QasePage по порядку
+        """
+        url = f"{self.base_url}/case/{self.project_code}"
 
-        # Рекурсивно получаем все кейсы (пагинация)
-        total = result.get("total", 0)
-        if offset + limit < total:
-            cases.extend(self.get_all_cases(limit=limit, offset=offset + limit))
+        def fetch_page(page_limit: int, page_offset: int) -> Dict:
+            params = dict(filters or {}, limit=page_limit, offset=page_offset)
+            response = self._request("GET", url, params=params)
+            response.raise_for_status()
+            return response.json().get("result", {})
 
-        return cases
+        return iter_pages(
+            fetch_page, limit=limit, offset=offset, concurrency=self.page_concurrency
+        )
 
     def get_case_by_id(self, case_id: int) -> Dict:
         """
@@ -96,7 +125,7 @@ class QaseClient:
             Данные тест-кейса
         """
         url = f"{self.base_url}/case/{self.project_code}/{case_id}"
-        response = self.session.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -111,7 +140,7 @@ class QaseClient:
             Список найденных тест-кейсов
         """
         url = f"{self.base_url}/case/{self.project_code}"
-        response = self.session.get(url, params=filters)
+        response = self._request("GET", url, params=filters)
         response.raise_for_status()
         return response.json().get("result", {}).get("entities", [])
 
@@ -126,7 +155,7 @@ class QaseClient:
             Созданный тест-кейс
         """
         url = f"{self.base_url}/case/{self.project_code}"
-        response = self.session.post(url, json=case_data)
+        response = self._request("POST", url, json=case_data)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -142,7 +171,7 @@ class QaseClient:
             Обновлённый тест-кейс
         """
         url = f"{self.base_url}/case/{self.project_code}/{case_id}"
-        response = self.session.patch(url, json=case_data)
+        response = self._request("PATCH", url, json=case_data)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -157,7 +186,7 @@ class QaseClient:
             True если успешно
         """
         url = f"{self.base_url}/case/{self.project_code}/{case_id}"
-        response = self.session.delete(url)
+        response = self._request("DELETE", url)
         response.raise_for_status()
         return True
 
@@ -175,7 +204,7 @@ class QaseClient:
         """
         url = f"{self.base_url}/run/{self.project_code}"
         params = {"limit": limit}
-        response = self.session.get(url, params=params)
+        response = self._request("GET", url, params=params)
         response.raise_for_status()
         return response.json().get("result", {}).get("entities", [])
 
@@ -190,7 +219,7 @@ class QaseClient:
             Созданный Test Run
         """
         url = f"{self.base_url}/run/{self.project_code}"
-        response = self.session.post(url, json=run_data)
+        response = self._request("POST", url, json=run_data)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -205,7 +234,7 @@ class QaseClient:
             Данные Test Run
         """
         url = f"{self.base_url}/run/{self.project_code}/{run_id}"
-        response = self.session.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -220,7 +249,7 @@ class QaseClient:
             Обновлённый Test Run
         """
         url = f"{self.base_url}/run/{self.project_code}/{run_id}/complete"
-        response = self.session.post(url)
+        response = self._request("POST", url)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -260,7 +289,7 @@ class QaseClient:
         if attachments:
             data["attachments"] = attachments
 
-        response = self.session.post(url, json=data)
+        response = self._request("POST", url, json=data)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -277,7 +306,7 @@ class QaseClient:
         """
         url = f"{self.base_url}/result/{self.project_code}/{run_id}/bulk"
         data = {"results": results}
-        response = self.session.post(url, json=data)
+        response = self._request("POST", url, json=data)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -291,7 +320,7 @@ class QaseClient:
             Список сьютов
         """
         url = f"{self.base_url}/suite/{self.project_code}"
-        response = self.session.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return response.json().get("result", {}).get("entities", [])
 
@@ -320,7 +349,7 @@ class QaseClient:
         if parent_id:
             data["parent_id"] = parent_id
 
-        response = self.session.post(url, json=data)
+        response = self._request("POST", url, json=data)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -334,7 +363,7 @@ class QaseClient:
             Список планов
         """
         url = f"{self.base_url}/plan/{self.project_code}"
-        response = self.session.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return response.json().get("result", {}).get("entities", [])
 
@@ -349,7 +378,7 @@ class QaseClient:
             Созданный план
         """
         url = f"{self.base_url}/plan/{self.project_code}"
-        response = self.session.post(url, json=plan_data)
+        response = self._request("POST", url, json=plan_data)
         response.raise_for_status()
         return response.json().get("result", {})
 
@@ -363,7 +392,7 @@ class QaseClient:
             Список общих шагов
         """
         url = f"{self.base_url}/shared_step/{self.project_code}"
-        response = self.session.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return response.json().get("result", {}).get("entities", [])
 
@@ -383,7 +412,7 @@ class QaseClient:
 
         with open(file_path, "rb") as f:
             files = {"file": f}
-            response = self.session.post(url, files=files)
+            response = self._request("POST", url, files=files)
             response.raise_for_status()
 
         return response.json().get("result", [])
@@ -398,7 +427,7 @@ class QaseClient:
             Список кастомных полей
         """
         url = f"{self.base_url}/custom_field/{self.project_code}"
-        response = self.session.get(url)
+        response = self._request("GET", url)
         response.raise_for_status()
         return response.json().get("result", {}).get("entities", [])
 
@@ -0,0 +1,174 @@
+"""
+Zoho Token Manager
+
+Общий для процесса access_token Zoho:
+- Время истечения хранится рядом с токенами в credentials/zoho.env
+  (ZOHO_ACCESS_TOKEN_EXPIRES_AT, unix time)
+- Токен обновляется заранее, до истечения, без проверочных запросов к API
+- Все экземпляры ZohoAPI с одним zoho.env используют один менеджер
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+from src.integrations.http_client import get_http_executor
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://accounts.zoho.com/oauth/v2/token"
+EXPIRES_AT_KEY = "ZOHO_ACCESS_TOKEN_EXPIRES_AT"
+
+# Обновляем токен за 5 минут до истечения
+REFRESH_MARGIN_SECONDS = 300
+# Срок жизни access_token Zoho, если сервер не прислал expires_in
+DEFAULT_EXPIRES_IN = 3600
+
+
+def update_env_values(env_path: str, values: Dict[str, object]):
+    """Заменить значения ключей в .env файле (недостающие ключи дописываются)"""
+    with open(env_path, "r", encoding="utf-8") as file:
+        lines = file.readlines()
+
+    pending = dict(values)
+    for index, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if key in pending:
+            lines[index] = f"{key}={pending.pop(key)}\n"
+    if pending and lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    lines.extend(f"{key}={value}\n" for key, value in pending.items())
+
+    with open(env_path, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+
+
+class ZohoTokenManager:
+    """Access token Zoho с упреждающим обновлением"""
+
+    def __init__(
+        self,
+        env_path: str,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        access_token: Optional[str] = None,
+        expires_at: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Args:
+            env_path: zoho.env, куда сохраняются обновлённые токены
+            client_id, client_secret, refresh_token: OAuth-данные клиента
+            access_token: Текущий токен (из zoho.env)
+            expires_at: Время истечения токена (unix time); None — неизвестно,
+                токен используется до первого ответа 401
+            session: HTTP-сессия для запросов токена
+        """
+        self.env_path = env_path
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self.access_token = access_token or None
+        self.expires_at = expires_at
+        self.session = session or requests.Session()
+        self.refresh_count = 0
+        self._lock = threading.Lock()
+
+    def get_access_token(self) -> str:
+        """Действующий access_token (обновляется, если скоро истечёт)"""
+        with self._lock:
+            if not self._is_fresh():
+                self._refresh()
+            return self.access_token
+
+    def invalidate(self, token: str):
+        """
+        Сервер отклонил token (401) — следующий get_access_token обновит его.
+        Если другой поток уже обновил токен, ничего не делаем.
+        """
+        with self._lock:
+            if token == self.access_token:
+                self.access_token = None
+
+    def _is_fresh(self) -> bool:
+        if not self.access_token:
+            return False
+        if self.expires_at is None:
+            return True
+        return time.time() < self.expires_at - REFRESH_MARGIN_SECONDS
+
+    def _refresh(self):
+        if not self.refresh_token:
+            raise ValueError("Отсутствует refresh_token для обновления access_token.")
+
+        response = get_http_executor().request(
+            self.session,
+            "POST",
+            TOKEN_URL,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        access_token = data.get("access_token")
+        if not access_token:
+            raise ValueError(f"Не удалось получить новый access_token: {data}")
+
+        self.access_token = access_token
+        self.expires_at = int(time.time()) + int(
+            data.get("expires_in", DEFAULT_EXPIRES_IN)
+        )
+        if data.get("refresh_token"):
+            self.refresh_token = data["refresh_token"]
+        self.refresh_count += 1
+        logger.info("✅ Zoho access_token обновлён")
+        self._save()
+
+    def _save(self):
+        try:
+            update_env_values(
+                self.env_path,
+                {
+                    "ZOHO_ACCESS_TOKEN": self.access_token,
+                    "ZOHO_REFRESH_TOKEN": self.refresh_token,
+                    EXPIRES_AT_KEY: self.expires_at,
+                },
+            )
+        except OSError as e:
+            logger.error(f"❌ Ошибка сохранения токенов Zoho: {e}")
+
+
+# Менеджеры по пути к zoho.env (общие для всех ZohoAPI процесса)
+_token_managers: Dict[str, ZohoTokenManager] = {}
+_registry_lock = threading.Lock()
+
+
+def get_token_manager(env_path: str, **credentials) -> ZohoTokenManager:
+    """
+    Получить менеджер токенов для zoho.env
+
+    credentials (аргументы ZohoTokenManager) используются только при
+    создании менеджера; дальше токен живёт в памяти менеджера.
+    """
+    with _registry_lock:
+        manager = _token_managers.get(env_path)
+        if manager is None:
+            manager = _token_managers[env_path] = ZohoTokenManager(
+                env_path, **credentials
+            )
+        return manager
+
+
+def reset_token_managers():
+    """Сброс менеджеров (после смены учётных данных и для тестирования)"""
+    with _registry_lock:
+        _token_managers.clear()
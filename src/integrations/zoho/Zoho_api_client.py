@@ -11,8 +11,35 @@
 
 import requests
 import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 from dotenv import load_dotenv
 from src.config import Config
+from src.integrations.http_cache import HttpCache, get_http_cache
+from src.integrations.http_client import get_http_executor
+from src.integrations.zoho.TokenManager import EXPIRES_AT_KEY, get_token_manager
+
+# Zoho Projects отдаёт список страницами: index (с 1) и range (не больше 200)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 200
+# TTL дискового кэша справочных запросов, секунды
+CACHE_TTLS = {
+    "tasklists": 3600,
+    "milestones": 3600,
+    "users": 6 * 3600,
+    "tags": 3600,
+    "defaultfields": 24 * 3600,
+}
+# Не чаще раза в столько секунд перечитывать индекс имён при промахе
+NAME_INDEX_REFRESH_INTERVAL = 60
+# Сколько названий (таск-листов/мейлстоунов) выгружать параллельно
+TITLE_FETCH_WORKERS = 4
+
+
+class ZohoPageError(RuntimeError):
+    """Страница списка не получена: выборка неполная"""
 
 
 class ZohoAPI:
@@ -27,19 +54,31 @@ class ZohoAPI:
         project_id (str): Идентификатор проекта.
         portal_name (str): Название портала.
         session (requests.Session): Сессия для повторного использования соединений.
+        token_manager (ZohoTokenManager): Общий для процесса менеджер access_token.
         base_url (str): Базовый URL для API запросов.
+        page_size (int): Размер страницы списков (ZOHO_PAGE_SIZE).
+        page_prefetch (int): Сколько следующих страниц запрашивать параллельно
+            (ZOHO_PAGE_PREFETCH, 0 — последовательно).
+        http_cache (HttpCache | None): Кэш справочных ответов
+            (None — кэш текущего проекта).
+        name_indexes (dict): Индексы имя → ID таск-листов и мейлстоунов
+            (загружаются при первом поиске по имени).
     """
 
-    def __init__(self):
-        # Ищем config сначала в credentials, потом в текущей директории
-        project_root = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "..", "..")
-        )
-        env_path = os.path.join(project_root, "credentials", "zoho.env")
+    def __init__(self, env_path: str | None = None):
+        """
+        :param env_path: Путь к zoho.env (по умолчанию credentials/zoho.env).
+        """
+        if env_path is None:
+            # Ищем config сначала в credentials, потом в текущей директории
+            project_root = os.path.abspath(
+                os.path.join(os.path.dirname(__file__), "..", "..", "..")
+            )
+            env_path = os.path.join(project_root, "credentials", "zoho.env")
 
-        if not os.path.exists(env_path):
-            # Fallback на старое расположение
-            env_path = os.path.join(os.path.dirname(__file__), "config_zoho.env")
+            if not os.path.exists(env_path):
+                # Fallback на старое расположение
+                env_path = os.path.join(os.path.dirname(__file__), "config_zoho.env")
 
         if not os.path.exists(env_path):
             example_path = Config.get_credentials_example_path("zoho.env.example")
@@ -48,7 +87,8 @@ class ZohoAPI:
                 f"Создайте файл на основе примера: {example_path}"
             )
 
-        load_dotenv(env_path)  # Загружаем переменные из zoho.env
+        # override: после обновления токенов в файле новые экземпляры видят актуальные значения
+        load_dotenv(env_path, override=True)  # Загружаем переменные из zoho.env
 
         self.client_id = os.getenv("ZOHO_CLIENT_ID")
         self.client_secret = os.getenv("ZOHO_CLIENT_SECRET")
@@ -58,20 +98,36 @@ class ZohoAPI:
         self.authorization_code = os.getenv("ZOHO_AUTHORIZATION_CODE")
         self.redirect_uri = os.getenv("ZOHO_REDIRECT_URI")
         self.portal_name = os.getenv("ZOHO_PORTAL_NAME")
+        self.page_size = min(
+            int(os.getenv("ZOHO_PAGE_SIZE", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE
+        )
+        self.page_prefetch = int(os.getenv("ZOHO_PAGE_PREFETCH", 2))
 
         self.session = (
             requests.Session()
         )  # Используем сессию для повторного использования соединений
         self.base_url = self.get_base_url()
-        self.check_and_refresh_tokens()
+        self.http_cache: HttpCache | None = None
+        self.name_indexes: dict[str, dict[str, str]] = {}
+        # Когда индекс прочитан из Zoho мимо кэша (0 — из кэша, возраст неизвестен)
+        self._name_indexes_fetched_at: dict[str, float] = {}
+        self.token_manager = None
+        self.init_token_manager(env_path)
 
     def get_base_url(self) -> str:
         """
         Определяет правильный API-домен в зависимости от региона.
 
+        ZOHO_API_URL задаёт базовый URL целиком (например, локальный стенд
+        scripts/integration_standin.py).
+
         Возвращает:
             str: Базовый URL для API запросов.
         """
+        api_url = os.getenv("ZOHO_API_URL")
+        if api_url:
+            return f"{api_url.rstrip('/')}/restapi/portal/{self.portal_name}"
+
         domains = {
             "com": "projectsapi.zoho.com",
             "eu": "projectsapi.zoho.eu",
@@ -95,6 +151,36 @@ class ZohoAPI:
             self.access_token = self.do_access_token()
             self.save_tokens(self.access_token, self.refresh_token)
 
+    def init_token_manager(self, env_path: str) -> None:
+        """
+        Подключает общий менеджер токенов. Токен не проверяется запросом к API:
+        он обновляется заранее по сохранённому сроку действия или после 401.
+        :param env_path: Путь к zoho.env.
+        """
+        if not self.refresh_token:
+            print("🔄 Получение нового refresh_token...")
+            self.refresh_token = self.get_refresh_token()
+            self.save_tokens(self.access_token, self.refresh_token)
+
+        expires_at = os.getenv(EXPIRES_AT_KEY)
+        self.token_manager = get_token_manager(
+            env_path,
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            refresh_token=self.refresh_token,
+            access_token=self.access_token,
+            expires_at=float(expires_at) if expires_at else None,
+        )
+
+    def get_access_token(self) -> str:
+        """
+        Возвращает действующий access_token (из общего менеджера токенов).
+        :return str: Токен доступа.
+        """
+        if self.token_manager is not None:
+            self.access_token = self.token_manager.get_access_token()
+        return self.access_token
+
     def check_access_token(self) -> bool:
         """
         Проверяет, действует ли текущий access_token.
@@ -102,7 +188,7 @@ class ZohoAPI:
         """
         url = f"{self.base_url}/projects/"
         headers = {"Authorization": f"Zoho-oauthtoken {self.access_token}"}
-        response = self.session.get(url, headers=headers)
+        response = self.request("GET", url, headers=headers)
         return response.status_code == 200
 
     def request_token(self, grant_type: str, additional_params: dict = None) -> dict:
@@ -122,7 +208,7 @@ class ZohoAPI:
             params.update(additional_params)
 
         try:
-            response = self.session.post(url, data=params)
+            response = self.request("POST", url, data=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -203,11 +289,69 @@ class ZohoAPI:
         except Exception as e:
             print(f"❌ Ошибка сохранения токенов: {e}")
 
-    def send_request(self, url: str, params: dict = None) -> dict | None:
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        HTTP-запрос через общий HttpExecutor (лимит частоты, повторы 429/5xx).
+        :param method: HTTP-метод.
+        :param url: URL для запроса.
+        :return requests.Response: Ответ сервера.
+        """
+        return get_http_executor().request(self.session, method, url, **kwargs)
+
+    def get_cache(self) -> HttpCache | None:
+        """
+        Дисковый кэш ответов (свой или кэш текущего проекта).
+        :return HttpCache | None: Кэш или None, если он недоступен.
+        """
+        return getattr(self, "http_cache", None) or get_http_cache()
+
+    def invalidate_cache(self, entity_type: str = None) -> int:
+        """
+        Сбрасывает кэшированные ответы проекта.
+        :param entity_type: Только этот список ('tasklists', 'users', ...);
+            None — все ответы портала.
+        :return int: Число удалённых записей.
+        """
+        cache = self.get_cache()
+        if cache is None:
+            return 0
+        prefix = f"{self.base_url}/"
+        if entity_type:
+            prefix = f"{self.base_url}/projects/{self.project_id}/{entity_type}/"
+        return cache.invalidate(prefix)
+
+    def cached_get(
+        self, url: str, headers: dict, params: dict = None, cache_ttl: int = None
+    ) -> requests.Response:
+        """
+        GET-запрос; при cache_ttl ответ берётся из дискового кэша, пока свеж,
+        затем перепроверяется по ETag/Last-Modified.
+        :param url: URL для запроса.
+        :param headers: Заголовки (авторизация).
+        :param params: Параметры запроса.
+        :param cache_ttl: Время жизни ответа в кэше, секунды (None — без кэша).
+        :return requests.Response: Ответ сервера или кэша.
+        """
+        cache = self.get_cache() if cache_ttl else None
+        if cache is None:
+            return self.request("GET", url, headers=headers, params=params)
+        return cache.send(
+            url,
+            params,
+            cache_ttl,
+            lambda conditional: self.request(
+                "GET", url, headers={**headers, **conditional}, params=params
+            ),
+        )
+
+    def send_request(
+        self, url: str, params: dict = None, cache_ttl: int = None
+    ) -> dict | None:
         """
         Универсальный метод для отправки запросов к API Zoho.
         :param url: URL для запроса.
         :param params: Параметры запроса.
+        :param cache_ttl: Кэшировать ответ на диске на столько секунд.
         :return dict | None: Ответ API в формате JSON или None в случае ошибки.
         """
         import logging
@@ -223,18 +367,22 @@ class ZohoAPI:
             format="%(asctime)s %(levelname)s %(message)s",
         )
         try:
-            headers = {"Authorization": f"Zoho-oauthtoken {self.access_token}"}
-            response = self.session.get(url, headers=headers, params=params)
+            access_token = self.get_access_token()
+            headers = {"Authorization": f"Zoho-oauthtoken {access_token}"}
+            response = self.cached_get(url, headers, params, cache_ttl)
 
             if response.status_code == 401:
                 print("🔄 access_token устарел, обновляем...")
-                self.access_token = self.do_access_token()
-                # TODO: save_tokens(self.access_token, self.refresh_token)
-                # Note: Token saving should be implemented in settings dialog
+                if self.token_manager is not None:
+                    self.token_manager.invalidate(access_token)
+                else:
+                    self.access_token = self.do_access_token()
 
                 # Повторяем запрос с новым токеном
-                headers = {"Authorization": f"Zoho-oauthtoken {self.access_token}"}
-                response = self.session.get(url, headers=headers, params=params)
+                headers = {
+                    "Authorization": f"Zoho-oauthtoken {self.get_access_token()}"
+                }
+                response = self.cached_get(url, headers, params, cache_ttl)
 
             if response.status_code == 403:
                 error_text = response.text
@@ -287,6 +435,9 @@ class ZohoAPI:
         """
         if response.status_code == 200:
             return response.json()
+        elif response.status_code == 204:
+            # Zoho отвечает 204 No Content на пустой список (и за последней страницей)
+            return {}
         else:
             print(f"❌ Ошибка запроса: {response.status_code}, {response.text}")
             return None
@@ -333,9 +484,12 @@ class ZohoAPI:
         tags: list[str] = None,
         milestone_id: str = None,
         tasklist_id: str = None,
+        modified_after_ms: int = None,
+        strict: bool = True,
     ) -> list[dict]:
         """
-        Получает сущности (задачи или баги) по фильтру.
+        Получает сущности (задачи или баги) по фильтру — все страницы целиком.
+        Для потоковой обработки используйте iter_entities_by_filter.
         :param entity_type: Тип сущности ('tasks', 'bugs', 'milestones', 'tasklists').
         :param created_after: Дата создания (YYYY-MM-DD), начиная с которой сущности будут включены.
         :param created_before: Дата создания (YYYY-MM-DD), до которой сущности будут включены.
@@ -345,8 +499,53 @@ class ZohoAPI:
         :param tags: Список тегов для фильтрации.
         :param milestone_id: ID мейлстоуна для фильтрации.
         :param tasklist_id: ID таск-листа для фильтрации.
+        :param modified_after_ms: Только изменённые после этого времени (мс, UTC).
+        :param strict: Неполученная страница — ZohoPageError (см. iter_pages).
         :return list[dict]: Список сущностей, соответствующих фильтру.
         """
+        return list(
+            self.iter_entities_by_filter(
+                entity_type,
+                created_after=created_after,
+                created_before=created_before,
+                closed_after=closed_after,
+                closed_before=closed_before,
+                owner_id=owner_id,
+                tags=tags,
+                milestone_id=milestone_id,
+                tasklist_id=tasklist_id,
+                modified_after_ms=modified_after_ms,
+                strict=strict,
+            )
+        )
+
+    def iter_entities_by_filter(
+        self,
+        entity_type: str,
+        created_after: str = None,
+        created_before: str = None,
+        closed_after: str = None,
+        closed_before: str = None,
+        owner_id: str = None,
+        tags: list[str] = None,
+        milestone_id: str = None,
+        tasklist_id: str = None,
+        modified_after_ms: int = None,
+        page_size: int = None,
+        prefetch: int = None,
+        cache_ttl: int = None,
+        strict: bool = True,
+    ) -> Iterator[dict]:
+        """
+        Потоково отдаёт сущности по фильтру, страница за страницей.
+        Параметры фильтра — как у get_entities_by_filter.
+        :param page_size: Размер страницы (по умолчанию self.page_size).
+        :param prefetch: Сколько следующих страниц запрашивать параллельно
+            (по умолчанию self.page_prefetch).
+        :param cache_ttl: Кэшировать страницы на столько секунд (None — без кэша).
+        :param strict: Неполученная страница — ZohoPageError (см. iter_pages).
+        :return Iterator[dict]: Генератор сущностей.
+        """
         if entity_type not in ["tasks", "bugs", "milestones", "tasklists"]:
             raise ValueError(
                 "Тип сущности должен быть 'tasks', 'bugs', 'milestones' или 'tasklists'."
@@ -370,15 +569,88 @@ class ZohoAPI:
             params["milestone_id"] = milestone_id
         if tasklist_id:
             params["tasklist_id"] = tasklist_id
+        if modified_after_ms:
+            # Фильтр Zoho по времени изменения; вызывающий дополнительно
+            # сверяет last_updated_time_long на своей стороне
+            params["last_modified_time"] = modified_after_ms
 
         print(
             f"🔍 Отправка запроса: URL={url}, Параметры={params}"
         )  # Логирование запроса
-        response = self.send_request(url, params=params)
-        if response is None:
-            print(f"❌ Не удалось получить {entity_type}. Проверьте права доступа.")
-            return []
-        return response.get(entity_type, [])
+        for page in self.iter_pages(
+            url, entity_type, params, page_size, prefetch, cache_ttl, strict
+        ):
+            yield from page
+
+    def iter_pages(
+        self,
+        url: str,
+        key: str,
+        params: dict = None,
+        page_size: int = None,
+        prefetch: int = None,
+        cache_ttl: int = None,
+        strict: bool = True,
+    ) -> Iterator[list[dict]]:
+        """
+        Постранично запрашивает список Zoho (параметры index/range).
+        Страницы отдаются по порядку, пока не придёт неполная или пустая.
+        При prefetch > 0 следующие страницы запрашиваются заранее в потоках
+        через ту же requests.Session; лишние запросы за концом списка
+        возвращают 204 и отбрасываются.
+        :param url: URL списка.
+        :param key: Ключ списка в ответе ('tasks', 'bugs', ...).
+        :param params: Параметры фильтра.
+        :param page_size: Размер страницы (range), не больше MAX_PAGE_SIZE.
+        :param prefetch: Сколько страниц запрашивать наперёд (0 — последовательно).
+        :param cache_ttl: Кэшировать страницы на столько секунд (None — без кэша).
+        :param strict: Неполученная страница — ZohoPageError. False — выборка
+            заканчивается на уже полученных записях (только если неполный
+            список допустим вызывающему).
+        :return Iterator[list[dict]]: Генератор страниц.
+        """
+        page_size = min(page_size or self.page_size, MAX_PAGE_SIZE)
+        prefetch = max(self.page_prefetch if prefetch is None else prefetch, 0)
+
+        def fetch(page: int) -> dict | None:
+            page_params = dict(params or {}, index=page * page_size + 1)
+            page_params["range"] = page_size
+            return self.send_request(url, params=page_params, cache_ttl=cache_ttl)
+
+        executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch else None
+        pending = deque()
+        next_page = 0
+        received = 0
+        try:
+            while True:
+                # Держим наперёд до prefetch запросов
+                while executor and len(pending) < prefetch:
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+                if pending:
+                    response = pending.popleft().result()
+                else:
+                    response = fetch(next_page)
+                    next_page += 1
+
+                if response is None:
+                    if strict:
+                        raise ZohoPageError(
+                            f"Не удалось получить {key} начиная с записи {received + 1}"
+                        )
+                    print(f"❌ Не удалось получить {key}. Проверьте права доступа.")
+                    return
+                records = response.get(key, [])
+                if records:
+                    received += len(records)
+                    yield records
+                if len(records) < page_size:
+                    return
+        finally:
+            if executor:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=False)
 
     def get_users(self, search_term: str = None) -> list[dict]:
         """
@@ -391,7 +663,7 @@ class ZohoAPI:
         if search_term:
             params["search"] = search_term
 
-        response = self.send_request(url, params)
+        response = self.send_request(url, params, cache_ttl=CACHE_TTLS["users"])
         if response is None:
             print(f"❌ Не удалось получить пользователей. Проверьте права доступа.")
             return []
@@ -431,38 +703,118 @@ class ZohoAPI:
         Ищет задачи по названию таск-листа или мейлстоуна.
         Сначала ищет по таск-листам, затем по мейлстоунам.
         """
-        # Сначала ищем по таск-листам
-        tasklist_id = self.get_tasklist_id_by_name(title)
-        if tasklist_id:
-            return self.get_entities_by_filter("tasks", tasklist_id=tasklist_id)
-
-        # Если не найдено, ищем по мейлстоунам
-        milestone_id = self.get_milestone_id_by_name(title)
-        if milestone_id:
-            return self.get_entities_by_filter("tasks", milestone_id=milestone_id)
+        return self.get_tasks_by_titles([title])[title]
+
+    def get_tasks_by_titles(
+        self, titles: list[str], max_workers: int = TITLE_FETCH_WORKERS
+    ) -> dict[str, list[dict]]:
+        """
+        Ищет задачи для нескольких названий таск-листов или мейлстоунов.
+        Названия сопоставляются с ID за один проход по индексам имён:
+        сначала таск-листы, оставшиеся — мейлстоуны. Задачи найденных
+        названий выгружаются параллельно.
+        :param titles: Названия таск-листов или мейлстоунов.
+        :param max_workers: Сколько названий выгружать одновременно.
+        :return dict[str, list[dict]]: Задачи по каждому названию
+            (пустой список, если название не найдено).
+        """
+        tasklist_ids = self.resolve_ids_by_name("tasklists", titles)
+        rest = [title for title in titles if not tasklist_ids[title]]
+        milestone_ids = self.resolve_ids_by_name("milestones", rest) if rest else {}
+
+        filters = {}
+        for title in titles:
+            if tasklist_ids[title]:
+                filters[title] = {"tasklist_id": tasklist_ids[title]}
+            elif milestone_ids.get(title):
+                filters[title] = {"milestone_id": milestone_ids[title]}
+
+        tasks = {title: [] for title in titles}
+        if not filters:
+            return tasks
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                title: executor.submit(self.get_entities_by_filter, "tasks", **scope)
+                for title, scope in filters.items()
+            }
+            for title, future in futures.items():
+                tasks[title] = future.result()
+        return tasks
 
-        # Если ничего не найдено, возвращаем пустой список
-        return []
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Ключ индекса имён: без учёта регистра и крайних пробелов.
+        """
+        return name.strip().casefold()
+
+    def get_name_index(self, entity_type: str, refresh: bool = False) -> dict[str, str]:
+        """
+        Индекс имя → ID таск-листов или мейлстоунов проекта.
+        Загружается один раз на экземпляр; refresh перечитывает список
+        мимо дискового кэша.
+        :param entity_type: 'tasklists' или 'milestones'.
+        :param refresh: Перечитать список из Zoho.
+        :return dict[str, str]: Нормализованное имя → ID (первое вхождение).
+        """
+        if entity_type not in ("tasklists", "milestones"):
+            raise ValueError("Тип сущности должен быть 'tasklists' или 'milestones'.")
+
+        if refresh:
+            self.invalidate_cache(entity_type)
+        elif entity_type in self.name_indexes:
+            return self.name_indexes[entity_type]
+
+        index = {}
+        for entity in self.iter_entities_by_filter(
+            entity_type, cache_ttl=CACHE_TTLS[entity_type]
+        ):
+            index.setdefault(self.normalize_name(entity["name"]), entity["id"])
+        self.name_indexes[entity_type] = index
+        # Список из дискового кэша мог быть сохранён до CACHE_TTLS назад
+        from_zoho = refresh or self.get_cache() is None
+        self._name_indexes_fetched_at[entity_type] = (
+            time.monotonic() if from_zoho else 0.0
+        )
+        return index
+
+    def resolve_ids_by_name(
+        self, entity_type: str, names: list[str]
+    ) -> dict[str, str | None]:
+        """
+        Сопоставляет названия с ID за один проход по индексу.
+        При промахе индекс перечитывается мимо кэша — сущность могла
+        появиться после загрузки. Индекс, прочитанный из Zoho, перечитывается
+        не чаще NAME_INDEX_REFRESH_INTERVAL секунд; загруженный из дискового
+        кэша — при первом же промахе.
+        :param entity_type: 'tasklists' или 'milestones'.
+        :param names: Названия.
+        :return dict[str, str | None]: ID по каждому названию (None — не найдено).
+        """
+        index = self.get_name_index(entity_type)
+        ids = {name: index.get(self.normalize_name(name)) for name in names}
+
+        fetched_at = self._name_indexes_fetched_at.get(entity_type, 0.0)
+        stale = (
+            not fetched_at
+            or time.monotonic() - fetched_at >= NAME_INDEX_REFRESH_INTERVAL
+        )
+        if stale and not all(ids.values()):
+            index = self.get_name_index(entity_type, refresh=True)
+            ids = {name: index.get(self.normalize_name(name)) for name in names}
+        return ids
 
     def get_tasklist_id_by_name(self, tasklist_name: str) -> str | None:
         """
         Получает ID таск-листа по его названию.
         """
-        tasklists = self.get_entities_by_filter("tasklists")
-        for tasklist in tasklists:
-            if tasklist["name"].lower() == tasklist_name.lower():
-                return tasklist["id"]
-        return None
+        return self.resolve_ids_by_name("tasklists", [tasklist_name])[tasklist_name]
 
     def get_milestone_id_by_name(self, milestone_name: str) -> str | None:
         """
         Получает ID мейлстоуна по его названию.
         """
-        milestones = self.get_entities_by_filter("milestones")
-        for milestone in milestones:
-            if milestone["name"].lower() == milestone_name.lower():
-                return milestone["id"]
-        return None
+        return self.resolve_ids_by_name("milestones", [milestone_name])[milestone_name]
 
     def get_tasks_in_date_range(self, start_date: str, end_date: str) -> list[dict]:
         """
@@ -489,7 +841,8 @@ class ZohoAPI:
         :return list[dict]: Список статусов багов.
         """
         url = f"{self.base_url}/projects/{self.project_id}/bugs/defaultfields/"
-        return self.send_request(url).get("defaultfields", {}).get("status_details", [])
+        response = self.send_request(url, cache_ttl=CACHE_TTLS["defaultfields"])
+        return response.get("defaultfields", {}).get("status_details", [])
 
     def get_project_tags(self) -> list[dict]:
         """
@@ -497,7 +850,7 @@ class ZohoAPI:
         :return list[dict]: Список тегов проекта.
         """
         url = f"{self.base_url}/projects/{self.project_id}/tags/"
-        response = self.send_request(url)
+        response = self.send_request(url, cache_ttl=CACHE_TTLS["tags"])
         return response.get("tags", [])
 
     def manage_tag(
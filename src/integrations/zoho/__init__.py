@@ -13,6 +13,7 @@ Zoho Projects API Integration - MATURE CODE
 """
 
 from .Zoho_api_client import ZohoAPI
+from .TokenManager import ZohoTokenManager, get_token_manager, reset_token_managers
 from .User import User, UserManager
 from .TaskStatus import TaskStatus, TaskStatusManager
 from .DefectStatus import DefectStatus, DefectStatusManager
@@ -27,6 +28,9 @@ from .portal_data import (
 
 __all__ = [
     "ZohoAPI",
+    "ZohoTokenManager",
+    "get_token_manager",
+    "reset_token_managers",
     "User",
     "UserManager",
     "TaskStatus",
@@ -3,7 +3,9 @@ from .user import User
 from .dictionary import Dictionary
 from .relation import Relation, RELATION_TYPES
 from .zoho_task import ZohoTask
+from .zoho_sync_state import ZohoSyncState
 from .report_template import ReportTemplate
+from .hierarchy import FunctionalItemClosure
 
 __all__ = [
     "FunctionalItem",
@@ -11,6 +13,8 @@ __all__ = [
     "Dictionary",
     "Relation",
     "ZohoTask",
+    "ZohoSyncState",
     "ReportTemplate",
+    "FunctionalItemClosure",
     "RELATION_TYPES",
 ]
@@ -0,0 +1,330 @@
+"""
+Модель FunctionalItemClosure - closure table иерархии parent_id
+
+Хранит все пары (предок, потомок, глубина), включая саму вершину с depth=0.
+Поддерживается триггерами SQLite на functional_items (вставка, смена
+parent_id, удаление), поэтому вопросы по поддереву и хлебные крошки
+решаются одним индексированным запросом без обхода ORM.
+"""
+
+import logging
+import weakref
+from typing import Dict, List, Optional
+
+from sqlalchemy import (
+    DDL,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    case,
+    delete,
+    event,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from src.db.base import Base
+from src.models.functional_item import FunctionalItem
+
+logger = logging.getLogger(__name__)
+
+# Защита от циклов в старых данных при пересборке
+MAX_HIERARCHY_DEPTH = 64
+
+
+class FunctionalItemClosure(Base):
+    """Пара предок → потомок в иерархии functional_items"""
+
+    __tablename__ = "functional_item_closure"
+
+    ancestor_id = Column(
+        Integer,
+        ForeignKey("functional_items.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    descendant_id = Column(
+        Integer,
+        ForeignKey("functional_items.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    depth = Column(Integer, nullable=False)  # 0 — сам элемент, 1 — прямой ребёнок
+
+    __table_args__ = (
+        Index("ix_functional_item_closure_descendant", "descendant_id", "depth"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<FunctionalItemClosure({self.ancestor_id} -> {self.descendant_id}, "
+            f"depth={self.depth})>"
+        )
+
+
+CLOSURE_TRIGGERS = [
+    # Новый элемент: сам себе предок + все предки родителя
+    """
+    CREATE TRIGGER IF NOT EXISTS functional_item_closure_ai
+    AFTER INSERT ON functional_items
+    BEGIN
+        INSERT INTO functional_item_closure (ancestor_id, descendant_id, depth)
+        VALUES (new.id, new.id, 0);
+        INSERT INTO functional_item_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, new.id, depth + 1
+        FROM functional_item_closure
+        WHERE descendant_id = new.parent_id;
+    END
+    """,
+    # Перенос под собственного потомка запрещён
+    """
+    CREATE TRIGGER IF NOT EXISTS functional_item_closure_bu
+    BEFORE UPDATE OF parent_id ON functional_items
+    WHEN new.parent_id IS NOT NULL AND EXISTS (
+        SELECT 1 FROM functional_item_closure
+        WHERE ancestor_id = new.id AND descendant_id = new.parent_id
+    )
+    BEGIN
+        SELECT RAISE(ABORT, 'hierarchy cycle: parent is a descendant');
+    END
+    """,
+    # Перенос поддерева: отрезаем старых предков, пришиваем новых
+    """
+    CREATE TRIGGER IF NOT EXISTS functional_item_closure_au
+    AFTER UPDATE OF parent_id ON functional_items
+    WHEN old.parent_id IS NOT new.parent_id
+    BEGIN
+        DELETE FROM functional_item_closure
+        WHERE descendant_id IN (
+            SELECT descendant_id FROM functional_item_closure
+            WHERE ancestor_id = new.id
+        )
+        AND ancestor_id NOT IN (
+            SELECT descendant_id FROM functional_item_closure
+            WHERE ancestor_id = new.id
+        );
+        INSERT INTO functional_item_closure (ancestor_id, descendant_id, depth)
+        SELECT up.ancestor_id, down.descendant_id, up.depth + down.depth + 1
+        FROM functional_item_closure AS up, functional_item_closure AS down
+        WHERE up.descendant_id = new.parent_id AND down.ancestor_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS functional_item_closure_ad
+    AFTER DELETE ON functional_items
+    BEGIN
+        DELETE FROM functional_item_closure
+        WHERE descendant_id = old.id OR ancestor_id = old.id;
+    END
+    """,
+]
+
+for _statement in CLOSURE_TRIGGERS:
+    event.listen(FunctionalItemClosure.__table__, "after_create", DDL(_statement))
+
+# Engine, для которых closure table уже проверена в этом процессе
+_ready_engines = weakref.WeakSet()
+
+
+def rebuild_closure(session: Session):
+    """Пересобрать closure table из parent_id (одним рекурсивным запросом)"""
+    session.execute(delete(FunctionalItemClosure))
+    session.connection().exec_driver_sql(f"""
+        INSERT INTO functional_item_closure (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM functional_items
+            UNION ALL
+            SELECT tree.ancestor_id, item.id, tree.depth + 1
+            FROM tree JOIN functional_items AS item
+                ON item.parent_id = tree.descendant_id
+            WHERE tree.depth < {MAX_HIERARCHY_DEPTH}
+        )
+        SELECT ancestor_id, descendant_id, MIN(depth)
+        FROM tree GROUP BY ancestor_id, descendant_id
+        """)
+
+
+def ensure_closure_table(bind: Engine) -> bool:
+    """
+    Создать closure table и триггеры в существующей БД (если их нет)
+
+    Новые БД получают их через Base.metadata.create_all.
+
+    Returns:
+        True если closure table готова, False если в БД ещё нет functional_items
+    """
+    if bind in _ready_engines:
+        return True
+
+    with bind.connect() as conn:
+        tables = {
+            row[0]
+            for row in conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )
+        }
+    if FunctionalItem.__tablename__ not in tables:
+        return False
+
+    if FunctionalItemClosure.__tablename__ not in tables:
+        # create() запускает after_create — триггеры создаются вместе с таблицей
+        FunctionalItemClosure.__table__.create(bind)
+        with Session(bind) as session:
+            rebuild_closure(session)
+            session.commit()
+        logger.info(f"✅ Создана closure table иерархии: {bind.url}")
+    else:
+        with bind.begin() as conn:
+            for statement in CLOSURE_TRIGGERS:
+                conn.exec_driver_sql(statement)
+
+    _ready_engines.add(bind)
+    return True
+
+
+def _prepare(session: Session):
+    ensure_closure_table(session.get_bind())
+
+
+# === ЗАПРОСЫ ===
+
+
+def subtree_ids(
+    root_id: int, include_self: bool = True, max_depth: Optional[int] = None
+):
+    """
+    SELECT id элементов поддерева — для фильтров вида
+    FunctionalItem.id.in_(subtree_ids(root_id))
+    """
+    stmt = select(FunctionalItemClosure.descendant_id).where(
+        FunctionalItemClosure.ancestor_id == root_id
+    )
+    if not include_self:
+        stmt = stmt.where(FunctionalItemClosure.depth > 0)
+    if max_depth is not None:
+        stmt = stmt.where(FunctionalItemClosure.depth <= max_depth)
+    return stmt
+
+
+def get_descendants(
+    session: Session,
+    root_id: int,
+    include_self: bool = False,
+    max_depth: Optional[int] = None,
+    item_type: Optional[str] = None,
+) -> List[FunctionalItem]:
+    """
+    Все потомки элемента (например, все Story под модулем)
+
+    Args:
+        session: Сессия БД
+        root_id: id корня поддерева
+        include_self: Включать сам корень
+        max_depth: Ограничение глубины (1 — только дети)
+        item_type: Фильтр по типу элемента
+    """
+    _prepare(session)
+    query = session.query(FunctionalItem).filter(
+        FunctionalItem.id.in_(subtree_ids(root_id, include_self, max_depth))
+    )
+    if item_type:
+        query = query.filter(FunctionalItem.type == item_type)
+    return query.order_by(FunctionalItem.functional_id).all()
+
+
+def get_ancestors(
+    session: Session, item_id: int, include_self: bool = False
+) -> List[FunctionalItem]:
+    """Предки элемента от корня к родителю (хлебные крошки)"""
+    _prepare(session)
+    query = (
+        session.query(FunctionalItem)
+        .join(
+            FunctionalItemClosure,
+            FunctionalItemClosure.ancestor_id == FunctionalItem.id,
+        )
+        .filter(FunctionalItemClosure.descendant_id == item_id)
+    )
+    if not include_self:
+        query = query.filter(FunctionalItemClosure.depth > 0)
+    return query.order_by(FunctionalItemClosure.depth.desc()).all()
+
+
+def get_breadcrumb(session: Session, item_id: int, separator: str = " / ") -> str:
+    """Путь до элемента: "FRONT / Splash Page / Age cookies" """
+    return separator.join(
+        item.title or item.functional_id
+        for item in get_ancestors(session, item_id, include_self=True)
+    )
+
+
+def subtree_coverage(session: Session, root_id: int) -> Dict[str, int]:
+    """
+    Свод покрытия по поддереву одним агрегирующим запросом
+
+    Returns:
+        dict: total, with_tests, automated, documented, crit, focus
+    """
+    _prepare(session)
+
+    def count_if(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    row = session.execute(
+        select(
+            func.count(FunctionalItem.id),
+            count_if(func.length(func.trim(FunctionalItem.test_cases_linked)) > 0),
+            count_if(
+                FunctionalItem.automation_status.in_(
+                    ["Automated", "Partially Automated"]
+                )
+            ),
+            count_if(func.length(func.trim(FunctionalItem.documentation_links)) > 0),
+            count_if(FunctionalItem.is_crit == 1),
+            count_if(FunctionalItem.is_focus == 1),
+        ).where(FunctionalItem.id.in_(subtree_ids(root_id)))
+    ).one()
+
+    keys = ["total", "with_tests", "automated", "documented", "crit", "focus"]
+    return dict(zip(keys, (int(value) for value in row)))
+
+
+def delete_subtree(session: Session, root_id: int) -> int:
+    """
+    Удалить элемент вместе со всем поддеревом
+
+    Связи удаляются, задачи Zoho отвязываются. Объекты сессии
+    после удаления сбрасываются (expire_all). Коммит — на вызывающем.
+
+    Returns:
+        Количество удалённых элементов
+    """
+    from src.models.relation import Relation
+    from src.models.zoho_task import ZohoTask
+
+    _prepare(session)
+    session.flush()
+
+    ids = list(session.execute(subtree_ids(root_id)).scalars())
+    if not ids:
+        return 0
+
+    session.execute(
+        update(ZohoTask)
+        .where(ZohoTask.functional_item_id.in_(ids))
+        .values(functional_item_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    session.execute(
+        delete(Relation)
+        .where(Relation.source_id.in_(ids) | Relation.target_id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    result = session.execute(
+        delete(FunctionalItem)
+        .where(FunctionalItem.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    session.expire_all()
+    return result.rowcount
@@ -7,12 +7,66 @@
 - Переключение между проектами
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from dataclasses import dataclass, fields
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 import json
 from datetime import datetime
 
+# Допустимые значения PRAGMA (значения подставляются в SQL — только из списка)
+JOURNAL_MODES = ("WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORE_MODES = ("DEFAULT", "FILE", "MEMORY")
+CHECKPOINT_MODES = ("NONE", "PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+
+@dataclass
+class DatabasePerformanceProfile:
+    """Профиль производительности SQLite (PRAGMA на каждое соединение)"""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024  # байт
+    cache_size: int = -64 * 1024  # < 0 — размер в KiB, > 0 — в страницах
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5000  # мс
+    checkpoint_on_close: str = "TRUNCATE"  # режим wal_checkpoint при закрытии
+
+    def __post_init__(self):
+        self.journal_mode = self._choice(self.journal_mode, JOURNAL_MODES, "WAL")
+        self.synchronous = self._choice(self.synchronous, SYNCHRONOUS_MODES, "NORMAL")
+        self.temp_store = self._choice(self.temp_store, TEMP_STORE_MODES, "MEMORY")
+        self.checkpoint_on_close = self._choice(
+            self.checkpoint_on_close, CHECKPOINT_MODES, "TRUNCATE"
+        )
+        self.mmap_size = max(0, int(self.mmap_size))
+        self.cache_size = int(self.cache_size)
+        self.busy_timeout = max(0, int(self.busy_timeout))
+
+    @staticmethod
+    def _choice(value, allowed, default: str) -> str:
+        value = str(value or "").upper()
+        return value if value in allowed else default
+
+    def pragmas(self) -> List[Tuple[str, object]]:
+        """PRAGMA в порядке применения (busy_timeout первым — до смены журнала)"""
+        return [
+            ("busy_timeout", self.busy_timeout),
+            ("journal_mode", self.journal_mode),
+            ("synchronous", self.synchronous),
+            ("mmap_size", self.mmap_size),
+            ("cache_size", self.cache_size),
+            ("temp_store", self.temp_store),
+        ]
+
+    def to_dict(self) -> Dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "DatabasePerformanceProfile":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
 
 @dataclass
 class ProjectConfig:
@@ -40,11 +94,16 @@ class ProjectConfig:
     tags: List[str] = None
     custom_fields: Dict = None
 
+    # Профиль производительности SQLite
+    performance: DatabasePerformanceProfile = None
+
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
         if self.custom_fields is None:
             self.custom_fields = {}
+        if self.performance is None:
+            self.performance = DatabasePerformanceProfile()
 
     def to_dict(self) -> Dict:
         """Сериализация в словарь"""
@@ -61,6 +120,7 @@ class ProjectConfig:
             "is_active": self.is_active,
             "tags": self.tags,
             "custom_fields": self.custom_fields,
+            "performance": self.performance.to_dict(),
         }
 
     @classmethod
@@ -79,6 +139,7 @@ class ProjectConfig:
             is_active=data.get("is_active", True),
             tags=data.get("tags", []),
             custom_fields=data.get("custom_fields", {}),
+            performance=DatabasePerformanceProfile.from_dict(data.get("performance")),
         )
 
 
@@ -0,0 +1,31 @@
+"""
+Модель состояния синхронизации Zoho
+
+Хранит watermark (максимальное время изменения задачи в Zoho) по каждой
+области синхронизации — milestone или tasklist. Следующая синхронизация
+запрашивает только задачи, изменённые после watermark.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime
+from src.db.base import Base
+
+
+class ZohoSyncState(Base):
+    """Последняя успешная синхронизация области Zoho"""
+
+    __tablename__ = "zoho_sync_state"
+
+    id = Column(Integer, primary_key=True)
+
+    # Область: "milestone:<id>" / "tasklist:<id>"
+    scope = Column(String(100), unique=True, nullable=False, index=True)
+
+    # Время последнего изменения задачи в Zoho (UTC), уже сохранённого в БД
+    watermark = Column(DateTime, nullable=True)
+
+    # Время последней успешной синхронизации (инкрементальной или полной)
+    synced_at = Column(DateTime, nullable=True)
+    full_synced_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<ZohoSyncState(scope='{self.scope}', watermark={self.watermark})>"
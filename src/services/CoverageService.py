@@ -0,0 +1,190 @@
+"""
+Coverage Service
+
+Агрегация покрытия functional_items на стороне SQL (без загрузки строк):
+- Итоги по выборке — один запрос
+- Разрезы (type, module, epic, segment, QA) — один GROUP BY на измерение
+- Признаки покрытия совпадают с FunctionalItem.is_covered_by_tests,
+  is_automated, is_documented и coverage_status
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional
+import logging
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.models import FunctionalItem, User
+
+logger = logging.getLogger(__name__)
+
+AUTOMATED_STATUSES = ["Automated", "Partially Automated"]
+# str.strip() без аргументов: пробелы, табуляции и переводы строк
+_WHITESPACE = " \t\r\n"
+
+# Измерение -> колонка группировки
+DIMENSIONS = {
+    "type": FunctionalItem.type,
+    "module": FunctionalItem.module,
+    "epic": FunctionalItem.epic,
+    "segment": FunctionalItem.segment,
+    "qa": User.name,
+}
+# Измерения, где подписи могут совпадать: группировка по id, key — подпись
+GROUP_KEYS = {
+    "qa": User.id,
+}
+
+
+def _not_blank(column):
+    return and_(column.isnot(None), func.length(func.trim(column, _WHITESPACE)) > 0)
+
+
+HAS_TESTS = _not_blank(FunctionalItem.test_cases_linked)
+# coalesce: NULL в NOT/AND дал бы NULL вместо False
+IS_AUTOMATED = func.coalesce(FunctionalItem.automation_status, "").in_(
+    AUTOMATED_STATUSES
+)
+IS_DOCUMENTED = _not_blank(FunctionalItem.documentation_links)
+
+
+def _count(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+# Агрегаты строки CoverageStats (кроме key)
+_AGGREGATES = [
+    func.count(FunctionalItem.id),
+    _count(FunctionalItem.is_crit == 1),
+    _count(FunctionalItem.is_focus == 1),
+    _count(HAS_TESTS),
+    _count(IS_AUTOMATED),
+    _count(IS_DOCUMENTED),
+    _count(and_(HAS_TESTS, IS_AUTOMATED, IS_DOCUMENTED)),
+    _count(
+        and_(
+            or_(HAS_TESTS, IS_AUTOMATED, IS_DOCUMENTED),
+            ~and_(HAS_TESTS, IS_AUTOMATED, IS_DOCUMENTED),
+        )
+    ),
+]
+
+
+class CoverageStats(NamedTuple):
+    """Покрытие группы элементов (key — значение измерения, None для итогов)"""
+
+    key: Optional[str]
+    total: int
+    crit: int
+    focus: int
+    with_tests: int
+    automated: int
+    documented: int
+    full: int
+    partial: int
+
+    @property
+    def none(self) -> int:
+        """Без покрытия (coverage_status == "none")"""
+        return self.total - self.full - self.partial
+
+    @property
+    def coverage(self) -> int:
+        """Общий процент покрытия: тесты, автоматизация и документация поровну"""
+        if not self.total:
+            return 0
+        return int(
+            ((self.with_tests + self.automated + self.documented) / (self.total * 3))
+            * 100
+        )
+
+    def pct(self, field: str) -> int:
+        """Процент элементов группы с признаком field"""
+        if not self.total:
+            return 0
+        return int((getattr(self, field) / self.total) * 100)
+
+
+def apply_filters(statement, filters: Dict):
+    """Фильтры отчётов (is_crit, is_focus, type, responsible_qa_id)"""
+    if filters.get("is_crit"):
+        statement = statement.where(FunctionalItem.is_crit == True)
+
+    if filters.get("is_focus"):
+        statement = statement.where(FunctionalItem.is_focus == True)
+
+    if filters.get("type"):
+        if isinstance(filters["type"], list):
+            statement = statement.where(FunctionalItem.type.in_(filters["type"]))
+        else:
+            statement = statement.where(FunctionalItem.type == filters["type"])
+
+    if filters.get("responsible_qa_id"):
+        statement = statement.where(
+            FunctionalItem.responsible_qa_id == filters["responsible_qa_id"]
+        )
+
+    return statement
+
+
+class CoverageService:
+    """Агрегаты покрытия functional_items"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def totals(self, filters: Optional[Dict] = None) -> CoverageStats:
+        """Итоги покрытия по выборке (один запрос)"""
+        statement = apply_filters(select(*_AGGREGATES), filters or {})
+        row = self.session.execute(statement).one()
+        return CoverageStats(None, *row)
+
+    def rollup(
+        self, dimension: str, filters: Optional[Dict] = None
+    ) -> List[CoverageStats]:
+        """
+        Покрытие в разрезе измерения (один GROUP BY)
+
+        Args:
+            dimension: Ключ DIMENSIONS (type, module, epic, segment, qa)
+            filters: Фильтры выборки
+
+        Returns:
+            List[CoverageStats]: Группы по значению измерения (None — не задано)
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Неизвестное измерение: {dimension}")
+
+        column = DIMENSIONS[dimension]
+        statement = select(column, *_AGGREGATES).select_from(FunctionalItem)
+        if dimension == "qa":
+            statement = statement.outerjoin(
+                User, User.id == FunctionalItem.responsible_qa_id
+            )
+        statement = apply_filters(statement, filters or {})
+        group_key = GROUP_KEYS.get(dimension, column)
+        statement = statement.group_by(group_key, column).order_by(column, group_key)
+
+        return [CoverageStats(*row) for row in self.session.execute(statement)]
+
+    def rollups(
+        self, dimensions: Iterable[str] = DIMENSIONS, filters: Optional[Dict] = None
+    ) -> Dict[str, List[CoverageStats]]:
+        """Разрезы по нескольким измерениям"""
+        return {dimension: self.rollup(dimension, filters) for dimension in dimensions}
+
+    def report_stats(self, filters: Optional[Dict] = None) -> Dict[str, int]:
+        """Статистика покрытия для placeholder'ов отчёта"""
+        stats = self.totals(filters)
+        if not stats.total:
+            return {"coverage": 0, "with_tests": 0, "automated": 0, "documented": 0}
+
+        return {
+            "coverage": stats.coverage,
+            "with_tests": stats.with_tests,
+            "with_tests_pct": stats.pct("with_tests"),
+            "automated": stats.automated,
+            "automated_pct": stats.pct("automated"),
+            "documented": stats.documented,
+            "documented_pct": stats.pct("documented"),
+        }
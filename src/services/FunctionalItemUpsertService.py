@@ -0,0 +1,230 @@
+"""
+FunctionalItem Upsert Service
+
+Массовый импорт/обновление functional_items по functional_id:
+- Пользователи и существующие элементы загружаются одним запросом каждый
+- Запись пачками через INSERT ... ON CONFLICT(functional_id) DO UPDATE
+- Статистика: новые / обновлённые / без изменений
+"""
+
+from typing import Any, Dict, Iterable, List, Set
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from src.models import FunctionalItem, User
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Поля с именами пользователей -> FK колонки
+USER_NAME_FIELDS = {
+    "responsible_qa": "responsible_qa_id",
+    "responsible_dev": "responsible_dev_id",
+    "accountable": "accountable_id",
+}
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class FunctionalItemUpsertService:
+    """Массовый upsert функциональных элементов по functional_id"""
+
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        create_users: bool = True,
+    ):
+        """
+        Args:
+            session: SQLAlchemy session
+            batch_size: Размер пачки для записи
+            create_users: Создавать пользователей, которых нет в БД
+                (иначе ссылка на неизвестного пользователя = None)
+        """
+        self.session = session
+        self.batch_size = batch_size
+        self.create_users = create_users
+        self._columns = {column.name for column in FunctionalItem.__table__.columns}
+
+    def upsert(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        update_existing: bool = True,
+        commit: bool = True,
+    ) -> Dict[str, int]:
+        """
+        Импорт строк в functional_items
+
+        Args:
+            rows: Словари с полями FunctionalItem (functional_id обязателен);
+                ответственные можно передать по имени: responsible_qa,
+                responsible_dev, accountable
+            update_existing: False — существующие элементы не трогаем (skipped)
+            commit: Зафиксировать транзакцию
+
+        Returns:
+            dict: new, updated, unchanged, skipped, errors, users_created
+        """
+        stats = {
+            "new": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "skipped": 0,
+            "errors": 0,
+            "users_created": 0,
+        }
+
+        # Нормализуем строки; дубли functional_id — побеждает последняя
+        prepared: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            func_id = (row.get("functional_id") or "").strip()
+            if not func_id:
+                stats["skipped"] += 1
+                continue
+            prepared[func_id] = dict(row, functional_id=func_id)
+
+        if not prepared:
+            return stats
+
+        users = self._resolve_users(prepared.values(), stats)
+        records = [self._to_record(row, users) for row in prepared.values()]
+
+        # Существующие элементы — один запрос по нужным колонкам
+        compare_columns = sorted(
+            {key for record in records for key in record} - {"functional_id"}
+        )
+        existing = {
+            values[0]: dict(zip(compare_columns, values[1:]))
+            for values in self.session.execute(
+                select(
+                    FunctionalItem.functional_id,
+                    *(FunctionalItem.__table__.c[name] for name in compare_columns),
+                )
+            )
+        }
+
+        to_write = []
+        for record in records:
+            current = existing.get(record["functional_id"])
+            if current is not None and not update_existing:
+                stats["skipped"] += 1
+            elif current is not None and all(
+                current[key] == value
+                for key, value in record.items()
+                if key != "functional_id"
+            ):
+                stats["unchanged"] += 1
+            else:
+                to_write.append(record)
+
+        failed = self._write(to_write)
+        for record in to_write:
+            if record["functional_id"] in failed:
+                stats["errors"] += 1
+            elif record["functional_id"] in existing:
+                stats["updated"] += 1
+            else:
+                stats["new"] += 1
+        if commit:
+            self.session.commit()
+        else:
+            self.session.flush()
+
+        logger.info(
+            f"✅ Upsert functional_items: новых {stats['new']}, "
+            f"обновлено {stats['updated']}, без изменений {stats['unchanged']}, "
+            f"пропущено {stats['skipped']}, ошибок {stats['errors']}"
+        )
+        return stats
+
+    def _resolve_users(
+        self, rows: Iterable[Dict[str, Any]], stats: Dict[str, int]
+    ) -> Dict[str, int]:
+        """Имя пользователя -> id (недостающие создаются одной пачкой)"""
+        names = {
+            row[field].strip()
+            for row in rows
+            for field in USER_NAME_FIELDS
+            if isinstance(row.get(field), str) and row[field].strip()
+        }
+        if not names:
+            return {}
+
+        users = {
+            name: user_id
+            for user_id, name in self.session.execute(select(User.id, User.name))
+        }
+
+        missing = sorted(names - users.keys())
+        if missing and self.create_users:
+            self.session.execute(
+                insert(User), [{"name": name, "is_active": 1} for name in missing]
+            )
+            for user_id, name in self.session.execute(
+                select(User.id, User.name).where(User.name.in_(missing))
+            ):
+                users[name] = user_id
+            stats["users_created"] += len(missing)
+            logger.info(f"👥 Создано пользователей: {len(missing)}")
+
+        return users
+
+    def _to_record(self, row: Dict[str, Any], users: Dict[str, int]) -> Dict[str, Any]:
+        """Строка импорта -> значения колонок functional_items"""
+        record = {}
+        for key, value in row.items():
+            if key in USER_NAME_FIELDS:
+                name = value.strip() if isinstance(value, str) else ""
+                record[USER_NAME_FIELDS[key]] = users.get(name) if name else None
+            elif key in self._columns and key != "id":
+                record[key] = int(value) if isinstance(value, bool) else value
+        return record
+
+    def _write(self, records: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Запись пачками INSERT ... ON CONFLICT DO UPDATE
+
+        Пачка с ошибкой (например, дубль alias_tag) повторяется построчно,
+        чтобы одна плохая строка не отменяла весь импорт.
+
+        Returns:
+            functional_id строк, которые не удалось записать
+        """
+        # executemany требует одинаковый набор ключей — группируем
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for record in records:
+            groups.setdefault(tuple(sorted(record)), []).append(record)
+
+        failed = set()
+        for keys, group in groups.items():
+            stmt = sqlite_insert(FunctionalItem.__table__)
+            update_set = {
+                key: stmt.excluded[key] for key in keys if key != "functional_id"
+            }
+            update_set["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["functional_id"], set_=update_set
+            )
+
+            for start in range(0, len(group), self.batch_size):
+                batch = group[start : start + self.batch_size]
+                try:
+                    with self.session.begin_nested():
+                        self.session.execute(stmt, batch)
+                except SQLAlchemyError:
+                    failed |= self._write_one_by_one(stmt, batch)
+
+        return failed
+
+    def _write_one_by_one(self, stmt, batch: List[Dict[str, Any]]) -> Set[str]:
+        failed = set()
+        for record in batch:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(stmt, [record])
+            except SQLAlchemyError as e:
+                failed.add(record["functional_id"])
+                logger.error(f"Ошибка импорта элемента {record['functional_id']}: {e}")
+        return failed
@@ -6,38 +6,114 @@ Google Sheets Exporter Service
 - Матрица покрытия с форматированием
 - RACI матрица
 - Тест-планы с фильтрами
+
+Все листы экспорта пишутся через одну SpreadsheetSession: одна
+авторизация, одна очистка (values_batch_clear) и одна запись
+(values_batch_update) на таблицу.
+
+Diff-режим (export_all_tables(diff=True)) пишет только изменённые строки.
+Манифест последнего экспорта лежит рядом с БД (sheet_manifests/), элементы
+без изменений с прошлого экспорта (updated_at) не пересобираются.
 """
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from pathlib import Path
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from src.models import FunctionalItem, User, Relation
-from src.integrations.google import GoogleSheetsClient
+from src.models import FunctionalItem, User
+from src.integrations.google import SpreadsheetSession
+from src.integrations.google.google_sheets_client import authorize
+from src.integrations.google.sheet_diff import (
+    MANIFEST_DIR_NAME,
+    SheetManifest,
+    manifest_path,
+)
+from src.services.RaciMatrixService import RaciMatrixService
+from src.services.RelationExportService import SHEET_COLUMNS, RelationExportService
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Колонки листа функциональных элементов
+FUNCTIONAL_ITEM_COLUMNS = [
+    "FuncID",
+    "Alias",
+    "Title",
+    "Type",
+    "Segment",
+    "Module",
+    "Epic",
+    "Feature",
+    "isCrit",
+    "isFocus",
+    "QA",
+    "Dev",
+    "Accountable",
+    "Test Cases",
+    "Automation",
+    "Documentation",
+    "Status",
+    "Maturity",
+]
+
+# Ключевые колонки строк (манифест и diff-экспорт)
+FUNCTIONAL_ITEM_KEY = ["FuncID"]
+USER_KEY = ["ID"]
+RELATION_KEY = ["Source ID", "Target ID", "Type"]
+
 
 class GoogleSheetsExporter:
     """Экспорт данных VoluptAS в Google Sheets"""
 
-    def __init__(self, credentials_path: str, session: Session):
+    def __init__(
+        self,
+        credentials_path: str,
+        session: Session,
+        manifest_dir: Optional[Path] = None,
+    ):
         """
         Args:
             credentials_path: Путь к service_account.json
             session: SQLAlchemy session
+            manifest_dir: Каталог манифестов экспорта (по умолчанию — рядом с БД)
         """
         self.credentials_path = credentials_path
         self.session = session
-        self.client = None
+        self.manifest_dir = manifest_dir
+        self.client = None  # gspread-клиент, авторизуется один раз
+
+    def _authorize(self):
+        if self.client is None:
+            self.client = authorize(self.credentials_path)
+        return self.client
+
+    def open_session(self, spreadsheet_id: str) -> SpreadsheetSession:
+        """Сессия пакетной записи листов spreadsheet"""
+        return SpreadsheetSession(
+            self._authorize(), spreadsheet_id, self.load_manifest(spreadsheet_id)
+        )
 
-    def export_all_tables(self, spreadsheet_id: str, filters: Optional[Dict] = None):
+    def load_manifest(self, spreadsheet_id: str) -> SheetManifest:
+        """Манифест экспортов spreadsheet (для БД в памяти — без файла)"""
+        directory = self.manifest_dir
+        if directory is None:
+            database = self.session.get_bind().url.database
+            if not database or database == ":memory:":
+                return SheetManifest()
+            directory = Path(database).parent / MANIFEST_DIR_NAME
+        return SheetManifest(manifest_path(directory, spreadsheet_id))
+
+    def export_all_tables(
+        self, spreadsheet_id: str, filters: Optional[Dict] = None, diff: bool = False
+    ):
         """
         Экспорт всех таблиц БД в отдельные листы
 
         Args:
             spreadsheet_id: ID Google Spreadsheet
             filters: Фильтры для данных (опционально)
+            diff: Писать только изменённые/новые/удалённые строки
 
         Returns:
             dict: Статистика экспорта
@@ -47,16 +123,23 @@ class GoogleSheetsExporter:
         stats = {"functional_items": 0, "users": 0, "relations": 0, "errors": []}
 
         try:
+            # Снимок по часам БД: с ним сравнивается updated_at в следующем diff
+            snapshot_at = self.session.scalar(select(func.now()))
+            sheets = self.open_session(spreadsheet_id)
+
             # 1. Экспорт функциональных элементов
             stats["functional_items"] = self._export_functional_items(
-                spreadsheet_id, "Функционал", filters
+                sheets, "Функционал", filters, diff
             )
 
             # 2. Экспорт пользователей
-            stats["users"] = self._export_users(spreadsheet_id, "Сотрудники")
+            stats["users"] = self._export_users(sheets, "Сотрудники", diff)
 
             # 3. Экспорт связей
-            stats["relations"] = self._export_relations(spreadsheet_id, "Связи")
+            stats["relations"] = self._export_relations(sheets, "Связи", diff)
+
+            # Запись всех листов
+            sheets.flush(exported_at=snapshot_at)
 
             logger.info(f"✅ Экспорт завершён: {stats}")
             return stats
@@ -67,22 +150,19 @@ class GoogleSheetsExporter:
             raise
 
     def _export_functional_items(
-        self, spreadsheet_id: str, sheet_name: str, filters: Optional[Dict] = None
+        self,
+        sheets: SpreadsheetSession,
+        sheet_name: str,
+        filters: Optional[Dict] = None,
+        diff: bool = False,
     ) -> int:
         """Экспорт функциональных элементов"""
         logger.info(f"📊 Экспорт functional_items в лист '{sheet_name}'")
 
-        # Инициализация клиента
-        self.client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
-        )
-
         # Получение данных из БД
         query = self.session.query(FunctionalItem)
 
-        # Проверка: если БД пустая - не создавать клиент (не очищать листы)
+        # Проверка: если БД пустая - не очищать лист
         total_count = query.count()
         if total_count == 0:
             logger.warning(f"⚠️ БД пустая, пропускаем экспорт '{sheet_name}'")
@@ -104,37 +184,85 @@ class GoogleSheetsExporter:
         items = query.all()
         logger.info(f"   Найдено элементов: {len(items)}")
 
+        # Префильтр diff: строки элементов без изменений с прошлого экспорта
+        # (ни самого элемента, ни ответственных) не пересобираются
+        since = None
+        if diff:
+            exported = sheets.manifest_entry(
+                sheet_name, FUNCTIONAL_ITEM_COLUMNS, FUNCTIONAL_ITEM_KEY
+            )
+            if exported and exported["exported_at"]:
+                since = datetime.fromisoformat(exported["exported_at"])
+                known = exported["rows"]
+                # Сравнение в Python: SQLite хранит время строкой без микросекунд
+                changed_users = {
+                    user_id
+                    for user_id, updated_at in self.session.execute(
+                        select(User.id, User.updated_at)
+                    )
+                    if updated_at >= since
+                }
+
         # Подготовка данных для экспорта
+        records = []
+        unchanged = []
         for item in items:
-            row_data = {
-                "FuncID": item.functional_id or "",
-                "Alias": item.alias_tag or "",
-                "Title": item.title or "",
-                "Type": item.type or "",
-                "Segment": item.segment or "",
-                "Module": item.module or "",
-                "Epic": item.epic or "",
-                "Feature": item.feature or "",
-                "isCrit": "Да" if item.is_crit else "",
-                "isFocus": "Да" if item.is_focus else "",
-                "QA": item.responsible_qa.name if item.responsible_qa else "",
-                "Dev": item.responsible_dev.name if item.responsible_dev else "",
-                "Accountable": item.accountable.name if item.accountable else "",
-                "Test Cases": item.test_cases_linked or "",
-                "Automation": item.automation_status or "",
-                "Documentation": item.documentation_links or "",
-                "Status": item.status or "",
-                "Maturity": item.maturity or "",
-            }
-            self.client.append_result(row_data)
+            if (
+                since
+                and item.functional_id in known
+                and item.updated_at < since
+                and not changed_users.intersection(
+                    (
+                        item.responsible_qa_id,
+                        item.responsible_dev_id,
+                        item.accountable_id,
+                    )
+                )
+            ):
+                unchanged.append(item.functional_id)
+                continue
+            records.append(self._functional_item_record(item))
 
         # Отправка данных
-        self.client.flush()
+        sheets.add_table(
+            sheet_name,
+            records,
+            headers=FUNCTIONAL_ITEM_COLUMNS,
+            key=FUNCTIONAL_ITEM_KEY,
+            diff=diff,
+            unchanged=unchanged,
+        )
         logger.info(f"✅ Экспортировано: {len(items)} элементов")
 
         return len(items)
 
-    def _export_users(self, spreadsheet_id: str, sheet_name: str) -> int:
+    @staticmethod
+    def _functional_item_record(item: FunctionalItem) -> Dict[str, Any]:
+        """Строка листа функциональных элементов"""
+        return {
+            "FuncID": item.functional_id or "",
+            "Alias": item.alias_tag or "",
+            "Title": item.title or "",
+            "Type": item.type or "",
+            "Segment": item.segment or "",
+            "Module": item.module or "",
+            "Epic": item.epic or "",
+            "Feature": item.feature or "",
+            "isCrit": "Да" if item.is_crit else "",
+            "isFocus": "Да" if item.is_focus else "",
+            "QA": item.responsible_qa.name if item.responsible_qa else "",
+            "Dev": item.responsible_dev.name if item.responsible_dev else "",
+            "Accountable": item.accountable.name if item.accountable else "",
+            "Test Cases": item.test_cases_linked or "",
+            "Automation": item.automation_status or "",
+            "Documentation": item.documentation_links or "",
+            "Status": item.status or "",
+            "Maturity": item.maturity or "",
+        }
+
+    def _export_users(
+        self, sheets: SpreadsheetSession, sheet_name: str, diff: bool = False
+    ) -> int:
         """Экспорт пользователей"""
         logger.info(f"👥 Экспорт users в лист '{sheet_name}'")
 
@@ -145,12 +273,7 @@ class GoogleSheetsExporter:
             logger.warning(f"⚠️ Нет пользователей, пропускаем экспорт '{sheet_name}'")
             return 0
 
-        self.client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
-        )
-
+        records = []
         for user in users:
             row_data = {
                 "ID": user.id,
@@ -161,55 +284,33 @@ class GoogleSheetsExporter:
                 "GitHub": user.github_username or "",
                 "Active": "Да" if user.is_active else "Нет",
             }
-            self.client.append_result(row_data)
+            records.append(row_data)
 
-        self.client.flush()
+        sheets.add_table(sheet_name, records, key=USER_KEY, diff=diff)
         logger.info(f"✅ Экспортировано: {len(users)} пользователей")
 
         return len(users)
 
-    def _export_relations(self, spreadsheet_id: str, sheet_name: str) -> int:
+    def _export_relations(
+        self, sheets: SpreadsheetSession, sheet_name: str, diff: bool = False
+    ) -> int:
         """Экспорт связей между элементами"""
         logger.info(f"🔗 Экспорт relations в лист '{sheet_name}'")
 
-        relations = self.session.query(Relation).all()
-        logger.info(f"   Найдено связей: {len(relations)}")
+        # funcid и названия концов — одним запросом с JOIN
+        records = list(RelationExportService(self.session).iter_sheet_records())
+        logger.info(f"   Найдено связей: {len(records)}")
 
-        if len(relations) == 0:
+        if len(records) == 0:
             logger.warning(f"⚠️ Нет связей, пропускаем экспорт '{sheet_name}'")
             return 0
 
-        self.client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
+        sheets.add_table(
+            sheet_name, records, headers=SHEET_COLUMNS, key=RELATION_KEY, diff=diff
         )
+        logger.info(f"✅ Экспортировано: {len(records)} связей")
 
-        for rel in relations:
-            # Получаем элементы для вывода названий
-            source = self.session.query(FunctionalItem).get(rel.source_id)
-            target = self.session.query(FunctionalItem).get(rel.target_id)
-
-            metadata = rel.get_metadata()
-            row_data = {
-                "Source ID": rel.source_id,
-                "Source FuncID": source.functional_id if source else "",
-                "Source Title": source.title if source else "",
-                "Target ID": rel.target_id,
-                "Target FuncID": target.functional_id if target else "",
-                "Target Title": target.title if target else "",
-                "Type": rel.type or "hierarchy",
-                "Weight": rel.weight or 1.0,
-                "Directed": "Да" if rel.directed else "Нет",
-                "Active": "Да" if rel.active else "Нет",
-                "Notes": metadata.get("notes", "") or "",
-            }
-            self.client.append_result(row_data)
-
-        self.client.flush()
-        logger.info(f"✅ Экспортировано: {len(relations)} связей")
-
-        return len(relations)
+        return len(records)
 
     def export_coverage_matrix(
         self, spreadsheet_id: str, sheet_name: str = "Coverage Matrix"
@@ -222,12 +323,6 @@ class GoogleSheetsExporter:
         """
         logger.info(f"📋 Экспорт coverage matrix в лист '{sheet_name}'")
 
-        self.client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
-        )
-
         items = (
             self.session.query(FunctionalItem)
             .filter(FunctionalItem.type.in_(["Feature", "Story", "Page", "Element"]))
@@ -236,6 +331,7 @@ class GoogleSheetsExporter:
 
         logger.info(f"   Элементов для матрицы: {len(items)}")
 
+        records = []
         for item in items:
             # Определяем покрытие
             has_tc = bool(item.test_cases_linked and item.test_cases_linked.strip())
@@ -259,9 +355,9 @@ class GoogleSheetsExporter:
                 "Coverage %": f"{coverage_pct}%",
                 "QA": item.responsible_qa.name if item.responsible_qa else "",
             }
-            self.client.append_result(row_data)
+            records.append(row_data)
 
-        self.client.flush()
+        self._write_sheet(spreadsheet_id, sheet_name, records)
         logger.info(f"✅ Матрица покрытия экспортирована: {len(items)} элементов")
 
         # TODO: Добавить условное форматирование (цвета) через Google Sheets API
@@ -275,48 +371,18 @@ class GoogleSheetsExporter:
 
         Строки: функциональные элементы
         Колонки: сотрудники
-        Значения: R/A/C/I
+        Значения: R(QA)/R(Dev)/A/C/I (RaciMatrixService)
         """
         logger.info(f"👥 Экспорт RACI matrix в лист '{sheet_name}'")
 
-        self.client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
-        )
+        matrix = RaciMatrixService(self.session).build()
 
-        items = self.session.query(FunctionalItem).all()
-        users = self.session.query(User).filter(User.is_active == True).all()
+        sheets = self.open_session(spreadsheet_id)
+        sheets.add_rows(sheet_name, matrix.headers, matrix.to_rows())
+        sheets.flush()
+        logger.info(f"✅ RACI матрица экспортирована: {len(matrix)} элементов")
 
-        logger.info(f"   Элементов: {len(items)}, Сотрудников: {len(users)}")
-
-        # Формируем матрицу
-        for item in items:
-            row_data = {
-                "FuncID": item.functional_id or "",
-                "Title": item.title or "",
-                "Type": item.type or "",
-            }
-
-            # Для каждого пользователя определяем роль
-            for user in users:
-                role = []
-                if item.responsible_qa_id == user.id:
-                    role.append("R(QA)")
-                if item.responsible_dev_id == user.id:
-                    role.append("R(Dev)")
-                if item.accountable_id == user.id:
-                    role.append("A")
-                # TODO: Добавить C и I из JSON полей
-
-                row_data[user.name] = ", ".join(role) if role else ""
-
-            self.client.append_result(row_data)
-
-        self.client.flush()
-        logger.info(f"✅ RACI матрица экспортирована: {len(items)} элементов")
-
-        return len(items)
+        return len(matrix)
 
     def export_test_plan(
         self, spreadsheet_id: str, sheet_name: str, filters: Dict[str, Any]
@@ -329,12 +395,6 @@ class GoogleSheetsExporter:
         """
         logger.info(f"📝 Экспорт test plan в лист '{sheet_name}'")
 
-        self.client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
-        )
-
         # Применяем фильтры
         query = self.session.query(FunctionalItem)
 
@@ -353,6 +413,7 @@ class GoogleSheetsExporter:
         logger.info(f"   Элементов в тест-плане: {len(items)}")
 
         # Экспорт в формате тест-плана
+        records = []
         for item in items:
             row_data = {
                 "FuncID": item.functional_id or "",
@@ -371,9 +432,17 @@ class GoogleSheetsExporter:
                 "Status": item.status or "Open",
                 "Notes": "",  # Для ручного заполнения
             }
-            self.client.append_result(row_data)
+            records.append(row_data)
 
-        self.client.flush()
+        self._write_sheet(spreadsheet_id, sheet_name, records)
         logger.info(f"✅ Тест-план экспортирован: {len(items)} элементов")
 
         return len(items)
+
+    def _write_sheet(
+        self, spreadsheet_id: str, sheet_name: str, records: List[Dict[str, Any]]
+    ):
+        """Очистить и записать один лист"""
+        sheets = self.open_session(spreadsheet_id)
+        sheets.add_table(sheet_name, records)
+        sheets.flush()
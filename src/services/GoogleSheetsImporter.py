@@ -6,16 +6,42 @@ Google Sheets Importer Service
 - Импорт users
 - Импорт relations
 - Обработка существующих записей (update vs insert)
+
+Листы читаются одним запросом values_batch_get (одна авторизация),
+существующие записи загружаются заранее словарями, запись — пачками.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import List, Dict, Any
+from gspread.utils import absolute_range_name, numericise_all, to_records
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from src.models import FunctionalItem, User, Relation
-from src.integrations.google import GoogleSheetsClient
+from src.models import User, Relation
+from src.integrations.google.google_sheets_client import authorize
+from src.services.FunctionalItemUpsertService import FunctionalItemUpsertService
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Таблица -> лист spreadsheet (в порядке импорта: сначала пользователи,
+# т.к. на них ссылаются элементы)
+SHEETS = {
+    "users": "Сотрудники",
+    "functional_items": "Функционал",
+    "relations": "Связи",
+}
+
+
+def to_sheet_records(values: List[List[Any]]) -> List[Dict[str, Any]]:
+    """Строки листа → словари по заголовкам (как Worksheet.get_all_records)"""
+    if not values:
+        return []
+    headers = values[0]
+    rows = [
+        numericise_all(list(row) + [""] * (len(headers) - len(row)))
+        for row in values[1:]
+    ]
+    return to_records(headers, rows)
+
 
 class GoogleSheetsImporter:
     """Импорт данных из Google Sheets в БД"""
@@ -44,16 +70,19 @@ class GoogleSheetsImporter:
         stats = {"functional_items": 0, "users": 0, "relations": 0, "errors": []}
 
         try:
+            # Все листы — одним чтением
+            tables = self.read_tables(spreadsheet_id)
+
             # 1. Импорт пользователей (сначала, т.к. на них ссылки)
-            stats["users"] = self._import_users(spreadsheet_id, "Сотрудники")
+            stats["users"] = self._import_users(tables["users"])
 
             # 2. Импорт функциональных элементов
             stats["functional_items"] = self._import_functional_items(
-                spreadsheet_id, "Функционал"
+                tables["functional_items"]
             )
 
             # 3. Импорт связей
-            stats["relations"] = self._import_relations(spreadsheet_id, "Связи")
+            stats["relations"] = self._import_relations(tables["relations"])
 
             logger.info(f"✅ Импорт завершён: {stats}")
             return stats
@@ -63,176 +92,132 @@ class GoogleSheetsImporter:
             stats["errors"].append(str(e))
             raise
 
-    def _import_users(self, spreadsheet_id: str, sheet_name: str) -> int:
-        """Импорт пользователей"""
-        logger.info(f"👥 Импорт users из листа '{sheet_name}'")
+    def _authorize(self):
+        return authorize(self.credentials_path)
+
+    def read_tables(self, spreadsheet_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Прочитать листы SHEETS одним запросом values_batch_get
 
-        client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
-            clear_on_open=False,  # НЕ очищать при импорте!
+        Returns:
+            dict: Таблица -> строки-словари (отсутствующий лист — пустой список)
+        """
+        spreadsheet = self._authorize().open_by_key(spreadsheet_id)
+        titles = {worksheet.title for worksheet in spreadsheet.worksheets()}
+
+        tables = {table: [] for table in SHEETS}
+        present = {
+            table: sheet_name
+            for table, sheet_name in SHEETS.items()
+            if sheet_name in titles
+        }
+        for table in tables.keys() - present.keys():
+            logger.warning(f"Лист '{SHEETS[table]}' не найден, пропускаем")
+        if not present:
+            return tables
+
+        response = spreadsheet.values_batch_get(
+            [absolute_range_name(sheet_name) for sheet_name in present.values()]
         )
+        for table, value_range in zip(present, response.get("valueRanges", [])):
+            tables[table] = to_sheet_records(value_range.get("values", []))
+            logger.info(f"   Лист '{SHEETS[table]}': {len(tables[table])} строк")
+        return tables
+
+    def _import_users(self, all_data: List[Dict[str, Any]]) -> int:
+        """Импорт пользователей (существующие — одним запросом)"""
+        logger.info(f"👥 Импорт users: {len(all_data)} строк")
 
-        # Читаем все данные
-        all_data = client.sheet.get_all_records()
-        logger.info(f"   Найдено строк: {len(all_data)}")
+        users = {user.name: user for user in self.session.scalars(select(User))}
 
         imported_count = 0
         updated_count = 0
+        new_users = []
 
         for row in all_data:
             try:
-                # Ищем существующего пользователя
-                user = (
-                    self.session.query(User)
-                    .filter(User.name == row.get("Name", ""))
-                    .first()
-                )
+                name = row.get("Name", "")
+                fields = {
+                    "position": row.get("Position", "") or None,
+                    "email": row.get("Email", "") or None,
+                    "zoho_id": row.get("Zoho ID", "") or None,
+                    "github_username": row.get("GitHub", "") or None,
+                    "is_active": 1 if row.get("Active") == "Да" else 0,
+                }
+                user = users.get(name)
 
                 if user:
                     # Обновляем
-                    user.position = row.get("Position", "") or None
-                    user.email = row.get("Email", "") or None
-                    user.zoho_id = row.get("Zoho ID", "") or None
-                    user.github_username = row.get("GitHub", "") or None
-                    user.is_active = 1 if row.get("Active") == "Да" else 0
+                    for field, value in fields.items():
+                        setattr(user, field, value)
                     updated_count += 1
                 else:
                     # Создаём нового
-                    user = User(
-                        name=row.get("Name", ""),
-                        position=row.get("Position", "") or None,
-                        email=row.get("Email", "") or None,
-                        zoho_id=row.get("Zoho ID", "") or None,
-                        github_username=row.get("GitHub", "") or None,
-                        is_active=1 if row.get("Active") == "Да" else 0,
-                    )
-                    self.session.add(user)
+                    user = users[name] = User(name=name, **fields)
+                    new_users.append(user)
                     imported_count += 1
 
             except Exception as e:
                 logger.error(f"Ошибка импорта пользователя {row.get('Name')}: {e}")
 
+        self.session.add_all(new_users)
         self.session.commit()
         logger.info(f"✅ Импортировано: {imported_count}, Обновлено: {updated_count}")
 
         return imported_count + updated_count
 
-    def _import_functional_items(self, spreadsheet_id: str, sheet_name: str) -> int:
-        """Импорт функциональных элементов"""
-        logger.info(f"📊 Импорт functional_items из листа '{sheet_name}'")
-
-        client = GoogleSheetsClient(
-            credentials_path=self.credentials_path,
-            spreadsheet_id=spreadsheet_id,
-            worksheet_name=sheet_name,
-            clear_on_open=False,  # НЕ очищать при импорте!
+    def _import_functional_items(self, all_data: List[Dict[str, Any]]) -> int:
+        """Импорт функциональных элементов (upsert пачками, пользователи — по имени)"""
+        logger.info(f"📊 Импорт functional_items: {len(all_data)} строк")
+
+        rows = [
+            {
+                "functional_id": str(row.get("FuncID", "")).strip(),
+                "alias_tag": row.get("Alias", "") or None,
+                "title": row.get("Title", "") or None,
+                "type": row.get("Type", "") or None,
+                "segment": row.get("Segment", "") or None,
+                "module": row.get("Module", "") or None,
+                "epic": row.get("Epic", "") or None,
+                "feature": row.get("Feature", "") or None,
+                "is_crit": row.get("isCrit") == "Да",
+                "is_focus": row.get("isFocus") == "Да",
+                # Ответственные — по имени (неизвестные имена -> None)
+                "responsible_qa": row.get("QA") or None,
+                "responsible_dev": row.get("Dev") or None,
+                "accountable": row.get("Accountable") or None,
+                "test_cases_linked": row.get("Test Cases", "") or None,
+                "automation_status": row.get("Automation", "") or None,
+                "documentation_links": row.get("Documentation", "") or None,
+                "status": row.get("Status", "") or None,
+                "maturity": row.get("Maturity", "") or None,
+            }
+            for row in all_data
+        ]
+
+        stats = FunctionalItemUpsertService(self.session, create_users=False).upsert(
+            rows
+        )
+        logger.info(
+            f"✅ Импортировано: {stats['new']}, Обновлено: {stats['updated']}, "
+            f"Без изменений: {stats['unchanged']}"
         )
 
-        all_data = client.sheet.get_all_records()
-        logger.info(f"   Найдено строк: {len(all_data)}")
-
-        imported_count = 0
-        updated_count = 0
-
-        for row in all_data:
-            try:
-                func_id = row.get("FuncID", "").strip()
-                if not func_id:
-                    continue
-
-                # Ищем существующий элемент
-                item = (
-                    self.session.query(FunctionalItem)
-                    .filter(FunctionalItem.functional_id == func_id)
-                    .first()
-                )
-
-                # Находим пользователей по имени
-                qa_user = (
-                    self.session.query(User)
-                    .filter(User.name == row.get("QA", ""))
-                    .first()
-                    if row.get("QA")
-                    else None
-                )
-
-                dev_user = (
-                    self.session.query(User)
-                    .filter(User.name == row.get("Dev", ""))
-                    .first()
-                    if row.get("Dev")
-                    else None
-                )
-
-                accountable_user = (
-                    self.session.query(User)
-                    .filter(User.name == row.get("Accountable", ""))
-                    .first()
-                    if row.get("Accountable")
-                    else None
-                )
-
-                data = {
-                    "functional_id": func_id,
-                    "alias_tag": row.get("Alias", "") or None,
-                    "title": row.get("Title", "") or None,
-                    "type": row.get("Type", "") or None,
-                    "segment": row.get("Segment", "") or None,
-                    "module": row.get("Module", "") or None,
-                    "epic": row.get("Epic", "") or None,
-                    "feature": row.get("Feature", "") or None,
-                    "is_crit": row.get("isCrit") == "Да",
-                    "is_focus": row.get("isFocus") == "Да",
-                    "responsible_qa_id": qa_user.id if qa_user else None,
-                    "responsible_dev_id": dev_user.id if dev_user else None,
-                    "accountable_id": accountable_user.id if accountable_user else None,
-                    "test_cases_linked": row.get("Test Cases", "") or None,
-                    "automation_status": row.get("Automation", "") or None,
-                    "documentation_links": row.get("Documentation", "") or None,
-                    "status": row.get("Status", "") or None,
-                    "maturity": row.get("Maturity", "") or None,
-                }
-
-                if item:
-                    # Обновляем существующий
-                    for key, value in data.items():
-                        setattr(item, key, value)
-                    updated_count += 1
-                else:
-                    # Создаём новый
-                    item = FunctionalItem(**data)
-                    self.session.add(item)
-                    imported_count += 1
-
-            except Exception as e:
-                logger.error(f"Ошибка импорта элемента {row.get('FuncID')}: {e}")
-
-        self.session.commit()
-        logger.info(f"✅ Импортировано: {imported_count}, Обновлено: {updated_count}")
-
-        return imported_count + updated_count
+        return stats["new"] + stats["updated"] + stats["unchanged"]
 
-    def _import_relations(self, spreadsheet_id: str, sheet_name: str) -> int:
-        """Импорт связей"""
-        logger.info(f"🔗 Импорт relations из листа '{sheet_name}'")
+    def _import_relations(self, all_data: List[Dict[str, Any]]) -> int:
+        """Импорт связей (существующие — одним запросом, новые — пачкой)"""
+        logger.info(f"🔗 Импорт relations: {len(all_data)} строк")
 
-        try:
-            client = GoogleSheetsClient(
-                credentials_path=self.credentials_path,
-                spreadsheet_id=spreadsheet_id,
-                worksheet_name=sheet_name,
-                clear_on_open=False,  # НЕ очищать при импорте!
+        existing = {
+            tuple(row)
+            for row in self.session.execute(
+                select(Relation.source_id, Relation.target_id, Relation.type)
             )
-        except Exception as e:
-            logger.warning(f"Лист '{sheet_name}' не найден, пропускаем: {e}")
-            return 0
-
-        all_data = client.sheet.get_all_records()
-        logger.info(f"   Найдено строк: {len(all_data)}")
+        }
 
         imported_count = 0
+        new_relations = []
 
         for row in all_data:
             try:
@@ -242,41 +227,35 @@ class GoogleSheetsImporter:
                 if not source_id or not target_id:
                     continue
 
-                # Ищем существующую связь
-                rel = (
-                    self.session.query(Relation)
-                    .filter(
-                        Relation.source_id == source_id,
-                        Relation.target_id == target_id,
-                        Relation.type == row.get("Type", "hierarchy"),
-                    )
-                    .first()
+                key = (int(source_id), int(target_id), row.get("Type", "hierarchy"))
+                if key in existing:
+                    continue
+
+                # Создаём новую связь
+                rel = Relation(
+                    source_id=key[0],
+                    target_id=key[1],
+                    type=key[2],
+                    weight=float(row.get("Weight", 1.0)),
+                    directed=row.get("Directed") == "Да",
+                    active=row.get("Active", "Да") == "Да",
                 )
 
-                if not rel:
-                    # Создаём новую связь
-                    rel = Relation(
-                        source_id=int(source_id),
-                        target_id=int(target_id),
-                        type=row.get("Type", "hierarchy"),
-                        weight=float(row.get("Weight", 1.0)),
-                        directed=row.get("Directed") == "Да",
-                        active=row.get("Active", "Да") == "Да",
-                    )
-
-                    # Устанавливаем notes в metadata
-                    notes = row.get("Notes", "")
-                    if notes:
-                        rel.set_metadata({"notes": notes})
-
-                    self.session.add(rel)
-                    imported_count += 1
+                # Устанавливаем notes в metadata
+                notes = row.get("Notes", "")
+                if notes:
+                    rel.set_metadata({"notes": notes})
+
+                new_relations.append(rel)
+                existing.add(key)
+                imported_count += 1
 
             except Exception as e:
                 logger.error(
                     f"Ошибка импорта связи {row.get('Source ID')}->{row.get('Target ID')}: {e}"
                 )
 
+        self.session.add_all(new_relations)
         self.session.commit()
         logger.info(f"✅ Импортировано связей: {imported_count}")
 
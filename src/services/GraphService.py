@@ -0,0 +1,594 @@
+"""
+Graph Service
+
+Граф связей проекта в памяти (networkx), загружается один раз:
+- Узлы — functional_items (компактные кортежи, без ORM-объектов)
+- Рёбра из атрибутов (parent_id, module, epic, feature) и таблицы Relation
+- Изменения применяются дельтами по событиям сессии (after_flush → after_commit)
+- Представления: соседи, подграф, отфильтрованный граф
+
+Массовые изменения в обход ORM (INSERT/UPDATE/DELETE через session.execute)
+помечают граф устаревшим — он перезагружается при следующем обращении.
+
+Коммит из фонового потока (QThread импорта) применяется к графу и
+рассылается подписчикам в GUI-потоке: граф читают и рисуют виджеты.
+"""
+
+from collections import namedtuple
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+import logging
+import threading
+
+import networkx as nx
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
+
+from src.models import FunctionalItem, Relation
+from src.utils.graph_builder import NODE_COLORS, NODE_SIZES, ParentResolutionIndex
+from src.utils.gui_thread import call_in_gui_thread
+
+logger = logging.getLogger(__name__)
+
+# Поля элемента, которые нужны графу
+ItemNode = namedtuple(
+    "ItemNode",
+    [
+        "id",
+        "functional_id",
+        "alias_tag",
+        "title",
+        "type",
+        "module",
+        "epic",
+        "feature",
+        "parent_id",
+        "segment",
+        "is_crit",
+        "is_focus",
+    ],
+)
+
+# Поле-ссылка -> (тип родителя, тип ребра)
+ATTRIBUTE_LINKS = {
+    "module": ("Module", "module-of"),
+    "epic": ("Epic", "epic-of"),
+    "feature": ("Feature", "feature-of"),
+}
+PARENT_TYPES = {parent_type for parent_type, _ in ATTRIBUTE_LINKS.values()}
+
+# Рёбра иерархии (для соседей элемента)
+HIERARCHY_EDGE_TYPES = {"parent-of"} | {
+    edge_type for _, edge_type in ATTRIBUTE_LINKS.values()
+}
+
+EDGE_WEIGHTS = {"parent-of": 1.0, "module-of": 0.8, "epic-of": 0.9, "feature-of": 0.95}
+
+# Изменение этих полей у Module/Epic/Feature меняет разрешение ссылок по названию
+_RESOLUTION_FIELDS = ("functional_id", "title", "type")
+
+_CHANGE_ORDER = {"item": 0, "item_deleted": 1, "relation": 2, "relation_deleted": 3}
+
+
+def _item_node(item: FunctionalItem) -> ItemNode:
+    return ItemNode(*(getattr(item, field) for field in ItemNode._fields))
+
+
+class GraphService:
+    """
+    Инкрементальный граф связей одной БД проекта
+
+    Граф — nx.MultiDiGraph: у рёбер из атрибутов ключ = тип ребра,
+    у рёбер из Relation ключ = "rel:<id>".
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        """
+        Args:
+            session_factory: sessionmaker БД проекта — его сессии
+                отслеживаются, через него же граф загружается
+        """
+        self.session_factory = session_factory
+        self.graph = nx.MultiDiGraph()
+        self.loaded = False
+        self.stale = False
+
+        self._items: Dict[int, ItemNode] = {}
+        self._relations: Dict[int, Tuple[int, int]] = {}
+        # child id -> {тип ребра: id родителя} (рёбра из атрибутов)
+        self._attr_parents: Dict[int, Dict[str, int]] = {}
+        # parent_id -> id детей (в т.ч. пока без родителя в графе)
+        self._children_by_parent: Dict[int, Set[int]] = {}
+        # (тип родителя, значение поля) -> id элементов со ссылкой
+        self._refs: Dict[Tuple[str, str], Set[int]] = {}
+        self._index: Optional[ParentResolutionIndex] = None
+
+        self._listeners: List[Callable[[], None]] = []
+        # Изменения по сессиям до коммита (сессии бывают в разных потоках):
+        # (транзакция, изменение) — откат SAVEPOINT отбрасывает только свои
+        self._pending: Dict[int, List[Tuple[SessionTransaction, tuple]]] = {}
+        self._pending_lock = threading.Lock()
+        self._install_events()
+
+    # === События сессии ===
+
+    def _install_events(self):
+        event.listen(self.session_factory, "after_flush", self._on_after_flush)
+        event.listen(self.session_factory, "after_commit", self._on_after_commit)
+        event.listen(
+            self.session_factory, "after_soft_rollback", self._on_after_rollback
+        )
+        event.listen(self.session_factory, "do_orm_execute", self._on_orm_execute)
+
+    def detach(self):
+        """Отключиться от событий сессий (при закрытии проекта)"""
+        event.remove(self.session_factory, "after_flush", self._on_after_flush)
+        event.remove(self.session_factory, "after_commit", self._on_after_commit)
+        event.remove(
+            self.session_factory, "after_soft_rollback", self._on_after_rollback
+        )
+        event.remove(self.session_factory, "do_orm_execute", self._on_orm_execute)
+
+    def _add_pending(self, session: Session, changes: List[tuple]):
+        if changes:
+            # Самая внутренняя транзакция: SAVEPOINT или корневая
+            transaction = session.get_nested_transaction() or session.get_transaction()
+            with self._pending_lock:
+                self._pending.setdefault(id(session), []).extend(
+                    (transaction, change) for change in changes
+                )
+
+    def _pop_pending(self, session: Session) -> Optional[List[tuple]]:
+        with self._pending_lock:
+            pending = self._pending.pop(id(session), None)
+        return [change for _, change in pending] if pending else None
+
+    def _discard_pending(self, session: Session, savepoint: SessionTransaction):
+        """Отбросить изменения внутри откаченного SAVEPOINT (и вложенных в него)"""
+
+        def inside(transaction):
+            while transaction is not None:
+                if transaction is savepoint:
+                    return True
+                transaction = transaction.parent
+            return False
+
+        with self._pending_lock:
+            pending = self._pending.get(id(session))
+            if pending:
+                pending[:] = [item for item in pending if not inside(item[0])]
+
+    def _on_after_flush(self, session: Session, flush_context):
+        changes = []
+        for obj in session.new:
+            if isinstance(obj, FunctionalItem):
+                changes.append(("item", _item_node(obj)))
+            elif isinstance(obj, Relation):
+                changes.append(("relation", self._relation_state(obj)))
+        for obj in session.dirty:
+            if not session.is_modified(obj, include_collections=False):
+                continue
+            if isinstance(obj, FunctionalItem):
+                changes.append(("item", _item_node(obj)))
+            elif isinstance(obj, Relation):
+                changes.append(("relation", self._relation_state(obj)))
+        for obj in session.deleted:
+            if isinstance(obj, FunctionalItem):
+                changes.append(("item_deleted", obj.id))
+            elif isinstance(obj, Relation):
+                changes.append(("relation_deleted", obj.id))
+        self._add_pending(session, changes)
+
+    def _on_orm_execute(self, orm_execute_state):
+        if not (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            return
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and table.name in (
+            FunctionalItem.__tablename__,
+            Relation.__tablename__,
+        ):
+            self._add_pending(orm_execute_state.session, [("reload", None)])
+
+    def _on_after_commit(self, session: Session):
+        # Освобождение SAVEPOINT — изменения ждут коммита внешней транзакции
+        if session.in_nested_transaction():
+            return
+        changes = self._pop_pending(session)
+        if changes:
+            call_in_gui_thread(lambda: self._apply_committed(changes))
+
+    def _apply_committed(self, changes: List[tuple]):
+        if not self.loaded:
+            return
+        for kind, payload in changes:
+            if kind == "reload":
+                self.stale = True
+                break
+        else:
+            self.apply_changes(changes)
+        self._notify()
+
+    def _on_after_rollback(self, session: Session, previous_transaction):
+        if previous_transaction.nested:
+            self._discard_pending(session, previous_transaction)
+        else:
+            self._pop_pending(session)
+
+    @staticmethod
+    def _relation_state(rel: Relation) -> tuple:
+        return (
+            rel.id,
+            rel.source_id,
+            rel.target_id,
+            rel.type,
+            rel.weight,
+            rel.directed,
+            rel.active,
+        )
+
+    # === Подписка на изменения ===
+
+    def add_listener(self, callback: Callable[[], None]):
+        """callback() вызывается в GUI-потоке после применения изменений из коммита"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self):
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Ошибка обработчика изменений графа: {e}")
+
+    # === Загрузка ===
+
+    def ensure_loaded(self):
+        """Загрузить граф, если он ещё не загружен или устарел"""
+        if not self.loaded or self.stale:
+            self.reload()
+
+    def reload(self):
+        """Полная загрузка из БД (два запроса)"""
+        self.graph.clear()
+        self._items.clear()
+        self._relations.clear()
+        self._attr_parents.clear()
+        self._children_by_parent.clear()
+        self._refs.clear()
+
+        session = self.session_factory()
+        try:
+            columns = [getattr(FunctionalItem, field) for field in ItemNode._fields]
+            items = [
+                ItemNode(*row)
+                for row in session.execute(select(*columns).order_by(FunctionalItem.id))
+            ]
+            relations = session.execute(
+                select(
+                    Relation.id,
+                    Relation.source_id,
+                    Relation.target_id,
+                    Relation.type,
+                    Relation.weight,
+                    Relation.directed,
+                    Relation.active,
+                )
+            ).all()
+        finally:
+            session.close()
+
+        for node in items:
+            self._items[node.id] = node
+            self._add_node(node)
+            self._index_refs(node)
+            if node.parent_id:
+                self._children_by_parent.setdefault(node.parent_id, set()).add(node.id)
+        self._rebuild_index()
+        for node in items:
+            self._update_item_edges(node)
+        for state in relations:
+            self._apply_relation(tuple(state))
+
+        self.loaded = True
+        self.stale = False
+        logger.info(
+            f"Graph loaded: {self.graph.number_of_nodes()} nodes, "
+            f"{self.graph.number_of_edges()} edges"
+        )
+
+    # === Применение изменений ===
+
+    def apply_changes(self, changes: Iterable[tuple]):
+        """
+        Применить изменения: ("item", ItemNode), ("item_deleted", id),
+        ("relation", (id, source, target, type, weight, directed, active)),
+        ("relation_deleted", id)
+
+        Элементы применяются раньше связей: связь попадает в граф,
+        только если оба её конца уже есть.
+        """
+        for kind, payload in sorted(
+            changes, key=lambda change: _CHANGE_ORDER[change[0]]
+        ):
+            if kind == "item":
+                self._apply_item(payload)
+            elif kind == "item_deleted":
+                self._remove_item(payload)
+            elif kind == "relation":
+                self._apply_relation(payload)
+            elif kind == "relation_deleted":
+                self._remove_relation(payload)
+
+    def _add_node(self, node: ItemNode):
+        self.graph.add_node(
+            node.id,
+            label=node.title,
+            title=node.title,
+            funcid=node.functional_id,
+            alias_tag=node.alias_tag,
+            type=node.type,
+            segment=node.segment,
+            is_crit=node.is_crit,
+            is_focus=node.is_focus,
+            color=NODE_COLORS.get(node.type, "#808080"),
+            size=NODE_SIZES.get(node.type, 1000),
+        )
+
+    def _apply_item(self, node: ItemNode):
+        old = self._items.get(node.id)
+        self._items[node.id] = node
+        self._add_node(node)
+
+        if old is not None:
+            self._index_refs(old, add=False)
+            if old.parent_id and old.parent_id != node.parent_id:
+                self._children_by_parent.get(old.parent_id, set()).discard(node.id)
+        self._index_refs(node)
+        if node.parent_id:
+            self._children_by_parent.setdefault(node.parent_id, set()).add(node.id)
+
+        self._update_item_edges(node)
+
+        # Дети, ссылающиеся через parent_id, могли появиться раньше родителя
+        for child_id in self._children_by_parent.get(node.id, ()):
+            child = self._items.get(child_id)
+            if child is not None:
+                self._update_item_edges(child)
+
+        if self._affects_resolution(old, node):
+            self._rebuild_index()
+            self._reresolve()
+
+    def _remove_item(self, item_id: int):
+        node = self._items.pop(item_id, None)
+        if node is None:
+            return
+
+        if node.parent_id:
+            self._children_by_parent.get(node.parent_id, set()).discard(item_id)
+        self._index_refs(node, add=False)
+        self._attr_parents.pop(item_id, None)
+
+        # Рёбра узла уходят вместе с ним — чистим их учёт у соседей
+        for source, target, key in list(self.graph.in_edges(item_id, keys=True)) + list(
+            self.graph.out_edges(item_id, keys=True)
+        ):
+            if key.startswith("rel:"):
+                self._relations.pop(int(key[4:]), None)
+            elif source == item_id:
+                self._attr_parents.get(target, {}).pop(key, None)
+        self.graph.remove_node(item_id)
+
+        if node.type in PARENT_TYPES:
+            self._rebuild_index()
+            self._reresolve()
+
+    @staticmethod
+    def _affects_resolution(old: Optional[ItemNode], new: ItemNode) -> bool:
+        if old is None:
+            return new.type in PARENT_TYPES
+        if old.type not in PARENT_TYPES and new.type not in PARENT_TYPES:
+            return False
+        return any(
+            getattr(old, field) != getattr(new, field) for field in _RESOLUTION_FIELDS
+        )
+
+    def _rebuild_index(self):
+        """Индекс по названиям (только Module/Epic/Feature, порядок по id)"""
+        parents = sorted(
+            (node for node in self._items.values() if node.type in PARENT_TYPES),
+            key=lambda node: node.id,
+        )
+        self._index = ParentResolutionIndex(parents)
+
+    def _reresolve(self):
+        """Переразрешить ссылки по названиям после изменения родителей"""
+        for (parent_type, value), child_ids in self._refs.items():
+            parent = self._index.find(value, parent_type)
+            parent_id = parent.id if parent else None
+            edge_type = next(
+                edge for ptype, edge in ATTRIBUTE_LINKS.values() if ptype == parent_type
+            )
+            for child_id in child_ids:
+                current = self._attr_parents.get(child_id, {}).get(edge_type)
+                target = parent_id if parent_id != child_id else None
+                if current != target:
+                    self._set_attr_edge(child_id, edge_type, target)
+
+    def _resolve(self, value: Optional[str], parent_type: str) -> Optional[int]:
+        if not value or self._index is None:
+            return None
+        parent = self._index.find(value, parent_type)
+        return parent.id if parent else None
+
+    def _update_item_edges(self, node: ItemNode):
+        """Рёбра от родителей к элементу (parent_id + ссылки по названию)"""
+        old = self._attr_parents.get(node.id, {})
+        wanted = {}
+        if node.parent_id and node.parent_id in self._items:
+            wanted["parent-of"] = node.parent_id
+        for field, (parent_type, edge_type) in ATTRIBUTE_LINKS.items():
+            parent_id = self._resolve(getattr(node, field), parent_type)
+            if parent_id is not None and parent_id != node.id:
+                wanted[edge_type] = parent_id
+
+        for edge_type in set(old) | set(wanted):
+            if old.get(edge_type) != wanted.get(edge_type):
+                self._set_attr_edge(node.id, edge_type, wanted.get(edge_type))
+
+    def _index_refs(self, node: ItemNode, add: bool = True):
+        """Обратный индекс ссылок по названию: (тип родителя, значение) -> id"""
+        for field, (parent_type, _) in ATTRIBUTE_LINKS.items():
+            value = getattr(node, field)
+            if not value:
+                continue
+            if add:
+                self._refs.setdefault((parent_type, value), set()).add(node.id)
+            else:
+                self._refs.get((parent_type, value), set()).discard(node.id)
+
+    def _set_attr_edge(self, child_id: int, edge_type: str, parent_id: Optional[int]):
+        parents = self._attr_parents.setdefault(child_id, {})
+        current = parents.pop(edge_type, None)
+        if current is not None and self.graph.has_edge(current, child_id, edge_type):
+            self.graph.remove_edge(current, child_id, edge_type)
+        if parent_id is not None:
+            parents[edge_type] = parent_id
+            self.graph.add_edge(
+                parent_id,
+                child_id,
+                key=edge_type,
+                type=edge_type,
+                weight=EDGE_WEIGHTS[edge_type],
+            )
+
+    def _apply_relation(self, state: tuple):
+        rel_id, source_id, target_id, rel_type, weight, directed, active = state
+        self._remove_relation(rel_id)
+        if not active or source_id not in self._items or target_id not in self._items:
+            return
+        self._relations[rel_id] = (source_id, target_id)
+        self.graph.add_edge(
+            source_id,
+            target_id,
+            key=f"rel:{rel_id}",
+            type=rel_type,
+            weight=weight or 1.0,
+            directed=directed,
+            relation_id=rel_id,
+        )
+
+    def _remove_relation(self, rel_id: int):
+        ends = self._relations.pop(rel_id, None)
+        if ends and self.graph.has_edge(*ends, f"rel:{rel_id}"):
+            self.graph.remove_edge(*ends, f"rel:{rel_id}")
+
+    # === Представления ===
+
+    def get_item(self, item_id: int) -> Optional[ItemNode]:
+        self.ensure_loaded()
+        return self._items.get(item_id)
+
+    def neighbors(self, item_id: int) -> Tuple[List[ItemNode], List[ItemNode]]:
+        """
+        Родители и дети элемента по рёбрам иерархии — O(степень узла)
+
+        Returns:
+            (parents, children)
+        """
+        self.ensure_loaded()
+        if item_id not in self.graph:
+            return [], []
+
+        def collect(edges, pick):
+            result, seen = [], set()
+            for edge in edges:
+                other = pick(edge)
+                if edge[2].get("type") in HIERARCHY_EDGE_TYPES and other not in seen:
+                    seen.add(other)
+                    result.append(self._items[other])
+            return result
+
+        parents = collect(self.graph.in_edges(item_id, data=True), lambda edge: edge[0])
+        children = collect(
+            self.graph.out_edges(item_id, data=True), lambda edge: edge[1]
+        )
+        return parents, children
+
+    def subgraph(self, item_ids: Iterable[int]) -> nx.DiGraph:
+        """Подграф по набору узлов (копия, DiGraph)"""
+        self.ensure_loaded()
+        nodes = [item_id for item_id in item_ids if item_id in self.graph]
+        return nx.DiGraph(self.graph.subgraph(nodes))
+
+    def ego_graph(self, item_id: int, radius: int = 1) -> nx.DiGraph:
+        """Окрестность узла радиуса radius (без учёта направления рёбер)"""
+        self.ensure_loaded()
+        if item_id not in self.graph:
+            return nx.DiGraph()
+        return nx.DiGraph(nx.ego_graph(self.graph, item_id, radius, undirected=True))
+
+    def filtered_graph(
+        self,
+        edge_types: Optional[Set[str]] = None,
+        node_filter: Optional[Callable[[ItemNode], bool]] = None,
+    ) -> nx.DiGraph:
+        """
+        Граф для отрисовки: рёбра только нужных типов, узлы по фильтру
+
+        Args:
+            edge_types: Типы рёбер (None — все)
+            node_filter: Предикат по ItemNode (None — все узлы)
+        """
+        self.ensure_loaded()
+        result = nx.DiGraph()
+        for node_id, data in self.graph.nodes(data=True):
+            if node_filter is None or node_filter(self._items[node_id]):
+                result.add_node(node_id, **data)
+        for source, target, data in self.graph.edges(data=True):
+            if edge_types is not None and data.get("type") not in edge_types:
+                continue
+            if source in result and target in result:
+                result.add_edge(source, target, **data)
+        return result
+
+
+# Граф на каждую БД проекта
+_graph_services: Dict[str, GraphService] = {}
+
+
+def get_graph_service(db_path: Optional[Union[str, Path]] = None) -> GraphService:
+    """
+    Получить граф БД проекта (по умолчанию — текущей)
+
+    Граф привязан к sessionmaker из реестра engine; если engine был
+    пересоздан, граф создаётся заново.
+    """
+    from src.db.database import get_database_path
+    from src.db.engine_registry import get_engine_registry
+
+    path = Path(db_path) if db_path else get_database_path()
+    key = str(path.resolve())
+    session_factory = get_engine_registry().get_sessionmaker(path)
+
+    service = _graph_services.get(key)
+    if service is None or service.session_factory is not session_factory:
+        if service is not None:
+            service.detach()
+        service = _graph_services[key] = GraphService(session_factory)
+    return service
+
+
+def reset_graph_services():
+    """Сброс графов (для тестирования)"""
+    for service in _graph_services.values():
+        service.detach()
+    _graph_services.clear()
@@ -0,0 +1,216 @@
+"""
+RACI Matrix Service
+
+Матрица RACI "функциональные элементы × сотрудники" на NumPy/pandas:
+- Элементы и сотрудники читаются двумя SELECT по колонкам (без ORM-объектов)
+- JSON-массивы consulted_ids/informed_ids разбираются один раз на элемент
+- Роли ячейки — битовая маска (uint8), подписи — одна выборка из таблицы
+  подписей по всей матрице
+- Общий источник для Google Sheets, CSV и таба RACI
+"""
+
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
+from pathlib import Path
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.models import FunctionalItem, User
+from src.services.CoverageService import apply_filters
+
+logger = logging.getLogger(__name__)
+
+# Битовые флаги ролей ячейки
+R_QA = 1
+R_DEV = 2
+ACCOUNTABLE = 4
+CONSULTED = 8
+INFORMED = 16
+
+# Флаг -> подпись (порядок подписей в ячейке)
+ROLES = [
+    (R_QA, "R(QA)"),
+    (R_DEV, "R(Dev)"),
+    (ACCOUNTABLE, "A"),
+    (CONSULTED, "C"),
+    (INFORMED, "I"),
+]
+
+# Роли из FK-колонок (один сотрудник) и из JSON-массивов id
+SINGLE_ROLES = [
+    (R_QA, "responsible_qa_id"),
+    (R_DEV, "responsible_dev_id"),
+    (ACCOUNTABLE, "accountable_id"),
+]
+LIST_ROLES = [
+    (CONSULTED, "consulted_ids"),
+    (INFORMED, "informed_ids"),
+]
+
+# Колонки элемента перед колонками сотрудников
+ITEM_COLUMNS = ["FuncID", "Title", "Type"]
+
+_ITEM_FIELDS = ["functional_id", "title", "type"]
+
+# Маска -> текст ячейки ("R(QA), A, C")
+LABELS = np.array(
+    [
+        ", ".join(label for flag, label in ROLES if code & flag)
+        for code in range(1 << len(ROLES))
+    ],
+    dtype=object,
+)
+
+
+def parse_ids(value: Optional[str]) -> List[int]:
+    """
+    id сотрудников из JSON-массива (consulted_ids, informed_ids)
+
+    Битый JSON и нечисловые элементы пропускаются
+    """
+    if not value:
+        return []
+    try:
+        ids = json.loads(value)
+    except (ValueError, TypeError):
+        return []
+    if not isinstance(ids, list):
+        ids = [ids]
+
+    result = []
+    for user_id in ids:
+        try:
+            result.append(int(user_id))
+        except (ValueError, TypeError):
+            continue
+    return result
+
+
+def role_codes(items: pd.DataFrame, user_ids: Iterable[int]) -> np.ndarray:
+    """
+    Маски ролей: строка — элемент, колонка — сотрудник
+
+    Args:
+        items: Колонки SINGLE_ROLES и LIST_ROLES, по строке на элемент
+        user_ids: id сотрудников (порядок колонок); прочие id игнорируются
+
+    Returns:
+        np.ndarray: uint8 (len(items), len(user_ids))
+    """
+    users = pd.Index(list(user_ids))
+    codes = np.zeros((len(items), len(users)), dtype=np.uint8)
+    positions = np.arange(len(items))
+
+    for flag, column in SINGLE_ROLES:
+        columns = users.get_indexer(items[column].to_numpy(dtype=object))
+        found = columns >= 0
+        codes[positions[found], columns[found]] |= flag
+
+    for flag, column in LIST_ROLES:
+        # Элемент -> строки (позиция элемента, id) для каждого id массива
+        ids = pd.Series(
+            [parse_ids(value) for value in items[column]], index=positions
+        ).explode()
+        columns = users.get_indexer(ids.to_numpy(dtype=object))
+        found = columns >= 0
+        # Повтор id в массиве безопасен: OR идемпотентен
+        codes[ids.index.to_numpy()[found], columns[found]] |= flag
+
+    return codes
+
+
+class RaciMatrix:
+    """Собранная матрица RACI"""
+
+    def __init__(self, items: pd.DataFrame, users: pd.DataFrame, codes: np.ndarray):
+        """
+        Args:
+            items: Колонки ITEM_COLUMNS, по строке на элемент
+            users: Колонки id и name, по строке на сотрудника
+            codes: Маски ролей (role_codes)
+        """
+        self.items = items
+        self.users = users
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def user_names(self) -> List[str]:
+        return self.users["name"].tolist()
+
+    @property
+    def headers(self) -> List[str]:
+        """Заголовки листа / CSV"""
+        return ITEM_COLUMNS + self.user_names
+
+    def labels(self) -> np.ndarray:
+        """Тексты ячеек (object-массив той же формы, что codes)"""
+        return LABELS[self.codes]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Элементы + колонка на сотрудника (имена могут повторяться)"""
+        roles = pd.DataFrame(self.labels(), columns=self.user_names)
+        return pd.concat([self.items.reset_index(drop=True), roles], axis=1)
+
+    def to_rows(self) -> List[List[Any]]:
+        """Строки листа (без заголовков), значения — str"""
+        return np.concatenate(
+            [self.items.to_numpy(dtype=object), self.labels()], axis=1
+        ).tolist()
+
+    def role_counts(self) -> pd.DataFrame:
+        """Сотрудник -> число элементов по каждой роли"""
+        counts = {
+            label: np.count_nonzero(self.codes & flag, axis=0) for flag, label in ROLES
+        }
+        return pd.DataFrame(counts, index=self.user_names)
+
+    def export_csv(self, target: Union[str, Path, IO[str]]) -> int:
+        """
+        Выгрузка в CSV (колонки headers)
+
+        Returns:
+            int: Количество элементов
+        """
+        self.to_frame().to_csv(target, index=False)
+        logger.info(f"✅ RACI матрица выгружена в CSV: {len(self)} элементов")
+        return len(self)
+
+
+class RaciMatrixService:
+    """Сборка матрицы RACI из БД"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def build(self, filters: Optional[Dict] = None) -> RaciMatrix:
+        """
+        Матрица по активным сотрудникам
+
+        Args:
+            filters: Фильтры элементов (как в CoverageService)
+        """
+        users = pd.DataFrame(
+            self.session.execute(
+                select(User.id, User.name)
+                .where(User.is_active == True)
+                .order_by(User.id)
+            ).all(),
+            columns=["id", "name"],
+        )
+        fields = _ITEM_FIELDS + [column for _, column in SINGLE_ROLES + LIST_ROLES]
+        statement = select(*(getattr(FunctionalItem, field) for field in fields))
+        statement = apply_filters(statement, filters or {}).order_by(FunctionalItem.id)
+        rows = pd.DataFrame(self.session.execute(statement).all(), columns=fields)
+
+        items = rows[_ITEM_FIELDS].fillna("").set_axis(ITEM_COLUMNS, axis=1)
+        codes = role_codes(rows, users["id"])
+
+        logger.info(f"   Элементов: {len(items)}, Сотрудников: {len(users)}")
+        return RaciMatrix(items, users, codes)
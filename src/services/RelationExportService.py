@@ -0,0 +1,179 @@
+"""
+Relation Export Service
+
+Выгрузка связей вместе с funcid и названиями концов:
+- functional_item_relations JOIN functional_items дважды (aliased) — один запрос
+- Строки читаются потоком (yield_per), ORM-объекты не создаются
+- Общий источник для Google Sheets, CSV и JSON
+"""
+
+from typing import Any, Dict, IO, Iterator, NamedTuple, Optional, Union
+from contextlib import contextmanager
+from pathlib import Path
+import csv
+import json
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+
+from src.models import FunctionalItem, Relation
+
+logger = logging.getLogger(__name__)
+
+# Строк на порцию курсора
+YIELD_PER = 1000
+
+# Колонки листа "Связи" (их же читает GoogleSheetsImporter)
+SHEET_COLUMNS = [
+    "Source ID",
+    "Source FuncID",
+    "Source Title",
+    "Target ID",
+    "Target FuncID",
+    "Target Title",
+    "Type",
+    "Weight",
+    "Directed",
+    "Active",
+    "Notes",
+]
+
+
+class RelationRow(NamedTuple):
+    """Связь с funcid/названиями концов (None — элемент не найден)"""
+
+    id: int
+    source_id: int
+    source_functional_id: Optional[str]
+    source_title: Optional[str]
+    target_id: int
+    target_functional_id: Optional[str]
+    target_title: Optional[str]
+    type: Optional[str]
+    weight: Optional[float]
+    directed: Optional[bool]
+    active: Optional[bool]
+    meta_data: Optional[str]
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Разобранный meta_data (как Relation.get_metadata)"""
+        if not self.meta_data:
+            return {}
+        try:
+            return json.loads(self.meta_data)
+        except ValueError:
+            return {}
+
+    def to_sheet_record(self) -> Dict[str, Any]:
+        """Строка листа "Связи" / CSV"""
+        return {
+            "Source ID": self.source_id,
+            "Source FuncID": self.source_functional_id or "",
+            "Source Title": self.source_title or "",
+            "Target ID": self.target_id,
+            "Target FuncID": self.target_functional_id or "",
+            "Target Title": self.target_title or "",
+            "Type": self.type or "hierarchy",
+            "Weight": self.weight or 1.0,
+            "Directed": "Да" if self.directed else "Нет",
+            "Active": "Да" if self.active else "Нет",
+            "Notes": self.metadata.get("notes", "") or "",
+        }
+
+    def to_json_record(self) -> Dict[str, Any]:
+        """Объект JSON-выгрузки"""
+        record = self._asdict()
+        del record["meta_data"]
+        record["metadata"] = self.metadata
+        return record
+
+
+class RelationExportService:
+    """Потоковая выгрузка связей"""
+
+    def __init__(self, session: Session, batch_size: int = YIELD_PER):
+        self.session = session
+        self.batch_size = batch_size
+
+    def query(self):
+        """SELECT связей с обоими концами (LEFT JOIN — висячие связи не теряются)"""
+        source = aliased(FunctionalItem, name="source")
+        target = aliased(FunctionalItem, name="target")
+        return (
+            select(
+                Relation.id,
+                Relation.source_id,
+                source.functional_id,
+                source.title,
+                Relation.target_id,
+                target.functional_id,
+                target.title,
+                Relation.type,
+                Relation.weight,
+                Relation.directed,
+                Relation.active,
+                Relation.meta_data,
+            )
+            .outerjoin(source, source.id == Relation.source_id)
+            .outerjoin(target, target.id == Relation.target_id)
+            .order_by(Relation.id)
+            .execution_options(yield_per=self.batch_size)
+        )
+
+    def iter_rows(self) -> Iterator[RelationRow]:
+        """Связи порциями по batch_size строк"""
+        for row in self.session.execute(self.query()):
+            yield RelationRow(*row)
+
+    def iter_sheet_records(self) -> Iterator[Dict[str, Any]]:
+        for row in self.iter_rows():
+            yield row.to_sheet_record()
+
+    def export_csv(self, target: Union[str, Path, IO[str]]) -> int:
+        """
+        Выгрузка в CSV (колонки SHEET_COLUMNS)
+
+        Returns:
+            int: Количество связей
+        """
+        with _open_text(target) as file:
+            writer = csv.DictWriter(file, fieldnames=SHEET_COLUMNS)
+            writer.writeheader()
+            count = 0
+            for record in self.iter_sheet_records():
+                writer.writerow(record)
+                count += 1
+
+        logger.info(f"✅ Связей выгружено в CSV: {count}")
+        return count
+
+    def export_json(self, target: Union[str, Path, IO[str]]) -> int:
+        """
+        Выгрузка в JSON-массив (пишется по одной связи, без сборки списка)
+
+        Returns:
+            int: Количество связей
+        """
+        with _open_text(target) as file:
+            file.write("[")
+            count = 0
+            for row in self.iter_rows():
+                file.write(",\n" if count else "\n")
+                file.write(json.dumps(row.to_json_record(), ensure_ascii=False))
+                count += 1
+            file.write("\n]\n" if count else "]\n")
+
+        logger.info(f"✅ Связей выгружено в JSON: {count}")
+        return count
+
+
+@contextmanager
+def _open_text(target: Union[str, Path, IO[str]]) -> Iterator[IO[str]]:
+    """Путь — открыть (и закрыть) файл; файловый объект — как есть"""
+    if isinstance(target, (str, Path)):
+        with open(target, "w", encoding="utf-8", newline="") as file:
+            yield file
+    else:
+        yield target
@@ -1,19 +1,39 @@
 """
 Report Generator Service
 
-Генерация отчётов из markdown шаблонов с подстановкой данных из БД
+Генерация отчётов из markdown шаблонов с подстановкой данных из БД.
+Шаблон компилируется один раз (кэш по id/updated_at), данные для
+placeholder'ов запрашиваются только если они есть в шаблоне.
 """
 
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
 from src.models import FunctionalItem, User, ZohoTask, ReportTemplate
-import re
+from src.services.CoverageService import CoverageService, apply_filters
+from src.utils.template_compiler import (
+    MISSING,
+    LazyContext,
+    compile_template,
+    memoize,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Ключи статистики покрытия (_calculate_coverage)
+COVERAGE_KEYS = [
+    "coverage",
+    "with_tests",
+    "with_tests_pct",
+    "automated",
+    "automated_pct",
+    "documented",
+    "documented_pct",
+]
+
+
 class ReportGenerator:
     """Генератор отчётов из шаблонов"""
 
@@ -44,7 +64,7 @@ class ReportGenerator:
 
         logger.info(f"📋 Генерация отчёта по шаблону: {template.name}")
 
-        # Собираем данные
+        # Провайдеры данных (запросы выполняются при подстановке)
         data_context = self._build_context(filters or {})
 
         # Объединяем с пользовательским контекстом
@@ -52,93 +72,91 @@ class ReportGenerator:
             data_context.update(context)
 
         # Подставляем данные в шаблон
-        report_content = self._render_template(template.content, data_context)
+        report_content = self._render_template(
+            template.content,
+            data_context,
+            key=("report_template", template.id, template.updated_at),
+        )
 
         logger.info(f"✅ Отчёт сгенерирован: {len(report_content)} символов")
 
         return report_content
 
-    def _build_context(self, filters: Dict) -> Dict[str, Any]:
-        """Построение контекста данных из БД"""
-        context = {}
+    def _build_context(self, filters: Dict) -> LazyContext:
+        """Ленивый контекст данных из БД: запрос — при первом обращении"""
+        context = LazyContext()
 
         # Базовые данные
-        context["date"] = datetime.now().strftime("%Y-%m-%d")
-        context["datetime"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-        # Данные из functional_items
-        query = self.session.query(FunctionalItem)
+        now = datetime.now()
+        context.update(
+            {
+                "date": now.strftime("%Y-%m-%d"),
+                "datetime": now.strftime("%Y-%m-%d %H:%M"),
+            }
+        )
 
-        # Применяем фильтры
+        # Если указан milestone - берём задачи из zoho_tasks
         if filters.get("milestone_name"):
-            # Если указан milestone - берём задачи из zoho_tasks
-            zoho_tasks = (
-                self.session.query(ZohoTask)
-                .filter(ZohoTask.milestone_name == filters["milestone_name"])
+            milestone_name = filters["milestone_name"]
+            zoho_tasks = memoize(
+                lambda: self.session.query(ZohoTask)
+                .filter(ZohoTask.milestone_name == milestone_name)
                 .all()
             )
-            context["milestone_name"] = filters["milestone_name"]
-            context["task_count"] = len(zoho_tasks)
-            context["task_table"] = self._format_zoho_tasks_table(zoho_tasks)
-            context["task_list"] = self._format_zoho_tasks_list(zoho_tasks)
-
-        if filters.get("is_crit"):
-            query = query.filter(FunctionalItem.is_crit == True)
-
-        if filters.get("is_focus"):
-            query = query.filter(FunctionalItem.is_focus == True)
-
-        if filters.get("type"):
-            if isinstance(filters["type"], list):
-                query = query.filter(FunctionalItem.type.in_(filters["type"]))
-            else:
-                query = query.filter(FunctionalItem.type == filters["type"])
-
-        if filters.get("responsible_qa_id"):
-            query = query.filter(
-                FunctionalItem.responsible_qa_id == filters["responsible_qa_id"]
+            context.update({"milestone_name": milestone_name})
+            context.provide("task_count", lambda: len(zoho_tasks()))
+            context.provide(
+                "task_table", lambda: self._format_zoho_tasks_table(zoho_tasks())
+            )
+            context.provide(
+                "task_list", lambda: self._format_zoho_tasks_list(zoho_tasks())
             )
 
-        # Получаем данные
-        items = query.all()
-
-        context["item_count"] = len(items)
-        context["feature_list"] = self._format_functional_items_list(items)
-        context["feature_table"] = self._format_functional_items_table(items)
+        # Данные из functional_items
+        items = memoize(lambda: self._query_items(filters).all())
+        context.provide("item_count", lambda: len(items()))
+        context.provide(
+            "feature_list", lambda: self._format_functional_items_list(items())
+        )
+        context.provide(
+            "feature_table", lambda: self._format_functional_items_table(items())
+        )
 
-        # Статистика по покрытию
-        coverage_stats = self._calculate_coverage(items)
-        context.update(coverage_stats)
+        # Статистика по покрытию (агрегаты в SQL, без загрузки строк)
+        context.provide_many(
+            COVERAGE_KEYS, lambda: CoverageService(self.session).report_stats(filters)
+        )
 
         # QA команда
-        qa_users = (
-            self.session.query(User)
-            .filter(User.is_active == True, User.role.like("%QA%"))
+        qa_users = memoize(
+            lambda: self.session.query(User)
+            .filter(User.is_active == True, User.position.like("%QA%"))
             .all()
         )
-        context["qa_team"] = ", ".join([u.name for u in qa_users])
-        if qa_users:
-            context["qa_lead"] = qa_users[0].name  # Первый QA как лид
+        context.provide("qa_team", lambda: ", ".join([u.name for u in qa_users()]))
+        # Первый QA как лид
+        context.provide(
+            "qa_lead", lambda: qa_users()[0].name if qa_users() else MISSING
+        )
 
         # Если указан конкретный QA
         if filters.get("responsible_qa_id"):
-            qa = self.session.query(User).get(filters["responsible_qa_id"])
-            if qa:
-                context["qa_name"] = qa.name
 
-        return context
+            def qa_name():
+                qa = self.session.query(User).get(filters["responsible_qa_id"])
+                return qa.name if qa else MISSING
+
+            context.provide("qa_name", qa_name)
 
-    def _render_template(self, template: str, context: Dict[str, Any]) -> str:
-        """Рендеринг шаблона с подстановкой данных"""
-        result = template
+        return context
 
-        # Подстановка простых placeholder'ов {{key}}
-        for key, value in context.items():
-            placeholder = f"{{{{{key}}}}}"
-            if placeholder in result:
-                result = result.replace(placeholder, str(value))
+    def _query_items(self, filters: Dict):
+        """Запрос functional_items с фильтрами"""
+        return apply_filters(self.session.query(FunctionalItem), filters)
 
-        return result
+    def _render_template(self, template: str, context: Dict[str, Any], key=None) -> str:
+        """Рендеринг шаблона с подстановкой данных (за один проход)"""
+        return compile_template(template, key).render(context)
 
     def _format_functional_items_list(self, items: List[FunctionalItem]) -> str:
         """Форматирование списка функциональных элементов"""
@@ -208,33 +226,6 @@ class ReportGenerator:
 
         return "\n".join(lines)
 
-    def _calculate_coverage(self, items: List[FunctionalItem]) -> Dict[str, Any]:
-        """Расчёт статистики покрытия"""
-        total = len(items)
-        if total == 0:
-            return {"coverage": 0, "with_tests": 0, "automated": 0, "documented": 0}
-
-        with_tests = sum(1 for item in items if item.test_cases_linked)
-        automated = sum(
-            1
-            for item in items
-            if item.automation_status in ["Automated", "Partially Automated"]
-        )
-        documented = sum(1 for item in items if item.documentation_links)
-
-        # Общий процент покрытия
-        coverage = int(((with_tests + automated + documented) / (total * 3)) * 100)
-
-        return {
-            "coverage": coverage,
-            "with_tests": with_tests,
-            "with_tests_pct": int((with_tests / total) * 100),
-            "automated": automated,
-            "automated_pct": int((automated / total) * 100),
-            "documented": documented,
-            "documented_pct": int((documented / total) * 100),
-        }
-
     def get_available_placeholders(self) -> List[str]:
         """Список доступных placeholder'ов"""
         return [
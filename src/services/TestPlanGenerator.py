@@ -12,10 +12,12 @@
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Обновлённые импорты для новой структуры проекта
 from src.integrations.zoho.Zoho_api_client import ZohoAPI
+from src.utils.template_compiler import LazyContext, compile_template
 
 
 class TestPlanGenerator:
@@ -34,8 +36,23 @@ class TestPlanGenerator:
         self.template = self.load_template()
         self.start_date = None
         self.end_date = None
-        self.all_tasks = []
-        self.milestones_in_sprint = []
+        # Задачи по ID Zoho и ID мейлстоунов (dict — упорядоченное множество)
+        self.tasks_by_id = {}
+        self.sprint_milestone_ids = {}
+
+    @property
+    def all_tasks(self) -> list[dict]:
+        """
+        Задачи спринта в порядке добавления.
+        """
+        return list(self.tasks_by_id.values())
+
+    @property
+    def milestones_in_sprint(self) -> list:
+        """
+        ID мейлстоунов задач спринта в порядке добавления.
+        """
+        return list(self.sprint_milestone_ids)
 
     def set_dates(self, start_date: str, end_date: str) -> None:
         """
@@ -65,18 +82,18 @@ class TestPlanGenerator:
         """
         Инициализирует список задач и мейлстоунов для генерации тест-плана.
         """
+        # Названия сопоставляются с ID таск-листов/мейлстоунов за один проход,
+        # задачи по названиям выгружаются параллельно
+        tasks_by_title = self.api.get_tasks_by_titles(list(titles))
         for title in titles:
-            tasks = self.api.get_tasks_by_title(title)
-
-            # Добавляем задачи, избегая дублирования
-            for task in tasks:
-                if task not in self.all_tasks:
-                    self.all_tasks.append(task)
+            # Задача из нескольких названий учитывается один раз (по ID Zoho)
+            for task in tasks_by_title[title]:
+                self.tasks_by_id.setdefault(task["id"], task)
 
                 # Сохраняем уникальные мейлстоуны
                 milestone_id = task.get("milestone_id")
-                if milestone_id and milestone_id not in self.milestones_in_sprint:
-                    self.milestones_in_sprint.append(milestone_id)
+                if milestone_id:
+                    self.sprint_milestone_ids[milestone_id] = None
 
     @staticmethod
     def load_template() -> str:
@@ -175,14 +192,20 @@ class TestPlanGenerator:
         """
         Генерирует фокус-лист для тест-плана.
         """
-        tasks = self.api.get_tasks_in_date_range(self.start_date, self.end_date)
+        # Нужно только количество — считаем по мере загрузки страниц
+        tasks_count = sum(
+            1
+            for _ in self.api.iter_entities_by_filter(
+                "tasks", created_after=self.start_date, created_before=self.end_date
+            )
+        )
         return (
             "- 📌 _Ключевые изменения (новый функционал, доработки, рефакторинг)_\n"
             "- 🐞 _Регрессные дефекты (новые баги, возникшие снова)_\n"
             "- ⚠️ _Флакующие тесты (нестабильные тесты, требующие анализа)_\n"
             "- *За каждым функционалом закрепляется специалист QA*\n"
             "- *После 2х релизов без дефектов в функционале — он покидает этот список*\n"
-            f"- Найдено задач: {len(tasks)}\n"
+            f"- Найдено задач: {tasks_count}\n"
         )
 
     def generate_affected_functionality(self, functionality_map: dict) -> str:
@@ -192,7 +215,7 @@ class TestPlanGenerator:
         if not self.start_date or not self.end_date:
             raise ValueError("Даты начала и конца спринта не установлены.")
 
-        tasks = self.api.get_entities_by_filter(
+        tasks = self.api.iter_entities_by_filter(
             entity_type="tasks",
             created_after=self.start_date,
             created_before=self.end_date,
@@ -247,17 +270,22 @@ class TestPlanGenerator:
         if not self.start_date or not self.end_date:
             raise ValueError("Даты начала и конца спринта не установлены.")
 
-        # Получаем баги в указанном диапазоне дат
-        defects = self.api.get_entities_by_filter(
-            entity_type="bugs",
-            created_after=self.start_date,
-            created_before=self.end_date,
-        )
-        closed_defects = self.api.get_entities_by_filter(
-            entity_type="bugs",
-            closed_after=self.start_date,
-            closed_before=self.end_date,
-        )
+        # Обнаруженные и закрытые баги в диапазоне дат — параллельно
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            defects_future = executor.submit(
+                self.api.get_entities_by_filter,
+                entity_type="bugs",
+                created_after=self.start_date,
+                created_before=self.end_date,
+            )
+            closed_future = executor.submit(
+                self.api.get_entities_by_filter,
+                entity_type="bugs",
+                closed_after=self.start_date,
+                closed_before=self.end_date,
+            )
+            defects = defects_future.result()
+            closed_defects = closed_future.result()
 
         # Генерируем таблицу дефектов
         defects_table = self.generate_defects_table(defects)
@@ -274,21 +302,19 @@ class TestPlanGenerator:
         """
         Генерирует тест-план и сохраняет его в файл.
         """
-        tasks_table = self.generate_tasks_table(tasks)
-        testing_schedule = self.generate_testing_schedule()
-        focus_list = self.generate_focus_list()
-        affected_functionality = self.generate_affected_functionality(
-            functionality_map={}
-        )
-        regression_report = self.generate_regression_report()
-
-        plan = (
-            self.template.replace("{{tasks_table}}", tasks_table)
-            .replace("{{testing_schedule}}", testing_schedule)
-            .replace("{{focus_list}}", focus_list)
-            .replace("{{affected_functionality}}", affected_functionality)
-            .replace("{{regression_report}}", regression_report)
+        # Разделы строятся (и запрашивают Zoho) только если есть в шаблоне
+        context = LazyContext(
+            providers={
+                "tasks_table": lambda: self.generate_tasks_table(tasks),
+                "testing_schedule": self.generate_testing_schedule,
+                "focus_list": self.generate_focus_list,
+                "affected_functionality": lambda: self.generate_affected_functionality(
+                    functionality_map={}
+                ),
+                "regression_report": self.generate_regression_report,
+            }
         )
+        plan = compile_template(self.template).render(context)
 
         with open(output_file, "w", encoding="utf-8") as file:
             file.write(plan)
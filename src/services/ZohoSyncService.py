@@ -3,31 +3,60 @@ Zoho Sync Service
 
 Сервис для синхронизации задач из Zoho Projects в VoluptAS:
 - Загрузка задач из Zoho Projects (по milestone, tasklist, фильтрам)
+- Инкрементальная синхронизация milestone/tasklist по watermark
 - Сохранение в локальную БД (zoho_tasks)
 - Сопоставление с functional_items
 - Обновление ответственных QA
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+from datetime import datetime, timezone
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
-from src.integrations.zoho.Zoho_api_client import ZohoAPI
-from src.models import ZohoTask, FunctionalItem, User
+from src.integrations.zoho.Zoho_api_client import ZohoAPI, ZohoPageError
+from src.models import ZohoTask, ZohoSyncState, FunctionalItem, User
+import hashlib
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 200
+
+# Колонки, которые обновляются у уже загруженной задачи
+UPDATE_FIELDS = [
+    "name",
+    "description",
+    "status",
+    "priority",
+    "start_date",
+    "end_date",
+    "owner_name",
+    "milestone_name",
+    "tasklist_name",
+]
+
 
 class ZohoSyncService:
     """Сервис синхронизации задач Zoho с VoluptAS"""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ):
         """
         Args:
             session: SQLAlchemy session
+            batch_size: Размер пачки (одна транзакция на пачку)
+            on_progress: Callback с сообщением о прогрессе после каждой пачки
         """
         self.session = session
+        self.batch_size = batch_size
+        self.on_progress = on_progress
         self.zoho_client = None
+        self._sync_state_ready = False
 
     def init_zoho_client(self) -> bool:
         """
@@ -44,12 +73,18 @@ class ZohoSyncService:
             logger.error(f"❌ Ошибка инициализации Zoho API: {e}")
             return False
 
-    def sync_tasks_by_milestone(self, milestone_name: str) -> Dict[str, int]:
+    def sync_tasks_by_milestone(
+        self, milestone_name: str, full_resync: bool = False
+    ) -> Dict[str, int]:
         """
         Синхронизация задач из Zoho по названию milestone
 
+        Повторная синхронизация загружает только задачи, изменённые
+        после прошлой успешной (watermark).
+
         Args:
             milestone_name: Название milestone в Zoho
+            full_resync: Загрузить все задачи milestone (восстановление)
 
         Returns:
             dict: Статистика синхронизации
@@ -66,18 +101,26 @@ class ZohoSyncService:
             logger.warning(f"⚠️ Milestone '{milestone_name}' не найден")
             return {"error": f'Milestone "{milestone_name}" не найден'}
 
-        # Получаем задачи
-        tasks_data = self.zoho_client.get_tasks_by_milestone(milestone_id)
-        logger.info(f"   Получено задач: {len(tasks_data)}")
-
-        return self._process_tasks(tasks_data, milestone_id, milestone_name)
+        return self._sync_scope(
+            f"milestone:{milestone_id}",
+            {"milestone_id": milestone_id},
+            full_resync,
+            milestone_id=milestone_id,
+            milestone_name=milestone_name,
+        )
 
-    def sync_tasks_by_tasklist(self, tasklist_name: str) -> Dict[str, int]:
+    def sync_tasks_by_tasklist(
+        self, tasklist_name: str, full_resync: bool = False
+    ) -> Dict[str, int]:
         """
         Синхронизация задач из Zoho по названию tasklist
 
+        Повторная синхронизация загружает только задачи, изменённые
+        после прошлой успешной (watermark).
+
         Args:
             tasklist_name: Название tasklist в Zoho
+            full_resync: Загрузить все задачи tasklist (восстановление)
 
         Returns:
             dict: Статистика синхронизации
@@ -94,12 +137,12 @@ class ZohoSyncService:
             logger.warning(f"⚠️ Tasklist '{tasklist_name}' не найден")
             return {"error": f'Tasklist "{tasklist_name}" не найден'}
 
-        # Получаем задачи
-        tasks_data = self.zoho_client.get_tasks_by_tasklist(tasklist_id)
-        logger.info(f"   Получено задач: {len(tasks_data)}")
-
-        return self._process_tasks(
-            tasks_data, tasklist_id=tasklist_id, tasklist_name=tasklist_name
+        return self._sync_scope(
+            f"tasklist:{tasklist_id}",
+            {"tasklist_id": tasklist_id},
+            full_resync,
+            tasklist_id=tasklist_id,
+            tasklist_name=tasklist_name,
         )
 
     def sync_tasks_by_filter(
@@ -127,149 +170,302 @@ class ZohoSyncService:
 
         logger.info(f"📋 Синхронизация задач по фильтрам")
 
-        # Получаем задачи
-        tasks_data = self.zoho_client.get_entities_by_filter(
+        # Задачи обрабатываются по мере загрузки страниц
+        tasks_data = self.zoho_client.iter_entities_by_filter(
             entity_type="tasks",
             created_after=created_after,
             created_before=created_before,
             owner_id=owner_id,
             milestone_id=milestone_id,
         )
-        logger.info(f"   Получено задач: {len(tasks_data)}")
+        tracker = {"latest": None, "not_modified": 0, "incomplete": False}
+        stats = self._process_tasks(self._track_modified(tasks_data, None, tracker))
+        if tracker["incomplete"]:
+            stats["errors"] += 1
+        return stats
+
+    def _sync_scope(
+        self, scope: str, filters: Dict, full_resync: bool, **context
+    ) -> Dict[str, int]:
+        """
+        Синхронизация области (milestone/tasklist) от сохранённого watermark
+
+        Watermark сдвигается только если все страницы получены и все пачки
+        сохранены без ошибок, иначе следующая синхронизация повторит тот же
+        интервал.
+        """
+        state = self.get_sync_state(scope)
+        watermark = None if full_resync or state is None else state.watermark
+        if watermark:
+            logger.info(f"   Инкрементально: изменённые после {watermark} UTC")
+        else:
+            logger.info("   Полная синхронизация")
+
+        tracker = {"latest": watermark, "not_modified": 0, "incomplete": False}
+        # Задачи обрабатываются по мере загрузки страниц
+        tasks_data = self.zoho_client.iter_entities_by_filter(
+            "tasks", modified_after_ms=self._to_ms(watermark), strict=True, **filters
+        )
+        stats = self._process_tasks(
+            self._track_modified(tasks_data, watermark, tracker), **context
+        )
+        stats["unchanged"] += tracker["not_modified"]
+        stats["incremental"] = watermark is not None
+        if tracker["incomplete"]:
+            stats["errors"] += 1
+
+        if stats["errors"]:
+            logger.warning(f"⚠️ Watermark {scope} не сдвинут: были ошибки")
+            return stats
+
+        now = datetime.utcnow()
+        if state is None:
+            state = ZohoSyncState(scope=scope)
+            self.session.add(state)
+        state.watermark = tracker["latest"]
+        state.synced_at = now
+        if watermark is None:
+            state.full_synced_at = now
+        self.session.commit()
+        return stats
+
+    def _track_modified(
+        self, tasks_data: Iterable[Dict], watermark: Optional[datetime], tracker: Dict
+    ) -> Iterator[Dict]:
+        """
+        Пропускает задачи, не изменённые после watermark (если фильтр Zoho
+        не сработал), и запоминает максимальное время изменения.
+        Неполученная страница завершает поток с tracker["incomplete"]
+        """
+        try:
+            for task in tasks_data:
+                modified = self._modified_time(task)
+                if modified is not None:
+                    if watermark is not None and modified < watermark:
+                        tracker["not_modified"] += 1
+                        continue
+                    if tracker["latest"] is None or modified > tracker["latest"]:
+                        tracker["latest"] = modified
+                yield task
+        except ZohoPageError as e:
+            logger.error(f"❌ {e}")
+            tracker["incomplete"] = True
+
+    @classmethod
+    def _modified_time(cls, task: Dict) -> Optional[datetime]:
+        """Время последнего изменения задачи в Zoho (UTC, без tzinfo)"""
+        for key in ("last_updated_time_long", "last_modified_time_long"):
+            if task.get(key):
+                return datetime.fromtimestamp(
+                    int(task[key]) / 1000, timezone.utc
+                ).replace(tzinfo=None)
+        return cls._parse_zoho_date(task.get("last_updated_time"))
 
-        return self._process_tasks(tasks_data)
+    @staticmethod
+    def _to_ms(value: Optional[datetime]) -> Optional[int]:
+        if value is None:
+            return None
+        return int(value.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+    def get_sync_state(self, scope: str) -> Optional[ZohoSyncState]:
+        """Состояние синхронизации области (таблица создаётся при первом обращении)"""
+        if not self._sync_state_ready:
+            ZohoSyncState.__table__.create(self.session.get_bind(), checkfirst=True)
+            self._sync_state_ready = True
+        return self.session.query(ZohoSyncState).filter_by(scope=scope).first()
 
     def _process_tasks(
         self,
-        tasks_data: List[Dict],
+        tasks_data: Iterable[Dict],
         milestone_id: Optional[str] = None,
         milestone_name: Optional[str] = None,
         tasklist_id: Optional[str] = None,
         tasklist_name: Optional[str] = None,
     ) -> Dict[str, int]:
         """
-        Обработка и сохранение задач в БД
+        Обработка и сохранение задач в БД пачками
+
+        Для каждой пачки: один IN-запрос существующих задач, массовая
+        вставка новых, массовое обновление изменённых (совпадающие по
+        хешу значений пропускаются) и коммит.
 
         Args:
-            tasks_data: Данные задач из Zoho API
+            tasks_data: Данные задач из Zoho API (список или генератор страниц)
             milestone_id: ID milestone (опционально)
             milestone_name: Название milestone (опционально)
             tasklist_id: ID tasklist (опционально)
             tasklist_name: Название tasklist (опционально)
 
         Returns:
-            dict: Статистика (new, updated, skipped)
+            dict: Статистика (new, updated, unchanged, skipped, errors)
         """
-        stats = {"new": 0, "updated": 0, "skipped": 0, "errors": 0}
+        stats = {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0, "errors": 0}
+        context = (milestone_id, milestone_name, tasklist_id, tasklist_name)
+
+        received = 0
+        for batch in self._batches(tasks_data):
+            received += len(batch)
+            self._process_batch(batch, context, stats)
+            self._progress(
+                f"💾 Сохранено задач: {received} "
+                f"(новых {stats['new']}, обновлено {stats['updated']})"
+            )
+
+        logger.info(f"   Получено задач: {received}")
+        logger.info(f"✅ Синхронизация завершена: {stats}")
+        return stats
 
+    def _batches(self, tasks_data: Iterable[Dict]) -> Iterator[List[Dict]]:
+        batch = []
         for task in tasks_data:
+            batch.append(task)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _progress(self, message: str):
+        logger.info(message)
+        if self.on_progress:
+            self.on_progress(message)
+
+    def _process_batch(self, batch: List[Dict], context: tuple, stats: Dict[str, int]):
+        """Одна пачка задач — одна транзакция"""
+        milestone_id, milestone_name, tasklist_id, tasklist_name = context
+
+        # Дубли внутри пачки — побеждает последняя версия задачи
+        tasks = {}
+        for task in batch:
+            if task.get("id") is None:
+                stats["skipped"] += 1
+                continue
+            tasks[str(task["id"])] = task
+
+        existing = {
+            row.zoho_task_id: row
+            for row in self.session.execute(
+                select(
+                    ZohoTask.id, ZohoTask.zoho_task_id, *self._update_columns()
+                ).where(ZohoTask.zoho_task_id.in_(list(tasks)))
+            )
+        }
+
+        new_records, updates = [], []
+        for zoho_task_id, task in tasks.items():
             try:
-                zoho_task_id = str(task.get("id"))
+                current = existing.get(zoho_task_id)
+                if current is None:
+                    new_records.append(
+                        self._task_record(
+                            task,
+                            milestone_id,
+                            milestone_name,
+                            tasklist_id,
+                            tasklist_name,
+                        )
+                    )
+                    continue
 
-                # Проверяем, существует ли задача
-                existing_task = (
-                    self.session.query(ZohoTask)
-                    .filter_by(zoho_task_id=zoho_task_id)
-                    .first()
+                values = self._updated_values(
+                    current._mapping, task, milestone_name, tasklist_name
                 )
-
-                if existing_task:
-                    # Обновляем существующую
-                    self._update_task(
-                        existing_task, task, milestone_name, tasklist_name
-                    )
-                    stats["updated"] += 1
+                if self._payload_hash(values) == self._payload_hash(
+                    {key: current._mapping[key] for key in values}
+                ):
+                    stats["unchanged"] += 1
                 else:
-                    # Создаём новую
-                    self._create_task(
-                        task, milestone_id, milestone_name, tasklist_id, tasklist_name
+                    updates.append(
+                        dict(values, id=current.id, synced_at=datetime.utcnow())
                     )
-                    stats["new"] += 1
-
             except Exception as e:
                 logger.error(f"❌ Ошибка обработки задачи {task.get('id')}: {e}")
                 stats["errors"] += 1
 
-        # Сохраняем изменения
         try:
+            if new_records:
+                self.session.execute(insert(ZohoTask), new_records)
+            if updates:
+                self.session.execute(update(ZohoTask), updates)
             self.session.commit()
-            logger.info(f"✅ Синхронизация завершена: {stats}")
         except Exception as e:
             self.session.rollback()
             logger.error(f"❌ Ошибка сохранения в БД: {e}")
-            stats["errors"] += 1
+            stats["errors"] += len(new_records) + len(updates)
+            return
 
-        return stats
+        stats["new"] += len(new_records)
+        stats["updated"] += len(updates)
+
+    @staticmethod
+    def _update_columns():
+        return [ZohoTask.__table__.c[name] for name in UPDATE_FIELDS]
 
-    def _create_task(
+    @staticmethod
+    def _payload_hash(values: Dict) -> str:
+        payload = json.dumps(values, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _task_record(
         self,
         task_data: Dict,
         milestone_id: Optional[str] = None,
         milestone_name: Optional[str] = None,
         tasklist_id: Optional[str] = None,
         tasklist_name: Optional[str] = None,
-    ):
-        """Создание новой задачи в БД"""
-        zoho_task = ZohoTask(
-            zoho_task_id=str(task_data.get("id")),
-            zoho_project_id=str(task_data.get("project_id", "")),
-            name=task_data.get("name", ""),
-            description=task_data.get("description", ""),
-            status=task_data.get("status", {}).get("name", ""),
-            priority=task_data.get("priority", ""),
-            created_time=self._parse_zoho_date(task_data.get("created_time")),
-            start_date=self._parse_zoho_date(task_data.get("start_date")),
-            end_date=self._parse_zoho_date(task_data.get("end_date")),
-            owner_id=str(
+    ) -> Dict:
+        """Значения колонок новой задачи"""
+        return {
+            "zoho_task_id": str(task_data.get("id")),
+            "zoho_project_id": str(task_data.get("project_id", "")),
+            "name": task_data.get("name", ""),
+            "description": task_data.get("description", ""),
+            "status": task_data.get("status", {}).get("name", ""),
+            "priority": task_data.get("priority", ""),
+            "created_time": self._parse_zoho_date(task_data.get("created_time")),
+            "start_date": self._parse_zoho_date(task_data.get("start_date")),
+            "end_date": self._parse_zoho_date(task_data.get("end_date")),
+            "owner_id": str(
                 task_data.get("details", {}).get("owners", [{}])[0].get("id", "")
             ),
-            owner_name=task_data.get("details", {})
+            "owner_name": task_data.get("details", {})
             .get("owners", [{}])[0]
             .get("name", ""),
-            milestone_id=milestone_id
+            "milestone_id": milestone_id
             or str(task_data.get("milestone", {}).get("id", "")),
-            milestone_name=milestone_name
+            "milestone_name": milestone_name
             or task_data.get("milestone", {}).get("name", ""),
-            tasklist_id=tasklist_id or str(task_data.get("tasklist", {}).get("id", "")),
-            tasklist_name=tasklist_name
+            "tasklist_id": tasklist_id
+            or str(task_data.get("tasklist", {}).get("id", "")),
+            "tasklist_name": tasklist_name
             or task_data.get("tasklist", {}).get("name", ""),
-            tags=task_data.get("tags", []),
-            custom_fields=task_data.get("custom_fields", {}),
-        )
-        self.session.add(zoho_task)
-        logger.debug(f"   + Создана задача: {zoho_task.name}")
+            "tags": task_data.get("tags", []),
+            "custom_fields": task_data.get("custom_fields", {}),
+        }
 
-    def _update_task(
+    def _updated_values(
         self,
-        zoho_task: ZohoTask,
+        current: Mapping,
         task_data: Dict,
         milestone_name: Optional[str] = None,
         tasklist_name: Optional[str] = None,
-    ):
-        """Обновление существующей задачи"""
-        zoho_task.name = task_data.get("name", zoho_task.name)
-        zoho_task.description = task_data.get("description", zoho_task.description)
-        zoho_task.status = task_data.get("status", {}).get("name", zoho_task.status)
-        zoho_task.priority = task_data.get("priority", zoho_task.priority)
-        zoho_task.start_date = (
-            self._parse_zoho_date(task_data.get("start_date")) or zoho_task.start_date
-        )
-        zoho_task.end_date = (
-            self._parse_zoho_date(task_data.get("end_date")) or zoho_task.end_date
-        )
-        zoho_task.owner_name = (
-            task_data.get("details", {})
+    ) -> Dict:
+        """Новые значения обновляемых колонок (отсутствующие в Zoho — прежние)"""
+        return {
+            "name": task_data.get("name", current["name"]),
+            "description": task_data.get("description", current["description"]),
+            "status": task_data.get("status", {}).get("name", current["status"]),
+            "priority": task_data.get("priority", current["priority"]),
+            "start_date": self._parse_zoho_date(task_data.get("start_date"))
+            or current["start_date"],
+            "end_date": self._parse_zoho_date(task_data.get("end_date"))
+            or current["end_date"],
+            "owner_name": task_data.get("details", {})
             .get("owners", [{}])[0]
-            .get("name", zoho_task.owner_name)
-        )
-
-        if milestone_name:
-            zoho_task.milestone_name = milestone_name
-        if tasklist_name:
-            zoho_task.tasklist_name = tasklist_name
-
-        zoho_task.synced_at = datetime.utcnow()
-        logger.debug(f"   ↻ Обновлена задача: {zoho_task.name}")
+            .get("name", current["owner_name"]),
+            "milestone_name": milestone_name or current["milestone_name"],
+            "tasklist_name": tasklist_name or current["tasklist_name"],
+        }
 
     @staticmethod
     def _parse_zoho_date(date_str: Optional[str]) -> Optional[datetime]:
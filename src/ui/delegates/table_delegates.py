@@ -0,0 +1,152 @@
+"""
+Table Delegates
+
+Делегаты, рисующие чекбоксы и кнопки действий прямо в ячейках таблицы
+(вместо setCellWidget на каждую строку).
+"""
+
+from PyQt6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
+    QToolTip,
+)
+from PyQt6.QtCore import QEvent, QModelIndex, QRect, Qt, pyqtSignal
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """Делегат для чекбокса по центру ячейки (Crit, Focus)"""
+
+    def _indicator_rect(self, option) -> QRect:
+        style = option.widget.style() if option.widget else QApplication.style()
+        size = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorWidth)
+        rect = QRect(0, 0, size, size)
+        rect.moveCenter(option.rect.center())
+        return rect
+
+    def paint(self, painter, option, index):
+        # Фон/выделение рисуем стандартно, без текста и встроенного чекбокса
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else QApplication.style()
+        option.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        option.text = ""
+        style.drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget
+        )
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        button = QStyleOptionButton()
+        button.rect = self._indicator_rect(option)
+        button.state = QStyle.StateFlag.State_Enabled | (
+            QStyle.StateFlag.State_On if checked else QStyle.StateFlag.State_Off
+        )
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_IndicatorCheckBox, button, painter, option.widget
+        )
+
+    def editorEvent(self, event, model, option, index):
+        if not index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            return False
+
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            if event.button() != Qt.MouseButton.LeftButton:
+                return False
+            if not self._indicator_rect(option).contains(event.position().toPoint()):
+                return False
+        elif event.type() == QEvent.Type.MouseButtonDblClick:
+            # Двойной клик не должен переключать дважды
+            return True
+        elif event.type() == QEvent.Type.KeyPress:
+            if event.key() not in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+                return False
+        else:
+            return False
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+        return model.setData(index, new_state, Qt.ItemDataRole.CheckStateRole)
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Делегат для колонки Actions: кнопки "Редактировать" и "Удалить"
+
+    Signals:
+        edit_clicked (QModelIndex): Нажата кнопка редактирования
+        delete_clicked (QModelIndex): Нажата кнопка удаления
+    """
+
+    edit_clicked = pyqtSignal(QModelIndex)
+    delete_clicked = pyqtSignal(QModelIndex)
+
+    BUTTONS = [("edit", "✏️", "Редактировать"), ("delete", "🗑️", "Удалить")]
+    BUTTON_WIDTH = 30
+    BUTTON_HEIGHT = 25
+    SPACING = 4
+    MARGIN = 4
+
+    def _button_rects(self, option):
+        rects = []
+        x = option.rect.left() + self.MARGIN
+        top = option.rect.top() + (option.rect.height() - self.BUTTON_HEIGHT) // 2
+        for name, _, _ in self.BUTTONS:
+            rects.append((name, QRect(x, top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)))
+            x += self.BUTTON_WIDTH + self.SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget
+        )
+
+        for (name, rect), (_, text, _) in zip(self._button_rects(option), self.BUTTONS):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = text
+            button.state = (
+                QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            )
+            style.drawControl(
+                QStyle.ControlElement.CE_PushButton, button, painter, option.widget
+            )
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        width = (
+            2 * self.MARGIN
+            + len(self.BUTTONS) * self.BUTTON_WIDTH
+            + (len(self.BUTTONS) - 1) * self.SPACING
+        )
+        size.setWidth(width)
+        size.setHeight(max(size.height(), self.BUTTON_HEIGHT + 4))
+        return size
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease:
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        pos = event.position().toPoint()
+        for name, rect in self._button_rects(option):
+            if rect.contains(pos):
+                if name == "edit":
+                    self.edit_clicked.emit(index)
+                else:
+                    self.delete_clicked.emit(index)
+                return True
+        return False
+
+    def helpEvent(self, event, view, option, index):
+        # Тултипы для нарисованных кнопок
+        for (name, rect), (_, _, tooltip) in zip(
+            self._button_rects(option), self.BUTTONS
+        ):
+            if rect.contains(event.pos()):
+                QToolTip.showText(event.globalPos(), tooltip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
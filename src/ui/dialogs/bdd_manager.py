@@ -192,6 +192,7 @@ class BDDFeatureManager(QMainWindow):
 
     def populate_table(self, items):
         """Заполнить таблицу"""
+        self.table_items = list(items)  # Элемент каждой строки (для фильтров)
         self.table.setRowCount(len(items))
 
         for row_idx, item in enumerate(items):
@@ -210,7 +211,11 @@ class BDDFeatureManager(QMainWindow):
 
     def apply_filters(self):
         """Применить фильтры"""
-        search_text = self.search_input.text().lower()
+        from src.db.search_index import search_functional_items
+
+        # Текстовый поиск — по FTS-индексу, строки проверяются по id
+        found_ids = search_functional_items(self.session, self.search_input.text())
+        found_ids = set(found_ids) if found_ids is not None else None
         type_filter = self.type_filter.currentText()
         segment_filter = self.segment_filter.currentText()
         only_crit = self.crit_check.isChecked()
@@ -220,13 +225,8 @@ class BDDFeatureManager(QMainWindow):
             show = True
 
             # Текстовый поиск
-            if search_text:
-                match = any(
-                    self.table.item(row, col)
-                    and search_text in self.table.item(row, col).text().lower()
-                    for col in range(self.table.columnCount())
-                )
-                show = show and match
+            if found_ids is not None:
+                show = self.table_items[row].id in found_ids
 
             # Type фильтр
             if type_filter and show:
@@ -21,15 +21,16 @@ class ExportThread(QThread):
     finished = pyqtSignal(dict, str)
     progress = pyqtSignal(str)
 
-    def __init__(self, exporter, spreadsheet_id):
+    def __init__(self, exporter, spreadsheet_id, diff=False):
         super().__init__()
         self.exporter = exporter
         self.spreadsheet_id = spreadsheet_id
+        self.diff = diff
 
     def run(self):
         try:
             self.progress.emit("📤 Экспорт данных...")
-            stats = self.exporter.export_all_tables(self.spreadsheet_id)
+            stats = self.exporter.export_all_tables(self.spreadsheet_id, diff=self.diff)
             self.finished.emit(stats, "")
         except Exception as e:
             logger.error(f"Ошибка экспорта: {e}")
@@ -78,6 +79,16 @@ class GoogleExportSimpleDialog(QDialog):
 
         layout.addLayout(url_layout)
 
+        # Режим записи
+        self.diff_checkbox = QCheckBox(
+            "Только изменения (строки, изменённые с прошлого экспорта)"
+        )
+        self.diff_checkbox.setToolTip(
+            "Листы не очищаются: обновляются, добавляются и удаляются только "
+            "отличающиеся строки. Фильтры и пометки соавторов сохраняются."
+        )
+        layout.addWidget(self.diff_checkbox)
+
         # Hint
         hint_label = QLabel(
             "<i>💡 Таблица должна быть расшарена на email из service_account.json<br>"
@@ -162,11 +173,16 @@ class GoogleExportSimpleDialog(QDialog):
             return
 
         # Подтверждение
+        diff = self.diff_checkbox.isChecked()
+        warning = (
+            "Будут записаны только изменённые строки."
+            if diff
+            else "⚠️ Существующие данные в таблице будут перезаписаны!"
+        )
         reply = QMessageBox.question(
             self,
             "Подтверждение",
-            "Экспортировать все данные БД в Google Sheets?\n\n"
-            "⚠️ Существующие данные в таблице будут перезаписаны!",
+            f"Экспортировать все данные БД в Google Sheets?\n\n{warning}",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
 
@@ -183,7 +199,7 @@ class GoogleExportSimpleDialog(QDialog):
             self.progress_bar.setVisible(True)
             self.progress_label.setText("🚀 Экспорт начат...")
 
-            self.export_thread = ExportThread(exporter, spreadsheet_id)
+            self.export_thread = ExportThread(exporter, spreadsheet_id, diff)
             self.export_thread.progress.connect(self.on_progress)
             self.export_thread.finished.connect(self.on_export_finished)
             self.export_thread.start()
@@ -476,7 +476,7 @@ class NewProjectDialog(QDialog):
 
             db_manager = get_database_manager()
             db_path = project.database_path
-            db_manager.connect_to_database(db_path)
+            db_manager.connect_to_database(db_path, project.performance)
             db_manager.init_database()
 
             # Создаём дефолтного пользователя
@@ -27,7 +27,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
-from src.integrations.qase import QaseClient
+from src.integrations.qase.qase_api import QaseClient
 from src.config import Config
 from dotenv import dotenv_values
 import os
@@ -39,6 +39,7 @@ class QaseImportThread(QThread):
     """Фоновый поток для импорта кейсов из Qase"""
 
     progress = pyqtSignal(int)  # 0-100
+    cases_loaded = pyqtSignal(list)  # очередная страница кейсов
     finished = pyqtSignal(list, str)  # cases, error_message
 
     def __init__(self, client: QaseClient, suite_id: int = None):
@@ -47,11 +48,15 @@ class QaseImportThread(QThread):
         self.suite_id = suite_id
 
     def run(self):
+        cases = []
         try:
             logger.info(f"Начало импорта кейсов (suite_id: {self.suite_id})")
-            self.progress.emit(10)
 
-            cases = self.client.get_cases(suite_id=self.suite_id)
+            for page in self.client.iter_cases(suite_id=self.suite_id):
+                cases.extend(page.entities)
+                self.cases_loaded.emit(page.entities)
+                if page.total:
+                    self.progress.emit(min(100, len(cases) * 100 // page.total))
 
             self.progress.emit(100)
             logger.info(f"Импортировано {len(cases)} кейсов")
@@ -59,7 +64,7 @@ class QaseImportThread(QThread):
 
         except Exception as e:
             logger.error(f"Ошибка импорта: {e}")
-            self.finished.emit([], str(e))
+            self.finished.emit(cases, str(e))
 
 
 class QaseSyncDialog(QDialog):
@@ -284,46 +289,46 @@ class QaseSyncDialog(QDialog):
 
         self.import_progress.setVisible(True)
         self.import_progress.setValue(0)
+        self.import_cases_table.setRowCount(0)
 
         self.import_thread = QaseImportThread(self.client, suite_id)
         self.import_thread.progress.connect(self.import_progress.setValue)
+        self.import_thread.cases_loaded.connect(self._on_cases_loaded)
         self.import_thread.finished.connect(self._on_import_finished)
         self.import_thread.start()
 
-    def _on_import_finished(self, cases: List[Dict], error: str):
-        """Обработка завершения импорта"""
-        self.import_progress.setVisible(False)
-
-        if error:
-            logger.error(f"Ошибка импорта: {error}")
-            QMessageBox.critical(self, "Ошибка", f"Не удалось импортировать:\n{error}")
-            return
-
-        # Показать таблицу импортированных кейсов
-        self.import_cases_table.setRowCount(0)
-
-        for i, case in enumerate(cases):
-            row = i
-            self.import_cases_table.insertRow(row)
+    def _on_cases_loaded(self, cases: List[Dict]):
+        """Добавить в таблицу очередную страницу кейсов"""
+        table = self.import_cases_table
+        for case in cases:
+            row = table.rowCount()
+            table.insertRow(row)
 
             # ID
-            id_item = QTableWidgetItem(str(case.get("id", "")))
-            self.import_cases_table.setItem(row, 0, id_item)
+            table.setItem(row, 0, QTableWidgetItem(str(case.get("id", ""))))
 
             # Название
-            title = case.get("title", "")
-            title_item = QTableWidgetItem(title)
-            self.import_cases_table.setItem(row, 1, title_item)
+            table.setItem(row, 1, QTableWidgetItem(case.get("title", "")))
 
             # Suite
-            suite_id = case.get("suite_id", "")
-            suite_item = QTableWidgetItem(str(suite_id))
-            self.import_cases_table.setItem(row, 2, suite_item)
+            table.setItem(row, 2, QTableWidgetItem(str(case.get("suite_id", ""))))
 
             # Description
-            desc = case.get("description", "")[:100]
-            desc_item = QTableWidgetItem(desc)
-            self.import_cases_table.setItem(row, 3, desc_item)
+            desc = (case.get("description") or "")[:100]
+            table.setItem(row, 3, QTableWidgetItem(desc))
+
+    def _on_import_finished(self, cases: List[Dict], error: str):
+        """Обработка завершения импорта"""
+        self.import_progress.setVisible(False)
+
+        if error:
+            logger.error(f"Ошибка импорта: {error}")
+            QMessageBox.critical(
+                self,
+                "Ошибка",
+                f"Не удалось импортировать (получено {len(cases)} кейсов):\n{error}",
+            )
+            return
 
         logger.info(f"✅ Импортировано {len(cases)} кейсов")
         QMessageBox.information(
@@ -5,6 +5,7 @@ Unified Settings Dialog - Единый центр настроек
 - Zoho Projects API
 - Google API
 - Qase.io API
+- Профиль производительности SQLite (БД проекта)
 """
 
 from PyQt6.QtWidgets import *
@@ -95,6 +96,10 @@ class SettingsDialog(QDialog):
         self.setMinimumHeight(600)
 
         self.project_root = Config.BASE_DIR
+        self.project_manager = project_manager
+        self.current_project = (
+            project_manager.get_current_project() if project_manager else None
+        )
 
         # Пути к файлам настроек - из профиля проекта
         if project_manager:
@@ -160,6 +165,10 @@ class SettingsDialog(QDialog):
         qase_tab = self.create_qase_tab()
         tabs.addTab(qase_tab, "📊 Qase.io")
 
+        # === TAB 4: DATABASE ===
+        db_tab = self.create_database_tab()
+        tabs.addTab(db_tab, "🗄️ База данных")
+
         layout.addWidget(tabs)
 
         # Кнопки
@@ -427,6 +436,104 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return tab
 
+    def create_database_tab(self):
+        """Создать вкладку профиля производительности SQLite"""
+        from src.models.project_config import (
+            JOURNAL_MODES,
+            SYNCHRONOUS_MODES,
+            TEMP_STORE_MODES,
+            CHECKPOINT_MODES,
+        )
+
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        info = QLabel(
+            "<b>🗄️ Профиль производительности SQLite</b><br><br>"
+            "PRAGMA применяются к каждому соединению с БД текущего проекта.<br>"
+            "Изменения вступают в силу после переподключения к проекту."
+        )
+        info.setWordWrap(True)
+        layout.addWidget(info)
+
+        form = QFormLayout()
+
+        self.db_journal_combo = QComboBox()
+        self.db_journal_combo.addItems(JOURNAL_MODES)
+        form.addRow("journal_mode:", self.db_journal_combo)
+
+        self.db_synchronous_combo = QComboBox()
+        self.db_synchronous_combo.addItems(SYNCHRONOUS_MODES)
+        form.addRow("synchronous:", self.db_synchronous_combo)
+
+        self.db_mmap_spin = QSpinBox()
+        self.db_mmap_spin.setRange(0, 16384)
+        self.db_mmap_spin.setSuffix(" MB")
+        form.addRow("mmap_size:", self.db_mmap_spin)
+
+        self.db_cache_spin = QSpinBox()
+        self.db_cache_spin.setRange(1, 4096)
+        self.db_cache_spin.setSuffix(" MB")
+        form.addRow("cache_size:", self.db_cache_spin)
+
+        self.db_temp_store_combo = QComboBox()
+        self.db_temp_store_combo.addItems(TEMP_STORE_MODES)
+        form.addRow("temp_store:", self.db_temp_store_combo)
+
+        self.db_busy_timeout_spin = QSpinBox()
+        self.db_busy_timeout_spin.setRange(0, 600000)
+        self.db_busy_timeout_spin.setSingleStep(1000)
+        self.db_busy_timeout_spin.setSuffix(" мс")
+        form.addRow("busy_timeout:", self.db_busy_timeout_spin)
+
+        self.db_checkpoint_combo = QComboBox()
+        self.db_checkpoint_combo.addItems(CHECKPOINT_MODES)
+        self.db_checkpoint_combo.setToolTip(
+            "Режим PRAGMA wal_checkpoint при закрытии БД (только для WAL)"
+        )
+        form.addRow("Checkpoint при закрытии:", self.db_checkpoint_combo)
+
+        layout.addLayout(form)
+
+        # Фактические значения на открытом соединении
+        effective_group = QGroupBox("Фактические значения PRAGMA")
+        effective_layout = QVBoxLayout(effective_group)
+        self.db_effective_label = QLabel()
+        self.db_effective_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        effective_layout.addWidget(self.db_effective_label)
+        refresh_btn = QPushButton("🔄 Обновить")
+        refresh_btn.clicked.connect(self.refresh_effective_pragmas)
+        effective_layout.addWidget(refresh_btn)
+        layout.addWidget(effective_group)
+
+        if not self.current_project:
+            for widget in tab.findChildren((QComboBox, QSpinBox)):
+                widget.setEnabled(False)
+
+        layout.addStretch()
+        return tab
+
+    def refresh_effective_pragmas(self):
+        """Показать фактические PRAGMA текущей БД"""
+        from src.db.database_manager import get_database_manager
+
+        db_manager = get_database_manager()
+        if not db_manager.is_connected():
+            self.db_effective_label.setText("БД не подключена")
+            return
+
+        try:
+            values = db_manager.get_effective_pragmas()
+        except Exception as e:
+            self.db_effective_label.setText(f"❌ Не удалось прочитать PRAGMA: {e}")
+            return
+
+        self.db_effective_label.setText(
+            "\n".join(f"{name}: {value}" for name, value in values.items())
+        )
+
     def toggle_password(self, line_edit):
         """Показать/скрыть пароль"""
         if line_edit.echoMode() == QLineEdit.EchoMode.Password:
@@ -631,6 +738,26 @@ class SettingsDialog(QDialog):
         self.load_zoho_settings()
         self.load_google_settings()
         self.load_qase_settings()
+        self.load_database_settings()
+
+    def load_database_settings(self):
+        """Загрузить профиль SQLite текущего проекта"""
+        if self.current_project:
+            profile = self.current_project.performance
+            self.db_journal_combo.setCurrentText(profile.journal_mode)
+            self.db_synchronous_combo.setCurrentText(profile.synchronous)
+            self.db_mmap_spin.setValue(profile.mmap_size // (1024 * 1024))
+            # cache_size < 0 — KiB, > 0 — страницы (по 4 KiB по умолчанию)
+            cache_kib = (
+                -profile.cache_size
+                if profile.cache_size < 0
+                else profile.cache_size * 4
+            )
+            self.db_cache_spin.setValue(max(1, cache_kib // 1024))
+            self.db_temp_store_combo.setCurrentText(profile.temp_store)
+            self.db_busy_timeout_spin.setValue(profile.busy_timeout)
+            self.db_checkpoint_combo.setCurrentText(profile.checkpoint_on_close)
+        self.refresh_effective_pragmas()
 
     def load_zoho_settings(self):
         """Загрузить настройки Zoho из zoho.env"""
@@ -730,7 +857,7 @@ class SettingsDialog(QDialog):
             return
 
         try:
-            from src.integrations.qase import QaseClient
+            from src.integrations.qase.qase_api import QaseClient
 
             client = QaseClient(api_token=token, project_code=project_code)
 
@@ -785,6 +912,9 @@ class SettingsDialog(QDialog):
             # Qase
             self.save_qase_settings()
 
+            # Профиль SQLite
+            self.save_database_settings()
+
             QMessageBox.information(
                 self,
                 "Успех",
@@ -811,6 +941,10 @@ ZOHO_REGION={self.zoho_region_combo.currentText()}
         try:
             with open(self.zoho_env_path, "w", encoding="utf-8") as f:
                 f.write(content)
+            # Новые учётные данные — менеджер токенов перечитает zoho.env
+            from src.integrations.zoho.TokenManager import reset_token_managers
+
+            reset_token_managers()
         except Exception as e:
             logging.error(f"Ошибка сохранения Zoho credentials: {e}")
             QMessageBox.critical(
@@ -851,3 +985,21 @@ QASE_BASE_URL={self.qase_url_edit.text().strip()}
                 "Ошибка",
                 f"Не удалось сохранить Qase credentials (qase.env):\n{e}",
             )
+
+    def save_database_settings(self):
+        """Сохранить профиль SQLite в конфигурацию проекта"""
+        if not self.current_project or not self.project_manager:
+            return
+
+        from src.models.project_config import DatabasePerformanceProfile
+
+        self.current_project.performance = DatabasePerformanceProfile(
+            journal_mode=self.db_journal_combo.currentText(),
+            synchronous=self.db_synchronous_combo.currentText(),
+            mmap_size=self.db_mmap_spin.value() * 1024 * 1024,
+            cache_size=-self.db_cache_spin.value() * 1024,
+            temp_store=self.db_temp_store_combo.currentText(),
+            busy_timeout=self.db_busy_timeout_spin.value(),
+            checkpoint_on_close=self.db_checkpoint_combo.currentText(),
+        )
+        self.project_manager.save()
@@ -14,8 +14,16 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl
 from PyQt6.QtGui import QDesktopServices
 import requests
 import os
+import time
 from pathlib import Path
 
+from src.integrations.zoho.TokenManager import (
+    DEFAULT_EXPIRES_IN,
+    EXPIRES_AT_KEY,
+    reset_token_managers,
+    update_env_values,
+)
+
 
 class OAuthTokenThread(QThread):
     """Поток для получения токенов в фоне"""
@@ -484,6 +492,11 @@ class ZohoOAuthWizard(QDialog):
                 else:
                     f.write(line)
 
+        # Срок действия access_token — токен обновится заранее, без проверок
+        expires_in = int(data.get("expires_in", DEFAULT_EXPIRES_IN))
+        update_env_values(env_path, {EXPIRES_AT_KEY: int(time.time()) + expires_in})
+        reset_token_managers()
+
     def prepare_step5(self):
         """Подготовка шага 5"""
         info = (
@@ -23,6 +23,8 @@ class SyncThread(QThread):
         self.sync_service = sync_service
         self.sync_type = sync_type
         self.params = params
+        # Прогресс сохранения пачек задач
+        self.sync_service.on_progress = self.progress.emit
 
     def run(self):
         try:
@@ -31,7 +33,8 @@ class SyncThread(QThread):
                     f"📋 Синхронизация по milestone: {self.params['milestone_name']}"
                 )
                 stats = self.sync_service.sync_tasks_by_milestone(
-                    self.params["milestone_name"]
+                    self.params["milestone_name"],
+                    full_resync=self.params.get("full_resync", False),
                 )
 
             elif self.sync_type == "tasklist":
@@ -39,7 +42,8 @@ class SyncThread(QThread):
                     f"📋 Синхронизация по tasklist: {self.params['tasklist_name']}"
                 )
                 stats = self.sync_service.sync_tasks_by_tasklist(
-                    self.params["tasklist_name"]
+                    self.params["tasklist_name"],
+                    full_resync=self.params.get("full_resync", False),
                 )
 
             elif self.sync_type == "filter":
@@ -159,6 +163,8 @@ class ZohoSyncDialog(QDialog):
             owner_label.setVisible(False)
             self.owner_id_edit.setVisible(False)
 
+            self.full_resync_checkbox.setVisible(True)
+
         elif sync_type == "По Tasklist":
             # Показать только tasklist
             milestone_label.setVisible(False)
@@ -176,6 +182,8 @@ class ZohoSyncDialog(QDialog):
             owner_label.setVisible(False)
             self.owner_id_edit.setVisible(False)
 
+            self.full_resync_checkbox.setVisible(True)
+
         elif sync_type == "По фильтрам (даты, ответственные)":
             # Показать фильтры
             milestone_label.setVisible(False)
@@ -193,6 +201,67 @@ class ZohoSyncDialog(QDialog):
             owner_label.setVisible(True)
             self.owner_id_edit.setVisible(True)
 
+            # Фильтры не инкрементальные
+            self.full_resync_checkbox.setVisible(False)
+
+    def create_tasks_tab(self):
+        """Вкладка синхронизации задач"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        info = QLabel(
+            "📋 <b>Синхронизация задач из Zoho Projects</b><br><br>"
+            "Milestone и tasklist синхронизируются инкрементально: загружаются "
+            "только задачи, изменённые после прошлой синхронизации."
+        )
+        info.setWordWrap(True)
+        layout.addWidget(info)
+
+        self.params_layout = QFormLayout()
+
+        self.sync_type_combo = QComboBox()
+        self.sync_type_combo.addItems(
+            [
+                "По Milestone (спринт)",
+                "По Tasklist",
+                "По фильтрам (даты, ответственные)",
+            ]
+        )
+        self.params_layout.addRow("Тип синхронизации:", self.sync_type_combo)
+
+        self.milestone_edit = QLineEdit()
+        self.milestone_edit.setPlaceholderText("Например: Sprint 42")
+        self.params_layout.addRow("Milestone:", self.milestone_edit)
+
+        self.tasklist_edit = QLineEdit()
+        self.params_layout.addRow("Tasklist:", self.tasklist_edit)
+
+        self.date_start_edit = QLineEdit()
+        self.date_start_edit.setPlaceholderText("YYYY-MM-DD")
+        self.params_layout.addRow("Создано с:", self.date_start_edit)
+
+        self.date_end_edit = QLineEdit()
+        self.date_end_edit.setPlaceholderText("YYYY-MM-DD")
+        self.params_layout.addRow("Создано по:", self.date_end_edit)
+
+        self.owner_id_edit = QLineEdit()
+        self.params_layout.addRow("ID ответственного:", self.owner_id_edit)
+
+        # Игнорировать watermark: заново загрузить все задачи области
+        self.full_resync_checkbox = QCheckBox("Полная пересинхронизация")
+        self.full_resync_checkbox.setToolTip(
+            "Загрузить все задачи milestone/tasklist, а не только изменённые"
+        )
+        self.params_layout.addRow(self.full_resync_checkbox)
+
+        layout.addLayout(self.params_layout)
+        layout.addStretch()
+
+        self.sync_type_combo.currentTextChanged.connect(self.on_sync_type_changed)
+        self.on_sync_type_changed(self.sync_type_combo.currentText())
+
+        return tab
+
     def create_users_tab(self):
         """Вкладка синхронизации пользователей"""
         tab = QWidget()
@@ -342,14 +411,16 @@ class ZohoSyncDialog(QDialog):
 
     def import_selected_defects(self):
         """Импорт выбранных дефектов в БД"""
-        from src.models import FunctionalItem
+        from src.services.FunctionalItemUpsertService import (
+            FunctionalItemUpsertService,
+        )
 
         selected_items = self.defects_list.selectedItems()
         if not selected_items:
             QMessageBox.warning(self, "Внимание", "Выберите дефекты для импорта")
             return
 
-        imported_count = 0
+        rows = []
         for item in selected_items:
             item_text = item.text()
             # Парсим: #123: Title [Status]
@@ -358,26 +429,22 @@ class ZohoSyncDialog(QDialog):
             rest = parts[1].split(" [") if len(parts) > 1 else ["", ""]
             title = rest[0] if len(rest) > 0 else item_text
 
-            # Проверяем есть ли уже
-            funcid = f"DEFECT:{defect_id}"
-            existing = self.session.query(FunctionalItem).filter_by(functional_id=funcid).first()
-            if existing:
-                continue
-
-            # Создаём новый
-            new_defect = FunctionalItem(
-                functional_id=funcid,
-                title=title,
-                type="Defect",
-                description=f"Импортировано из Zoho (Defect #{defect_id})",
-                is_crit=0,
-                is_focus=0,
+            rows.append(
+                {
+                    "functional_id": f"DEFECT:{defect_id}",
+                    "title": title,
+                    "type": "Defect",
+                    "description": f"Импортировано из Zoho (Defect #{defect_id})",
+                    "is_crit": 0,
+                    "is_focus": 0,
+                }
             )
-            self.session.add(new_defect)
-            imported_count += 1
 
-        self.session.commit()
-        self.progress_label.setText(f"✅ Импортировано {imported_count} дефектов")
+        # Уже импортированные дефекты не перезаписываем
+        stats = FunctionalItemUpsertService(self.session).upsert(
+            rows, update_existing=False
+        )
+        self.progress_label.setText(f"✅ Импортировано {stats['new']} дефектов")
 
     def start_sync(self):
         """Начать синхронизацию"""
@@ -398,6 +465,7 @@ class ZohoSyncDialog(QDialog):
                 QMessageBox.warning(self, "Ошибка", "Укажите название Milestone")
                 return
             params["milestone_name"] = milestone_name
+            params["full_resync"] = self.full_resync_checkbox.isChecked()
 
         elif sync_type == "tasklist":
             tasklist_name = self.tasklist_edit.text().strip()
@@ -405,6 +473,7 @@ class ZohoSyncDialog(QDialog):
                 QMessageBox.warning(self, "Ошибка", "Укажите название Tasklist")
                 return
             params["tasklist_name"] = tasklist_name
+            params["full_resync"] = self.full_resync_checkbox.isChecked()
 
         elif sync_type == "filter":
             params["created_after"] = self.date_start_edit.text().strip() or None
@@ -472,6 +541,7 @@ class ZohoSyncDialog(QDialog):
 
 • Новых задач: {stats.get('new', 0)}
 • Обновлено задач: {stats.get('updated', 0)}
+• Без изменений: {stats.get('unchanged', 0)}
 • Ошибок: {stats.get('errors', 0)}
 
 Задачи сохранены в локальной БД VoluptAS."""
@@ -9,6 +9,12 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QAction
 from PyQt6.QtCore import pyqtSignal
+import networkx as nx
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from src.models.relation import RELATION_TYPES
+from src.services.GraphService import get_graph_service
 
 
 class GraphViewWindow(QMainWindow):
@@ -16,7 +22,7 @@ class GraphViewWindow(QMainWindow):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.session = SessionLocal()
+        self.graph_service = get_graph_service()
         self.graph = nx.DiGraph()
         self.pos = None
 
@@ -34,6 +40,7 @@ class GraphViewWindow(QMainWindow):
 
         self.init_ui()
         self.load_graph()
+        self.graph_service.add_listener(self.on_graph_changed)
 
     def init_ui(self):
         self.setWindowTitle("Граф связей")
@@ -107,42 +114,22 @@ class GraphViewWindow(QMainWindow):
         self.refresh_graph()
 
     def load_graph(self):
-        """Загрузить граф из БД"""
-        self.graph.clear()
-
-        # Загружаем все элементы
-        items = self.session.query(FunctionalItem).all()
-
-        # Добавляем ноды
-        for item in items:
-            self.graph.add_node(
-                item.id,
-                label=item.alias_tag or item.functional_id.split(".")[-1],
-                functional_id=item.functional_id,
-                type=item.type,
-                is_crit=item.is_crit,
-                is_focus=item.is_focus,
-                segment=item.segment,
-            )
+        """Граф из GraphService — только связи из таблицы Relation"""
+        self.graph = self.graph_service.filtered_graph(edge_types=set(RELATION_TYPES))
 
-        # Загружаем связи
-        relations = self.session.query(Relation).filter_by(active=True).all()
-
-        for rel in relations:
-            # Добавляем рёбра с атрибутами
-            self.graph.add_edge(
-                rel.source_id,
-                rel.target_id,
-                type=rel.type,
-                weight=rel.weight,
-                directed=rel.directed,
-                metadata=rel.get_metadata(),
-            )
+        for node_id, data in self.graph.nodes(data=True):
+            data["label"] = data["alias_tag"] or data["funcid"].split(".")[-1]
 
         self.statusBar().showMessage(
-            f"Загружено: {len(items)} узлов, {len(relations)} связей"
+            f"Загружено: {self.graph.number_of_nodes()} узлов, "
+            f"{self.graph.number_of_edges()} связей"
         )
 
+    def on_graph_changed(self):
+        """Граф проекта изменился (коммит) — обновляем представление"""
+        self.load_graph()
+        self.refresh_graph()
+
     def refresh_graph(self):
         """Перерисовать граф"""
         self.figure.clear()
@@ -281,5 +268,5 @@ class GraphViewWindow(QMainWindow):
             self.statusBar().showMessage(f"✅ Граф сохранён: {filename}")
 
     def closeEvent(self, event):
-        self.session.close()
+        self.graph_service.remove_listener(self.on_graph_changed)
         event.accept()
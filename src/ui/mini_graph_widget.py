@@ -1,6 +1,7 @@
 """
 Мини-граф для отображения связей выбранного элемента на главном экране
 Связи строятся из атрибутов (parent_id, module, epic, feature)
+и берутся из графа проекта в памяти (GraphService)
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
@@ -9,8 +10,8 @@ import networkx as nx
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
-from src.models import FunctionalItem
-from src.utils.graph_builder import get_item_neighbors, NODE_COLORS
+from src.services.GraphService import get_graph_service
+from src.utils.graph_builder import NODE_COLORS
 
 
 class MiniGraphWidget(QWidget):
@@ -21,7 +22,6 @@ class MiniGraphWidget(QWidget):
         # Используем session из parent (MainWindow)
         self.session = parent.session if parent and hasattr(parent, "session") else None
         self.current_item_id = None
-        self.all_items = []
 
         self.init_ui()
 
@@ -56,17 +56,14 @@ class MiniGraphWidget(QWidget):
 
         self.current_item_id = item_id
 
-        # Загружаем элемент
-        item = self.session.query(FunctionalItem).filter_by(id=item_id).first()
+        # Граф проекта загружается один раз и обновляется по коммитам
+        graph_service = get_graph_service()
+        item = graph_service.get_item(item_id)
         if not item:
             self.clear_graph()
             return
 
-        # Загружаем все элементы для поиска связей
-        self.all_items = self.session.query(FunctionalItem).all()
-
-        # Получаем соседей из атрибутов
-        parents, children = get_item_neighbors(item, self.all_items)
+        parents, children = graph_service.neighbors(item_id)
 
         if not parents and not children:
             self.show_no_relations(item)
@@ -0,0 +1,322 @@
+"""
+Functional Items Table Model
+
+Виртуализированная модель таблицы функциональных элементов для MainWindow.
+Строки хранятся компактными кортежами (ItemRow), ячейки рисуются делегатами —
+виджеты создаются только для видимых строк (и только редакторы).
+"""
+
+from collections import namedtuple
+from typing import Callable, List, Optional, Set
+
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+)
+from sqlalchemy.orm import Session, aliased
+
+from src.models import FunctionalItem, User
+
+# Компактная строка таблицы (одна на элемент)
+ItemRow = namedtuple(
+    "ItemRow",
+    [
+        "id",
+        "functional_id",
+        "alias_tag",
+        "title",
+        "type",
+        "module",
+        "epic",
+        "feature",
+        "qa_name",
+        "dev_name",
+        "segment",
+        "is_crit",
+        "is_focus",
+    ],
+)
+
+# Колонки таблицы
+COL_FUNCID = 0
+COL_ALIAS = 1
+COL_TITLE = 2
+COL_TYPE = 3
+COL_MODULE = 4
+COL_EPIC = 5
+COL_FEATURE = 6
+COL_QA = 7
+COL_DEV = 8
+COL_SEGMENT = 9
+COL_CRIT = 10
+COL_FOCUS = 11
+COL_ACTIONS = 12
+
+HEADERS = [
+    "FuncID",
+    "Alias",
+    "Title",
+    "Type",
+    "Module",
+    "Epic",
+    "Feature",
+    "QA",
+    "Dev",
+    "Segment",
+    "Crit",
+    "Focus",
+    "Actions",
+]
+
+EDITABLE_COLUMNS = {COL_ALIAS, COL_TITLE, COL_SEGMENT}
+EDIT_FIELDS = {COL_ALIAS: "alias_tag", COL_TITLE: "title", COL_SEGMENT: "segment"}
+CHECK_COLUMNS = {COL_CRIT: "is_crit", COL_FOCUS: "is_focus"}
+
+# Маркер "это сам уровень иерархии" в колонках Module/Epic/Feature
+HIERARCHY_MARKER = "──┐"
+
+
+def load_item_rows(session: Session) -> List[ItemRow]:
+    """
+    Загрузка строк таблицы одним запросом (без ORM-объектов)
+
+    Args:
+        session: Сессия БД
+
+    Returns:
+        Список ItemRow, отсортированный по functional_id
+    """
+    qa_user = aliased(User)
+    dev_user = aliased(User)
+
+    query = (
+        session.query(
+            FunctionalItem.id,
+            FunctionalItem.functional_id,
+            FunctionalItem.alias_tag,
+            FunctionalItem.title,
+            FunctionalItem.type,
+            FunctionalItem.module,
+            FunctionalItem.epic,
+            FunctionalItem.feature,
+            qa_user.name,
+            dev_user.name,
+            FunctionalItem.segment,
+            FunctionalItem.is_crit,
+            FunctionalItem.is_focus,
+        )
+        .outerjoin(qa_user, FunctionalItem.responsible_qa_id == qa_user.id)
+        .outerjoin(dev_user, FunctionalItem.responsible_dev_id == dev_user.id)
+        .order_by(FunctionalItem.functional_id)
+    )
+
+    return [ItemRow(*values) for values in query]
+
+
+def display_text(row: ItemRow, column: int) -> str:
+    """Текст ячейки для отображения"""
+    if column == COL_FUNCID:
+        return row.functional_id or ""
+    if column == COL_ALIAS:
+        # Если alias_tag пустой, используем последнюю часть functional_id
+        return row.alias_tag or (row.functional_id or "").split(".")[-1]
+    if column == COL_TITLE:
+        return row.title or ""
+    if column == COL_TYPE:
+        return row.type or ""
+    if column == COL_MODULE:
+        return HIERARCHY_MARKER if row.type == "Module" else (row.module or "")
+    if column == COL_EPIC:
+        return HIERARCHY_MARKER if row.type == "Epic" else (row.epic or "")
+    if column == COL_FEATURE:
+        return HIERARCHY_MARKER if row.type == "Feature" else (row.feature or "")
+    if column == COL_QA:
+        return row.qa_name or ""
+    if column == COL_DEV:
+        return row.dev_name or ""
+    if column == COL_SEGMENT:
+        return row.segment or ""
+    return ""
+
+
+class FunctionalItemTableModel(QAbstractTableModel):
+    """
+    Модель таблицы функциональных элементов
+
+    Изменения пользователя передаются в on_commit(row, column, value) —
+    callback сохраняет их в БД и возвращает True при успехе. Только после
+    этого строка модели обновляется.
+    """
+
+    def __init__(
+        self,
+        parent=None,
+        on_commit: Optional[Callable[[ItemRow, int, object], bool]] = None,
+    ):
+        super().__init__(parent)
+        self.on_commit = on_commit
+        self._rows: List[ItemRow] = []
+
+    # === Данные ===
+
+    def set_rows(self, rows: List[ItemRow]):
+        """Полная замена данных модели"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rows(self) -> List[ItemRow]:
+        return self._rows
+
+    def row_at(self, row: int) -> Optional[ItemRow]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def update_row(self, row: int, **changes):
+        """Обновить поля строки и перерисовать её"""
+        self._rows[row] = self._rows[row]._replace(**changes)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1)
+        )
+
+    # === QAbstractTableModel ===
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if column in CHECK_COLUMNS:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                checked = bool(getattr(row, CHECK_COLUMNS[column]))
+                return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+            return None
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return display_text(row, column)
+
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() in EDITABLE_COLUMNS:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        elif index.column() in CHECK_COLUMNS:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+
+        row_idx = index.row()
+        column = index.column()
+        row = self._rows[row_idx]
+
+        if column in CHECK_COLUMNS and role == Qt.ItemDataRole.CheckStateRole:
+            state = value.value if isinstance(value, Qt.CheckState) else value
+            new_value = 1 if state == Qt.CheckState.Checked.value else 0
+            field = CHECK_COLUMNS[column]
+        elif column in EDITABLE_COLUMNS and role == Qt.ItemDataRole.EditRole:
+            field = EDIT_FIELDS[column]
+            new_value = str(value).strip()
+            # Сравнение с полем, а не с текстом ячейки: alias по умолчанию
+            # (хвост functional_id), введённый явно, сохраняется
+            if new_value == (getattr(row, field) or ""):
+                return False
+        else:
+            return False
+
+        if self.on_commit and not self.on_commit(row, column, new_value):
+            return False
+
+        if field != "title" and new_value == "":
+            new_value = None
+        self.update_row(row_idx, **{field: new_value})
+        return True
+
+
+class FunctionalItemFilterProxyModel(QSortFilterProxyModel):
+    """
+    Фильтрация строк FunctionalItemTableModel
+
+    Работает по данным кортежей модели, без обращения к виджетам.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search_text = ""
+        self.column_filters = {}
+        self.quick_filter = "all"  # all, crit, focus
+        self.allowed_ids: Optional[Set[int]] = None
+
+    def set_filters(
+        self,
+        search_text: str = "",
+        column_filters: Optional[dict] = None,
+        quick_filter: str = "all",
+        allowed_ids: Optional[Set[int]] = None,
+    ):
+        """
+        Установить фильтры и перефильтровать строки
+
+        Args:
+            search_text: Текстовый поиск (по всем текстовым колонкам)
+            column_filters: {колонка: точное значение}
+            quick_filter: all | crit | focus
+            allowed_ids: Множество id, которые разрешено показывать (None — все)
+        """
+        self.search_text = search_text.lower()
+        self.column_filters = {
+            column: value for column, value in (column_filters or {}).items() if value
+        }
+        self.quick_filter = quick_filter
+        self.allowed_ids = allowed_ids
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        row = self.sourceModel().row_at(source_row)
+        if row is None:
+            return False
+
+        if self.quick_filter == "crit" and not row.is_crit:
+            return False
+        if self.quick_filter == "focus" and not row.is_focus:
+            return False
+
+        if self.allowed_ids is not None and row.id not in self.allowed_ids:
+            return False
+
+        for column, value in self.column_filters.items():
+            if display_text(row, column) != value:
+                return False
+
+        if self.search_text:
+            return any(
+                self.search_text in display_text(row, column).lower()
+                for column in range(COL_CRIT)
+            )
+
+        return True
@@ -7,8 +7,12 @@
 - Документацией
 - Багами
 - Типами проверок (Smoke/Regression/Dev-only)
+
+Метрики и разрезы считаются агрегатами SQL (CoverageService).
 """
 
+import logging
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -19,15 +23,32 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QTableWidget,
+    QTableWidgetItem,
 )
 from PyQt6.QtCore import Qt
 
+from src.services.CoverageService import CoverageService
+
+logger = logging.getLogger(__name__)
+
+# Измерения разреза покрытия: ключ CoverageService.DIMENSIONS -> подпись
+ROLLUP_DIMENSIONS = {
+    "module": "Module",
+    "epic": "Epic",
+    "type": "Тип",
+    "segment": "Сегмент",
+    "qa": "QA",
+}
+
 
 class CoverageMatrixTabWidget(QWidget):
     """Таб с матрицей трассировок"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Используем session из parent (MainWindow), иначе — своя на обновление
+        self.session = parent.session if parent and hasattr(parent, "session") else None
+        self.metric_labels = {}
         self._init_ui()
 
     def _init_ui(self):
@@ -91,6 +112,24 @@ class CoverageMatrixTabWidget(QWidget):
         )
         layout.addWidget(table, 1)
 
+        # Разрез покрытия
+        rollup_controls = QHBoxLayout()
+        rollup_controls.addWidget(QLabel("<b>Покрытие в разрезе:</b>"))
+        self.rollup_combo = QComboBox()
+        for dimension, title in ROLLUP_DIMENSIONS.items():
+            self.rollup_combo.addItem(title, dimension)
+        self.rollup_combo.currentIndexChanged.connect(lambda _: self.refresh())
+        rollup_controls.addWidget(self.rollup_combo)
+        rollup_controls.addStretch()
+        layout.addLayout(rollup_controls)
+
+        self.rollup_table = QTableWidget()
+        self.rollup_table.setColumnCount(8)
+        self.rollup_table.setHorizontalHeaderLabels(
+            ["Группа", "Всего", "Crit", "Кейсы", "Авто", "Доки", "Coverage %", "NG"]
+        )
+        layout.addWidget(self.rollup_table, 1)
+
         # Метрики внизу
         metrics = self._create_metrics_panel()
         layout.addWidget(metrics)
@@ -99,7 +138,9 @@ class CoverageMatrixTabWidget(QWidget):
         actions = QHBoxLayout()
         actions.addWidget(QPushButton("💾 Экспорт в Excel/CSV"))
         actions.addWidget(QPushButton("📊 Отчёт по покрытию (PDF)"))
-        actions.addWidget(QPushButton("🔄 Обновить статусы"))
+        refresh_btn = QPushButton("🔄 Обновить статусы")
+        refresh_btn.clicked.connect(self.refresh)
+        actions.addWidget(refresh_btn)
         actions.addStretch()
 
         layout.addLayout(actions)
@@ -109,40 +150,77 @@ class CoverageMatrixTabWidget(QWidget):
         panel = QGroupBox("📈 МЕТРИКИ ПОКРЫТИЯ")
         layout = QHBoxLayout(panel)
 
-        # Блок 1: Общее
-        col1 = QVBoxLayout()
-        col1.addWidget(QLabel("<b>Общее</b>"))
-        col1.addWidget(QLabel("Всего: 156"))
-        col1.addWidget(QLabel("Критических: 45"))
-        col1.addWidget(QLabel("В фокусе: 23"))
-        layout.addLayout(col1)
-
-        # Блок 2: Автотесты
-        col2 = QVBoxLayout()
-        col2.addWidget(QLabel("<b>Автотесты</b>"))
-        col2.addWidget(QLabel("С авто: 87 (56%)"))
-        col2.addWidget(QLabel("Без авто: 69"))
-        col2.addWidget(QLabel("Progress: 12"))
-        layout.addLayout(col2)
-
-        # Блок 3: Тест-кейсы
-        col3 = QVBoxLayout()
-        col3.addWidget(QLabel("<b>Тест-кейсы</b>"))
-        col3.addWidget(QLabel("С кейсами: 120"))
-        col3.addWidget(QLabel("Без кейсов: 36"))
-        col3.addWidget(QLabel("В работе: 15"))
-        layout.addLayout(col3)
-
-        # Блок 4: Риски
-        col4 = QVBoxLayout()
-        col4.addWidget(QLabel("<b>Риски</b>"))
-        col4.addWidget(QLabel("NG: 23 (15%)"))
-        col4.addWidget(QLabel("OK: 98 (63%)"))
-        col4.addWidget(QLabel("⚠️: 35 (22%)"))
-        layout.addLayout(col4)
+        blocks = [
+            ("Общее", ["total", "crit", "focus"]),
+            ("Автотесты", ["automated", "not_automated"]),
+            ("Тест-кейсы", ["with_tests", "without_tests"]),
+            ("Риски", ["none", "full", "partial"]),
+        ]
+        for title, keys in blocks:
+            column = QVBoxLayout()
+            column.addWidget(QLabel(f"<b>{title}</b>"))
+            for key in keys:
+                self.metric_labels[key] = QLabel("—")
+                column.addWidget(self.metric_labels[key])
+            layout.addLayout(column)
 
         return panel
 
     def refresh(self):
-        """Обновление данных"""
-        pass
+        """Обновление метрик и разреза (агрегаты SQL, без загрузки строк)"""
+        session = self.session
+        own_session = session is None
+        try:
+            if own_session:
+                from src.db.database import get_session_local
+
+                session = get_session_local()()
+            service = CoverageService(session)
+            self._show_totals(service.totals())
+            self._show_rollup(service.rollup(self.rollup_combo.currentData()))
+        except Exception as e:
+            logger.error(f"Ошибка расчёта покрытия: {e}")
+        finally:
+            if own_session and session is not None:
+                session.close()
+
+    def _show_totals(self, stats):
+        """Метрики покрытия по всем элементам"""
+
+        def share(count):
+            return f"{count} ({int(count * 100 / stats.total) if stats.total else 0}%)"
+
+        texts = {
+            "total": f"Всего: {stats.total}",
+            "crit": f"Критических: {stats.crit}",
+            "focus": f"В фокусе: {stats.focus}",
+            "automated": f"С авто: {share(stats.automated)}",
+            "not_automated": f"Без авто: {stats.total - stats.automated}",
+            "with_tests": f"С кейсами: {share(stats.with_tests)}",
+            "without_tests": f"Без кейсов: {stats.total - stats.with_tests}",
+            "none": f"NG: {share(stats.none)}",
+            "full": f"OK: {share(stats.full)}",
+            "partial": f"⚠️: {share(stats.partial)}",
+        }
+        for key, text in texts.items():
+            self.metric_labels[key].setText(text)
+
+    def _show_rollup(self, groups):
+        """Таблица разреза: одна строка на значение измерения"""
+        self.rollup_table.setRowCount(len(groups))
+        for row, stats in enumerate(groups):
+            values = [
+                stats.key or "—",
+                stats.total,
+                stats.crit,
+                stats.with_tests,
+                stats.automated,
+                stats.documented,
+                stats.coverage,
+                stats.none,
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.rollup_table.setItem(row, column, item)
@@ -3,6 +3,7 @@
 
 Obsidian-style граф со всеми элементами и связями
 Связи строятся из атрибутов (parent_id, module, epic, feature)
+Граф берётся из GraphService и перерисовывается после коммитов
 """
 
 from PyQt6.QtWidgets import (
@@ -21,8 +22,8 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import logging
 
-from src.models import FunctionalItem, Relation
-from src.utils.graph_builder import build_graph_from_attributes, NODE_COLORS
+from src.services.GraphService import get_graph_service
+from src.utils.graph_builder import NODE_COLORS
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,8 @@ class FullGraphTabWidget(QWidget):
         self.session = parent.session if parent and hasattr(parent, "session") else None
         self.graph = nx.DiGraph()
         self.pos = None
+        self.graph_service = None
+        self._graph_dirty = False
         self._init_ui()
         self.load_graph()
 
@@ -69,43 +72,38 @@ class FullGraphTabWidget(QWidget):
         pass  # Пока фильтры отключены
 
     def load_graph(self):
-        """Загрузить граф из БД — связи из атрибутов + Relation таблица"""
+        """Граф из GraphService — связи из атрибутов + Relation таблица"""
         if not self.session:
             return
 
-        self.graph.clear()
-
-        items = self.session.query(FunctionalItem).all()
-
-        # Загружаем активные связи из БД
-        relations = self.session.query(Relation).filter_by(active=True).all()
-
-        logger.info(f"Loading graph: {len(items)} items, {len(relations)} relations")
-
-        # Строим граф из атрибутов + связей
-        nodes_data, edges_data = build_graph_from_attributes(items, relations)
+        graph_service = get_graph_service()
+        if graph_service is not self.graph_service:
+            # Новый проект/engine — переподписываемся на изменения
+            if self.graph_service is not None:
+                self.graph_service.remove_listener(self.on_graph_changed)
+            graph_service.add_listener(self.on_graph_changed)
+            self.graph_service = graph_service
+
+        self.graph = graph_service.filtered_graph()
+        self._graph_dirty = False
+        logger.info(
+            f"Loading graph: {self.graph.number_of_nodes()} nodes, "
+            f"{self.graph.number_of_edges()} edges"
+        )
 
-        # Добавляем узлы
-        for node in nodes_data:
-            self.graph.add_node(
-                node["id"],
-                label=node["title"],
-                funcid=node["funcid"],
-                type=node["type"],
-                color=node["color"],
-                size=node["size"],
-            )
+        self.refresh_graph()
 
-        # Добавляем рёбра
-        for edge in edges_data:
-            self.graph.add_edge(
-                edge["from"],
-                edge["to"],
-                type=edge["type"],
-                weight=edge["weight"],
-            )
+    def on_graph_changed(self):
+        """Граф проекта изменился (коммит) — перерисовываем, если таб виден"""
+        if self.isVisible():
+            self.load_graph()
+        else:
+            self._graph_dirty = True
 
-        self.refresh_graph()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._graph_dirty:
+            self.load_graph()
 
     def refresh_graph(self):
         """Перерисовать граф"""
@@ -218,4 +216,6 @@ class FullGraphTabWidget(QWidget):
 
     def closeEvent(self, event):
         # Session управляется в MainWindow, не закрываем его здесь
+        if self.graph_service is not None:
+            self.graph_service.remove_listener(self.on_graph_changed)
         event.accept()
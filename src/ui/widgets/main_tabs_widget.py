@@ -1,12 +1,13 @@
 """
 Главный виджет с табами для основных представлений VoluptAS
 
-Содержит 5 табов:
+Содержит 6 табов:
 1. Таблица + Мини-граф
 2. Большой граф
 3. BDD Features
 4. Матрица трассировок
 5. INFRA Maturity
+6. RACI матрица
 """
 
 from PyQt6.QtWidgets import QWidget, QTabWidget, QVBoxLayout
@@ -31,6 +32,7 @@ class MainTabsWidget(QWidget):
     TAB_BDD = 2
     TAB_COVERAGE = 3
     TAB_INFRA = 4
+    TAB_RACI = 5
 
     def __init__(self, parent=None):
         """
@@ -66,6 +68,7 @@ class MainTabsWidget(QWidget):
         from src.ui.widgets.bdd_tab import BddTabWidget
         from src.ui.widgets.coverage_matrix_tab import CoverageMatrixTabWidget
         from src.ui.widgets.infra_maturity_tab import InfraMaturityTabWidget
+        from src.ui.widgets.raci_matrix_tab import RaciMatrixTabWidget
 
         # Таб 1: Таблица + Мини-граф
         self.table_graph_tab = TableGraphTabWidget(self)
@@ -87,6 +90,10 @@ class MainTabsWidget(QWidget):
         self.infra_tab = InfraMaturityTabWidget(self)
         self.tab_widget.addTab(self.infra_tab, "🏗️ INFRA")
 
+        # Таб 6: RACI матрица
+        self.raci_tab = RaciMatrixTabWidget(self)
+        self.tab_widget.addTab(self.raci_tab, "👥 RACI")
+
     def _connect_signals(self):
         """Подключение сигналов"""
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
@@ -101,6 +108,11 @@ class MainTabsWidget(QWidget):
         tab_name = self.tab_widget.tabText(index)
         self.tab_changed.emit(index, tab_name)
 
+        # Покрытие и RACI матрица пересобираются при открытии таба
+        widget = self.tab_widget.widget(index)
+        if widget in (self.coverage_tab, self.raci_tab):
+            widget.refresh()
+
     def switch_to_tab(self, index: int):
         """
         Переключение на указанный таб
@@ -124,7 +136,7 @@ class MainTabsWidget(QWidget):
         """
         Настройка горячих клавиш для переключения табов
 
-        Ctrl+1/2/3/4/5 для быстрого переключения
+        Ctrl+1..6 для быстрого переключения
         """
         from PyQt6.QtGui import QShortcut, QKeySequence
 
@@ -134,6 +146,7 @@ class MainTabsWidget(QWidget):
             (QKeySequence("Ctrl+3"), self.TAB_BDD),
             (QKeySequence("Ctrl+4"), self.TAB_COVERAGE),
             (QKeySequence("Ctrl+5"), self.TAB_INFRA),
+            (QKeySequence("Ctrl+6"), self.TAB_RACI),
         ]
 
         for key_seq, tab_index in shortcuts:
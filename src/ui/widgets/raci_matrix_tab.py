@@ -0,0 +1,164 @@
+"""
+Таб: RACI матрица
+
+Функциональные элементы × активные сотрудники, в ячейке — роли
+R(QA)/R(Dev)/A/C/I. Матрица собирается RaciMatrixService, таблица
+читает подписи из массива по требованию (виджеты ячеек не создаются).
+"""
+
+import logging
+
+from PyQt6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QCheckBox,
+    QTableView,
+    QFileDialog,
+    QMessageBox,
+)
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from src.services.RaciMatrixService import ITEM_COLUMNS, RaciMatrix, RaciMatrixService
+
+logger = logging.getLogger(__name__)
+
+
+class RaciTableModel(QAbstractTableModel):
+    """Модель поверх RaciMatrix: колонки элемента + выбранные сотрудники"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+        self.labels = None
+        self.user_names = []
+        # Позиции сотрудников матрицы, показанные в таблице
+        self.user_columns = []
+
+    def set_matrix(self, matrix: RaciMatrix, hide_empty: bool = False):
+        """Показать матрицу (hide_empty — скрыть сотрудников без ролей)"""
+        self.beginResetModel()
+        self.items = matrix.items.to_numpy(dtype=object)
+        self.labels = matrix.labels()
+        self.user_names = matrix.user_names
+        if hide_empty:
+            self.user_columns = matrix.codes.any(axis=0).nonzero()[0].tolist()
+        else:
+            self.user_columns = list(range(len(self.user_names)))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(ITEM_COLUMNS) + len(self.user_columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column() - len(ITEM_COLUMNS)
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column < 0:
+                return self.items[index.row()][index.column()]
+            return self.labels[index.row(), self.user_columns[column]]
+        if role == Qt.ItemDataRole.TextAlignmentRole and column >= 0:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role != Qt.ItemDataRole.DisplayRole
+            or orientation != Qt.Orientation.Horizontal
+        ):
+            return None
+        if section < len(ITEM_COLUMNS):
+            return ITEM_COLUMNS[section]
+        return self.user_names[self.user_columns[section - len(ITEM_COLUMNS)]]
+
+
+class RaciMatrixTabWidget(QWidget):
+    """Таб с RACI матрицей"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Используем session из parent (MainWindow), иначе — своя на обновление
+        self.session = parent.session if parent and hasattr(parent, "session") else None
+        self.matrix = None
+        self._init_ui()
+
+    def _init_ui(self):
+        """Инициализация интерфейса"""
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        self.hide_empty_checkbox = QCheckBox("Скрыть сотрудников без ролей")
+        self.hide_empty_checkbox.toggled.connect(lambda _: self._show_matrix())
+        controls.addWidget(self.hide_empty_checkbox)
+        controls.addStretch()
+        self.summary_label = QLabel("—")
+        controls.addWidget(self.summary_label)
+        layout.addLayout(controls)
+
+        self.model = RaciTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        layout.addWidget(self.table, 1)
+
+        # Действия
+        actions = QHBoxLayout()
+        refresh_btn = QPushButton("🔄 Обновить")
+        refresh_btn.clicked.connect(self.refresh)
+        actions.addWidget(refresh_btn)
+        export_btn = QPushButton("💾 Экспорт в CSV")
+        export_btn.clicked.connect(self.export_csv)
+        actions.addWidget(export_btn)
+        actions.addStretch()
+        layout.addLayout(actions)
+
+    def refresh(self):
+        """Пересобрать матрицу из БД"""
+        session = self.session
+        own_session = session is None
+        try:
+            if own_session:
+                from src.db.database import get_session_local
+
+                session = get_session_local()()
+            self.matrix = RaciMatrixService(session).build()
+            self._show_matrix()
+        except Exception as e:
+            logger.error(f"Ошибка построения RACI матрицы: {e}")
+        finally:
+            if own_session and session is not None:
+                session.close()
+
+    def _show_matrix(self):
+        if self.matrix is None:
+            return
+        self.model.set_matrix(self.matrix, self.hide_empty_checkbox.isChecked())
+        assigned = int(self.matrix.codes.any(axis=0).sum())
+        self.summary_label.setText(
+            f"Элементов: {len(self.matrix)}, сотрудников: "
+            f"{len(self.matrix.user_names)} (с ролями: {assigned})"
+        )
+
+    def export_csv(self):
+        """Сохранить текущую матрицу в CSV"""
+        if self.matrix is None:
+            self.refresh()
+        if self.matrix is None:
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Сохранить RACI матрицу", "raci_matrix.csv", "CSV files (*.csv)"
+        )
+        if not file_path:
+            return
+        try:
+            count = self.matrix.export_csv(file_path)
+            QMessageBox.information(
+                self, "Экспорт", f"RACI матрица сохранена: {count} элементов"
+            )
+        except OSError as e:
+            QMessageBox.critical(self, "Ошибка", f"Не удалось сохранить файл: {e}")
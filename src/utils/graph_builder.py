@@ -7,6 +7,7 @@ Graph Builder
 - module, epic, feature, story, page (иерархические связи)
 """
 
+from bisect import bisect_right
 from typing import List, Dict, Tuple, Optional
 from src.models import FunctionalItem
 import logging
@@ -59,10 +60,7 @@ def build_graph_from_attributes(
 
     # Индекс для быстрого поиска
     items_by_id = {item.id: item for item in items}
-    items_by_title_type = {}
-    for item in items:
-        key = (item.title.lower(), item.type)
-        items_by_title_type[key] = item
+    parent_index = ParentResolutionIndex(items)
 
     # 1. Создаём узлы
     for item in items:
@@ -94,7 +92,7 @@ def build_graph_from_attributes(
 
         # module — связь module-of
         if item.module:
-            parent = find_parent_by_title(items, item.module, "Module")
+            parent = parent_index.find(item.module, "Module")
             if parent and parent.id != item.id:
                 edges.append(
                     {
@@ -108,7 +106,7 @@ def build_graph_from_attributes(
 
         # epic — связь epic-of
         if item.epic:
-            parent = find_parent_by_title(items, item.epic, "Epic")
+            parent = parent_index.find(item.epic, "Epic")
             if parent and parent.id != item.id:
                 edges.append(
                     {
@@ -122,7 +120,7 @@ def build_graph_from_attributes(
 
         # feature — связь feature-of
         if item.feature:
-            parent = find_parent_by_title(items, item.feature, "Feature")
+            parent = parent_index.find(item.feature, "Feature")
             if parent and parent.id != item.id:
                 edges.append(
                     {
@@ -159,7 +157,10 @@ def build_graph_from_attributes(
 
 
 def find_parent_by_title(
-    items: List[FunctionalItem], title: str, type_filter: str
+    items: List[FunctionalItem],
+    title: str,
+    type_filter: str,
+    index: Optional["ParentResolutionIndex"] = None,
 ) -> Optional[FunctionalItem]:
     """
     Поиск родителя по названию и типу
@@ -173,60 +174,171 @@ def find_parent_by_title(
         items: Список элементов
         title: Название для поиска
         type_filter: Тип элемента (Module, Epic, Feature...)
+        index: Готовый индекс (если не передан — строится по items)
 
     Returns:
         Элемент или None
     """
-    title_lower = title.lower().strip()
-
-    # Очищаем от префиксов типа "[Module]:", "[Epic]:"
-    title_clean = title_lower
-    for prefix in [
-        "[module]:",
-        "[epic]:",
-        "[feature]:",
-        "[story]:",
-        "[page]:",
-        "[element]:",
-        "[service]:",
-    ]:
+    if index is None:
+        index = ParentResolutionIndex(items)
+    return index.find(title, type_filter)
+
+
+# Префиксы типов в заголовках ("[Module]: FRONT")
+TITLE_PREFIXES = [
+    "[module]:",
+    "[epic]:",
+    "[feature]:",
+    "[story]:",
+    "[page]:",
+    "[element]:",
+    "[service]:",
+]
+
+# Разделитель заголовков в корпусе для поиска подстрок
+_CORPUS_SEPARATOR = "\x00"
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Нижний регистр + удаление префиксов типа "[Module]:" """
+    title_clean = (title or "").lower().strip()
+    for prefix in TITLE_PREFIXES:
         title_clean = title_clean.replace(prefix, "").strip()
+    return title_clean
+
+
+def _funcid_key(title_clean: str) -> str:
+    """Ключ для сравнения с functional_id ("front end" → "FRONT-END")"""
+    return title_clean.upper().replace(" ", "-").replace("_", "-")
+
+
+class _TypeIndex:
+    """Индексы по элементам одного типа (позиции — порядок в исходном списке)"""
+
+    def __init__(self):
+        # Точное совпадение title (lower/strip) → первая позиция
+        self.exact: Dict[str, int] = {}
+        # Очищенный title → первая позиция
+        self.clean: Dict[str, int] = {}
+        # Длины очищенных заголовков (для поиска "item_title in title")
+        self.clean_lengths: set = set()
+        # Префиксное дерево по functional_id: узел = [min_pos, children]
+        self.funcid_trie: list = [None, {}]
+        # Корпус очищенных заголовков для поиска "title in item_title"
+        self._corpus_parts: List[str] = []
+        self._corpus_offsets: List[int] = []
+        self._corpus_positions: List[int] = []
+        self._corpus_length = 0
+        self.corpus = ""
+
+    def add(self, position: int, item: FunctionalItem):
+        title_lower = (item.title or "").lower().strip()
+        title_clean = normalize_title(item.title)
+
+        self.exact.setdefault(title_lower, position)
+        self.clean.setdefault(title_clean, position)
+        self.clean_lengths.add(len(title_clean))
+
+        if item.functional_id:
+            node = self.funcid_trie
+            if node[0] is None:
+                node[0] = position
+            for char in item.functional_id.upper():
+                node = node[1].setdefault(char, [position, {}])
+
+        self._corpus_offsets.append(self._corpus_length)
+        self._corpus_positions.append(position)
+        self._corpus_parts.append(title_clean)
+        self._corpus_length += len(title_clean) + len(_CORPUS_SEPARATOR)
+
+    def freeze(self):
+        self.corpus = _CORPUS_SEPARATOR.join(self._corpus_parts)
+        self._corpus_parts = []
+
+    def match_funcid_prefix(self, key: str) -> Optional[int]:
+        node = self.funcid_trie
+        for char in key:
+            node = node[1].get(char)
+            if node is None:
+                return None
+        return node[0]
+
+    def match_contained(self, title_clean: str) -> Optional[int]:
+        """Первая позиция, где title ⊂ item_title или item_title ⊂ title"""
+        best = None
+
+        # title_clean in item_title_clean — первое вхождение в корпусе
+        # совпадает с первым по порядку элементом
+        if self._corpus_positions and _CORPUS_SEPARATOR not in title_clean:
+            offset = self.corpus.find(title_clean)
+            if offset >= 0:
+                best = self._corpus_positions[
+                    bisect_right(self._corpus_offsets, offset) - 1
+                ]
+
+        # item_title_clean in title_clean — перебор подстрок нужных длин
+        for length in self.clean_lengths:
+            for start in range(len(title_clean) - length + 1):
+                position = self.clean.get(title_clean[start : start + length])
+                if position is not None and (best is None or position < best):
+                    best = position
+
+        return best
+
+
+class ParentResolutionIndex:
+    """
+    Индекс для поиска родителя по названию (замена линейного скана)
 
-    for item in items:
-        if item.type != type_filter:
-            continue
-
-        # 1. Точное совпадение title
-        if item.title.lower().strip() == title_lower:
-            return item
-
-        # 2. Совпадение без префикса
-        item_title_clean = item.title.lower().strip()
-        for prefix in [
-            "[module]:",
-            "[epic]:",
-            "[feature]:",
-            "[story]:",
-            "[page]:",
-            "[element]:",
-            "[service]:",
-        ]:
-            item_title_clean = item_title_clean.replace(prefix, "").strip()
-
-        if item_title_clean == title_clean:
-            return item
-
-        # 3. Совпадение по functional_id (например, "FRONT" → "MOD:FRONT")
-        if item.functional_id.upper().startswith(
-            title_clean.upper().replace(" ", "-").replace("_", "-")
-        ):
-            return item
+    Строится один раз на список элементов и сохраняет семантику
+    find_parent_by_title: возвращается первый по порядку элемент нужного
+    типа, подходящий под любое из правил:
+    1. Точное совпадение title
+    2. Совпадение без префикса ("[Module]:")
+    3. functional_id начинается с названия ("FRONT" → "MOD:FRONT...")
+    4. Вхождение одного очищенного title в другой
 
-        # 4. Содержит title (для частичных совпадений)
-        if title_clean in item_title_clean or item_title_clean in title_clean:
-            return item
+    Результаты поиска кэшируются по (type, title).
+    """
 
-    return None
+    def __init__(self, items: List[FunctionalItem]):
+        self._items = list(items)
+        self._by_type: Dict[str, _TypeIndex] = {}
+        self._cache: Dict[Tuple[str, str], Optional[FunctionalItem]] = {}
+
+        for position, item in enumerate(self._items):
+            type_index = self._by_type.get(item.type)
+            if type_index is None:
+                type_index = self._by_type[item.type] = _TypeIndex()
+            type_index.add(position, item)
+
+        for type_index in self._by_type.values():
+            type_index.freeze()
+
+    def find(self, title: str, type_filter: str) -> Optional[FunctionalItem]:
+        """Поиск элемента типа type_filter по названию title"""
+        key = (type_filter, title)
+        if key in self._cache:
+            return self._cache[key]
+
+        result = None
+        type_index = self._by_type.get(type_filter)
+        if type_index is not None:
+            title_lower = title.lower().strip()
+            title_clean = normalize_title(title)
+
+            candidates = [
+                type_index.exact.get(title_lower),
+                type_index.clean.get(title_clean),
+                type_index.match_funcid_prefix(_funcid_key(title_clean)),
+                type_index.match_contained(title_clean),
+            ]
+            positions = [p for p in candidates if p is not None]
+            if positions:
+                result = self._items[min(positions)]
+
+        self._cache[key] = result
+        return result
 
 
 def build_hierarchy_graph(
@@ -273,7 +385,9 @@ def build_hierarchy_graph(
 
 
 def get_item_neighbors(
-    item: FunctionalItem, items: List[FunctionalItem]
+    item: FunctionalItem,
+    items: List[FunctionalItem],
+    index: Optional[ParentResolutionIndex] = None,
 ) -> Tuple[List[FunctionalItem], List[FunctionalItem]]:
     """
     Получение соседей элемента (родители и дети)
@@ -281,6 +395,7 @@ def get_item_neighbors(
     Args:
         item: Элемент
         items: Все элементы
+        index: Готовый индекс (если не передан — строится по items)
 
     Returns:
         (parents, children)
@@ -288,6 +403,10 @@ def get_item_neighbors(
     parents = []
     children = []
 
+    parent_index = index
+    if parent_index is None and (item.module or item.epic or item.feature):
+        parent_index = ParentResolutionIndex(items)
+
     # Родители
     if item.parent_id:
         parent = next((i for i in items if i.id == item.parent_id), None)
@@ -295,17 +414,17 @@ def get_item_neighbors(
             parents.append(parent)
 
     if item.module:
-        parent = find_parent_by_title(items, item.module, "Module")
+        parent = parent_index.find(item.module, "Module")
         if parent and parent not in parents:
             parents.append(parent)
 
     if item.epic:
-        parent = find_parent_by_title(items, item.epic, "Epic")
+        parent = parent_index.find(item.epic, "Epic")
         if parent and parent not in parents:
             parents.append(parent)
 
     if item.feature:
-        parent = find_parent_by_title(items, item.feature, "Feature")
+        parent = parent_index.find(item.feature, "Feature")
         if parent and parent not in parents:
             parents.append(parent)
 
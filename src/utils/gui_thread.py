@@ -0,0 +1,50 @@
+"""
+Вызов функций в GUI-потоке Qt
+
+Коммиты из фоновых потоков (QThread импорта/синхронизации) вызывают
+обработчики сервисов в своём потоке, а виджеты можно трогать только из
+GUI-потока. call_in_gui_thread ставит вызов в очередь событий GUI-потока.
+"""
+
+from typing import Callable
+import threading
+
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, Qt, pyqtSignal, pyqtSlot
+
+
+class _Dispatcher(QObject):
+    """Живёт в GUI-потоке; слот очередного соединения выполняется в нём"""
+
+    call = pyqtSignal(object)
+
+    @pyqtSlot(object)
+    def run(self, callback: Callable[[], None]):
+        callback()
+
+
+_dispatcher = None
+_lock = threading.Lock()
+
+
+def call_in_gui_thread(callback: Callable[[], None]):
+    """
+    Вызвать callback в GUI-потоке
+
+    Из GUI-потока (или без QCoreApplication) — сразу, иначе — асинхронно,
+    когда GUI-поток обработает события.
+    """
+    global _dispatcher
+
+    app = QCoreApplication.instance()
+    if app is None or QThread.currentThread() is app.thread():
+        callback()
+        return
+
+    with _lock:
+        if _dispatcher is None or _dispatcher.thread() is not app.thread():
+            _dispatcher = _Dispatcher()
+            _dispatcher.moveToThread(app.thread())
+            _dispatcher.call.connect(
+                _dispatcher.run, Qt.ConnectionType.QueuedConnection
+            )
+    _dispatcher.call.emit(callback)
@@ -0,0 +1,165 @@
+"""
+Template Compiler - Компиляция markdown-шаблонов с {{placeholder}}
+
+Шаблон разбирается один раз на литералы и имена placeholder'ов и
+рендерится за один проход. Скомпилированные шаблоны кэшируются по ключу
+(для ReportTemplate — id и updated_at).
+
+LazyContext вычисляет значения по требованию: провайдер вызывается только
+если placeholder есть в шаблоне, и не больше одного раза.
+Неизвестные placeholder'ы остаются в тексте как есть.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+# Сколько скомпилированных шаблонов держать в памяти
+MAX_COMPILED = 128
+
+# Значение провайдера "нет данных": placeholder остаётся в тексте
+MISSING = object()
+
+
+class CompiledTemplate:
+    """Шаблон, разобранный на литералы и имена placeholder'ов"""
+
+    def __init__(self, source: str):
+        self.source = source
+        # Чётные элементы — литералы, нечётные — имена placeholder'ов
+        self.parts: List[str] = PLACEHOLDER_RE.split(source)
+        self.placeholders: FrozenSet[str] = frozenset(self.parts[1::2])
+
+    def render(self, context: Mapping[str, Any]) -> str:
+        """Подставить значения context за один проход"""
+        chunks = []
+        for index, part in enumerate(self.parts):
+            if index % 2 == 0:
+                chunks.append(part)
+                continue
+            value = context.get(part, MISSING)
+            chunks.append("{{%s}}" % part if value is MISSING else str(value))
+        return "".join(chunks)
+
+
+class LazyContext(Mapping):
+    """Контекст шаблона: готовые значения и ленивые провайдеры"""
+
+    def __init__(
+        self,
+        values: Optional[Dict[str, Any]] = None,
+        providers: Optional[Dict[str, Callable[[], Any]]] = None,
+    ):
+        self._values: Dict[str, Any] = dict(values or {})
+        self._providers: Dict[str, Callable[[], Any]] = dict(providers or {})
+        # Провайдер может читать другие ключи контекста
+        self._lock = threading.RLock()
+
+    def provide(self, key: str, provider: Callable[[], Any]):
+        """Зарегистрировать провайдер значения (MISSING — нет данных)"""
+        self._values.pop(key, None)
+        self._providers[key] = provider
+
+    def provide_many(self, keys: List[str], provider: Callable[[], Dict[str, Any]]):
+        """Один провайдер для нескольких ключей (вызывается один раз)"""
+        group = memoize(provider)
+        for key in keys:
+            self.provide(key, lambda key=key: group().get(key, MISSING))
+
+    def update(self, values: Dict[str, Any]):
+        """Готовые значения (переопределяют провайдеры)"""
+        for key in values:
+            self._providers.pop(key, None)
+        self._values.update(values)
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            if key not in self._values:
+                provider = self._providers.get(key)
+                if provider is None:
+                    raise KeyError(key)
+                self._values[key] = provider()
+                del self._providers[key]
+            value = self._values[key]
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._values) + list(self._providers))
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._providers)
+
+
+def memoize(function: Callable[[], Any]) -> Callable[[], Any]:
+    """Функция без аргументов, вычисляемая один раз"""
+    result = []
+
+    def wrapper():
+        if not result:
+            result.append(function())
+        return result[0]
+
+    return wrapper
+
+
+_compiled: "OrderedDict[Hashable, CompiledTemplate]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_template(
+    source: str, key: Union[Hashable, None] = None
+) -> CompiledTemplate:
+    """
+    Скомпилировать шаблон (с кэшем)
+
+    Args:
+        source: Текст шаблона
+        key: Ключ кэша (например, ("report_template", id, updated_at));
+            по умолчанию — сам текст
+
+    Returns:
+        CompiledTemplate: Скомпилированный шаблон
+    """
+    key = source if key is None else key
+    with _compiled_lock:
+        compiled = _compiled.get(key)
+        # Текст сверяется: шаблон могли изменить без смены ключа
+        if compiled is not None and compiled.source == source:
+            _compiled.move_to_end(key)
+            return compiled
+
+    compiled = CompiledTemplate(source)
+    with _compiled_lock:
+        _compiled[key] = compiled
+        _compiled.move_to_end(key)
+        while len(_compiled) > MAX_COMPILED:
+            _compiled.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_templates():
+    """Сброс кэша скомпилированных шаблонов (для тестирования)"""
+    with _compiled_lock:
+        _compiled.clear()
+
+
+def render_template(
+    source: str, context: Mapping[str, Any], key: Union[Hashable, None] = None
+) -> str:
+    """Скомпилировать (с кэшем) и отрендерить шаблон"""
+    return compile_template(source, key).render(context)
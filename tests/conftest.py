@@ -0,0 +1,28 @@
+"""
+Общие фикстуры тестов
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# Qt-тесты работают без дисплея
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# src.db.database при импорте создаёт ProjectManager и сохраняет профили:
+# тесты пишут во временный каталог, а не в data/config
+_config_dir = tempfile.mkdtemp(prefix="voluptas-config-")
+os.environ["VOLUPTAS_CONFIG_DIR"] = _config_dir
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_config_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,167 @@
+"""
+Tests for CoverageService
+
+Агрегаты SQL совпадают с подсчётом по свойствам FunctionalItem
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, User
+from src.services.CoverageService import CoverageService
+
+# (test_cases_linked, automation_status, documentation_links)
+COVERAGE_VARIANTS = [
+    (None, None, None),
+    ("SAN-1", "Automated", "https://docs/1"),
+    ("  \n", "Manual", ""),
+    ("SAN-2", None, "https://docs/2"),
+    (None, "Partially Automated", None),
+    ("SAN-3", "Automated", None),
+]
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'coverage.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    qa = [User(name="Anna"), User(name="Boris")]
+    session.add_all(qa)
+    session.flush()
+    for i in range(30):
+        tests, automation, docs = COVERAGE_VARIANTS[i % len(COVERAGE_VARIANTS)]
+        session.add(
+            FunctionalItem(
+                functional_id=f"m{i % 3}.e{i % 4}.f{i}",
+                title=f"Feature {i}",
+                type="Feature" if i % 5 else "Epic",
+                module=f"Module {i % 3}" if i % 7 else None,
+                epic=f"Epic {i % 4}",
+                segment="UI" if i % 2 else "API",
+                is_crit=int(i % 4 == 0),
+                is_focus=int(i % 6 == 0),
+                responsible_qa_id=qa[i % 2].id if i % 3 else None,
+                test_cases_linked=tests,
+                automation_status=automation,
+                documentation_links=docs,
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def expected(items):
+    """Подсчёт по свойствам ORM-объектов"""
+    statuses = [item.coverage_status for item in items]
+    return {
+        "total": len(items),
+        "crit": sum(1 for item in items if item.is_crit),
+        "focus": sum(1 for item in items if item.is_focus),
+        "with_tests": sum(1 for item in items if item.is_covered_by_tests),
+        "automated": sum(1 for item in items if item.is_automated),
+        "documented": sum(1 for item in items if item.is_documented),
+        "full": statuses.count("full"),
+        "partial": statuses.count("partial"),
+        "none": statuses.count("none"),
+    }
+
+
+def as_dict(stats):
+    return {key: getattr(stats, key) for key in expected([]).keys()}
+
+
+class TestCoverageService:
+    """totals / rollup / report_stats"""
+
+    def test_totals_match_python(self, session):
+        items = session.query(FunctionalItem).all()
+
+        stats = CoverageService(session).totals()
+
+        assert as_dict(stats) == expected(items)
+        assert stats.key is None
+
+    def test_totals_with_filters(self, session):
+        items = [
+            item
+            for item in session.query(FunctionalItem).all()
+            if item.is_crit and item.type == "Feature"
+        ]
+
+        stats = CoverageService(session).totals({"is_crit": True, "type": ["Feature"]})
+
+        assert as_dict(stats) == expected(items)
+
+    @pytest.mark.parametrize("dimension", ["type", "module", "epic", "segment"])
+    def test_rollup_matches_python(self, session, dimension):
+        items = session.query(FunctionalItem).all()
+
+        groups = CoverageService(session).rollup(dimension)
+
+        keys = {getattr(item, dimension) for item in items}
+        assert {group.key for group in groups} == keys
+        for group in groups:
+            members = [item for item in items if getattr(item, dimension) == group.key]
+            assert as_dict(group) == expected(members)
+
+    def test_rollup_by_qa(self, session):
+        groups = {g.key: g for g in CoverageService(session).rollup("qa")}
+
+        assert set(groups) == {"Anna", "Boris", None}
+        assert sum(group.total for group in groups.values()) == 30
+        assert groups[None].total == 10
+
+    def test_rollup_by_qa_same_names(self, session):
+        """Тёзки — разные группы (сотрудники сопоставляются по id)"""
+        # БД, где users без UNIQUE(name): create_all не меняет существующую схему
+        connection = session.connection()
+        connection.exec_driver_sql("CREATE TABLE users_copy AS SELECT * FROM users")
+        connection.exec_driver_sql("DROP TABLE users")
+        connection.exec_driver_sql("ALTER TABLE users_copy RENAME TO users")
+        connection.exec_driver_sql("INSERT INTO users (id, name) VALUES (100, 'Anna')")
+        session.query(FunctionalItem).filter(
+            FunctionalItem.responsible_qa_id.is_(None)
+        ).update({FunctionalItem.responsible_qa_id: 100})
+        session.commit()
+
+        groups = CoverageService(session).rollup("qa")
+
+        assert [group.key for group in groups] == ["Anna", "Anna", "Boris"]
+        assert sorted(group.total for group in groups[:2]) == [10, 10]
+
+    def test_one_query_per_dimension(self, session):
+        statements = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        rollups = CoverageService(session).rollups()
+
+        assert set(rollups) == {"type", "module", "epic", "segment", "qa"}
+        assert len(statements) == 5
+        assert all("GROUP BY" in statement for statement in statements)
+
+    def test_report_stats(self, session):
+        stats = CoverageService(session).report_stats()
+        empty = CoverageService(session).report_stats({"responsible_qa_id": 999})
+
+        assert stats["with_tests"] == 15
+        assert stats["with_tests_pct"] == 50
+        assert stats["coverage"] == int((15 + 15 + 10) / 90 * 100)
+        assert empty == {
+            "coverage": 0,
+            "with_tests": 0,
+            "automated": 0,
+            "documented": 0,
+        }
+
+    def test_unknown_dimension(self, session):
+        with pytest.raises(ValueError):
+            CoverageService(session).rollup("feature_id")
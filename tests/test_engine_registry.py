@@ -0,0 +1,126 @@
+"""
+Tests for EngineRegistry
+
+Проверка переиспользования engine и LRU-вытеснения
+"""
+
+from sqlalchemy import text
+
+from src.db.engine_registry import EngineRegistry
+
+
+class TestEngineRegistry:
+    """Тесты реестра engine"""
+
+    def test_engine_reused(self, tmp_path):
+        """Один engine и sessionmaker на путь к БД"""
+        registry = EngineRegistry()
+        db_path = tmp_path / "project.db"
+
+        engine = registry.get_engine(db_path)
+
+        assert registry.get_engine(db_path) is engine
+        assert registry.get_sessionmaker(db_path) is registry.get_sessionmaker(
+            str(db_path)
+        )
+        assert len(registry) == 1
+
+    def test_foreign_keys_enabled(self, tmp_path):
+        """PRAGMA foreign_keys включается на соединениях"""
+        registry = EngineRegistry()
+        session = registry.get_sessionmaker(tmp_path / "project.db")()
+
+        assert session.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        session.close()
+
+    def test_lru_eviction(self, tmp_path):
+        """Давно не используемый engine вытесняется"""
+        registry = EngineRegistry(max_engines=2)
+        first, second, third = (tmp_path / f"p{i}.db" for i in range(3))
+
+        registry.get_engine(first)
+        registry.get_engine(second)
+        registry.get_engine(first)  # first снова "свежий"
+        registry.get_engine(third)
+
+        assert first in registry
+        assert third in registry
+        assert second not in registry
+
+    def test_dispose(self, tmp_path):
+        """dispose / dispose_all убирают engine из реестра"""
+        registry = EngineRegistry()
+        first, second = tmp_path / "a.db", tmp_path / "b.db"
+        registry.get_engine(first)
+        registry.get_engine(second)
+
+        assert registry.dispose(first) is True
+        assert registry.dispose(first) is False
+        assert first not in registry
+
+        registry.dispose_all()
+        assert len(registry) == 0
+
+class TestPerformanceProfile:
+    """Тесты профиля производительности SQLite"""
+
+    def test_profile_applied(self, tmp_path):
+        """PRAGMA профиля применяются к соединениям"""
+        from src.db.engine_registry import read_effective_pragmas
+        from src.models.project_config import DatabasePerformanceProfile
+
+        registry = EngineRegistry()
+        profile = DatabasePerformanceProfile(cache_size=-2048, busy_timeout=1234)
+        values = read_effective_pragmas(
+            registry.get_engine(tmp_path / "project.db", profile)
+        )
+
+        assert values["journal_mode"] == "WAL"
+        assert values["synchronous"] == "NORMAL"
+        assert values["temp_store"] == "MEMORY"
+        assert values["cache_size"] == -2048
+        assert values["busy_timeout"] == 1234
+        assert values["foreign_keys"] == 1
+        registry.dispose_all()
+
+    def test_profile_change_recreates_engine(self, tmp_path):
+        """Новый профиль пересоздаёт engine, тот же профиль — переиспользует"""
+        from src.models.project_config import DatabasePerformanceProfile
+
+        registry = EngineRegistry()
+        db_path = tmp_path / "project.db"
+        engine = registry.get_engine(db_path, DatabasePerformanceProfile())
+
+        assert registry.get_engine(db_path, DatabasePerformanceProfile()) is engine
+        assert registry.get_engine(db_path) is engine
+
+        changed = DatabasePerformanceProfile(journal_mode="DELETE")
+        assert registry.get_engine(db_path, changed) is not engine
+        assert registry.get_profile(db_path).journal_mode == "DELETE"
+        registry.dispose_all()
+
+    def test_checkpoint_on_dispose(self, tmp_path):
+        """При закрытии WAL сбрасывается в основной файл (TRUNCATE)"""
+        registry = EngineRegistry()
+        db_path = tmp_path / "project.db"
+        engine = registry.get_engine(db_path)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE t (x INTEGER)")
+            conn.exec_driver_sql("INSERT INTO t VALUES (1)")
+
+        registry.dispose(db_path)
+
+        wal = tmp_path / "project.db-wal"
+        assert not wal.exists() or wal.stat().st_size == 0
+
+    def test_profile_roundtrip(self):
+        """Сериализация профиля и защита от недопустимых значений"""
+        from src.models.project_config import DatabasePerformanceProfile
+
+        profile = DatabasePerformanceProfile.from_dict(
+            {"journal_mode": "wal; DROP TABLE x", "synchronous": "full", "extra": 1}
+        )
+
+        assert profile.journal_mode == "WAL"
+        assert profile.synchronous == "FULL"
+        assert DatabasePerformanceProfile.from_dict(profile.to_dict()) == profile
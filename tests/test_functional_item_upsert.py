@@ -0,0 +1,101 @@
+"""
+Tests for FunctionalItemUpsertService
+
+Проверка массового upsert по functional_id
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, User
+from src.services.FunctionalItemUpsertService import FunctionalItemUpsertService
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def make_row(func_id, **fields):
+    row = {"functional_id": func_id, "title": func_id.title(), "type": "Feature"}
+    row.update(fields)
+    return row
+
+
+class TestFunctionalItemUpsert:
+    """Тесты upsert функциональных элементов"""
+
+    def test_new_updated_unchanged(self, session):
+        """Статистика новых, обновлённых и неизменных строк"""
+        service = FunctionalItemUpsertService(session)
+        stats = service.upsert([make_row("a"), make_row("b"), make_row("c")])
+        assert stats["new"] == 3
+
+        stats = service.upsert(
+            [make_row("a"), make_row("b", title="Changed"), make_row("d")]
+        )
+
+        assert (stats["new"], stats["updated"], stats["unchanged"]) == (1, 1, 1)
+        item = session.query(FunctionalItem).filter_by(functional_id="b").one()
+        assert item.title == "Changed"
+        assert session.query(FunctionalItem).count() == 4
+
+    def test_users_resolved_by_name(self, session):
+        """Ответственные по имени: существующие переиспользуются, новые создаются"""
+        session.add(User(name="Alice", is_active=1))
+        session.commit()
+
+        stats = FunctionalItemUpsertService(session).upsert(
+            [
+                make_row("a", responsible_qa="Alice", responsible_dev="Bob"),
+                make_row("b", responsible_qa="Bob"),
+            ]
+        )
+
+        assert stats["users_created"] == 1
+        item = session.query(FunctionalItem).filter_by(functional_id="a").one()
+        assert item.responsible_qa.name == "Alice"
+        assert item.responsible_dev.name == "Bob"
+
+    def test_unknown_users_not_created(self, session):
+        """create_users=False: неизвестное имя -> None"""
+        FunctionalItemUpsertService(session, create_users=False).upsert(
+            [make_row("a", responsible_qa="Ghost")]
+        )
+
+        assert session.query(User).count() == 0
+        item = session.query(FunctionalItem).one()
+        assert item.responsible_qa_id is None
+
+    def test_skip_existing(self, session):
+        """update_existing=False не перезаписывает существующие элементы"""
+        service = FunctionalItemUpsertService(session)
+        service.upsert([make_row("a")])
+
+        stats = service.upsert(
+            [make_row("a", title="New title"), make_row("b")], update_existing=False
+        )
+
+        assert (stats["new"], stats["skipped"]) == (1, 1)
+        item = session.query(FunctionalItem).filter_by(functional_id="a").one()
+        assert item.title == "A"
+
+    def test_bad_row_does_not_break_batch(self, session):
+        """Строка с ошибкой (дубль alias_tag) не отменяет остальные"""
+        stats = FunctionalItemUpsertService(session).upsert(
+            [
+                make_row("a", alias_tag="same"),
+                make_row("b", alias_tag="same"),
+                make_row("c", alias_tag="other"),
+            ]
+        )
+
+        assert stats["new"] == 2
+        assert stats["errors"] == 1
+        assert session.query(FunctionalItem).count() == 2
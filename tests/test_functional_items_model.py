@@ -0,0 +1,309 @@
+"""
+Tests for FunctionalItemTableModel / FunctionalItemFilterProxyModel
+
+setData сохраняет через on_commit и только потом меняет строку,
+прокси фильтрует по кортежам модели
+"""
+
+import pytest
+from PyQt6.QtCore import Qt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, User
+from src.ui.views.functional_items_model import (
+    COL_ALIAS,
+    COL_CRIT,
+    COL_EPIC,
+    COL_FOCUS,
+    COL_FUNCID,
+    COL_MODULE,
+    COL_QA,
+    COL_SEGMENT,
+    COL_TITLE,
+    COL_TYPE,
+    HIERARCHY_MARKER,
+    FunctionalItemFilterProxyModel,
+    FunctionalItemTableModel,
+    ItemRow,
+    load_item_rows,
+)
+
+
+def make_row(item_id, functional_id, **fields):
+    values = dict.fromkeys(ItemRow._fields)
+    values.update(id=item_id, functional_id=functional_id, is_crit=0, is_focus=0)
+    values.update(fields)
+    return ItemRow(**values)
+
+
+ROWS = [
+    make_row(1, "app.auth", title="Auth", type="Module", is_crit=1),
+    make_row(
+        2,
+        "app.auth.login",
+        title="Login",
+        type="Feature",
+        module="auth",
+        qa_name="Anna",
+        segment="UI",
+        is_focus=1,
+    ),
+    make_row(
+        3,
+        "app.billing.pay",
+        alias_tag="pay",
+        title="Payment",
+        type="Feature",
+        module="billing",
+        segment="Backend",
+        is_crit=1,
+        is_focus=1,
+    ),
+]
+
+
+class Recorder:
+    """on_commit: запоминает вызовы и возвращает заданный результат"""
+
+    def __init__(self, result=True):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, row, column, value):
+        self.calls.append((row.id, column, value))
+        return self.result
+
+
+@pytest.fixture
+def commits():
+    return Recorder()
+
+
+@pytest.fixture
+def model(qapp, commits):
+    model = FunctionalItemTableModel(on_commit=commits)
+    model.set_rows(ROWS)
+    return model
+
+
+@pytest.fixture
+def proxy(model):
+    proxy = FunctionalItemFilterProxyModel()
+    proxy.setSourceModel(model)
+    return proxy
+
+
+def visible_ids(proxy):
+    return [
+        proxy.sourceModel().row_at(proxy.mapToSource(proxy.index(row, 0)).row()).id
+        for row in range(proxy.rowCount())
+    ]
+
+
+class TestTableModel:
+    """data / flags / setData"""
+
+    def test_display(self, model):
+        assert model.rowCount() == 3
+        assert model.data(model.index(0, COL_ALIAS)) == "auth"
+        assert model.data(model.index(2, COL_ALIAS)) == "pay"
+        assert model.data(model.index(0, COL_EPIC)) == ""
+        assert model.data(model.index(1, COL_MODULE)) == "auth"
+        assert model.data(model.index(0, COL_MODULE)) == HIERARCHY_MARKER
+        assert model.data(model.index(1, COL_QA)) == "Anna"
+
+    def test_check_state(self, model):
+        crit = model.index(0, COL_CRIT)
+
+        assert model.data(crit, Qt.ItemDataRole.CheckStateRole) == (
+            Qt.CheckState.Checked
+        )
+        assert model.data(crit) is None
+        assert model.flags(crit) & Qt.ItemFlag.ItemIsUserCheckable
+        assert not model.flags(model.index(0, COL_FUNCID)) & Qt.ItemFlag.ItemIsEditable
+        assert model.flags(model.index(0, COL_TITLE)) & Qt.ItemFlag.ItemIsEditable
+
+    def test_edit_commits(self, model, commits):
+        changed = []
+        model.dataChanged.connect(lambda top, bottom: changed.append(top.row()))
+
+        assert model.setData(model.index(1, COL_TITLE), "  Sign in ")
+
+        assert commits.calls == [(2, COL_TITLE, "Sign in")]
+        assert model.row_at(1).title == "Sign in"
+        assert changed == [1]
+
+    def test_unchanged_value_skipped(self, model, commits):
+        assert not model.setData(model.index(1, COL_TITLE), "Login ")
+        assert not model.setData(model.index(2, COL_ALIAS), "pay")
+        # Пустой alias остаётся пустым
+        assert not model.setData(model.index(1, COL_ALIAS), " ")
+
+        assert commits.calls == []
+
+    def test_default_alias_saved(self, model, commits):
+        """Alias, совпадающий с отображаемым по умолчанию, сохраняется в поле"""
+        assert model.data(model.index(1, COL_ALIAS)) == "login"
+
+        assert model.setData(model.index(1, COL_ALIAS), "login")
+
+        assert commits.calls == [(2, COL_ALIAS, "login")]
+        assert model.row_at(1).alias_tag == "login"
+
+    def test_empty_becomes_none(self, model, commits):
+        assert model.setData(model.index(2, COL_ALIAS), "")
+        assert model.setData(model.index(2, COL_SEGMENT), " ")
+        assert model.setData(model.index(2, COL_TITLE), "")
+
+        # В on_commit уходит строка, в модели пустые alias/segment — None
+        assert [value for _, _, value in commits.calls] == ["", "", ""]
+        row = model.row_at(2)
+        assert row.alias_tag is None
+        assert row.segment is None
+        assert row.title == ""
+        assert model.data(model.index(2, COL_ALIAS)) == "pay"
+
+    def test_check_state_conversion(self, model, commits):
+        role = Qt.ItemDataRole.CheckStateRole
+
+        assert model.setData(model.index(0, COL_CRIT), Qt.CheckState.Unchecked, role)
+        # Делегаты и view передают состояние как int
+        assert model.setData(
+            model.index(0, COL_FOCUS), Qt.CheckState.Checked.value, role
+        )
+
+        assert commits.calls == [(1, COL_CRIT, 0), (1, COL_FOCUS, 1)]
+        assert model.row_at(0).is_crit == 0
+        assert model.row_at(0).is_focus == 1
+        assert model.data(model.index(0, COL_FOCUS), role) == Qt.CheckState.Checked
+
+    def test_rejected_commit_keeps_row(self, model, commits):
+        commits.result = False
+
+        assert not model.setData(model.index(1, COL_TITLE), "Sign in")
+        assert not model.setData(
+            model.index(1, COL_CRIT),
+            Qt.CheckState.Checked,
+            Qt.ItemDataRole.CheckStateRole,
+        )
+
+        assert len(commits.calls) == 2
+        assert model.row_at(1) == ROWS[1]
+
+    def test_readonly_and_wrong_role(self, model, commits):
+        assert not model.setData(model.index(0, COL_FUNCID), "app.other")
+        assert not model.setData(model.index(0, COL_TYPE), "Epic")
+        assert not model.setData(model.index(0, COL_CRIT), Qt.CheckState.Unchecked)
+        assert not model.setData(
+            model.index(0, COL_TITLE), "x", Qt.ItemDataRole.CheckStateRole
+        )
+
+        assert commits.calls == []
+        assert model.rows() == ROWS
+
+    def test_without_callback(self, qapp):
+        model = FunctionalItemTableModel()
+        model.set_rows(ROWS)
+
+        assert model.setData(model.index(0, COL_TITLE), "Authentication")
+        assert model.row_at(0).title == "Authentication"
+
+
+class TestFilterProxy:
+    """filterAcceptsRow"""
+
+    def test_no_filters(self, proxy):
+        assert visible_ids(proxy) == [1, 2, 3]
+
+    def test_quick_filter(self, proxy):
+        proxy.set_filters(quick_filter="crit")
+        assert visible_ids(proxy) == [1, 3]
+
+        proxy.set_filters(quick_filter="focus")
+        assert visible_ids(proxy) == [2, 3]
+
+    def test_search(self, proxy):
+        # Без учёта регистра, по отображаемому тексту (alias по умолчанию тоже)
+        proxy.set_filters(search_text="ANNA")
+        assert visible_ids(proxy) == [2]
+
+        proxy.set_filters(search_text="login")
+        assert visible_ids(proxy) == [2]
+
+        proxy.set_filters(search_text="billing")
+        assert visible_ids(proxy) == [3]
+
+        proxy.set_filters(search_text="nothing")
+        assert visible_ids(proxy) == []
+
+    def test_column_filters(self, proxy):
+        proxy.set_filters(column_filters={COL_TYPE: "Feature", COL_SEGMENT: ""})
+        assert visible_ids(proxy) == [2, 3]
+
+        proxy.set_filters(column_filters={COL_TYPE: "Feature", COL_SEGMENT: "UI"})
+        assert visible_ids(proxy) == [2]
+
+    def test_allowed_ids(self, proxy):
+        proxy.set_filters(allowed_ids={1, 3})
+        assert visible_ids(proxy) == [1, 3]
+
+        proxy.set_filters(allowed_ids=set())
+        assert visible_ids(proxy) == []
+
+    def test_combined(self, proxy):
+        proxy.set_filters(
+            search_text="app", quick_filter="focus", allowed_ids={1, 2, 3}
+        )
+        assert visible_ids(proxy) == [2, 3]
+
+        proxy.set_filters(search_text="auth", quick_filter="crit")
+        assert visible_ids(proxy) == [1]
+
+    def test_follows_model_edits(self, model, proxy):
+        proxy.setDynamicSortFilter(True)
+        proxy.set_filters(quick_filter="crit")
+
+        model.setData(
+            model.index(1, COL_CRIT),
+            Qt.CheckState.Checked,
+            Qt.ItemDataRole.CheckStateRole,
+        )
+
+        assert visible_ids(proxy) == [1, 2, 3]
+
+
+class TestLoadItemRows:
+    """load_item_rows"""
+
+    def test_rows_with_user_names(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'items.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        anna = User(name="Anna", is_active=1)
+        session.add(anna)
+        session.flush()
+        session.add_all(
+            [
+                FunctionalItem(
+                    functional_id="app.b", title="B", type="Feature", is_crit=1
+                ),
+                FunctionalItem(
+                    functional_id="app.a",
+                    title="A",
+                    type="Module",
+                    responsible_qa_id=anna.id,
+                ),
+            ]
+        )
+        session.commit()
+
+        rows = load_item_rows(session)
+
+        assert [row.functional_id for row in rows] == ["app.a", "app.b"]
+        assert rows[0].qa_name == "Anna"
+        assert rows[0].dev_name is None
+        assert rows[1].is_crit == 1
+        session.close()
+        engine.dispose()
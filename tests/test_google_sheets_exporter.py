@@ -0,0 +1,199 @@
+"""
+Tests for GoogleSheetsExporter и SpreadsheetSession
+
+Все листы экспорта — одна очистка и одна запись
+"""
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.integrations.google import SpreadsheetSession
+from src.models import FunctionalItem, Relation, User
+from src.services.GoogleSheetsExporter import GoogleSheetsExporter
+
+
+class FakeWorksheet:
+    def __init__(self, sheet_id, title, rows=1000, cols=26):
+        self.id = sheet_id
+        self.title = title
+        self.row_count = rows
+        self.col_count = cols
+
+
+class FakeSpreadsheet:
+    """Запоминает вызовы API"""
+
+    def __init__(self, worksheets):
+        self._worksheets = worksheets
+        self.calls = []
+
+    def worksheets(self):
+        self.calls.append(("worksheets",))
+        return self._worksheets
+
+    def batch_update(self, body):
+        self.calls.append(("batch_update", body))
+        replies = []
+        for request in body["requests"]:
+            if "addSheet" in request:
+                props = dict(request["addSheet"]["properties"], sheetId=100)
+                replies.append({"addSheet": {"properties": props}})
+            else:
+                replies.append({})
+        return {"replies": replies}
+
+    def values_batch_clear(self, body):
+        self.calls.append(("values_batch_clear", body["ranges"]))
+
+    def values_batch_update(self, body):
+        self.calls.append(("values_batch_update", body))
+
+    def written(self):
+        """Лист -> записанные строки (последний values_batch_update)"""
+        body = [call[1] for call in self.calls if call[0] == "values_batch_update"][-1]
+        return {item["range"]: item["values"] for item in body["data"]}
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+        self.opened = []
+
+    def open_by_key(self, key):
+        self.opened.append(key)
+        return self.spreadsheet
+
+
+def call_names(spreadsheet):
+    return [call[0] for call in spreadsheet.calls]
+
+
+class TestSpreadsheetSession:
+    """add_table / flush"""
+
+    def test_flush_writes_all_tables_in_one_call(self):
+        spreadsheet = FakeSpreadsheet([FakeWorksheet(0, "A"), FakeWorksheet(1, "B")])
+        sheets = SpreadsheetSession(FakeClient(spreadsheet), "id")
+
+        sheets.add_table("A", [{"x": np.int64(1)}, {"x": 2, "y": np.float32(0.5)}])
+        sheets.add_table("B", [])
+        sheets.flush()
+
+        assert call_names(spreadsheet) == [
+            "worksheets",
+            "values_batch_clear",
+            "values_batch_update",
+        ]
+        assert spreadsheet.calls[1][1] == ["'A'", "'B'"]
+        assert spreadsheet.written() == {"'A'!A1": [["x", "y"], [1, ""], [2, 0.5]]}
+        assert type(spreadsheet.written()["'A'!A1"][1][0]) is int
+
+    def test_missing_and_small_sheets_resized_once(self):
+        spreadsheet = FakeSpreadsheet([FakeWorksheet(7, "Small", rows=10, cols=2)])
+        sheets = SpreadsheetSession(FakeClient(spreadsheet), "id")
+
+        sheets.add_table("Small", [{"n": i} for i in range(150)])
+        sheets.add_table("New", [{"n": 1}])
+        sheets.flush()
+        sheets.add_table("New", [{"n": 2}])
+        sheets.flush()
+
+        updates = [call[1] for call in spreadsheet.calls if call[0] == "batch_update"]
+        assert len(updates) == 1
+        small, new = updates[0]["requests"]
+        grid = small["updateSheetProperties"]["properties"]["gridProperties"]
+        assert grid == {"rowCount": 151, "columnCount": 26}
+        assert new["addSheet"]["properties"]["title"] == "New"
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    qa = User(name="Anna", is_active=1)
+    session.add(qa)
+    session.flush()
+    items = [
+        FunctionalItem(
+            functional_id=f"app.f{i}",
+            title=f"Feature {i}",
+            type="Feature",
+            responsible_qa_id=qa.id,
+        )
+        for i in range(3)
+    ]
+    session.add_all(items)
+    session.flush()
+    session.add(
+        Relation(source_id=items[0].id, target_id=items[1].id, type="functional")
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_exporter(session, worksheets=()):
+    spreadsheet = FakeSpreadsheet(list(worksheets))
+    exporter = GoogleSheetsExporter("service_account.json", session)
+    exporter.client = FakeClient(spreadsheet)
+    return exporter, spreadsheet
+
+
+class TestGoogleSheetsExporter:
+    """export_all_tables"""
+
+    def test_export_all_tables_batched(self, session):
+        exporter, spreadsheet = make_exporter(
+            session,
+            [
+                FakeWorksheet(0, "Функционал"),
+                FakeWorksheet(1, "Сотрудники"),
+                FakeWorksheet(2, "Связи"),
+            ],
+        )
+
+        stats = exporter.export_all_tables("sheet-id")
+
+        assert stats == {
+            "functional_items": 3,
+            "users": 1,
+            "relations": 1,
+            "errors": [],
+        }
+        assert exporter.client.opened == ["sheet-id"]
+        assert call_names(spreadsheet) == [
+            "worksheets",
+            "values_batch_clear",
+            "values_batch_update",
+        ]
+        written = spreadsheet.written()
+        assert [row[0] for row in written["'Функционал'!A1"]] == [
+            "FuncID",
+            "app.f0",
+            "app.f1",
+            "app.f2",
+        ]
+        assert written["'Сотрудники'!A1"][1][1] == "Anna"
+        relation = dict(zip(*written["'Связи'!A1"]))
+        assert (relation["Source FuncID"], relation["Target FuncID"]) == (
+            "app.f0",
+            "app.f1",
+        )
+
+    def test_empty_tables_not_cleared(self, session):
+        session.query(Relation).delete()
+        session.commit()
+        exporter, spreadsheet = make_exporter(session)
+
+        stats = exporter.export_all_tables("sheet-id")
+
+        assert stats["relations"] == 0
+        assert spreadsheet.calls[-2] == (
+            "values_batch_clear",
+            ["'Функционал'", "'Сотрудники'"],
+        )
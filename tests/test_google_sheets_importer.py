@@ -0,0 +1,168 @@
+"""
+Tests for GoogleSheetsImporter
+
+Чтение листов одним values_batch_get и запись без запросов на каждую строку
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, Relation, User
+from src.services.GoogleSheetsImporter import GoogleSheetsImporter, to_sheet_records
+
+SHEET_VALUES = {
+    "Сотрудники": [
+        ["Name", "Position", "Email", "Zoho ID", "GitHub", "Active"],
+        ["Anna", "QA Lead", "anna@test", "", "", "Да"],
+        ["Boris", "Developer"],
+    ],
+    "Функционал": [
+        ["FuncID", "Title", "Type", "QA", "isCrit"],
+        ["app.auth", "Auth", "Module", "Anna", "Да"],
+        ["app.auth.login", "Login", "Feature", "Boris", ""],
+    ],
+    "Связи": [
+        ["Source ID", "Target ID", "Type", "Weight", "Notes"],
+        [1, 2, "hierarchy", 1, "parent"],
+        [1, 2, "hierarchy", 1, ""],
+        ["1", "2", "functional", 0.5, ""],
+        ["", "2", "hierarchy", 1, ""],
+    ],
+}
+
+
+class FakeWorksheet:
+    def __init__(self, title):
+        self.title = title
+
+
+class FakeSpreadsheet:
+    """Листы в памяти; запоминает batch-чтения"""
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.batch_gets = []
+
+    def worksheets(self):
+        return [FakeWorksheet(title) for title in self.sheets]
+
+    def values_batch_get(self, ranges):
+        self.batch_gets.append(ranges)
+        return {
+            "valueRanges": [
+                {"range": name, "values": self.sheets[name.strip("'")]}
+                for name in ranges
+            ]
+        }
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+
+    def open_by_key(self, key):
+        return self.spreadsheet
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(name="Anna", position="QA", is_active=0))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_importer(session, sheets):
+    spreadsheet = FakeSpreadsheet(sheets)
+    importer = GoogleSheetsImporter("service_account.json", session)
+    importer._authorize = lambda: FakeClient(spreadsheet)
+    return importer, spreadsheet
+
+
+class TestGoogleSheetsImporter:
+    """import_all_tables / read_tables"""
+
+    def test_records_padded_and_numericised(self):
+        records = to_sheet_records([["A", "B", "C"], ["x", "2"], []])
+
+        assert records == [{"A": "x", "B": 2, "C": ""}, {"A": "", "B": "", "C": ""}]
+        assert to_sheet_records([]) == []
+
+    def test_single_batch_read(self, session):
+        importer, spreadsheet = make_importer(session, SHEET_VALUES)
+
+        tables = importer.read_tables("sheet-id")
+
+        assert spreadsheet.batch_gets == [["'Сотрудники'", "'Функционал'", "'Связи'"]]
+        assert [row["Name"] for row in tables["users"]] == ["Anna", "Boris"]
+        assert tables["users"][1]["Active"] == ""
+
+    def test_missing_sheet_is_empty(self, session):
+        importer, spreadsheet = make_importer(
+            session, {"Сотрудники": SHEET_VALUES["Сотрудники"]}
+        )
+
+        tables = importer.read_tables("sheet-id")
+
+        assert spreadsheet.batch_gets == [["'Сотрудники'"]]
+        assert tables["functional_items"] == []
+        assert tables["relations"] == []
+
+    def test_import_all_tables(self, session):
+        importer, spreadsheet = make_importer(session, SHEET_VALUES)
+
+        stats = importer.import_all_tables("sheet-id")
+
+        assert stats == {
+            "functional_items": 2,
+            "users": 2,
+            "relations": 2,
+            "errors": [],
+        }
+        anna = session.query(User).filter_by(name="Anna").one()
+        assert (anna.position, anna.is_active) == ("QA Lead", 1)
+        items = {item.functional_id: item for item in session.query(FunctionalItem)}
+        assert items["app.auth"].responsible_qa_id == anna.id
+        relations = session.query(Relation).order_by(Relation.type).all()
+        assert [(r.type, r.weight) for r in relations] == [
+            ("functional", 0.5),
+            ("hierarchy", 1.0),
+        ]
+        assert relations[1].get_metadata() == {"notes": "parent"}
+
+    def test_reimport_is_idempotent(self, session):
+        importer, _ = make_importer(session, SHEET_VALUES)
+        importer.import_all_tables("sheet-id")
+
+        importer.import_all_tables("sheet-id")
+
+        assert session.query(User).count() == 2
+        assert session.query(FunctionalItem).count() == 2
+        assert session.query(Relation).count() == 2
+
+    def test_queries_do_not_grow_with_rows(self, session):
+        def count_statements(rows):
+            sheets = dict(SHEET_VALUES)
+            sheets["Сотрудники"] = SHEET_VALUES["Сотрудники"][:1] + [
+                [f"User {i}", "QA"] for i in range(rows)
+            ]
+            importer, _ = make_importer(session, sheets)
+            statements = []
+
+            def listener(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(session.get_bind(), "before_cursor_execute", listener)
+            try:
+                importer._import_users(importer.read_tables("id")["users"])
+            finally:
+                event.remove(session.get_bind(), "before_cursor_execute", listener)
+            return len([s for s in statements if s.startswith("SELECT")])
+
+        assert count_statements(5) == count_statements(50)
@@ -9,6 +9,7 @@ from src.utils.graph_builder import (
     build_graph_from_attributes,
     find_parent_by_title,
     get_item_neighbors,
+    ParentResolutionIndex,
     NODE_COLORS,
     NODE_SIZES,
 )
@@ -78,6 +79,65 @@ class TestFindParentByTitle:
         assert parent is None
 
 
+class TestParentResolutionIndex:
+    """Тесты индекса поиска родителя"""
+
+    def test_first_item_wins_across_rules(self):
+        """Порядок элементов важнее порядка правил (как в линейном поиске)"""
+        items = [
+            FunctionalItem(id=1, title="Authentication", type="Epic", functional_id="EPIC:AUTHENTICATION"),
+            FunctionalItem(id=2, title="AUTH", type="Epic", functional_id="EPIC:AUTH"),
+        ]
+
+        index = ParentResolutionIndex(items)
+
+        # Точное совпадение у id=2, но id=1 раньше и подходит по вхождению
+        assert index.find("auth", "Epic").id == 1
+
+    def test_funcid_prefix(self):
+        """Совпадение по префиксу functional_id"""
+        items = [
+            FunctionalItem(id=1, title="Frontend app", type="Module", functional_id="MOD:X"),
+            FunctionalItem(id=2, title="Web", type="Module", functional_id="FRONT-END.WEB"),
+        ]
+
+        index = ParentResolutionIndex(items)
+
+        assert index.find("Front End", "Module").id == 2
+
+    def test_type_filter(self):
+        """Элементы другого типа не учитываются"""
+        items = [
+            FunctionalItem(id=1, title="FRONTEND", type="Epic", functional_id="EPIC:FRONTEND"),
+        ]
+
+        index = ParentResolutionIndex(items)
+
+        assert index.find("FRONTEND", "Module") is None
+        assert index.find("FRONTEND", "Epic").id == 1
+
+    def test_matches_find_parent_by_title(self):
+        """Результаты индекса совпадают с find_parent_by_title"""
+        items = [
+            FunctionalItem(id=1, title="[Module]: FRONT", type="Module", functional_id="MOD:FRONT"),
+            FunctionalItem(id=2, title="[Module]: BACK", type="Module", functional_id="MOD:BACK"),
+            FunctionalItem(id=3, title="[Epic]: Splash Page", type="Epic", functional_id="FRONT.SPLASH"),
+        ]
+
+        index = ParentResolutionIndex(items)
+
+        for title, type_filter in [
+            ("FRONT", "Module"),
+            ("[Module]: BACK", "Module"),
+            ("splash", "Epic"),
+            ("Splash Page extra", "Epic"),
+            ("missing", "Epic"),
+        ]:
+            assert index.find(title, type_filter) is find_parent_by_title(
+                items, title, type_filter
+            )
+
+
 class TestBuildGraphFromAttributes:
     """Тесты построения графа"""
 
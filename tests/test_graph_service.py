@@ -0,0 +1,284 @@
+"""
+Tests for GraphService
+
+Проверка инкрементального графа: дельты по коммитам совпадают
+с полной перезагрузкой, откат не меняет граф
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, Relation
+from src.services.FunctionalItemUpsertService import FunctionalItemUpsertService
+from src.services.GraphService import GraphService
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'graph.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def session(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def service(session_factory):
+    service = GraphService(session_factory)
+    yield service
+    service.detach()
+
+
+def add(session, func_id, item_type="Feature", **fields):
+    item = FunctionalItem(
+        functional_id=func_id,
+        title=fields.pop("title", func_id),
+        type=item_type,
+        **fields,
+    )
+    session.add(item)
+    session.flush()
+    return item
+
+
+def edges(graph):
+    return sorted((u, v, key) for u, v, key in graph.edges(keys=True))
+
+
+def assert_matches_reload(service, session_factory):
+    fresh = GraphService(session_factory)
+    try:
+        fresh.reload()
+        assert sorted(service.graph.nodes) == sorted(fresh.graph.nodes)
+        assert edges(service.graph) == edges(fresh.graph)
+    finally:
+        fresh.detach()
+
+
+@pytest.fixture
+def project(session):
+    """Модуль FRONT, фича Splash (parent_id + module), история Cookies"""
+    front = add(session, "m1", "Module", title="FRONT")
+    splash = add(session, "front.splash", parent_id=front.id, module="FRONT")
+    cookies = add(
+        session, "front.splash.cookies", "Story", parent_id=splash.id, module="FRONT"
+    )
+    session.add(Relation(source_id=cookies.id, target_id=front.id, type="functional"))
+    session.commit()
+    return front, splash, cookies
+
+
+class TestLoad:
+    """Загрузка и представления"""
+
+    def test_edges_from_attributes_and_relations(self, service, project):
+        """parent_id, module и Relation дают рёбра"""
+        front, splash, cookies = project
+        service.reload()
+
+        assert edges(service.graph) == sorted(
+            [
+                (front.id, splash.id, "parent-of"),
+                (front.id, splash.id, "module-of"),
+                (splash.id, cookies.id, "parent-of"),
+                (front.id, cookies.id, "module-of"),
+                (cookies.id, front.id, "rel:1"),
+            ]
+        )
+
+    def test_neighbors(self, service, project):
+        """Соседи по иерархии без дублей, Relation не учитываются"""
+        front, splash, cookies = project
+
+        parents, children = service.neighbors(splash.id)
+
+        assert [node.id for node in parents] == [front.id]
+        assert [node.id for node in children] == [cookies.id]
+        assert service.neighbors(999) == ([], [])
+
+    def test_filtered_graph(self, service, project):
+        """Фильтр по типам рёбер и узлам"""
+        front, splash, cookies = project
+
+        graph = service.filtered_graph(edge_types={"functional"})
+        assert list(graph.edges) == [(cookies.id, front.id)]
+        assert graph.number_of_nodes() == 3
+
+        graph = service.filtered_graph(node_filter=lambda node: node.type != "Story")
+        assert sorted(graph.nodes) == [front.id, splash.id]
+
+    def test_subgraph(self, service, project):
+        front, splash, cookies = project
+
+        graph = service.subgraph([splash.id, cookies.id, 999])
+
+        assert list(graph.edges) == [(splash.id, cookies.id)]
+
+
+class TestDeltas:
+    """Изменения через сессию применяются без перезагрузки"""
+
+    def test_insert_update_delete(self, service, session, session_factory, project):
+        front, splash, cookies = project
+        service.ensure_loaded()
+
+        back = add(session, "back", "Module", title="BACK")
+        api = add(session, "back.api", module="BACK")
+        session.add(Relation(source_id=api.id, target_id=splash.id, type="functional"))
+        cookies.parent_id = None
+        cookies.module = "BACK"
+        session.commit()
+        assert not service.stale
+        assert_matches_reload(service, session_factory)
+        assert service.graph.has_edge(back.id, cookies.id, "module-of")
+
+        relation = session.query(Relation).filter_by(source_id=api.id).one()
+        session.delete(relation)
+        session.delete(back)
+        session.commit()
+        assert back.id not in service.graph
+        assert not service.graph.has_edge(api.id, splash.id)
+        assert_matches_reload(service, session_factory)
+
+    def test_parent_rename_reresolves(self, service, session, session_factory, project):
+        """Переименование модуля перепривязывает ссылки по названию"""
+        front, splash, cookies = project
+        service.ensure_loaded()
+
+        front.title = "Web"
+        session.commit()
+
+        assert not service.graph.has_edge(front.id, splash.id, "module-of")
+        assert_matches_reload(service, session_factory)
+
+        other = add(session, "web", "Module", title="FRONT")
+        session.commit()
+
+        assert service.graph.has_edge(other.id, splash.id, "module-of")
+        assert_matches_reload(service, session_factory)
+
+    def test_child_before_parent(self, service, session, session_factory):
+        """Ребёнок, добавленный в одном коммите с родителем, получает ребро"""
+        service.ensure_loaded()
+
+        root = add(session, "root", "Module")
+        child = add(session, "root.child", parent_id=root.id)
+        session.commit()
+
+        assert service.graph.has_edge(root.id, child.id, "parent-of")
+        assert_matches_reload(service, session_factory)
+
+    def test_rollback_discards_changes(self, service, session, project):
+        service.ensure_loaded()
+        before = edges(service.graph)
+
+        add(session, "temp", "Module")
+        session.rollback()
+
+        assert edges(service.graph) == before
+
+    def test_savepoint_rollback_keeps_outer_changes(
+        self, service, session, session_factory, project
+    ):
+        """Откат SAVEPOINT отбрасывает только его изменения"""
+        front, splash, cookies = project
+        service.ensure_loaded()
+
+        kept = add(session, "front.kept", module="FRONT")
+        with session.begin_nested():
+            released = add(session, "front.released", module="FRONT")
+        # Освобождение SAVEPOINT — ещё не коммит
+        assert released.id not in service.graph
+        with pytest.raises(ValueError):
+            with session.begin_nested():
+                lost = add(session, "front.lost", module="FRONT")
+                lost_id = lost.id
+                raise ValueError
+        session.commit()
+
+        assert kept.id in service.graph
+        assert released.id in service.graph
+        assert lost_id not in service.graph
+        assert_matches_reload(service, session_factory)
+
+    def test_upsert_with_failed_row(self, service, session, session_factory, project):
+        """Неудачная строка импорта не теряет пометку об успешных пачках"""
+        service.ensure_loaded()
+        rows = [
+            {"functional_id": func_id, "title": func_id, "type": "Feature"}
+            for func_id in ("a", "b", "c")
+        ]
+        # Дубль alias_tag — ошибка в SAVEPOINT второй пачки
+        rows[0]["alias_tag"] = rows[2]["alias_tag"] = "same"
+
+        stats = FunctionalItemUpsertService(session, batch_size=2).upsert(
+            rows, commit=False
+        )
+
+        assert stats["errors"] == 1
+        # Пачки в SAVEPOINT — граф не меняется до коммита
+        assert not service.stale
+        session.commit()
+
+        assert service.stale
+        service.ensure_loaded()
+        ids = {node.functional_id for node in service._items.values()}
+        assert {"a", "b"} <= ids
+        assert "c" not in ids
+        assert_matches_reload(service, session_factory)
+
+    def test_bulk_statement_marks_stale(
+        self, service, session, session_factory, project
+    ):
+        """Массовый DELETE в обход ORM — перезагрузка при следующем обращении"""
+        front, splash, cookies = project
+        service.ensure_loaded()
+        notified = []
+        service.add_listener(lambda: notified.append(True))
+
+        session.execute(delete(Relation))
+        session.commit()
+
+        assert service.stale
+        assert notified == [True]
+        service.ensure_loaded()
+        assert not any(key.startswith("rel:") for _, _, key in edges(service.graph))
+        assert_matches_reload(service, session_factory)
+
+    def test_commit_from_worker_thread(self, qapp, service, session_factory, project):
+        """Коммит из фонового потока применяется и рассылается в GUI-потоке"""
+        front, splash, cookies = project
+        service.ensure_loaded()
+        calls = []
+        service.add_listener(lambda: calls.append(threading.current_thread()))
+
+        def worker():
+            session = session_factory()
+            try:
+                add(session, "front.new", module="FRONT")
+                session.commit()
+            finally:
+                session.close()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        # До обработки событий GUI-потока граф и подписчики не тронуты
+        assert calls == []
+        assert not any(n.functional_id == "front.new" for n in service._items.values())
+
+        qapp.processEvents()
+
+        assert calls == [threading.main_thread()]
+        assert_matches_reload(service, session_factory)
@@ -0,0 +1,152 @@
+"""
+Tests for hierarchy closure table
+
+Проверка поддержки closure table триггерами и запросов по поддереву
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import DatabaseError
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, FunctionalItemClosure, Relation
+from src.models.hierarchy import (
+    ensure_closure_table,
+    delete_subtree,
+    get_ancestors,
+    get_breadcrumb,
+    get_descendants,
+    subtree_coverage,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tree.db'}")
+    event.listen(
+        engine,
+        "connect",
+        lambda conn, record: conn.execute("PRAGMA foreign_keys=ON"),
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add(session, func_id, parent=None, item_type="Feature", **fields):
+    item = FunctionalItem(
+        functional_id=func_id,
+        title=func_id.split(".")[-1].upper(),
+        type=item_type,
+        parent_id=parent.id if parent else None,
+        **fields,
+    )
+    session.add(item)
+    session.flush()
+    return item
+
+
+@pytest.fixture
+def tree(session):
+    """front > splash > (cookies, age) ; back"""
+    front = add(session, "front", item_type="Module")
+    splash = add(session, "front.splash", front, item_type="Epic")
+    cookies = add(session, "front.splash.cookies", splash, test_cases_linked="TC-1")
+    age = add(session, "front.splash.age", splash, item_type="Story", is_crit=1)
+    back = add(session, "back", item_type="Module")
+    session.commit()
+    return {
+        "front": front,
+        "splash": splash,
+        "cookies": cookies,
+        "age": age,
+        "back": back,
+    }
+
+
+def funcids(items):
+    return [item.functional_id for item in items]
+
+
+class TestClosureTable:
+    """Тесты closure table"""
+
+    def test_descendants_and_ancestors(self, session, tree):
+        """Поддерево и хлебные крошки"""
+        assert funcids(get_descendants(session, tree["front"].id)) == [
+            "front.splash",
+            "front.splash.age",
+            "front.splash.cookies",
+        ]
+        assert funcids(
+            get_descendants(session, tree["front"].id, item_type="Story")
+        ) == ["front.splash.age"]
+        assert funcids(get_descendants(session, tree["front"].id, max_depth=1)) == [
+            "front.splash"
+        ]
+        assert funcids(get_ancestors(session, tree["cookies"].id)) == [
+            "front",
+            "front.splash",
+        ]
+        assert get_breadcrumb(session, tree["cookies"].id) == "FRONT / SPLASH / COOKIES"
+
+    def test_reparent_moves_subtree(self, session, tree):
+        """Перенос элемента переносит всё его поддерево"""
+        tree["splash"].parent_id = tree["back"].id
+        session.commit()
+
+        assert get_descendants(session, tree["front"].id) == []
+        assert funcids(get_ancestors(session, tree["age"].id)) == [
+            "back",
+            "front.splash",
+        ]
+
+    def test_cycle_rejected(self, session, tree):
+        """Нельзя сделать элемент потомком собственного потомка"""
+        tree["front"].parent_id = tree["cookies"].id
+
+        with pytest.raises(DatabaseError):
+            session.commit()
+
+    def test_coverage_rollup(self, session, tree):
+        """Свод покрытия по поддереву"""
+        stats = subtree_coverage(session, tree["splash"].id)
+
+        assert stats["total"] == 3
+        assert stats["with_tests"] == 1
+        assert stats["crit"] == 1
+
+    def test_delete_subtree(self, session, tree):
+        """Каскадное удаление поддерева вместе со связями"""
+        session.add(Relation(source_id=tree["age"].id, target_id=tree["back"].id))
+        session.commit()
+
+        assert delete_subtree(session, tree["splash"].id) == 3
+        session.commit()
+
+        assert funcids(session.query(FunctionalItem).order_by("id")) == [
+            "front",
+            "back",
+        ]
+        assert session.query(Relation).count() == 0
+        assert session.query(FunctionalItemClosure).count() == 2
+
+    def test_ensure_builds_for_existing_db(self, engine, session, tree):
+        """Closure table пересобирается из parent_id в старой БД"""
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP TABLE functional_item_closure")
+
+        assert ensure_closure_table(engine)
+        assert funcids(get_ancestors(session, tree["age"].id)) == [
+            "front",
+            "front.splash",
+        ]
+        assert session.query(FunctionalItemClosure).count() == 10
@@ -0,0 +1,211 @@
+"""
+Tests for HttpCache
+
+Дисковый кэш ответов: TTL, перепроверка ETag/Last-Modified, LRU-вытеснение,
+инвалидация и кэширование справочных запросов ZohoAPI
+"""
+
+import json
+
+import pytest
+import requests
+
+from src.integrations import http_client
+from src.integrations.http_cache import HttpCache, make_key
+from src.integrations.zoho.Zoho_api_client import ZohoAPI
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_response(status=200, payload=None, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode() if payload is not None else b""
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeServer:
+    """fetch(conditional) для HttpCache.send; поддерживает ETag"""
+
+    def __init__(self, payload, etag=None):
+        self.payload = payload
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, conditional):
+        self.requests.append(conditional)
+        if self.etag and conditional.get("If-None-Match") == self.etag:
+            return make_response(304)
+        headers = {"Content-Type": "application/json"}
+        if self.etag:
+            headers["ETag"] = self.etag
+        return make_response(200, self.payload, headers)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = HttpCache(tmp_path / "http_cache.db", clock=clock)
+    yield cache
+    cache.close()
+
+
+class TestHttpCache:
+    """HttpCache.send"""
+
+    def test_fresh_entry_served_from_disk(self, tmp_path, cache, clock):
+        server = FakeServer({"tags": [1, 2]})
+
+        first = cache.send("https://api.test/tags", {"a": 1}, 60, server)
+        clock.now += 30
+        # Новый экземпляр на том же файле (перезапуск приложения)
+        reopened = HttpCache(tmp_path / "http_cache.db", clock=clock)
+        second = reopened.send("https://api.test/tags", {"a": 1}, 60, server)
+        reopened.close()
+
+        assert first.json() == second.json() == {"tags": [1, 2]}
+        assert second.headers["X-Cache"] == "HIT"
+        assert len(server.requests) == 1
+
+    def test_params_are_part_of_key(self, cache):
+        server = FakeServer({"ok": True})
+
+        cache.send("https://api.test/users", {"search": "a"}, 60, server)
+        cache.send("https://api.test/users", {"search": "b"}, 60, server)
+
+        assert len(server.requests) == 2
+        assert make_key("u", {"b": 1, "a": 2}) == make_key("u", {"a": 2, "b": 1})
+
+    def test_expired_entry_revalidated_with_etag(self, cache, clock):
+        server = FakeServer({"v": 1}, etag='"abc"')
+
+        cache.send("https://api.test/x", None, 60, server)
+        clock.now += 61
+        response = cache.send("https://api.test/x", None, 60, server)
+        clock.now += 30
+        cache.send("https://api.test/x", None, 60, server)
+
+        assert response.status_code == 200
+        assert response.json() == {"v": 1}
+        # 304 продлил запись ещё на ttl: третий вызов без запроса
+        assert server.requests == [{}, {"If-None-Match": '"abc"'}]
+
+    def test_expired_entry_without_validators_refetched(self, cache, clock):
+        server = FakeServer({"v": 1})
+
+        cache.send("https://api.test/x", None, 60, server)
+        clock.now += 61
+        server.payload = {"v": 2}
+        response = cache.send("https://api.test/x", None, 60, server)
+
+        assert response.json() == {"v": 2}
+        assert server.requests == [{}, {}]
+
+    def test_errors_not_cached(self, cache):
+        calls = []
+
+        def fetch(conditional):
+            calls.append(conditional)
+            return make_response(500, {"error": True})
+
+        cache.send("https://api.test/x", None, 60, fetch)
+        response = cache.send("https://api.test/x", None, 60, fetch)
+
+        assert response.status_code == 500
+        assert len(calls) == 2
+
+    def test_lru_eviction(self, tmp_path, clock):
+        cache = HttpCache(tmp_path / "lru.db", max_bytes=350, clock=clock)
+        payload = {"data": "x" * 80}
+        for name in ("a", "b", "c"):
+            clock.now += 1
+            cache.send(f"https://api.test/{name}", None, 60, FakeServer(payload))
+        # "a" прочитана последней — вытесняется "b"
+        clock.now += 1
+        cache.send("https://api.test/a", None, 60, FakeServer(payload))
+        clock.now += 1
+        cache.send("https://api.test/d", None, 60, FakeServer(payload))
+
+        server = FakeServer(payload)
+        for name in ("a", "c", "d", "b"):
+            cache.send(f"https://api.test/{name}", None, 60, server)
+
+        assert len(server.requests) == 1
+        assert cache.get_stats()["bytes"] <= 350
+        cache.close()
+
+    def test_invalidate_by_prefix(self, cache):
+        server = FakeServer({"ok": True})
+        for url in ("https://api.test/p/1/tags/", "https://api.test/p/1/users/"):
+            cache.send(url, None, 60, server)
+
+        assert cache.invalidate("https://api.test/p/1/tags/") == 1
+        cache.send("https://api.test/p/1/users/", None, 60, server)
+        cache.send("https://api.test/p/1/tags/", None, 60, server)
+        cache.clear()
+
+        assert len(server.requests) == 3
+        assert cache.get_stats() == {"entries": 0, "bytes": 0}
+
+
+class FakeZohoSession:
+    """Zoho: теги и статусы багов; считает запросы"""
+
+    def __init__(self):
+        self.urls = []
+
+    def request(self, method, url, headers=None, params=None, timeout=None):
+        self.urls.append(url)
+        if url.endswith("/tags/"):
+            return make_response(200, {"tags": [{"id": "1", "name": "smoke"}]})
+        return make_response(
+            200, {"defaultfields": {"status_details": [{"name": "Open"}]}}
+        )
+
+
+@pytest.fixture
+def zoho_api(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        http_client, "_http_executor", http_client.HttpExecutor(sleep=lambda s: None)
+    )
+    api = ZohoAPI.__new__(ZohoAPI)
+    api.session = FakeZohoSession()
+    api.access_token = "token"
+    api.token_manager = None
+    api.base_url = "https://zoho.test/restapi/portal/test"
+    api.project_id = "1"
+    api.http_cache = HttpCache(tmp_path / "http_cache.db")
+    yield api
+    api.http_cache.close()
+
+
+class TestZohoCache:
+    """Справочные запросы ZohoAPI через кэш"""
+
+    def test_dictionary_calls_cached(self, zoho_api):
+        for _ in range(3):
+            assert zoho_api.get_project_tags() == [{"id": "1", "name": "smoke"}]
+            assert zoho_api.get_bug_statuses() == [{"name": "Open"}]
+
+        assert len(zoho_api.session.urls) == 2
+
+    def test_invalidate_entity(self, zoho_api):
+        zoho_api.get_project_tags()
+        zoho_api.get_bug_statuses()
+
+        assert zoho_api.invalidate_cache("tags") == 1
+        zoho_api.get_project_tags()
+        zoho_api.get_bug_statuses()
+
+        assert len(zoho_api.session.urls) == 3
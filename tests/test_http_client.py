@@ -0,0 +1,178 @@
+"""
+Tests for HttpExecutor
+
+Проверка троттлинга по хостам, повторов 429/5xx и Retry-After без сети
+"""
+
+import pytest
+import requests
+
+from src.integrations.http_client import (
+    HttpExecutor,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """Отдаёт заранее заданные ответы (или исключения) по порядку"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_executor(clock, **kwargs):
+    kwargs.setdefault("rate", 100)
+    kwargs.setdefault("burst", 100)
+    return HttpExecutor(
+        max_retries=3,
+        backoff_base=1.0,
+        clock=clock,
+        sleep=clock.sleep,
+        jitter=lambda: 1.0,
+        **kwargs,
+    )
+
+
+class TestTokenBucket:
+    """Ограничение частоты"""
+
+    def test_burst_then_rate(self, clock):
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 0.5, 1.0]
+
+    def test_refill_capped(self, clock):
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+        bucket.reserve()
+        clock.now = 100
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_per_host_buckets(self, clock):
+        executor = make_executor(clock, rate=1, burst=1)
+        session = FakeSession(*[FakeResponse(200) for _ in range(3)])
+
+        executor.request(session, "GET", "https://a.test/x")
+        executor.request(session, "GET", "https://b.test/x")
+        assert clock.sleeps == []
+
+        executor.request(session, "GET", "https://a.test/y")
+        assert clock.sleeps == [1.0]
+
+
+class TestRetries:
+    """Повторы и Retry-After"""
+
+    def test_exponential_backoff_on_5xx(self, clock):
+        executor = make_executor(clock)
+        session = FakeSession(
+            FakeResponse(502), FakeResponse(503), FakeResponse(500), FakeResponse(200)
+        )
+
+        response = executor.request(session, "GET", "https://api.test/items")
+
+        assert response.status_code == 200
+        assert clock.sleeps == [1.0, 2.0, 4.0]
+        assert session.calls[0][2]["timeout"] == 30
+
+    def test_retry_after_seconds(self, clock):
+        executor = make_executor(clock)
+        session = FakeSession(
+            FakeResponse(429, {"Retry-After": "7"}), FakeResponse(200)
+        )
+
+        executor.request(session, "GET", "https://api.test/items")
+
+        assert clock.sleeps == [7.0]
+
+    def test_gives_up_after_max_retries(self, clock):
+        executor = make_executor(clock)
+        session = FakeSession(*[FakeResponse(503) for _ in range(4)])
+
+        response = executor.request(session, "GET", "https://api.test/items")
+
+        assert response.status_code == 503
+        assert len(session.calls) == 4
+        metrics = executor.get_metrics()["api.test"]
+        assert (metrics["calls"], metrics["retries"], metrics["errors"]) == (4, 3, 1)
+
+    def test_long_retry_after_not_waited(self, clock):
+        executor = make_executor(clock)
+        session = FakeSession(FakeResponse(429, {"Retry-After": "3600"}))
+
+        response = executor.request(session, "GET", "https://api.test/items")
+
+        assert response.status_code == 429
+        assert clock.sleeps == []
+
+    def test_post_retried_only_if_unprocessed(self, clock):
+        """POST не повторяется после 500 — запрос мог быть выполнен"""
+        executor = make_executor(clock)
+        session = FakeSession(FakeResponse(500), FakeResponse(429), FakeResponse(201))
+
+        first = executor.request(session, "POST", "https://api.test/items")
+        second = executor.request(session, "POST", "https://api.test/items")
+
+        assert (first.status_code, second.status_code) == (500, 201)
+
+    def test_connection_error_retried(self, clock):
+        executor = make_executor(clock)
+        session = FakeSession(requests.ConnectionError("reset"), FakeResponse(200))
+
+        assert executor.request(session, "GET", "https://api.test/x").status_code == 200
+
+        session = FakeSession(requests.ConnectionError("reset"))
+        with pytest.raises(requests.ConnectionError):
+            executor.request(session, "POST", "https://api.test/x")
+
+    def test_files_not_retried(self, clock):
+        executor = make_executor(clock)
+        session = FakeSession(FakeResponse(503), FakeResponse(200))
+
+        response = executor.request(
+            session, "POST", "https://api.test/upload", files={"file": b"data"}
+        )
+
+        assert response.status_code == 503
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Thu, 01 Jan 1970 00:01:00 GMT", now=30) == 30.0
@@ -0,0 +1,69 @@
+"""
+Tests for scripts/integration_standin.py и benchmark_integrations.py
+
+Настоящие клиенты Zoho, Qase и gspread против локального стенда
+"""
+
+import os
+
+import pytest
+
+from scripts import benchmark_integrations
+from src.integrations.http_client import reset_http_executor
+from src.integrations.zoho.TokenManager import reset_token_managers
+
+
+@pytest.fixture(autouse=True)
+def clean_environment():
+    """ZohoAPI загружает zoho.env стенда в os.environ"""
+    environ = dict(os.environ)
+    yield
+    os.environ.clear()
+    os.environ.update(environ)
+    reset_http_executor()
+    reset_token_managers()
+
+
+def run(*argv):
+    args = benchmark_integrations.parse_args(
+        ["--latency-ms", "0", "--rate", "1000", *argv]
+    )
+    config = benchmark_integrations.StandInConfig(
+        page_size=args.server_page_size,
+        error_rate=args.error_rate,
+        tasks=args.tasks,
+        milestones=args.milestones,
+        cases=args.cases,
+    )
+    return {
+        result["name"]: result
+        for result in benchmark_integrations.run_benchmarks(config, args)
+    }
+
+
+class TestBenchmark:
+    """Сценарии замера на стенде"""
+
+    def test_zoho_full_and_incremental(self):
+        results = run(
+            "--only", "zoho", "--tasks", "45", "--milestones", "3", "--page-size", "10"
+        )
+
+        assert results["zoho-full"]["rows"] == 45
+        # Повторная синхронизация: задачи не менялись, watermark отсекает всё
+        assert results["zoho-incr"]["rows"] == 0
+        assert results["zoho-incr"]["requests"] > 0
+
+    def test_qase_cases_paginated(self):
+        results = run("--only", "qase", "--cases", "250")
+
+        assert results["qase-cases"]["rows"] == 250
+        assert results["qase-cases"]["requests"] == 3
+
+    def test_sheets_export_with_errors(self):
+        """429/503 стенда повторяются общим HttpExecutor"""
+        results = run("--only", "sheets", "--items", "12", "--error-rate", "0.2")
+
+        # 12 элементов, 20 сотрудников, 6 связей
+        assert results["sheets-export"]["rows"] == 38
+        assert results["sheets-export"]["retries"] > 0
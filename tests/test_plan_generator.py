@@ -0,0 +1,71 @@
+"""
+Tests for TestPlanGenerator
+
+Сбор задач спринта по названиям и отчёт о регрессе без обращения к Zoho
+"""
+
+import threading
+
+from src.services.TestPlanGenerator import TestPlanGenerator as PlanGenerator
+
+
+class FakeApi:
+    """Задачи по названиям (с пересечениями) и баги"""
+
+    def __init__(self):
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.bug_queries = []
+
+    def get_tasks_by_titles(self, titles):
+        task = {"id": 1, "name": "Shared", "milestone_id": "m1"}
+        return {
+            "Sprint 1": [task, {"id": 2, "name": "Only 1", "milestone_id": "m1"}],
+            "Release": [dict(task), {"id": 3, "name": "Only R", "milestone_id": "m2"}],
+            "Empty": [],
+        }
+
+    def get_entities_by_filter(self, entity_type, **filters):
+        self.bug_queries.append(filters)
+        # Оба запроса должны быть в работе одновременно
+        self.barrier.wait()
+        status = "closed" if "closed_after" in filters else "open"
+        return [
+            {
+                "key": f"BUG-{status}",
+                "link": {"web": {"url": "https://zoho.test/bug"}},
+                "title": status,
+                "status": {"type": status},
+            }
+        ]
+
+
+def make_generator():
+    generator = PlanGenerator.__new__(PlanGenerator)
+    generator.api = FakeApi()
+    generator.start_date = "2026-01-01"
+    generator.end_date = "2026-01-14"
+    generator.tasks_by_id = {}
+    generator.sprint_milestone_ids = {}
+    return generator
+
+
+class TestPlanGeneratorTasks:
+    """initialize_tasks_and_milestones / generate_regression_report"""
+
+    def test_tasks_deduplicated_by_id(self):
+        generator = make_generator()
+
+        generator.initialize_tasks_and_milestones(["Sprint 1", "Release", "Empty"])
+
+        assert [task["id"] for task in generator.all_tasks] == [1, 2, 3]
+        assert generator.milestones_in_sprint == ["m1", "m2"]
+
+    def test_regression_report_queries_in_parallel(self):
+        generator = make_generator()
+
+        report = generator.generate_regression_report()
+
+        assert len(generator.api.bug_queries) == 2
+        assert "BUG-open" in report
+        assert "BUG-closed" in report
+        assert report.index("BUG-open") < report.index("BUG-closed")
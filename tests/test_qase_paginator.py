@@ -0,0 +1,162 @@
+"""
+Tests for Qase paginator
+
+Проверка постраничной выборки limit/offset с параллельной загрузкой страниц
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.integrations.http_cache import HttpCache
+from src.integrations.qase.paginator import QasePage, iter_pages
+from src.integrations.qase.qase_api import QaseClient
+
+
+class FakeQase:
+    """Список из total записей; страницы отвечают в обратном порядке скорости"""
+
+    def __init__(self, total, delay=0.0):
+        self.total = total
+        self.delay = delay
+        self.offsets = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, limit, offset):
+        with self._lock:
+            self.offsets.append(offset)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        # Ранние страницы отвечают дольше поздних
+        time.sleep(self.delay * (self.total - offset) / max(self.total, 1))
+        with self._lock:
+            self.active -= 1
+        entities = [{"id": i} for i in range(offset, min(offset + limit, self.total))]
+        return {
+            "total": self.total,
+            "filtered": self.total,
+            "count": len(entities),
+            "entities": entities,
+        }
+
+
+class TestIterPages:
+    """iter_pages"""
+
+    @pytest.mark.parametrize("total", [0, 5, 100, 250])
+    def test_all_records_in_order(self, total):
+        fake = FakeQase(total)
+
+        pages = list(iter_pages(fake, limit=100, concurrency=3))
+
+        ids = [case["id"] for page in pages for case in page.entities]
+        assert ids == list(range(total))
+        assert all(page.total == total for page in pages)
+        assert sorted(fake.offsets) == list(range(0, max(total, 1), 100))
+
+    def test_bounded_concurrency(self):
+        fake = FakeQase(1000, delay=0.02)
+
+        pages = list(iter_pages(fake, limit=50, concurrency=3))
+
+        assert [page.offset for page in pages] == list(range(0, 1000, 50))
+        assert 1 < fake.max_active <= 3
+
+    def test_early_exit_stops_requests(self):
+        fake = FakeQase(10_000)
+
+        pages = iter_pages(fake, limit=100, concurrency=2)
+        first = next(pages)
+        pages.close()
+
+        assert first.entities[0] == {"id": 0}
+        assert len(fake.offsets) == 1
+
+    def test_limit_capped_and_offset(self):
+        fake = FakeQase(450)
+
+        pages = list(iter_pages(fake, limit=500, offset=200))
+
+        assert [page.offset for page in pages] == [200, 300, 400]
+        assert len(pages[0].entities) == 100
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, total):
+        self.fake = FakeQase(total)
+        self.params = []
+
+    def request(self, method, url, params=None, **kwargs):
+        self.params.append(params)
+        result = self.fake(params["limit"], params["offset"])
+        return FakeResponse({"status": True, "result": result})
+
+
+def make_client(tmp_path, total):
+    client = QaseClient("token", "SAN")
+    client.session = FakeSession(total)
+    client.http_cache = HttpCache(tmp_path / "http_cache.db")
+    return client
+
+
+class TestQaseClientCases:
+    """QaseClient.get_cases / iter_cases"""
+
+    def test_get_cases_all_pages_cached(self, tmp_path):
+        client = make_client(tmp_path, 230)
+
+        cases = client.get_cases(suite_id=7)
+        again = client.get_cases(suite_id=7)
+
+        assert [case["id"] for case in cases] == list(range(230))
+        assert again == cases
+        assert len(client.session.params) == 3
+        assert all(params["suite_id"] == 7 for params in client.session.params)
+
+    def test_cache_survives_new_client(self, tmp_path):
+        """Кэш на диске: новый клиент (повторное открытие диалога) не ходит в API"""
+        make_client(tmp_path, 120).get_cases()
+
+        client = make_client(tmp_path, 120)
+        cases = client.get_cases()
+
+        assert len(cases) == 120
+        assert client.session.params == []
+
+    def test_create_case_invalidates_cases(self, tmp_path):
+        client = make_client(tmp_path, 50)
+        client.get_cases()
+        client.session.request = lambda method, url, **kwargs: FakeResponse(
+            {"status": True, "result": {"id": 51}}
+        )
+        client.create_case("New")
+        client.session = FakeSession(51)
+
+        assert len(client.get_cases()) == 51
+
+    def test_iter_cases_reports_total(self, tmp_path):
+        client = make_client(tmp_path, 150)
+
+        pages = list(client.iter_cases())
+
+        assert [len(page.entities) for page in pages] == [100, 50]
+        assert pages[0] == QasePage(pages[0].entities, 0, 150)
@@ -0,0 +1,196 @@
+"""
+Tests for RaciMatrixService
+
+Векторная матрица совпадает с поэлементным расчётом, включая C и I
+"""
+
+import io
+import json
+import random
+import time
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, User
+from src.services.GoogleSheetsExporter import GoogleSheetsExporter
+from src.services.RaciMatrixService import (
+    ACCOUNTABLE,
+    CONSULTED,
+    INFORMED,
+    R_DEV,
+    R_QA,
+    RaciMatrixService,
+    parse_ids,
+    role_codes,
+)
+from tests.test_google_sheets_exporter import FakeClient, FakeSpreadsheet
+
+
+def loop_codes(items, user_ids):
+    """Эталон: перебор элементов × сотрудников"""
+    codes = []
+    for item in items.to_dict("records"):
+        consulted = parse_ids(item["consulted_ids"])
+        informed = parse_ids(item["informed_ids"])
+        row = []
+        for user_id in user_ids:
+            code = 0
+            if item["responsible_qa_id"] == user_id:
+                code |= R_QA
+            if item["responsible_dev_id"] == user_id:
+                code |= R_DEV
+            if item["accountable_id"] == user_id:
+                code |= ACCOUNTABLE
+            if user_id in consulted:
+                code |= CONSULTED
+            if user_id in informed:
+                code |= INFORMED
+            row.append(code)
+        codes.append(row)
+    return codes
+
+
+def random_items(count, user_ids, seed=0):
+    rng = random.Random(seed)
+
+    def some_user():
+        # None и id вне списка сотрудников (неактивные) тоже встречаются
+        return rng.choice([None, -1] + list(user_ids))
+
+    def some_ids():
+        ids = rng.sample(list(user_ids), rng.randint(0, min(4, len(user_ids))))
+        return rng.choice([None, json.dumps(ids), json.dumps([str(i) for i in ids])])
+
+    return pd.DataFrame(
+        {
+            "responsible_qa_id": [some_user() for _ in range(count)],
+            "responsible_dev_id": [some_user() for _ in range(count)],
+            "accountable_id": [some_user() for _ in range(count)],
+            "consulted_ids": [some_ids() for _ in range(count)],
+            "informed_ids": [some_ids() for _ in range(count)],
+        }
+    )
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'raci.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    anna = User(name="Anna", is_active=1)
+    boris = User(name="Boris", is_active=1)
+    retired = User(name="Retired", is_active=0)
+    session.add_all([anna, boris, retired])
+    session.flush()
+    session.add_all(
+        [
+            FunctionalItem(
+                functional_id="app.auth",
+                title="Auth",
+                type="Module",
+                is_crit=1,
+                responsible_qa_id=anna.id,
+                responsible_dev_id=boris.id,
+                accountable_id=anna.id,
+                consulted_ids=json.dumps([boris.id, retired.id]),
+                informed_ids=json.dumps([anna.id]),
+            ),
+            FunctionalItem(
+                functional_id="app.auth.login",
+                title="Login",
+                type="Feature",
+                consulted_ids="not json",
+                informed_ids=json.dumps([str(boris.id), "x"]),
+            ),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestRoleCodes:
+    """role_codes / parse_ids"""
+
+    def test_parse_ids(self):
+        assert parse_ids(None) == []
+        assert parse_ids("") == []
+        assert parse_ids('[1, "2", null, "x"]') == [1, 2]
+        assert parse_ids("3") == [3]
+        assert parse_ids("{broken") == []
+
+    def test_matches_loop(self):
+        user_ids = list(range(1, 21))
+        items = random_items(300, user_ids)
+
+        assert role_codes(items, user_ids).tolist() == loop_codes(items, user_ids)
+
+    def test_empty(self):
+        items = random_items(0, [1])
+
+        assert role_codes(items, [1, 2]).shape == (0, 2)
+        assert role_codes(random_items(3, [1]), []).shape == (3, 0)
+
+    def test_large_matrix_is_fast(self):
+        user_ids = list(range(1, 201))
+        items = random_items(5000, user_ids)
+
+        started = time.perf_counter()
+        codes = role_codes(items, user_ids)
+        elapsed = time.perf_counter() - started
+
+        assert codes.shape == (5000, 200)
+        # Векторная сборка — десятки мс, перебор loop_codes — ~0.4 с
+        assert elapsed < 0.3
+
+
+class TestRaciMatrixService:
+    """build / to_rows / export_csv"""
+
+    def test_build(self, session):
+        matrix = RaciMatrixService(session).build()
+
+        assert matrix.headers == ["FuncID", "Title", "Type", "Anna", "Boris"]
+        assert matrix.to_rows() == [
+            ["app.auth", "Auth", "Module", "R(QA), A, I", "R(Dev), C"],
+            ["app.auth.login", "Login", "Feature", "", "I"],
+        ]
+        counts = matrix.role_counts()
+        assert counts.loc["Boris"].to_dict() == {
+            "R(QA)": 0,
+            "R(Dev)": 1,
+            "A": 0,
+            "C": 1,
+            "I": 1,
+        }
+
+    def test_filters(self, session):
+        matrix = RaciMatrixService(session).build({"is_crit": True})
+
+        assert [row[0] for row in matrix.to_rows()] == ["app.auth"]
+
+    def test_export_csv(self, session):
+        buffer = io.StringIO()
+
+        count = RaciMatrixService(session).build().export_csv(buffer)
+
+        assert count == 2
+        lines = buffer.getvalue().splitlines()
+        assert lines[0] == "FuncID,Title,Type,Anna,Boris"
+        assert lines[1] == 'app.auth,Auth,Module,"R(QA), A, I","R(Dev), C"'
+
+    def test_sheet_export(self, session):
+        spreadsheet = FakeSpreadsheet([])
+        exporter = GoogleSheetsExporter("service_account.json", session)
+        exporter.client = FakeClient(spreadsheet)
+
+        assert exporter.export_raci_matrix("sheet-id") == 2
+
+        written = spreadsheet.written()["'RACI Matrix'!A1"]
+        assert written[0] == ["FuncID", "Title", "Type", "Anna", "Boris"]
+        assert written[2] == ["app.auth.login", "Login", "Feature", "", "I"]
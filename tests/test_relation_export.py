@@ -0,0 +1,124 @@
+"""
+Tests for RelationExportService
+
+Один запрос с JOIN на всю выгрузку, потоковая запись CSV/JSON
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, Relation
+from src.services.GoogleSheetsImporter import to_sheet_records
+from src.services.RelationExportService import SHEET_COLUMNS, RelationExportService
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'relations.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    items = [
+        FunctionalItem(functional_id=f"app.f{i}", title=f"Feature {i}", type="Feature")
+        for i in range(30)
+    ]
+    session.add_all(items)
+    session.flush()
+    for i in range(25):
+        relation = Relation(
+            source_id=items[i].id,
+            target_id=items[i + 1].id,
+            type="functional" if i % 2 else "hierarchy",
+            weight=0.5 if i % 3 == 0 else None,
+            directed=i % 2 == 0,
+        )
+        if i == 0:
+            relation.set_metadata({"notes": "первая"})
+        session.add(relation)
+    # Висячая связь: цель удалена мимо ORM
+    session.add(Relation(source_id=items[0].id, target_id=999, type="custom"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def count_statements(session):
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+class TestRelationExportService:
+    """iter_rows / export_csv / export_json"""
+
+    def test_single_query_with_joins(self, session):
+        statements = count_statements(session)
+
+        rows = list(RelationExportService(session, batch_size=4).iter_rows())
+
+        assert len(rows) == 26
+        assert len(statements) == 1
+        assert statements[0].count("JOIN functional_items") == 2
+        assert (rows[0].source_functional_id, rows[0].target_functional_id) == (
+            "app.f0",
+            "app.f1",
+        )
+        assert rows[-1].target_functional_id is None
+
+    def test_sheet_records_match_relation_fields(self, session):
+        records = list(RelationExportService(session).iter_sheet_records())
+
+        first, second, dangling = records[0], records[1], records[-1]
+        assert list(first) == SHEET_COLUMNS
+        assert (first["Type"], first["Weight"], first["Directed"]) == (
+            "hierarchy",
+            0.5,
+            "Да",
+        )
+        assert first["Notes"] == "первая"
+        assert (second["Type"], second["Weight"], second["Directed"]) == (
+            "functional",
+            1.0,
+            "Нет",
+        )
+        assert (dangling["Target ID"], dangling["Target FuncID"]) == (999, "")
+
+    def test_csv_roundtrip_with_importer_columns(self, session):
+        buffer = io.StringIO()
+
+        count = RelationExportService(session).export_csv(buffer)
+
+        values = list(csv.reader(io.StringIO(buffer.getvalue())))
+        records = to_sheet_records(values)
+        assert count == len(records) == 26
+        assert records[0]["Source ID"] == 1
+        assert records[0]["Notes"] == "первая"
+
+    def test_json_export(self, session, tmp_path):
+        path = tmp_path / "relations.json"
+
+        count = RelationExportService(session).export_json(path)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert count == len(data) == 26
+        assert data[0]["metadata"] == {"notes": "первая"}
+        assert data[0]["source_functional_id"] == "app.f0"
+        assert "meta_data" not in data[0]
+
+    def test_json_export_empty(self, session, tmp_path):
+        session.query(Relation).delete()
+        session.commit()
+        path = tmp_path / "empty.json"
+
+        assert RelationExportService(session).export_json(path) == 0
+        assert json.loads(path.read_text(encoding="utf-8")) == []
@@ -0,0 +1,187 @@
+"""
+Tests for search_index
+
+Проверка FTS5-индекса functional_items и его синхронизации триггерами
+"""
+
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db import search_index
+from src.db.base import Base
+from src.db.search_index import (
+    FTS_TABLE,
+    build_match_query,
+    ensure_search_index,
+    search_functional_items,
+)
+from src.models import FunctionalItem
+
+
+def make_engine(path, **connect_args):
+    engine = create_engine(f"sqlite:///{path}", connect_args=connect_args)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def has_fts_table(engine):
+    with engine.connect() as conn:
+        return bool(
+            conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE name=?", (FTS_TABLE,)
+            ).scalar()
+        )
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = make_engine(tmp_path / "search.db")
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            FunctionalItem(
+                functional_id="front.splash_page",
+                title="[Epic]: Splash Page",
+                type="Epic",
+            ),
+            FunctionalItem(
+                functional_id="front.splash_page.cookies",
+                title="[Feature]: Age cookies",
+                type="Feature",
+                description="Проверка возраста",
+            ),
+            FunctionalItem(
+                functional_id="back.api", title="[Module]: API", type="Module"
+            ),
+        ]
+    )
+    session.commit()
+    # Как при инициализации engine (init_db / DatabaseManager)
+    assert ensure_search_index(engine)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def ids_of(session, *functional_ids):
+    return {
+        item.id
+        for item in session.query(FunctionalItem).filter(
+            FunctionalItem.functional_id.in_(functional_ids)
+        )
+    }
+
+
+class TestSearchIndex:
+    """Тесты полнотекстового поиска"""
+
+    def test_match_query(self):
+        """Слова ищутся как префиксы через AND"""
+        assert build_match_query("splash cook") == '"splash"* AND "cook"*'
+        assert build_match_query("  ,. ") is None
+
+    def test_existing_rows_indexed(self, session):
+        """Индекс заполняется из уже существующих строк"""
+        found = search_functional_items(session, "splash")
+
+        assert set(found) == ids_of(
+            session, "front.splash_page", "front.splash_page.cookies"
+        )
+
+    def test_ranking(self, session):
+        """Совпадение в нескольких полях выше по bm25"""
+        found = search_functional_items(session, "cookies")
+
+        assert found[0] == ids_of(session, "front.splash_page.cookies").pop()
+
+    def test_case_insensitive_cyrillic(self, session):
+        """Поиск по описанию без учёта регистра"""
+        found = search_functional_items(session, "ВОЗРАСТ")
+
+        assert set(found) == ids_of(session, "front.splash_page.cookies")
+
+    def test_triggers_keep_index_in_sync(self, session):
+        """Вставка, изменение и удаление отражаются в индексе"""
+        search_functional_items(session, "api")
+
+        item = FunctionalItem(functional_id="back.auth", title="Login", type="Epic")
+        session.add(item)
+        session.commit()
+        assert search_functional_items(session, "login") == [item.id]
+
+        item.title = "Logout"
+        session.commit()
+        assert search_functional_items(session, "login") == []
+        assert search_functional_items(session, "logout") == [item.id]
+
+        session.delete(item)
+        session.commit()
+        assert search_functional_items(session, "logout") == []
+
+    def test_empty_query(self, session):
+        """Пустая строка поиска — фильтр не нужен"""
+        assert search_functional_items(session, "") is None
+
+
+class TestEnsureSearchIndex:
+    """Создание индекса при инициализации engine, не при поиске"""
+
+    def test_search_does_not_create_index(self, tmp_path):
+        """Без индекса поиск идёт через LIKE и не выполняет DDL"""
+        engine = make_engine(tmp_path / "plain.db")
+        session = sessionmaker(bind=engine)()
+        item = FunctionalItem(functional_id="back.auth", title="Login", type="Epic")
+        session.add(item)
+        session.commit()
+
+        assert search_functional_items(session, "login") == [item.id]
+        assert not has_fts_table(engine)
+
+        # Индекс, созданный ранее (другим engine / запуском), подхватывается
+        other = create_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+        assert ensure_search_index(other)
+        assert search_functional_items(session, "log") == [item.id]
+        session.close()
+        other.dispose()
+        engine.dispose()
+
+    def test_missing_fts5_remembered(self, tmp_path, monkeypatch):
+        """SQLite без FTS5: DDL не повторяется при каждом вызове"""
+        engine = make_engine(tmp_path / "nofts.db")
+        monkeypatch.setattr(
+            search_index,
+            "_ddl_statements",
+            lambda: [f"CREATE VIRTUAL TABLE {FTS_TABLE} USING no_fts(title)"],
+        )
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        assert not ensure_search_index(engine)
+        executed = len(statements)
+        assert not ensure_search_index(engine)
+
+        assert executed > 0
+        assert len(statements) == executed
+        engine.dispose()
+
+    def test_locked_database_retried(self, tmp_path):
+        """Блокировка БД не запоминается: следующий вызов создаёт индекс"""
+        path = tmp_path / "locked.db"
+        engine = make_engine(path, timeout=0)
+        writer = sqlite3.connect(path)
+        writer.execute("BEGIN IMMEDIATE")
+
+        assert not ensure_search_index(engine)
+
+        writer.rollback()
+        writer.close()
+        assert ensure_search_index(engine)
+        assert has_fts_table(engine)
+        engine.dispose()
@@ -0,0 +1,328 @@
+"""
+Tests for sheet_diff и diff-экспорта GoogleSheetsExporter
+
+Diff по хешам строк; после diff-экспорта лист совпадает с полным экспортом
+"""
+
+import gspread
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from datetime import datetime
+
+from scripts.benchmark_integrations import standin_sheets_client
+from scripts.integration_standin import IntegrationStandIn, StandInConfig
+from src.db.base import Base
+from src.integrations.google.sheet_diff import (
+    SheetManifest,
+    cell_text,
+    diff_rows,
+    index_sheet,
+    row_hash,
+)
+from src.integrations.http_client import get_http_executor, reset_http_executor
+from src.models import FunctionalItem, Relation, User
+from src.services.GoogleSheetsExporter import GoogleSheetsExporter
+
+HEADERS = ["Key", "Value"]
+
+
+def state(*rows, start=2):
+    return {row[0]: [number, row_hash(row)] for number, row in enumerate(rows, start)}
+
+
+class TestDiffRows:
+    """diff_rows / index_sheet"""
+
+    def test_update_delete_append(self):
+        previous = state(["a", 1], ["b", 2], ["c", 3])
+
+        changes = diff_rows(
+            previous, [], HEADERS, ["Key"], [["a", 10], ["c", 3.0], ["d", 4]]
+        )
+
+        assert changes.deletes == [3]
+        assert changes.updates == [(2, ["a", 10])]
+        assert changes.appends == [["d", 4]]
+        assert changes.append_at == 4
+        assert {key: number for key, (number, _) in changes.rows.items()} == {
+            "a": 2,
+            "c": 3,
+            "d": 4,
+        }
+
+    def test_unchanged_keys_kept(self):
+        previous = state(["a", 1], ["b", 2], ["c", 3])
+
+        changes = diff_rows(previous, [], HEADERS, ["Key"], [["c", 4]], ["a", "b"])
+
+        assert changes.deletes == []
+        assert changes.updates == [(4, ["c", 4])]
+        assert changes.rows["a"] == previous["a"]
+        assert changes.appends == []
+
+    def test_stray_rows_deleted_and_rows_shifted(self):
+        previous = state(["a", 1]) | state(["b", 2], ["c", 3], start=4)
+
+        changes = diff_rows(
+            previous, [3, 6], HEADERS, ["Key"], [["a", 1], ["b", 2], ["c", 3]]
+        )
+
+        assert changes.deletes == [6, 3]
+        assert changes.updates == []
+        assert [changes.rows[key][0] for key in "abc"] == [2, 3, 4]
+        assert changes.row_count == 4
+
+    def test_index_sheet(self):
+        values = [
+            ["Key", "Value", "Notes"],
+            ["a", 1],
+            ["", 2],
+            ["a", 3],
+            ["b", 2.0, "x"],
+        ]
+
+        previous, stray = index_sheet(values, HEADERS, ["Key"])
+
+        # Повтор ключа — вторая строка с номером вхождения, не лишняя
+        assert previous == {
+            "a": [2, row_hash(["a", 1])],
+            "a\x1e2": [4, row_hash(["a", 3])],
+            "b": [5, row_hash(["b", 2])],
+        }
+        assert stray == [3]
+        assert index_sheet([["Value", "Key"]], HEADERS, ["Key"]) is None
+        assert cell_text(2.0) == cell_text("2") == "2"
+
+    def test_repeated_keys(self):
+        """Строки с одинаковым ключом сравниваются по порядку вхождения"""
+        previous = {
+            "a": [2, row_hash(["a", 1])],
+            "a\x1e2": [3, row_hash(["a", 2])],
+            "b": [4, row_hash(["b", 1])],
+        }
+
+        changes = diff_rows(
+            previous, [], HEADERS, ["Key"], [["a", 1], ["a", 5], ["b", 1], ["a", 6]]
+        )
+
+        assert changes.deletes == []
+        assert changes.updates == [(3, ["a", 5])]
+        assert changes.appends == [["a", 6]]
+        assert changes.append_at == 5
+        assert changes.rows["a\x1e3"][0] == 5
+
+        changes = diff_rows(previous, [], HEADERS, ["Key"], [["a", 1], ["b", 1]])
+        assert changes.deletes == [3]
+
+    def test_append_after_row_count(self):
+        """Новые строки — после всех записанных строк листа"""
+        previous = state(["a", 1], ["b", 2])
+
+        changes = diff_rows(previous, [], HEADERS, ["Key"], [["c", 3]], ["a", "b"], 5)
+
+        assert changes.append_at == 6
+        assert changes.row_count == 6
+
+    def test_manifest_roundtrip(self, tmp_path):
+        manifest = SheetManifest(tmp_path / "m" / "book.json")
+        manifest.set("Лист", HEADERS, ["Key"], state(["a", 1]), datetime(2026, 1, 1))
+        manifest.save()
+
+        loaded = SheetManifest(tmp_path / "m" / "book.json")
+
+        assert loaded.get("Лист", HEADERS, ["Key"])["rows"] == state(["a", 1])
+        assert loaded.get("Лист", ["Key"], ["Key"]) is None
+
+
+@pytest.fixture
+def standin():
+    reset_http_executor()
+    get_http_executor().rate = get_http_executor().burst = 1000
+    with IntegrationStandIn(StandInConfig(latency=0)) as server:
+        yield server
+    reset_http_executor()
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'diff.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    users = [User(name=f"User {i}", is_active=1) for i in range(3)]
+    session.add_all(users)
+    session.flush()
+    items = [
+        FunctionalItem(
+            functional_id=f"app.f{i}",
+            title=f"Feature {i}",
+            type="Feature",
+            responsible_qa_id=users[i % 3].id,
+        )
+        for i in range(20)
+    ]
+    session.add_all(items)
+    session.flush()
+    session.add_all(
+        Relation(source_id=items[i].id, target_id=items[i + 1].id, type="functional")
+        for i in range(0, 18, 3)
+    )
+    session.commit()
+    # Данные «старше» любого экспорта — префильтр по updated_at работает
+    past = datetime(2020, 1, 1)
+    session.execute(update(FunctionalItem).values(updated_at=past))
+    session.execute(update(User).values(updated_at=past))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def sheet_rows(standin, spreadsheet_id, title):
+    book = standin.data.spreadsheets[spreadsheet_id]
+    sheet_id = next(p["sheetId"] for p in book["sheets"] if p["title"] == title)
+    rows = []
+    for row in book["values"][sheet_id]:
+        row = [cell_text(value) for value in row]
+        while row and row[-1] == "":
+            row.pop()
+        rows.append(row)
+    while rows and not rows[-1]:
+        rows.pop()
+    return rows
+
+
+def make_exporter(session, standin, **kwargs):
+    exporter = GoogleSheetsExporter("standin.json", session, **kwargs)
+    exporter.client = standin_sheets_client(standin.url)
+    return exporter
+
+
+def change_data(session):
+    items = {i.functional_id: i for i in session.query(FunctionalItem)}
+    items["app.f1"].title = "Renamed"
+    session.delete(items["app.f2"])
+    session.add(FunctionalItem(functional_id="app.new", title="New", type="Feature"))
+    session.query(User).filter_by(name="User 0").one().name = "Lead"
+    relation = session.query(Relation).first()
+    relation.type = "hierarchy"
+    session.commit()
+
+
+class TestDiffExport:
+    """export_all_tables(diff=True) против стенда"""
+
+    SHEETS = ["Функционал", "Сотрудники", "Связи"]
+
+    def assert_same_as_full(self, session, standin):
+        make_exporter(session, standin).export_all_tables("fresh")
+        for title in self.SHEETS:
+            diffed = sheet_rows(standin, "book", title)
+            fresh = sheet_rows(standin, "fresh", title)
+            assert diffed[0] == fresh[0]
+            assert sorted(diffed[1:]) == sorted(fresh[1:])
+
+    def test_diff_matches_full_export(self, session, standin, monkeypatch):
+        exporter = make_exporter(session, standin)
+        exporter.export_all_tables("book")
+        change_data(session)
+
+        built = []
+        original = GoogleSheetsExporter._functional_item_record
+        monkeypatch.setattr(
+            GoogleSheetsExporter,
+            "_functional_item_record",
+            staticmethod(
+                lambda item: built.append(item.functional_id) or original(item)
+            ),
+        )
+        standin.reset_counts()
+        exporter.export_all_tables("book", diff=True)
+        monkeypatch.undo()
+
+        # Манифест есть: лист не читается, строки без изменений не собираются
+        assert standin.counts["sheets"] == 4
+        assert sorted(built) == sorted(
+            ["app.f1", "app.new"] + [f"app.f{i}" for i in range(0, 20, 3)]
+        )
+        self.assert_same_as_full(session, standin)
+
+    def test_no_changes_no_writes(self, session, standin):
+        exporter = make_exporter(session, standin)
+        exporter.export_all_tables("book")
+
+        standin.reset_counts()
+        exporter.export_all_tables("book", diff=True)
+
+        # Только open_by_key и список листов
+        assert standin.counts["sheets"] == 2
+
+    def test_without_manifest_reads_sheet_once(self, session, standin, tmp_path):
+        make_exporter(session, standin, manifest_dir=tmp_path / "a").export_all_tables(
+            "book"
+        )
+        change_data(session)
+
+        standin.reset_counts()
+        make_exporter(session, standin, manifest_dir=tmp_path / "b").export_all_tables(
+            "book", diff=True
+        )
+
+        # + один values_batch_get
+        assert standin.counts["sheets"] == 5
+        self.assert_same_as_full(session, standin)
+
+    def test_failed_write_forces_reread(self, session, standin, monkeypatch):
+        exporter = make_exporter(session, standin)
+        exporter.export_all_tables("book")
+        change_data(session)
+
+        original = gspread.Spreadsheet.values_batch_update
+
+        def fail_once(spreadsheet, *args, **kwargs):
+            monkeypatch.setattr(gspread.Spreadsheet, "values_batch_update", original)
+            raise ConnectionError("Сеть недоступна")
+
+        monkeypatch.setattr(gspread.Spreadsheet, "values_batch_update", fail_once)
+        with pytest.raises(ConnectionError):
+            exporter.export_all_tables("book", diff=True)
+
+        # Строки уже удалены, значения не записаны: манифест сброшен
+        assert exporter.load_manifest("book").sheets == {}
+        standin.reset_counts()
+        stats = exporter.export_all_tables("book", diff=True)
+
+        assert stats["errors"] == []
+        # Лист перечитан одним values_batch_get; удалять строки уже нечего
+        assert standin.counts["sheets"] == 4
+        self.assert_same_as_full(session, standin)
+
+    @pytest.mark.parametrize("from_manifest", [True, False])
+    def test_duplicate_relations(self, session, standin, tmp_path, from_manifest):
+        """Связи с одинаковым ключом (source, target, type) не теряются"""
+        first = session.query(Relation).first()
+        session.add(
+            Relation(
+                source_id=first.source_id,
+                target_id=first.target_id,
+                type=first.type,
+                weight=2.0,
+            )
+        )
+        session.commit()
+        make_exporter(session, standin, manifest_dir=tmp_path / "a").export_all_tables(
+            "book"
+        )
+        items = session.query(FunctionalItem).order_by(FunctionalItem.id).all()
+        session.add(
+            Relation(source_id=items[1].id, target_id=items[2].id, type="functional")
+        )
+        session.commit()
+
+        manifest_dir = tmp_path / ("a" if from_manifest else "b")
+        make_exporter(session, standin, manifest_dir=manifest_dir).export_all_tables(
+            "book", diff=True
+        )
+
+        self.assert_same_as_full(session, standin)
+        assert len(sheet_rows(standin, "book", "Связи")) == 1 + 8
@@ -0,0 +1,149 @@
+"""
+Tests for template_compiler и ReportGenerator
+
+Однопроходный рендеринг {{placeholder}}, кэш компиляции, ленивый контекст
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.models import FunctionalItem, ReportTemplate, User
+from src.services.ReportGenerator import ReportGenerator
+from src.utils import template_compiler
+from src.utils.template_compiler import (
+    MISSING,
+    LazyContext,
+    compile_template,
+    render_template,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    template_compiler.clear_compiled_templates()
+    yield
+    template_compiler.clear_compiled_templates()
+
+
+class TestCompiler:
+    """compile_template / CompiledTemplate.render"""
+
+    def test_render_single_pass(self):
+        compiled = compile_template("# {{title}}\n{{body}} / {{title}}")
+
+        result = compiled.render({"title": "{{body}}", "body": "text"})
+
+        # Значения не разбираются повторно
+        assert result == "# {{body}}\ntext / {{body}}"
+        assert compiled.placeholders == {"title", "body"}
+
+    def test_unknown_placeholders_kept(self):
+        assert render_template("{{a}} {{b}} {{ c }}", {"a": 1}) == "1 {{b}} {{ c }}"
+
+    def test_cache_by_key(self):
+        first = compile_template("{{a}}", key=("report_template", 1, "t1"))
+        again = compile_template("{{a}}", key=("report_template", 1, "t1"))
+        changed = compile_template("{{b}}", key=("report_template", 1, "t1"))
+
+        assert first is again
+        assert changed is not first
+        assert changed.placeholders == {"b"}
+
+
+class TestLazyContext:
+    """LazyContext"""
+
+    def test_only_used_providers_called(self):
+        calls = []
+
+        def provider(name):
+            def provide():
+                calls.append(name)
+                return name.upper()
+
+            return provide
+
+        context = LazyContext(
+            values={"date": "2026-01-01"},
+            providers={name: provider(name) for name in ("a", "b", "c")},
+        )
+
+        result = render_template("{{date}} {{a}} {{a}} {{c}}", context)
+
+        assert result == "2026-01-01 A A C"
+        assert calls == ["a", "c"]
+
+    def test_missing_and_override(self):
+        context = LazyContext(providers={"lead": lambda: MISSING})
+        context.provide_many(["x", "y"], lambda: {"x": 1})
+        context.update({"lead": "Anna"})
+
+        assert render_template("{{lead}} {{x}} {{y}}", context) == "Anna 1 {{y}}"
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(name="Anna", position="QA Engineer", is_active=1))
+    session.add(
+        FunctionalItem(
+            functional_id="app.auth.login", title="Login", type="Feature", is_crit=True
+        )
+    )
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def count_selects(session):
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+class TestReportGenerator:
+    """ReportGenerator.generate_report"""
+
+    def add_template(self, session, content):
+        template = ReportTemplate(name=f"t{content.count('{')}", content=content)
+        session.add(template)
+        session.commit()
+        return template
+
+    def test_report_rendered(self, session):
+        template = self.add_template(
+            session, "{{item_count}} | {{coverage}} | {{qa_lead}} | {{qa_name}}"
+        )
+
+        report = ReportGenerator(session).generate_report(template.id)
+
+        assert report == "1 | 0 | Anna | {{qa_name}}"
+
+    def test_unused_placeholders_not_queried(self, session):
+        template = self.add_template(session, "Отчёт на {{date}}")
+        statements = count_selects(session)
+
+        report = ReportGenerator(session).generate_report(template.id)
+
+        assert report.startswith("Отчёт на 20")
+        # Только выборка самого шаблона
+        assert len(statements) == 1
+        assert "report_templates" in statements[0]
+
+    def test_user_context_overrides(self, session):
+        template = self.add_template(session, "{{qa_team}} {{custom}}")
+
+        report = ReportGenerator(session).generate_report(
+            template.id, context={"qa_team": "Team", "custom": "X"}
+        )
+
+        assert report == "Team X"
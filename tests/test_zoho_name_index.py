@@ -0,0 +1,154 @@
+"""
+Tests for ZohoAPI name index
+
+Поиск ID таск-листов и мейлстоунов по имени через индекс без обращения к сети
+"""
+
+import json
+
+import pytest
+import requests
+
+from src.integrations import http_client
+from src.integrations.http_cache import HttpCache
+from src.integrations.zoho import Zoho_api_client
+from src.integrations.zoho.Zoho_api_client import ZohoAPI, ZohoPageError
+
+
+def make_response(status, payload=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode() if payload is not None else b""
+    return response
+
+
+class FakeZoho:
+    """Таск-листы, мейлстоуны и задачи проекта; считает запросы по спискам"""
+
+    def __init__(self):
+        self.lists = {
+            "tasklists": [
+                {"id": "t1", "name": "Sprint 1"},
+                {"id": "t2", "name": "Backlog"},
+            ],
+            "milestones": [{"id": "m1", "name": "Release 2.0"}],
+        }
+        self.requests = []
+        # Индекс записи, на которой список отвечает 500
+        self.fail_on_index = None
+
+    def request(self, method, url, headers=None, params=None, timeout=None):
+        entity_type = url.rstrip("/").rsplit("/", 1)[-1]
+        self.requests.append((entity_type, dict(params or {})))
+        if entity_type == "tasks":
+            scope = params.get("tasklist_id") or params.get("milestone_id")
+            return make_response(200, {"tasks": [{"id": f"task-{scope}"}]})
+        start = params["index"] - 1
+        if start == self.fail_on_index:
+            return make_response(500)
+        records = self.lists[entity_type][start : start + params["range"]]
+        if not records:
+            return make_response(204)
+        return make_response(200, {entity_type: records})
+
+    def count(self, entity_type):
+        return sum(1 for name, _ in self.requests if name == entity_type)
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        http_client, "_http_executor", http_client.HttpExecutor(sleep=lambda s: None)
+    )
+    api = ZohoAPI.__new__(ZohoAPI)
+    api.session = FakeZoho()
+    api.access_token = "token"
+    api.token_manager = None
+    api.base_url = "https://zoho.test/restapi/portal/test"
+    api.project_id = "1"
+    api.page_size = 10
+    api.page_prefetch = 0
+    api.http_cache = HttpCache(tmp_path / "http_cache.db")
+    api.name_indexes = {}
+    api._name_indexes_fetched_at = {}
+    yield api
+    api.http_cache.close()
+
+
+class TestNameIndex:
+    """get_tasklist_id_by_name / get_milestone_id_by_name / resolve_ids_by_name"""
+
+    def test_index_loaded_once(self, api):
+        assert api.get_tasklist_id_by_name("sprint 1") == "t1"
+        assert api.get_tasklist_id_by_name("  BACKLOG ") == "t2"
+        assert api.get_milestone_id_by_name("Release 2.0") == "m1"
+        assert api.session.count("tasklists") == 1
+        assert api.session.count("milestones") == 1
+
+        # Промах по индексу из кэша — одно перечитывание мимо кэша, дальше
+        # не чаще NAME_INDEX_REFRESH_INTERVAL
+        assert api.get_tasklist_id_by_name("Unknown") is None
+        assert api.get_tasklist_id_by_name("Unknown") is None
+        assert api.session.count("tasklists") == 2
+
+    def test_batch_resolution(self, api):
+        ids = api.resolve_ids_by_name("tasklists", ["Backlog", "Sprint 1", "Nope"])
+
+        assert ids == {"Backlog": "t2", "Sprint 1": "t1", "Nope": None}
+        # Загрузка + одно перечитывание на промах "Nope" для всего списка
+        assert api.session.count("tasklists") == 2
+
+    def test_miss_refreshes_index(self, api, monkeypatch):
+        """Новый таск-лист находится после перечитывания (мимо дискового кэша)"""
+        api.get_tasklist_id_by_name("Sprint 1")
+        api.session.lists["tasklists"].append({"id": "t3", "name": "Sprint 2"})
+
+        # Индекс загружен через кэш — промах перечитывает список сразу
+        assert api.get_tasklist_id_by_name("Sprint 2") == "t3"
+        assert api.session.count("tasklists") == 2
+
+        # Только что прочитанный из Zoho индекс — не чаще интервала
+        api.session.lists["tasklists"].append({"id": "t4", "name": "Sprint 3"})
+        assert api.get_tasklist_id_by_name("Sprint 3") is None
+        monkeypatch.setattr(Zoho_api_client, "NAME_INDEX_REFRESH_INTERVAL", 0)
+        assert api.get_tasklist_id_by_name("Sprint 3") == "t4"
+
+        assert api.session.count("tasklists") == 3
+
+    def test_cached_index_from_earlier_run(self, api):
+        """Индекс из часового кэша прошлого запуска не считается свежим"""
+        api.get_tasklist_id_by_name("Sprint 1")
+        api.session.lists["tasklists"].append({"id": "t3", "name": "Sprint 2"})
+        # Новый экземпляр: индекс в памяти пуст, список в дисковом кэше
+        api.name_indexes = {}
+        api._name_indexes_fetched_at = {}
+
+        assert api.get_tasklist_id_by_name("Sprint 1") == "t1"
+        assert api.session.count("tasklists") == 1
+        assert api.get_tasklist_id_by_name("Sprint 2") == "t3"
+        assert api.session.count("tasklists") == 2
+
+    def test_get_tasks_by_titles(self, api):
+        tasks = api.get_tasks_by_titles(["Sprint 1", "Release 2.0", "Nope"])
+
+        assert tasks == {
+            "Sprint 1": [{"id": "task-t1"}],
+            "Release 2.0": [{"id": "task-m1"}],
+            "Nope": [],
+        }
+        # "Nope" не найдено: оба индекса перечитаны по разу
+        assert api.session.count("tasklists") == 2
+        assert api.session.count("milestones") == 2
+        assert api.get_tasks_by_title("Backlog") == [{"id": "task-t2"}]
+
+    def test_failed_page_not_cached(self, api):
+        """Неполный список не становится индексом на всю сессию"""
+        api.page_size = 1
+        api.session.fail_on_index = 1
+
+        with pytest.raises(ZohoPageError):
+            api.get_tasklist_id_by_name("Backlog")
+        assert "tasklists" not in api.name_indexes
+
+        api.session.fail_on_index = None
+        assert api.get_tasklist_id_by_name("Backlog") == "t2"
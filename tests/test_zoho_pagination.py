@@ -0,0 +1,141 @@
+"""
+Tests for Zoho API pagination
+
+Проверка постраничной выборки (index/range) без обращения к сети
+"""
+
+import threading
+
+import pytest
+
+from src.integrations import http_client
+from src.integrations.zoho.Zoho_api_client import ZohoAPI, ZohoPageError
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = ""
+        self.headers = {}
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Отдаёт total задач страницами, как Zoho (204 за концом списка)"""
+
+    def __init__(self, total, fail_on_index=None):
+        self.total = total
+        self.fail_on_index = fail_on_index
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, params=None, timeout=None):
+        with self._lock:
+            self.requests.append(dict(params))
+        start = params["index"] - 1
+        if start == self.fail_on_index:
+            return FakeResponse(500)
+        tasks = [
+            {"id": i} for i in range(start, min(start + params["range"], self.total))
+        ]
+        if not tasks:
+            return FakeResponse(204)
+        return FakeResponse(200, {"tasks": tasks})
+
+
+@pytest.fixture(autouse=True)
+def executor(monkeypatch):
+    """Повторы 5xx без реального ожидания"""
+    executor = http_client.HttpExecutor(sleep=lambda seconds: None)
+    monkeypatch.setattr(http_client, "_http_executor", executor)
+    return executor
+
+
+def make_api(session, page_size=10, prefetch=0):
+    api = ZohoAPI.__new__(ZohoAPI)
+    api.session = session
+    api.access_token = "token"
+    api.token_manager = None
+    api.base_url = "https://zoho.test/restapi/portal/test"
+    api.project_id = "1"
+    api.page_size = page_size
+    api.page_prefetch = prefetch
+    return api
+
+
+class TestPagination:
+    """iter_entities_by_filter / get_entities_by_filter"""
+
+    @pytest.mark.parametrize("prefetch", [0, 3])
+    @pytest.mark.parametrize("total", [0, 7, 10, 25])
+    def test_all_pages_in_order(self, total, prefetch):
+        """Все записи по порядку при любом prefetch"""
+        api = make_api(FakeSession(total), prefetch=prefetch)
+
+        tasks = api.get_entities_by_filter("tasks", milestone_id="42")
+
+        assert [task["id"] for task in tasks] == list(range(total))
+
+    def test_sequential_stops_on_short_page(self):
+        """Без prefetch — ровно столько запросов, сколько страниц"""
+        session = FakeSession(25)
+        api = make_api(session)
+
+        list(api.iter_entities_by_filter("tasks", milestone_id="42"))
+
+        assert [params["index"] for params in session.requests] == [1, 11, 21]
+        assert all(params["milestone_id"] == "42" for params in session.requests)
+        assert all(params["range"] == 10 for params in session.requests)
+
+    def test_stream_stops_early(self):
+        """Ранний выход из генератора не выкачивает весь список"""
+        session = FakeSession(1000)
+        api = make_api(session)
+
+        first = next(api.iter_entities_by_filter("tasks"))
+
+        assert first == {"id": 0}
+        assert len(session.requests) == 1
+
+    def test_error_raises(self):
+        """Пропущенная страница не выглядит как конец списка"""
+        api = make_api(FakeSession(30, fail_on_index=10), prefetch=2)
+        received = []
+
+        with pytest.raises(ZohoPageError, match="с записи 11"):
+            for task in api.iter_entities_by_filter("tasks"):
+                received.append(task["id"])
+
+        assert received == list(range(10))
+        with pytest.raises(ZohoPageError):
+            api.get_entities_by_filter("tasks")
+
+    def test_lenient_error_stops_iteration(self):
+        """strict=False: выборка завершается уже полученными записями"""
+        api = make_api(FakeSession(30, fail_on_index=10), prefetch=2)
+
+        tasks = api.get_entities_by_filter("tasks", strict=False)
+
+        assert [task["id"] for task in tasks] == list(range(10))
+
+    def test_failed_page_is_retried(self, executor):
+        session = FakeSession(30, fail_on_index=10)
+        api = make_api(session)
+
+        with pytest.raises(ZohoPageError):
+            list(api.iter_entities_by_filter("tasks"))
+
+        indexes = [params["index"] for params in session.requests]
+        assert indexes == [1, 11, 11, 11, 11, 11]
+        assert executor.get_metrics()["zoho.test"]["retries"] == 4
+
+    def test_page_size_capped(self):
+        session = FakeSession(5)
+        api = make_api(session)
+
+        list(api.iter_entities_by_filter("tasks", page_size=1000))
+
+        assert session.requests[0]["range"] == 200
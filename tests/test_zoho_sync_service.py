@@ -0,0 +1,219 @@
+"""
+Tests for ZohoSyncService
+
+Проверка пакетного сохранения задач: новые, изменённые, без изменений
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base
+from src.integrations.zoho.Zoho_api_client import ZohoPageError
+from src.models import ZohoSyncState, ZohoTask
+from src.services.ZohoSyncService import ZohoSyncService
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def make_task(task_id, name=None, status="Open", modified_ms=None):
+    return {
+        "id": task_id,
+        "last_updated_time_long": modified_ms,
+        "project_id": 7,
+        "name": name or f"Task {task_id}",
+        "status": {"name": status},
+        "start_date": "04-01-2025",
+        "details": {"owners": [{"id": 1, "name": "QA"}]},
+        "tags": ["front"],
+    }
+
+
+class TestProcessTasks:
+    """Пакетная обработка _process_tasks"""
+
+    def test_insert_update_unchanged(self, session):
+        service = ZohoSyncService(session, batch_size=4)
+
+        stats = service._process_tasks(
+            (make_task(i) for i in range(10)), milestone_name="R1"
+        )
+        assert stats["new"] == 10
+        assert session.query(ZohoTask).count() == 10
+
+        tasks = [make_task(i) for i in range(10)]
+        tasks[3] = make_task(3, status="Closed")
+        tasks.append(make_task(10))
+        stats = service._process_tasks(tasks, milestone_name="R1")
+
+        assert (stats["new"], stats["updated"], stats["unchanged"]) == (1, 1, 9)
+        task = session.query(ZohoTask).filter_by(zoho_task_id="3").one()
+        assert task.status == "Closed"
+        assert task.milestone_name == "R1"
+        assert task.tags == ["front"]
+
+    def test_missing_fields_keep_values(self, session):
+        """Поля, которых нет в ответе Zoho, не затираются"""
+        service = ZohoSyncService(session)
+        service._process_tasks([make_task(1)], milestone_name="R1")
+
+        stats = service._process_tasks([{"id": 1, "name": "Renamed"}])
+
+        task = session.query(ZohoTask).one()
+        assert stats["updated"] == 1
+        assert (task.name, task.status, task.milestone_name) == (
+            "Renamed",
+            "Open",
+            "R1",
+        )
+
+    def test_one_query_and_commit_per_batch(self, session, engine):
+        """На пачку — один SELECT существующих и один коммит"""
+        progress = []
+        service = ZohoSyncService(session, batch_size=5, on_progress=progress.append)
+        selects = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: (
+                selects.append(statement) if statement.startswith("SELECT") else None
+            ),
+        )
+
+        stats = service._process_tasks([make_task(i) for i in range(12)])
+
+        assert stats["new"] == 12
+        assert len(selects) == 3
+        assert len(progress) == 3
+        assert progress[-1].startswith("💾 Сохранено задач: 12")
+
+    def test_duplicates_and_missing_ids(self, session):
+        service = ZohoSyncService(session)
+
+        stats = service._process_tasks(
+            [make_task(1), make_task(1, name="Latest"), {"name": "no id"}]
+        )
+
+        assert (stats["new"], stats["skipped"]) == (1, 1)
+        assert session.query(ZohoTask).one().name == "Latest"
+
+
+class FakeZohoClient:
+    """Zoho без фильтра last_modified_time — отдаёт все задачи"""
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.calls = []
+        # Страница после tasks не получена
+        self.fail_after_tasks = False
+
+    def get_milestone_id_by_name(self, name):
+        return "55"
+
+    def iter_entities_by_filter(self, entity_type, **filters):
+        self.calls.append(filters)
+        yield from self.tasks
+        if self.fail_after_tasks:
+            raise ZohoPageError("Не удалось получить tasks")
+
+
+class TestIncrementalSync:
+    """Синхронизация milestone по watermark"""
+
+    def test_watermark_cursor(self, session):
+        client = FakeZohoClient(
+            [make_task(1, modified_ms=1_000_000), make_task(2, modified_ms=2_000_000)]
+        )
+        service = ZohoSyncService(session)
+        service.zoho_client = client
+
+        stats = service.sync_tasks_by_milestone("R1")
+        assert (stats["new"], stats["incremental"]) == (2, False)
+        assert client.calls[0]["modified_after_ms"] is None
+
+        state = session.query(ZohoSyncState).one()
+        assert state.scope == "milestone:55"
+        assert service._to_ms(state.watermark) == 2_000_000
+        assert state.full_synced_at is not None
+
+        # Задача 1 не менялась, задача 2 изменилась, задача 3 новая
+        client.tasks = [
+            make_task(1, modified_ms=1_000_000),
+            make_task(2, status="Closed", modified_ms=3_000_000),
+            make_task(3, modified_ms=3_000_000),
+        ]
+        stats = service.sync_tasks_by_milestone("R1")
+
+        assert client.calls[1]["modified_after_ms"] == 2_000_000
+        assert stats["incremental"] is True
+        assert (stats["new"], stats["updated"], stats["unchanged"]) == (1, 1, 1)
+        assert service._to_ms(state.watermark) == 3_000_000
+
+    def test_full_resync_ignores_watermark(self, session):
+        client = FakeZohoClient([make_task(1, modified_ms=5_000)])
+        service = ZohoSyncService(session)
+        service.zoho_client = client
+        service.sync_tasks_by_milestone("R1")
+
+        stats = service.sync_tasks_by_milestone("R1", full_resync=True)
+
+        assert client.calls[1]["modified_after_ms"] is None
+        assert (stats["unchanged"], stats["incremental"]) == (1, False)
+
+    def test_errors_keep_watermark(self, session, monkeypatch):
+        client = FakeZohoClient([make_task(1, modified_ms=5_000)])
+        service = ZohoSyncService(session)
+        service.zoho_client = client
+        service.sync_tasks_by_milestone("R1")
+
+        def broken_record(*args):
+            raise ValueError("bad task")
+
+        client.tasks = [make_task(2, modified_ms=9_000)]
+        monkeypatch.setattr(service, "_task_record", broken_record)
+        stats = service.sync_tasks_by_milestone("R1")
+
+        assert stats["errors"] == 1
+        state = session.query(ZohoSyncState).one()
+        assert service._to_ms(state.watermark) == 5_000
+
+    def test_missing_page_keeps_watermark(self, session):
+        client = FakeZohoClient([make_task(1, modified_ms=5_000)])
+        service = ZohoSyncService(session)
+        service.zoho_client = client
+        service.sync_tasks_by_milestone("R1")
+
+        client.tasks = [make_task(2, modified_ms=9_000)]
+        client.fail_after_tasks = True
+        stats = service.sync_tasks_by_milestone("R1")
+
+        assert client.calls[1]["strict"] is True
+        # Полученные задачи сохранены, интервал будет запрошен повторно
+        assert (stats["new"], stats["errors"]) == (1, 1)
+        state = session.query(ZohoSyncState).one()
+        assert service._to_ms(state.watermark) == 5_000
+
+    def test_filter_sync_missing_page(self, session):
+        """Синхронизация по фильтрам: неполученная страница — ошибка в статистике"""
+        client = FakeZohoClient([make_task(1), make_task(2)])
+        client.fail_after_tasks = True
+        service = ZohoSyncService(session)
+        service.zoho_client = client
+
+        stats = service.sync_tasks_by_filter(created_after="2024-01-01")
+
+        assert (stats["new"], stats["errors"]) == (2, 1)
+        assert session.query(ZohoSyncState).count() == 0
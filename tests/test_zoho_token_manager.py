@@ -0,0 +1,133 @@
+"""
+Tests for ZohoTokenManager
+
+Проверка упреждающего обновления access_token без сетевых запросов
+"""
+
+import time
+
+import pytest
+
+from src.integrations.zoho.TokenManager import (
+    EXPIRES_AT_KEY,
+    REFRESH_MARGIN_SECONDS,
+    ZohoTokenManager,
+    get_token_manager,
+    reset_token_managers,
+    update_env_values,
+)
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self):
+        self.posts = []
+
+    def request(self, method, url, data=None, timeout=None):
+        self.posts.append(data)
+        return FakeResponse(
+            {"access_token": f"access-{len(self.posts)}", "expires_in": 3600}
+        )
+
+
+@pytest.fixture
+def env_path(tmp_path):
+    path = tmp_path / "zoho.env"
+    path.write_text(
+        "ZOHO_CLIENT_ID=client\nZOHO_ACCESS_TOKEN=old\nZOHO_REFRESH_TOKEN=refresh\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    reset_token_managers()
+    yield
+    reset_token_managers()
+
+
+def make_manager(env_path, **kwargs):
+    session = FakeSession()
+    manager = ZohoTokenManager(
+        env_path, "client", "secret", "refresh", session=session, **kwargs
+    )
+    return manager, session
+
+
+class TestTokenManager:
+    """Обновление токена по сроку действия"""
+
+    def test_fresh_token_without_requests(self, env_path):
+        manager, session = make_manager(
+            env_path, access_token="old", expires_at=time.time() + 3600
+        )
+
+        assert manager.get_access_token() == "old"
+        assert session.posts == []
+
+    def test_unknown_expiry_is_trusted_until_401(self, env_path):
+        """Старый zoho.env без срока действия — без проверочного запроса"""
+        manager, session = make_manager(env_path, access_token="old")
+
+        assert manager.get_access_token() == "old"
+        manager.invalidate("old")
+        assert manager.get_access_token() == "access-1"
+        assert len(session.posts) == 1
+
+    def test_refresh_before_expiry_and_persist(self, env_path):
+        manager, session = make_manager(
+            env_path,
+            access_token="old",
+            expires_at=time.time() + REFRESH_MARGIN_SECONDS - 1,
+        )
+
+        assert manager.get_access_token() == "access-1"
+        assert session.posts[0]["grant_type"] == "refresh_token"
+
+        content = open(env_path, encoding="utf-8").read()
+        assert "ZOHO_ACCESS_TOKEN=access-1\n" in content
+        assert f"{EXPIRES_AT_KEY}={manager.expires_at}\n" in content
+        assert content.startswith("ZOHO_CLIENT_ID=client\n")
+
+    def test_stale_invalidate_is_ignored(self, env_path):
+        """401 по уже заменённому токену не вызывает второго обновления"""
+        manager, session = make_manager(env_path)
+        manager.get_access_token()
+
+        manager.invalidate("old")
+        assert manager.get_access_token() == "access-1"
+        assert len(session.posts) == 1
+
+    def test_shared_per_env_file(self, env_path):
+        first = get_token_manager(
+            env_path, client_id="a", client_secret="b", refresh_token="c"
+        )
+        second = get_token_manager(
+            env_path, client_id="x", client_secret="y", refresh_token="z"
+        )
+
+        assert first is second
+        assert second.client_id == "a"
+
+
+def test_update_env_values_appends_missing(tmp_path):
+    path = tmp_path / "zoho.env"
+    path.write_text("A=1\nB=2", encoding="utf-8")
+
+    update_env_values(str(path), {"B": 3, "C": 4})
+
+    assert path.read_text(encoding="utf-8") == "A=1\nB=3\nC=4\n"